@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SERVER_ROOT = REPO_ROOT / "server_py"
+if str(SERVER_ROOT) not in sys.path:
+    sys.path.insert(0, str(SERVER_ROOT))
+
+import httpx
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.logging import RequestLoggingMiddleware
+from app.core.rate_limit import RateLimitMiddleware
+
+
+class LegacyRateLimitMiddleware(BaseHTTPMiddleware):
+    """The previous BaseHTTPMiddleware shape, kept for comparison (no-op on /health)."""
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        return await call_next(request)
+
+
+class LegacyRequestLoggingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        start = time.time()
+        response = await call_next(request)
+        duration = (time.time() - start) * 1000
+        print(f"{request.method} {request.url.path} {response.status_code} {duration:.1f}ms")
+        return response
+
+
+def build_app(rate_limit_cls, logging_cls) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(rate_limit_cls)
+    app.add_middleware(logging_cls)
+
+    @app.get("/health")
+    def health():
+        return {"ok": True}
+
+    return app
+
+
+async def requests_per_second(app: FastAPI, requests: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Both logging middlewares print a line per request; keep that off the report.
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(50):
+                await client.get("/health")
+            started = time.perf_counter()
+            for _ in range(requests):
+                await client.get("/health")
+            return requests / (time.perf_counter() - started)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare /health throughput with BaseHTTPMiddleware vs pure ASGI middleware.",
+    )
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    variants = [
+        ("BaseHTTPMiddleware", build_app(LegacyRateLimitMiddleware, LegacyRequestLoggingMiddleware)),
+        ("pure ASGI", build_app(RateLimitMiddleware, RequestLoggingMiddleware)),
+    ]
+    results = {}
+    for label, app in variants:
+        results[label] = asyncio.run(requests_per_second(app, args.requests))
+        print(f"{label:>20}: {results[label]:8.0f} req/s")
+    baseline = results["BaseHTTPMiddleware"]
+    print(f"{'speedup':>20}: {results['pure ASGI'] / baseline:8.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SERVER_ROOT = REPO_ROOT / "server_py"
+if str(SERVER_ROOT) not in sys.path:
+    sys.path.insert(0, str(SERVER_ROOT))
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from app.api.fast_json import json_bytes
+from app.api.serializers.base_item import to_base_item_read
+from app.models.base_item import (
+    BaseItem,
+    BaseItemCostUnit,
+    BaseItemKind,
+    BaseItemSource,
+    BaseItemWeaponCategory,
+    BaseItemWeaponRangeType,
+)
+from app.models.campaign import RoleMode, SystemType
+from app.schemas.base_item import BaseItemRead
+from app.schemas.roll_event import RollDice, RollEventRead
+from app.schemas.session import ActivityEvent, RollActivityEvent, ShopActivityEvent
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def base_items(count: int) -> list[BaseItemRead]:
+    return [
+        to_base_item_read(
+            BaseItem(
+                id=f"base-item-{index}",
+                system=SystemType.DND5E,
+                canonical_key=f"dagger-{index}",
+                name_en="Dagger",
+                name_pt="Adaga",
+                description_en="A sharp blade.",
+                description_pt="Uma lâmina afiada.",
+                item_kind=BaseItemKind.WEAPON,
+                cost_quantity=2.0,
+                cost_unit=BaseItemCostUnit.GP,
+                weight=1.0,
+                weapon_category=BaseItemWeaponCategory.SIMPLE,
+                weapon_range_type=BaseItemWeaponRangeType.MELEE,
+                damage_dice="1d4",
+                damage_type="piercing",
+                range_normal_meters=20,
+                range_long_meters=60,
+                weapon_properties_json=["finesse", "light", "thrown"],
+                stealth_disadvantage=False,
+                is_shield=False,
+                source=BaseItemSource.SEED_JSON_BOOTSTRAP,
+                source_ref="Dagger",
+                is_srd=True,
+                is_active=True,
+            )
+        )
+        for index in range(count)
+    ]
+
+
+def rolls(count: int) -> list[RollEventRead]:
+    return [
+        RollEventRead(
+            id=f"roll-{index}",
+            campaignId="campaign-1",
+            sessionId="session-1",
+            userId="user-1",
+            authorName="Hero",
+            roleMode=RoleMode.PLAYER,
+            label="Attack",
+            expression="2d6+3",
+            dice=RollDice(count=2, sides=6, modifier=3),
+            results=[4, 5],
+            total=12,
+            createdAt=NOW,
+        )
+        for index in range(count)
+    ]
+
+
+def activity(count: int) -> list[Any]:
+    events: list[Any] = []
+    for index in range(count):
+        if index % 2:
+            events.append(ShopActivityEvent(action="opened", timestamp=NOW, sessionOffsetSeconds=index))
+        else:
+            events.append(
+                RollActivityEvent(
+                    userId="user-1",
+                    displayName="Hero",
+                    expression="1d20",
+                    results=[17],
+                    total=17,
+                    timestamp=NOW,
+                    sessionOffsetSeconds=index,
+                )
+            )
+    return events
+
+
+def per_1k_ms(run: Callable[[], Any], items: int, repeat: int) -> float:
+    run()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        run()
+    return (time.perf_counter() - started) / repeat * 1000 * (1000 / items)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare per-1k-item JSON serialization: FastAPI response_model path vs FastJSONRoute.",
+    )
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    cases = [
+        ("base items", list[BaseItemRead], base_items(args.items)),
+        ("rolls", list[RollEventRead], rolls(args.items)),
+        ("activity", list[ActivityEvent], activity(args.items)),
+    ]
+    loop = asyncio.new_event_loop()
+    print(f"{'payload':>12} {'default ms/1k':>14} {'fast ms/1k':>11} {'speedup':>8}")
+    for label, response_model, content in cases:
+        field = APIRoute("/bench", lambda: None, response_model=response_model).response_field
+
+        def default_path() -> bytes:
+            encoded = loop.run_until_complete(serialize_response(field=field, response_content=content))
+            return JSONResponse(encoded).body
+
+        def fast_path() -> bytes:
+            return json_bytes(content, response_model)
+
+        default_ms = per_1k_ms(default_path, args.items, args.repeat)
+        fast_ms = per_1k_ms(fast_path, args.items, args.repeat)
+        print(f"{label:>12} {default_ms:14.2f} {fast_ms:11.2f} {default_ms / fast_ms:7.1f}x")
+    loop.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,48 @@
+"""Composite indexes for hot session, shop and inventory queries.
+
+Revision ID: 0047_hot_session_query_indexes
+Revises: 0046_base_spell_delete_set_null
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0047_hot_session_query_indexes"
+down_revision: Union[str, None] = "0046_base_spell_delete_set_null"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# campaign_member(campaign_id, user_id) is already covered by its unique constraint.
+_INDEXES: tuple[tuple[str, str, list[str]], ...] = (
+    ("ix_roll_event_session_id_created_at", "roll_event", ["session_id", "created_at"]),
+    (
+        "ix_session_command_event_session_id_created_at",
+        "session_command_event",
+        ["session_id", "created_at"],
+    ),
+    ("ix_purchase_event_session_id_created_at", "purchase_event", ["session_id", "created_at"]),
+    (
+        "ix_inventoryitem_campaign_party_member_item",
+        "inventoryitem",
+        ["campaign_id", "party_id", "member_id", "item_id"],
+    ),
+    (
+        "ix_session_state_session_id_player_user_id",
+        "session_state",
+        ["session_id", "player_user_id"],
+    ),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in _INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _columns in reversed(_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,48 @@
+"""Persist combat log entries.
+
+Revision ID: 0048_combat_log_entry
+Revises: 0047_hot_session_query_indexes
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0048_combat_log_entry"
+down_revision: Union[str, None] = "0047_hot_session_query_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "combat_log_entry",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("session_id", sa.String(), nullable=False),
+        sa.Column("sequence", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("message", sa.String(), nullable=False),
+        sa.Column("source", sa.String(), nullable=True),
+        sa.Column("payload_json", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True, server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(["session_id"], ["campaign_session.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_combat_log_entry_session_id_created_at_sequence",
+        "combat_log_entry",
+        ["session_id", "created_at", "sequence"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_combat_log_entry_session_id_created_at_sequence",
+        table_name="combat_log_entry",
+    )
+    op.drop_table("combat_log_entry")
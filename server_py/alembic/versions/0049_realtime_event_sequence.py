@@ -0,0 +1,41 @@
+"""Per-channel realtime sequence numbers and replay buffer.
+
+Revision ID: 0049_realtime_event_sequence
+Revises: 0048_combat_log_entry
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0049_realtime_event_sequence"
+down_revision: Union[str, None] = "0048_combat_log_entry"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "realtime_channel_sequence",
+        sa.Column("channel", sa.String(), nullable=False),
+        sa.Column("last_seq", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("channel"),
+    )
+    op.create_table(
+        "realtime_event",
+        sa.Column("channel", sa.String(), nullable=False),
+        sa.Column("seq", sa.BigInteger(), nullable=False, autoincrement=False),
+        sa.Column("data", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("channel", "seq"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("realtime_event")
+    op.drop_table("realtime_channel_sequence")
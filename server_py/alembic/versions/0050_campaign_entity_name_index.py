@@ -0,0 +1,29 @@
+"""Keyset index for the paginated bestiary listing.
+
+Revision ID: 0050_campaign_entity_name_index
+Revises: 0049_realtime_event_sequence
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0050_campaign_entity_name_index"
+down_revision: Union[str, None] = "0049_realtime_event_sequence"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_campaign_entity_campaign_id_name_id",
+        "campaign_entity",
+        ["campaign_id", "name", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_campaign_entity_campaign_id_name_id", table_name="campaign_entity")
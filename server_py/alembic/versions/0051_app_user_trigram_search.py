@@ -0,0 +1,39 @@
+"""Trigram indexes for user search.
+
+Revision ID: 0051_app_user_trigram_search
+Revises: 0050_campaign_entity_name_index
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0051_app_user_trigram_search"
+down_revision: Union[str, None] = "0050_campaign_entity_name_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEXES: tuple[tuple[str, str], ...] = (
+    ("ix_app_user_username_trgm", "username"),
+    ("ix_app_user_display_name_trgm", "display_name"),
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, column in _INDEXES:
+        op.create_index(
+            name,
+            "app_user",
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    for name, _column in reversed(_INDEXES):
+        op.drop_index(name, table_name="app_user")
@@ -0,0 +1,60 @@
+"""Background campaign deletion jobs and the pending-delete marker.
+
+Revision ID: 0052_campaign_deletion_job
+Revises: 0051_app_user_trigram_search
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0052_campaign_deletion_job"
+down_revision: Union[str, None] = "0051_app_user_trigram_search"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "campaign",
+        sa.Column("deletion_requested_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_table(
+        "campaign_deletion_job",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("campaign_id", sa.String(), nullable=False),
+        sa.Column("campaign_name", sa.String(), nullable=False),
+        sa.Column("requested_by_user_id", sa.String(), nullable=True),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("steps_total", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("steps_done", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("rows_deleted", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("current_table", sa.String(), nullable=True),
+        sa.Column("error", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True, server_default=sa.func.now()),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_campaign_deletion_job_campaign_id",
+        "campaign_deletion_job",
+        ["campaign_id"],
+    )
+    op.create_index(
+        "ix_campaign_deletion_job_status_created_at",
+        "campaign_deletion_job",
+        ["status", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_campaign_deletion_job_status_created_at", table_name="campaign_deletion_job")
+    op.drop_index("ix_campaign_deletion_job_campaign_id", table_name="campaign_deletion_job")
+    op.drop_table("campaign_deletion_job")
+    op.drop_column("campaign", "deletion_requested_at")
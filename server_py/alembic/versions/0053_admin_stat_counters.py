@@ -0,0 +1,213 @@
+"""Trigger-maintained counters for the admin dashboard.
+
+Revision ID: 0053_admin_stat_counters
+Revises: 0052_campaign_deletion_job
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0053_admin_stat_counters"
+down_revision: Union[str, None] = "0052_campaign_deletion_job"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, total key, flag column, flag value, flag key). An empty total key
+# means only the flag is counted; an empty flag column means only the total.
+_COUNTED_TABLES: tuple[tuple[str, str, str, str, str], ...] = (
+    ("app_user", "users_total", "is_system_admin", "true", "system_admins_total"),
+    ("campaign", "campaigns_total", "", "", ""),
+    ("party", "parties_total", "", "", ""),
+    ("campaign_session", "sessions_total", "status", "ACTIVE", "active_sessions_total"),
+    ("base_item", "base_items_total", "is_active", "true", "base_items_active"),
+    ("base_spell", "base_spells_total", "is_active", "true", "base_spells_active"),
+    ("session_runtime", "", "combat_active", "true", "active_combats_total"),
+)
+
+_SEED_ADMIN_STATS = """
+INSERT INTO admin_stat (key, value)
+SELECT 'users_total', count(*) FROM app_user
+UNION ALL SELECT 'system_admins_total', count(*) FROM app_user WHERE is_system_admin
+UNION ALL SELECT 'campaigns_total', count(*) FROM campaign
+UNION ALL SELECT 'parties_total', count(*) FROM party
+UNION ALL SELECT 'sessions_total', count(*) FROM campaign_session
+UNION ALL SELECT 'active_sessions_total', count(*) FROM campaign_session WHERE status = 'ACTIVE'
+UNION ALL SELECT 'base_items_total', count(*) FROM base_item
+UNION ALL SELECT 'base_items_active', count(*) FROM base_item WHERE is_active
+UNION ALL SELECT 'base_spells_total', count(*) FROM base_spell
+UNION ALL SELECT 'base_spells_active', count(*) FROM base_spell WHERE is_active
+UNION ALL SELECT 'active_combats_total', count(*) FROM session_runtime WHERE combat_active
+"""
+
+_SEED_ADMIN_USER_STATS = """
+INSERT INTO admin_user_stat (user_id, campaigns_count, gm_campaigns_count, parties_count)
+SELECT
+    app_user.id,
+    coalesce(campaigns.total, 0),
+    coalesce(campaigns.gm_total, 0),
+    coalesce(parties.total, 0)
+FROM app_user
+LEFT JOIN (
+    SELECT user_id, count(*) AS total, count(*) FILTER (WHERE role_mode = 'GM') AS gm_total
+    FROM campaign_member
+    GROUP BY user_id
+) AS campaigns ON campaigns.user_id = app_user.id
+LEFT JOIN (
+    SELECT user_id, count(*) AS total
+    FROM party_member
+    GROUP BY user_id
+) AS parties ON parties.user_id = app_user.id
+"""
+
+_FUNCTIONS = """
+CREATE FUNCTION admin_stat_add(stat_key text, delta bigint) RETURNS void
+LANGUAGE sql AS $$
+    UPDATE admin_stat SET value = value + delta WHERE key = stat_key
+$$;
+
+CREATE FUNCTION admin_stat_track() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    total_key text := TG_ARGV[0];
+    flag_column text := TG_ARGV[1];
+    flag_value text := TG_ARGV[2];
+    flag_key text := TG_ARGV[3];
+    old_flag boolean := false;
+    new_flag boolean := false;
+BEGIN
+    IF total_key <> '' AND TG_OP = 'INSERT' THEN
+        PERFORM admin_stat_add(total_key, 1);
+    ELSIF total_key <> '' AND TG_OP = 'DELETE' THEN
+        PERFORM admin_stat_add(total_key, -1);
+    END IF;
+    IF flag_column <> '' THEN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            old_flag := coalesce(to_jsonb(OLD) ->> flag_column = flag_value, false);
+        END IF;
+        IF TG_OP IN ('UPDATE', 'INSERT') THEN
+            new_flag := coalesce(to_jsonb(NEW) ->> flag_column = flag_value, false);
+        END IF;
+        IF old_flag <> new_flag THEN
+            PERFORM admin_stat_add(flag_key, CASE WHEN new_flag THEN 1 ELSE -1 END);
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+CREATE FUNCTION admin_user_stat_add(
+    target_user_id text,
+    campaigns_delta integer,
+    gm_campaigns_delta integer,
+    parties_delta integer
+) RETURNS void
+LANGUAGE sql AS $$
+    INSERT INTO admin_user_stat AS stat (user_id, campaigns_count, gm_campaigns_count, parties_count)
+    VALUES (target_user_id, campaigns_delta, gm_campaigns_delta, parties_delta)
+    ON CONFLICT (user_id) DO UPDATE SET
+        campaigns_count = stat.campaigns_count + EXCLUDED.campaigns_count,
+        gm_campaigns_count = stat.gm_campaigns_count + EXCLUDED.gm_campaigns_count,
+        parties_count = stat.parties_count + EXCLUDED.parties_count
+$$;
+
+CREATE FUNCTION admin_user_stat_track_campaign_member() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM admin_user_stat_add(
+            OLD.user_id, -1, CASE WHEN OLD.role_mode = 'GM' THEN -1 ELSE 0 END, 0
+        );
+    END IF;
+    IF TG_OP IN ('UPDATE', 'INSERT') THEN
+        PERFORM admin_user_stat_add(
+            NEW.user_id, 1, CASE WHEN NEW.role_mode = 'GM' THEN 1 ELSE 0 END, 0
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+CREATE FUNCTION admin_user_stat_track_party_member() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM admin_user_stat_add(OLD.user_id, 0, 0, -1);
+    END IF;
+    IF TG_OP IN ('UPDATE', 'INSERT') THEN
+        PERFORM admin_user_stat_add(NEW.user_id, 0, 0, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+"""
+
+
+def _trigger_name(table: str) -> str:
+    return f"trg_admin_stat_{table}"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "admin_stat",
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("value", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    op.create_table(
+        "admin_user_stat",
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("campaigns_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("gm_campaigns_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("parties_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["user_id"], ["app_user.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.execute(_FUNCTIONS)
+
+    # Lock the counted tables so no write lands between the seed and the triggers.
+    counted = ", ".join(
+        sorted({table for table, *_rest in _COUNTED_TABLES} | {"campaign_member", "party_member"})
+    )
+    op.execute(f"LOCK TABLE {counted} IN SHARE ROW EXCLUSIVE MODE")
+
+    for table, total_key, flag_column, flag_value, flag_key in _COUNTED_TABLES:
+        events = "INSERT OR DELETE"
+        if flag_column:
+            events += f" OR UPDATE OF {flag_column}"
+        op.execute(
+            f"CREATE TRIGGER {_trigger_name(table)} AFTER {events} ON {table} "
+            "FOR EACH ROW EXECUTE FUNCTION admin_stat_track("
+            f"'{total_key}', '{flag_column}', '{flag_value}', '{flag_key}')"
+        )
+    op.execute(
+        "CREATE TRIGGER trg_admin_user_stat_campaign_member "
+        "AFTER INSERT OR DELETE OR UPDATE OF user_id, role_mode ON campaign_member "
+        "FOR EACH ROW EXECUTE FUNCTION admin_user_stat_track_campaign_member()"
+    )
+    op.execute(
+        "CREATE TRIGGER trg_admin_user_stat_party_member "
+        "AFTER INSERT OR DELETE OR UPDATE OF user_id ON party_member "
+        "FOR EACH ROW EXECUTE FUNCTION admin_user_stat_track_party_member()"
+    )
+
+    op.execute(_SEED_ADMIN_STATS)
+    op.execute(_SEED_ADMIN_USER_STATS)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_admin_user_stat_party_member ON party_member")
+    op.execute("DROP TRIGGER IF EXISTS trg_admin_user_stat_campaign_member ON campaign_member")
+    for table, *_rest in reversed(_COUNTED_TABLES):
+        op.execute(f"DROP TRIGGER IF EXISTS {_trigger_name(table)} ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS admin_user_stat_track_party_member()")
+    op.execute("DROP FUNCTION IF EXISTS admin_user_stat_track_campaign_member()")
+    op.execute("DROP FUNCTION IF EXISTS admin_user_stat_add(text, integer, integer, integer)")
+    op.execute("DROP FUNCTION IF EXISTS admin_stat_track()")
+    op.execute("DROP FUNCTION IF EXISTS admin_stat_add(text, bigint)")
+    op.drop_table("admin_user_stat")
+    op.drop_table("admin_stat")
@@ -0,0 +1,27 @@
+"""Keyset indexes for the paginated admin user and campaign listings.
+
+Revision ID: 0054_admin_listing_keyset_indexes
+Revises: 0053_admin_stat_counters
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0054_admin_listing_keyset_indexes"
+down_revision: Union[str, None] = "0053_admin_stat_counters"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_app_user_created_at_id", "app_user", ["created_at", "id"])
+    op.create_index("ix_campaign_created_at_id", "campaign", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_campaign_created_at_id", table_name="campaign")
+    op.drop_index("ix_app_user_created_at_id", table_name="app_user")
@@ -2,6 +2,7 @@ from fastapi import Depends, HTTPException, Request
 from sqlmodel import Session, select
 
 from app.core.auth import decode_jwt
+from app.db.loaders import load_campaign, load_campaign_member
 from app.db.session import get_session
 from app.models.campaign import Campaign, RoleMode
 from app.models.campaign_member import CampaignMember
@@ -36,15 +37,11 @@ def require_system_admin(user: User = Depends(get_current_user)) -> User:
 def require_campaign_member(
     campaign_id: str, user: User, session: Session
 ) -> tuple[Campaign, CampaignMember]:
-    campaign = session.exec(select(Campaign).where(Campaign.id == campaign_id)).first()
-    if not campaign:
+    campaign = load_campaign(session, campaign_id)
+    # A campaign pending deletion is already gone as far as players and GMs are concerned.
+    if not campaign or campaign.deletion_requested_at is not None:
         raise HTTPException(status_code=404, detail="Campaign not found")
-    member = session.exec(
-        select(CampaignMember).where(
-            CampaignMember.campaign_id == campaign_id,
-            CampaignMember.user_id == user.id,
-        )
-    ).first()
+    member = load_campaign_member(session, campaign_id, user.id)
     if not member:
         raise HTTPException(status_code=403, detail="Not a campaign member")
     return campaign, member
@@ -0,0 +1,154 @@
+"""Opt-in fast JSON path for large read endpoints.
+
+By default FastAPI re-validates whatever a route returns against its
+``response_model``, turns it back into plain Python with ``jsonable_encoder``
+semantics and then runs ``json.dumps``. Routes that already build their schema
+objects pay for that twice. Routers created with
+``APIRouter(route_class=FastJSONRoute)`` serialize GET responses straight to
+bytes with a cached pydantic-core ``TypeAdapter`` instead.
+
+The fast path is only taken when the returned value already has the declared
+type (a model, or a list of models). Anything else, such as dicts or ORM rows
+returned for a ``response_model`` route, falls back to the regular FastAPI
+path so fields are still filtered.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache, wraps
+import inspect
+from types import UnionType
+from typing import Annotated, Any, Callable, Union, get_args, get_origin
+
+from fastapi import Response
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.dependencies.utils import get_typed_return_annotation, get_typed_signature
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+_ORIGINAL_ENDPOINT = "__fast_json_original__"
+
+
+@lru_cache(maxsize=None)
+def _adapter(annotation: Any) -> TypeAdapter:
+    return TypeAdapter(annotation)
+
+
+def _model_types(annotation: Any) -> tuple[type[BaseModel], ...] | None:
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _model_types(get_args(annotation)[0])
+    if origin is Union or origin is UnionType:
+        members: list[type[BaseModel]] = []
+        for arg in get_args(annotation):
+            arg_types = _model_types(arg)
+            if arg_types is None:
+                return None
+            members.extend(arg_types)
+        return tuple(members)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return (annotation,)
+    return None
+
+
+def _typed_check(response_model: Any) -> Callable[[Any], bool] | None:
+    """Return a cheap "already has the declared type" test, or None if unsupported."""
+    if get_origin(response_model) is list:
+        args = get_args(response_model)
+        item_types = _model_types(args[0]) if args else None
+        if item_types is None:
+            return None
+        return lambda value: isinstance(value, list) and all(
+            isinstance(item, item_types) for item in value
+        )
+    model_types = _model_types(response_model)
+    if model_types is None:
+        return None
+    return lambda value: isinstance(value, model_types)
+
+
+def json_bytes(value: Any, response_model: Any = None) -> bytes:
+    if response_model is None:
+        return to_json(value)
+    return _adapter(response_model).dump_json(value, by_alias=True)
+
+
+def _fast_endpoint(endpoint: Callable[..., Any], response_model: Any, status_code: int) -> Callable[..., Any]:
+    if response_model is None:
+        is_typed = None
+    else:
+        is_typed = _typed_check(response_model)
+        if is_typed is None:
+            return endpoint
+
+    def render(value: Any) -> Any:
+        if isinstance(value, Response):
+            return value
+        if is_typed is None:
+            return Response(json_bytes(value), status_code=status_code, media_type="application/json")
+        if not is_typed(value):
+            return value
+        return Response(
+            json_bytes(value, response_model),
+            status_code=status_code,
+            media_type="application/json",
+        )
+
+    if inspect.iscoroutinefunction(endpoint):
+        @wraps(endpoint)
+        async def fast_endpoint(*args: Any, **kwargs: Any) -> Any:
+            return render(await endpoint(*args, **kwargs))
+    else:
+        # Stays sync so FastAPI keeps running it (and the encoding) in the threadpool.
+        @wraps(endpoint)
+        def fast_endpoint(*args: Any, **kwargs: Any) -> Any:
+            return render(endpoint(*args, **kwargs))
+
+    setattr(fast_endpoint, _ORIGINAL_ENDPOINT, endpoint)
+    return fast_endpoint
+
+
+def _sets_response_headers(endpoint: Callable[..., Any]) -> bool:
+    # Headers set on an injected Response are dropped when a Response is returned.
+    return any(
+        isinstance(parameter.annotation, type) and issubclass(parameter.annotation, Response)
+        for parameter in get_typed_signature(endpoint).parameters.values()
+    )
+
+
+def _uses_default_serialization(kwargs: dict[str, Any]) -> bool:
+    if not isinstance(kwargs.get("response_class", DefaultPlaceholder(None)), DefaultPlaceholder):
+        return False
+    if kwargs.get("response_model_include") or kwargs.get("response_model_exclude"):
+        return False
+    return not any(
+        kwargs.get(flag)
+        for flag in (
+            "response_model_exclude_unset",
+            "response_model_exclude_defaults",
+            "response_model_exclude_none",
+        )
+    ) and kwargs.get("response_model_by_alias", True)
+
+
+class FastJSONRoute(APIRoute):
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        # include_router rebuilds routes from route.endpoint; never wrap twice.
+        endpoint = getattr(endpoint, _ORIGINAL_ENDPOINT, endpoint)
+        methods = {method.upper() for method in kwargs.get("methods") or ("GET",)}
+        response_model = kwargs.get("response_model", DefaultPlaceholder(None))
+        if isinstance(response_model, DefaultPlaceholder):
+            # Mirror APIRoute: an unset response_model is inferred from the return annotation.
+            annotation = get_typed_return_annotation(endpoint)
+            if isinstance(annotation, type) and issubclass(annotation, Response):
+                annotation = None
+            response_model = annotation
+        status_code = kwargs.get("status_code") or 200
+        if (
+            methods == {"GET"}
+            and _uses_default_serialization(kwargs)
+            and not _sets_response_headers(endpoint)
+        ):
+            endpoint = _fast_endpoint(endpoint, response_model, status_code)
+        super().__init__(path, endpoint, **kwargs)
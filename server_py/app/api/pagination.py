@@ -0,0 +1,49 @@
+"""Opaque keyset cursors shared by the paginated listings.
+
+A cursor is the sort key of the last row on a page, JSON-encoded and URL-safe
+base64'd without padding. Clients pass it back untouched; anything that does not
+decode to the expected key is rejected with a 400.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from collections.abc import Callable
+from typing import Any
+
+from fastapi import HTTPException
+from sqlalchemy import and_, or_
+
+
+def encode_cursor(*values: str | None) -> str:
+    raw = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *parsers: Callable[[str], Any]) -> tuple[Any, ...]:
+    """Decode ``cursor`` into one value per parser, each read from a string."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if (
+            not isinstance(values, list)
+            or len(values) != len(parsers)
+            or not all(isinstance(value, str) for value in values)
+        ):
+            raise ValueError
+        return tuple(parse(value) for parse, value in zip(parsers, values))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+
+
+def after_keyset(sort_column, id_column, sort_value, id_value, *, descending: bool = False):
+    """Rows after ``(sort_value, id_value)`` in ``sort_column, id_column`` order."""
+    if descending:
+        return or_(
+            sort_column < sort_value,
+            and_(sort_column == sort_value, id_column < id_value),
+        )
+    return or_(
+        sort_column > sort_value,
+        and_(sort_column == sort_value, id_column > id_value),
+    )
@@ -5,6 +5,7 @@ from pydantic import BaseModel
 from sqlmodel import Session
 
 from app.api.deps import require_system_admin
+from app.api.fast_json import FastJSONRoute
 from app.api.serializers.base_item import to_base_item_read
 from app.db.session import get_session
 from app.models.base_item import BaseItemEquipmentCategory, BaseItemKind
@@ -20,14 +21,16 @@ from app.services.base_items import (
     update_base_item,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 
 class BaseItemSeedSyncResult(BaseModel):
     inserted: int
     updated: int
+    unchanged: int = 0
     deactivated: int = 0
     total: int
+    elapsedMs: float | None = None
 
 
 @router.get("/base-items", response_model=list[BaseItemRead])
@@ -5,6 +5,7 @@ from pydantic import BaseModel
 from sqlmodel import Session
 
 from app.api.deps import require_system_admin
+from app.api.fast_json import FastJSONRoute
 from app.api.serializers.base_spell import to_base_spell_read
 from app.db.session import get_session
 from app.models.base_spell import SpellSchool
@@ -20,14 +21,16 @@ from app.services.base_spells import (
     update_base_spell,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 
 class BaseSpellSeedSyncResult(BaseModel):
     inserted: int
     updated: int
+    unchanged: int = 0
     deactivated: int = 0
     total: int
+    elapsedMs: float | None = None
 
 
 @router.get("/base-spells", response_model=list[BaseSpellRead])
@@ -4,27 +4,34 @@ from fastapi import APIRouter, Depends, Query
 from sqlmodel import Session
 
 from app.api.deps import require_system_admin
+from app.api.fast_json import FastJSONRoute
 from app.db.session import get_session
 from app.models.campaign import RoleMode, SystemType
+from app.models.campaign_deletion_job import CampaignDeletionStatus
 from app.models.user import User
 from app.schemas.admin_system import (
-    AdminCampaignRead,
+    AdminCampaignDeletionRead,
+    AdminCampaignPage,
     AdminDiagnosticsRead,
     AdminOverviewRead,
+    AdminUserPage,
     AdminUserRead,
     AdminUserUpdate,
 )
 from app.services.admin_system import (
     delete_admin_user,
     delete_admin_campaign,
+    get_admin_campaign_deletion,
     get_admin_diagnostics,
     get_admin_overview,
+    list_admin_campaign_deletions,
     list_admin_campaigns,
     list_admin_users,
+    retry_admin_campaign_deletion,
     update_admin_user,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 
 @router.get("/overview", response_model=AdminOverviewRead)
@@ -35,12 +42,13 @@ def admin_overview(
     return get_admin_overview(db=session)
 
 
-@router.get("/users", response_model=list[AdminUserRead])
+@router.get("/users", response_model=AdminUserPage)
 def admin_list_users(
     search: str | None = None,
     role: RoleMode | None = None,
     is_system_admin: bool | None = Query(None, alias="is_system_admin"),
     limit: int = Query(100, ge=1, le=500),
+    cursor: str | None = None,
     _user: User = Depends(require_system_admin),
     session: Session = Depends(get_session),
 ):
@@ -50,6 +58,7 @@ def admin_list_users(
         role=role,
         is_system_admin=is_system_admin,
         limit=limit,
+        cursor=cursor,
     )
 
 
@@ -73,11 +82,12 @@ def admin_delete_user(
     return None
 
 
-@router.get("/campaigns", response_model=list[AdminCampaignRead])
+@router.get("/campaigns", response_model=AdminCampaignPage)
 def admin_list_campaigns(
     search: str | None = None,
     system: SystemType | None = None,
     limit: int = Query(100, ge=1, le=500),
+    cursor: str | None = None,
     _user: User = Depends(require_system_admin),
     session: Session = Depends(get_session),
 ):
@@ -86,17 +96,53 @@ def admin_list_campaigns(
         search=search,
         system=system,
         limit=limit,
+        cursor=cursor,
     )
 
 
-@router.delete("/campaigns/{campaign_id}", status_code=204)
+@router.delete(
+    "/campaigns/{campaign_id}",
+    status_code=202,
+    response_model=AdminCampaignDeletionRead,
+)
 def admin_delete_campaign(
     campaign_id: str,
+    user: User = Depends(require_system_admin),
+    session: Session = Depends(get_session),
+):
+    return delete_admin_campaign(db=session, campaign_id=campaign_id, requested_by_user_id=user.id)
+
+
+@router.get("/campaign-deletions", response_model=list[AdminCampaignDeletionRead])
+def admin_list_campaign_deletions(
+    status: CampaignDeletionStatus | None = None,
+    limit: int = Query(50, ge=1, le=200),
     _user: User = Depends(require_system_admin),
     session: Session = Depends(get_session),
 ):
-    delete_admin_campaign(db=session, campaign_id=campaign_id)
-    return None
+    return list_admin_campaign_deletions(db=session, status=status, limit=limit)
+
+
+@router.get("/campaign-deletions/{job_id}", response_model=AdminCampaignDeletionRead)
+def admin_get_campaign_deletion(
+    job_id: str,
+    _user: User = Depends(require_system_admin),
+    session: Session = Depends(get_session),
+):
+    return get_admin_campaign_deletion(db=session, job_id=job_id)
+
+
+@router.post(
+    "/campaign-deletions/{job_id}/retry",
+    status_code=202,
+    response_model=AdminCampaignDeletionRead,
+)
+def admin_retry_campaign_deletion(
+    job_id: str,
+    _user: User = Depends(require_system_admin),
+    session: Session = Depends(get_session),
+):
+    return retry_admin_campaign_deletion(db=session, job_id=job_id)
 
 
 @router.get("/diagnostics", response_model=AdminDiagnosticsRead)
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session
 
 from app.api.deps import get_current_user
+from app.api.fast_json import FastJSONRoute
 from app.api.serializers.base_item import to_base_item_read
 from app.db.session import get_session
 from app.models.base_item import BaseItemKind
@@ -13,7 +14,7 @@ from app.services.base_items import (
     list_base_items as list_catalog_base_items,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 
 @router.get("", response_model=list[BaseItemRead])
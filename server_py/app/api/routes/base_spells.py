@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlmodel import Session
 
 from app.api.deps import get_current_user
+from app.api.fast_json import FastJSONRoute
 from app.api.serializers.base_spell import to_base_spell_read
 from app.db.session import get_session
 from app.models.base_spell import SpellSchool
@@ -13,7 +14,7 @@ from app.services.base_spells import (
     list_base_spells as list_catalog_base_spells,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 
 @router.get("", response_model=list[BaseSpellRead])
@@ -5,6 +5,7 @@ from pydantic import BaseModel
 from sqlmodel import Session, select
 
 from app.api.deps import get_current_user, require_campaign_member, require_gm
+from app.api.fast_json import FastJSONRoute
 from app.api.serializers.item import to_item_read
 from app.db.session import get_session
 from app.models.base_item import BaseItemKind
@@ -13,7 +14,7 @@ from app.models.user import User
 from app.schemas.item import ItemRead
 from app.services.campaign_catalog import list_campaign_catalog, snapshot_campaign_catalog
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 
 class CatalogSeedResult(BaseModel):
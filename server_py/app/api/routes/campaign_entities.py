@@ -1,10 +1,12 @@
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
+from sqlalchemy import func
 from sqlmodel import Session, select
 
 from app.api.deps import get_current_user, require_campaign_member, require_gm
+from app.api.pagination import after_keyset, decode_cursor, encode_cursor
 from app.db.session import get_session
 from app.models.campaign_entity import CampaignEntity
 from app.models.session import Session as SessionModel, SessionStatus
@@ -17,6 +19,8 @@ from app.schemas.campaign_entity import (
     CampaignEntityCreate,
     CampaignEntityPublicRead,
     CampaignEntityRead,
+    CampaignEntitySummaryPage,
+    CampaignEntitySummaryRead,
     CampaignEntityUpdate,
     EntitySenses,
     EntitySpellcasting,
@@ -24,6 +28,22 @@ from app.schemas.campaign_entity import (
 
 router = APIRouter()
 
+SUMMARY_PAGE_DEFAULT = 50
+SUMMARY_PAGE_MAX = 200
+_SUMMARY_COLUMNS = (
+    CampaignEntity.id,
+    CampaignEntity.campaign_id,
+    CampaignEntity.name,
+    CampaignEntity.category,
+    CampaignEntity.size,
+    CampaignEntity.creature_type,
+    CampaignEntity.creature_subtype,
+    CampaignEntity.image_url,
+    CampaignEntity.armor_class,
+    CampaignEntity.max_hp,
+    CampaignEntity.initiative_bonus,
+)
+
 
 def _model_to_dict(value: BaseModel | None) -> dict | None:
     if value is None:
@@ -125,6 +145,65 @@ def to_campaign_entity_public_read(entry: CampaignEntity) -> CampaignEntityPubli
     )
 
 
+def _revealed_entity_ids(campaign_id: str):
+    return (
+        select(SessionEntity.campaign_entity_id)
+        .join(SessionModel, SessionModel.id == SessionEntity.session_id)
+        .where(
+            SessionModel.campaign_id == campaign_id,
+            SessionEntity.visible_to_players == True,
+            SessionModel.status == SessionStatus.ACTIVE,
+        )
+    )
+
+
+def list_campaign_entity_summaries(
+    session: Session,
+    campaign_id: str,
+    *,
+    limit: int,
+    cursor: str | None = None,
+    search: str | None = None,
+    category: str | None = None,
+    revealed_only: bool = False,
+) -> CampaignEntitySummaryPage:
+    """One page of the bestiary, ordered by (name, id), without the statblock columns."""
+    statement = select(*_SUMMARY_COLUMNS).where(CampaignEntity.campaign_id == campaign_id)
+    if revealed_only:
+        statement = statement.where(CampaignEntity.id.in_(_revealed_entity_ids(campaign_id)))
+    if category:
+        statement = statement.where(CampaignEntity.category == category)
+    if search and search.strip():
+        pattern = f"%{search.strip().lower()}%"
+        statement = statement.where(func.lower(CampaignEntity.name).like(pattern))
+    if cursor:
+        after_name, after_id = decode_cursor(cursor, str, str)
+        statement = statement.where(
+            after_keyset(CampaignEntity.name, CampaignEntity.id, after_name, after_id)
+        )
+    rows = session.exec(
+        statement.order_by(CampaignEntity.name, CampaignEntity.id).limit(limit + 1)
+    ).all()
+    items = [
+        CampaignEntitySummaryRead(
+            id=row.id,
+            campaignId=row.campaign_id,
+            name=row.name,
+            category=row.category,
+            size=row.size,
+            creatureType=row.creature_type,
+            creatureSubtype=row.creature_subtype,
+            imageUrl=row.image_url,
+            armorClass=row.armor_class,
+            maxHp=row.max_hp,
+            initiativeBonus=row.initiative_bonus,
+        )
+        for row in rows[:limit]
+    ]
+    next_cursor = encode_cursor(items[-1].name, items[-1].id) if len(rows) > limit else None
+    return CampaignEntitySummaryPage(items=items, nextCursor=next_cursor)
+
+
 @router.get("/{campaign_id}/entities", response_model=list[CampaignEntityRead])
 def list_campaign_entities(
     campaign_id: str,
@@ -141,6 +220,27 @@ def list_campaign_entities(
     return [to_campaign_entity_read(e) for e in entries]
 
 
+@router.get("/{campaign_id}/entities/summary", response_model=CampaignEntitySummaryPage)
+def list_campaign_entity_summary(
+    campaign_id: str,
+    limit: int = Query(default=SUMMARY_PAGE_DEFAULT, ge=1, le=SUMMARY_PAGE_MAX),
+    cursor: str | None = None,
+    search: str | None = None,
+    category: str | None = None,
+    user: User = Depends(get_current_user),
+    session: Session = Depends(get_session),
+):
+    require_gm(campaign_id, user, session)
+    return list_campaign_entity_summaries(
+        session,
+        campaign_id,
+        limit=limit,
+        cursor=cursor,
+        search=search,
+        category=category,
+    )
+
+
 @router.post("/{campaign_id}/entities", response_model=CampaignEntityRead, status_code=201)
 def create_campaign_entity(
     campaign_id: str,
@@ -280,3 +380,65 @@ def list_public_campaign_entities(
     )
     entries = session.exec(statement).all()
     return [to_campaign_entity_public_read(e) for e in entries]
+
+
+@router.get("/{campaign_id}/entities/public/summary", response_model=CampaignEntitySummaryPage)
+def list_public_campaign_entity_summary(
+    campaign_id: str,
+    limit: int = Query(default=SUMMARY_PAGE_DEFAULT, ge=1, le=SUMMARY_PAGE_MAX),
+    cursor: str | None = None,
+    search: str | None = None,
+    category: str | None = None,
+    user: User = Depends(get_current_user),
+    session: Session = Depends(get_session),
+):
+    require_campaign_member(campaign_id, user, session)
+    return list_campaign_entity_summaries(
+        session,
+        campaign_id,
+        limit=limit,
+        cursor=cursor,
+        search=search,
+        category=category,
+        revealed_only=True,
+    )
+
+
+@router.get("/{campaign_id}/entities/public/{entity_id}", response_model=CampaignEntityPublicRead)
+def get_public_campaign_entity(
+    campaign_id: str,
+    entity_id: str,
+    user: User = Depends(get_current_user),
+    session: Session = Depends(get_session),
+):
+    require_campaign_member(campaign_id, user, session)
+    entry = session.exec(
+        select(CampaignEntity).where(
+            CampaignEntity.id == entity_id,
+            CampaignEntity.campaign_id == campaign_id,
+            CampaignEntity.id.in_(_revealed_entity_ids(campaign_id)),
+        )
+    ).first()
+    if not entry:
+        raise HTTPException(status_code=404, detail="Entity not found")
+    return to_campaign_entity_public_read(entry)
+
+
+# Declared after the static /entities/... paths so they are not captured as ids.
+@router.get("/{campaign_id}/entities/{entity_id}", response_model=CampaignEntityRead)
+def get_campaign_entity(
+    campaign_id: str,
+    entity_id: str,
+    user: User = Depends(get_current_user),
+    session: Session = Depends(get_session),
+):
+    require_gm(campaign_id, user, session)
+    entry = session.exec(
+        select(CampaignEntity).where(
+            CampaignEntity.id == entity_id,
+            CampaignEntity.campaign_id == campaign_id,
+        )
+    ).first()
+    if not entry:
+        raise HTTPException(status_code=404, detail="Entity not found")
+    return to_campaign_entity_read(entry)
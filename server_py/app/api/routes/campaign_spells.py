@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlmodel import Session, select
 
 from app.api.deps import get_current_user, require_campaign_member, require_gm
+from app.api.fast_json import FastJSONRoute
 from app.db.session import get_session
 from app.models.base_spell import SpellSchool
 from app.models.campaign import Campaign
@@ -15,7 +16,7 @@ from app.services.campaign_spells import (
     update_campaign_spell,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 
 def to_campaign_spell_read(
@@ -19,7 +19,7 @@ from app.schemas.campaign import (
     CampaignUpdate,
 )
 from app.services.campaign_catalog import snapshot_campaign_catalog
-from app.services.campaign_cleanup import delete_campaign_tree
+from app.services.campaign_deletion import request_campaign_deletion
 from app.services.campaign_spells import snapshot_campaign_spells
 
 router = APIRouter()
@@ -77,7 +77,10 @@ def list_campaigns(
             CampaignMember.role_mode,
         )
         .join(CampaignMember, CampaignMember.campaign_id == Campaign.id)
-        .where(CampaignMember.user_id == user.id)
+        .where(
+            CampaignMember.user_id == user.id,
+            Campaign.deletion_requested_at.is_(None),  # type: ignore[union-attr]
+        )
         .order_by(Campaign.created_at.desc())
     )
     entries = session.exec(statement).all()
@@ -227,6 +230,6 @@ def delete_campaign(
     session: Session = Depends(get_session),
 ):
     campaign, _member = require_gm(campaign_id, user, session)
-    delete_campaign_tree(session, campaign)
+    request_campaign_deletion(session, campaign, requested_by_user_id=user.id)
     session.commit()
     return None
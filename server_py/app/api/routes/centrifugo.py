@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
 from pydantic import BaseModel
 from sqlmodel import Session, select
 
@@ -11,6 +13,7 @@ from app.models.party import Party
 from app.models.party_member import PartyMember, PartyMemberStatus
 from app.models.session import Session as CampaignSession, SessionStatus
 from app.models.user import User
+from app.services.realtime_replay import list_realtime_events_since
 
 import time
 
@@ -29,6 +32,14 @@ class SubscribeResponse(BaseModel):
     token: str
 
 
+class RealtimeReplayResponse(BaseModel):
+    channel: str
+    lastSeq: int
+    events: list[dict[str, Any]]
+    truncated: bool
+    hasMore: bool
+
+
 @router.post("/centrifugo/connection-token", response_model=ConnectionTokenResponse)
 def connection_token(user: User = Depends(get_current_user)):
     payload = {
@@ -50,18 +61,7 @@ def subscribe_token(
     session: Session = Depends(get_session),
 ):
     channel = body.channel
-    parts = channel.split(":", 1)
-    if len(parts) != 2:
-        raise HTTPException(status_code=400, detail="Invalid channel format")
-
-    namespace, resource_id = parts
-
-    if namespace == "campaign":
-        member = _validate_campaign_access(session, resource_id, user.id)
-    elif namespace == "session":
-        member = _validate_session_access(session, resource_id, user.id)
-    else:
-        raise HTTPException(status_code=400, detail="Unknown channel namespace")
+    member = _validate_channel_access(session, channel, user.id)
 
     display_name = member.display_name if member else (user.display_name or user.username)
 
@@ -80,6 +80,44 @@ def subscribe_token(
     return SubscribeResponse(token=token)
 
 
+@router.get("/realtime/{channel}/since/{seq}", response_model=RealtimeReplayResponse)
+def replay_channel(
+    channel: str,
+    seq: int = Path(ge=0),
+    limit: int = Query(default=200, ge=1, le=500),
+    user: User = Depends(get_current_user),
+    session: Session = Depends(get_session),
+):
+    """Events published on ``channel`` after ``seq``, oldest first.
+
+    ``truncated`` means some of the missed events are no longer buffered and the
+    client has to refetch its state (e.g. the session snapshot) instead.
+    """
+    _validate_channel_access(session, channel, user.id)
+    replay = list_realtime_events_since(session, channel, seq, limit)
+    return RealtimeReplayResponse(
+        channel=replay.channel,
+        lastSeq=replay.last_seq,
+        events=replay.events,
+        truncated=replay.truncated,
+        hasMore=replay.has_more,
+    )
+
+
+def _validate_channel_access(session: Session, channel: str, user_id: str) -> CampaignMember:
+    parts = channel.split(":", 1)
+    if len(parts) != 2:
+        raise HTTPException(status_code=400, detail="Invalid channel format")
+
+    namespace, resource_id = parts
+
+    if namespace == "campaign":
+        return _validate_campaign_access(session, resource_id, user_id)
+    if namespace == "session":
+        return _validate_session_access(session, resource_id, user_id)
+    raise HTTPException(status_code=400, detail="Unknown channel namespace")
+
+
 def _validate_campaign_access(
     session: Session,
     campaign_id: str,
@@ -17,6 +17,7 @@ from app.schemas.character_sheet import (
     CharacterSheetRead,
     CharacterSheetUpdate,
 )
+from app.services.campaign_deletion import is_campaign_pending_deletion
 from app.services.character_sheet_inventory import sync_character_sheet_inventory
 from app.services.centrifugo import centrifugo
 from app.services.dragonborn_breath_weapon import apply_dragonborn_breath_weapon_canonical_state
@@ -52,7 +53,7 @@ def party_id(party: Party) -> str:
 
 def get_party_or_404(party_id_value: str, session: Session) -> Party:
     party = session.get(Party, party_id_value)
-    if party is None:
+    if party is None or is_campaign_pending_deletion(session, party.campaign_id):
         raise HTTPException(status_code=404, detail="Party not found")
     return party
 
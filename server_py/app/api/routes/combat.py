@@ -1,12 +1,13 @@
-from fastapi import APIRouter, Depends
-from sqlmodel import Session, select
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import Session
 
 from app.api.deps import get_current_user, get_session
+from app.api.fast_json import FastJSONRoute
 from app.api.routes.sessions._shared import record_session_activity
+from app.api.routes.sessions.state_common import require_session_view_access
+from app.db.loaders import load_campaign_member, load_session
 from app.models.campaign import RoleMode
-from app.models.campaign_member import CampaignMember
 from app.models.combat import CombatState
-from app.models.session import Session as CampaignSession
 from app.models.user import User
 from app.schemas.combat import (
     CombatApplyDamageRequest,
@@ -32,83 +33,117 @@ from app.schemas.combat import (
     CombatStartRequest,
     CombatWildShapeAttackRequest,
 )
+from app.services.campaign_deletion import is_campaign_pending_deletion
 from app.services.centrifugo import centrifugo
 from app.services.combat import CombatService, CombatServiceError
+from app.services.combat_service.command_log import combat_command, list_combat_log_entries
 from app.services.realtime import build_event, campaign_channel, event_version, session_channel
 
-router = APIRouter()
+
+def _reject_pending_deletion(session_id: str, db: Session = Depends(get_session)) -> None:
+    """Combat writes rows the deletion job may already have cleared; stop them early."""
+    session_entry = load_session(db, session_id)
+    if session_entry and is_campaign_pending_deletion(db, session_entry.campaign_id):
+        raise HTTPException(status_code=404, detail="Session not found")
+
+
+router = APIRouter(route_class=FastJSONRoute, dependencies=[Depends(_reject_pending_deletion)])
 
 
 def _is_session_gm(db: Session, session_id: str, user: User) -> bool:
     """Check if user is GM in the campaign that owns this session."""
-    session_entry = db.exec(
-        select(CampaignSession).where(CampaignSession.id == session_id)
-    ).first()
+    session_entry = load_session(db, session_id)
     if not session_entry:
         return False
-    member = db.exec(
-        select(CampaignMember).where(
-            CampaignMember.campaign_id == session_entry.campaign_id,
-            CampaignMember.user_id == user.id,
-        )
-    ).first()
+    member = load_campaign_member(db, session_entry.campaign_id, user.id)
     return member is not None and member.role_mode == RoleMode.GM
 
 
-async def _publish_roll_result(
-    db: Session,
-    session_id: str,
-    user: User,
-    result,
-) -> None:
+def _roll_payload(result) -> tuple[dict, object] | None:
     if result is None:
-        return
+        return None
     if isinstance(result, dict):
         timestamp = result.get("timestamp")
         payload = dict(result)
     else:
         timestamp = result.timestamp
         payload = result.model_dump(mode="json")
-
     if timestamp is None:
+        return None
+    return payload, timestamp
+
+
+async def _publish_roll_results(
+    db: Session,
+    session_id: str,
+    user: User,
+    results: list,
+) -> None:
+    """Record every roll of one action, commit once and publish them together.
+
+    A single roll goes out as ``roll_resolved``; several (an area spell's saves
+    and concentration checks) go out as one ``rolls_resolved`` event, so the
+    number of commits and messages does not grow with the target count.
+    """
+    rolls = [roll for roll in (_roll_payload(result) for result in results) if roll is not None]
+    if not rolls:
         return
 
-    session_entry = db.exec(select(CampaignSession).where(CampaignSession.id == session_id)).first()
+    session_entry = load_session(db, session_id)
     if not session_entry:
         return
 
-    member = db.exec(
-        select(CampaignMember).where(
-            CampaignMember.campaign_id == session_entry.campaign_id,
-            CampaignMember.user_id == user.id,
-        )
-    ).first()
+    member = load_campaign_member(db, session_entry.campaign_id, user.id)
     if not member or not member.id:
         return
 
-    payload["partyId"] = session_entry.party_id
-
-    await centrifugo.publish(
-        session_channel(session_entry.id),
-        build_event("roll_resolved", payload, version=event_version(timestamp)),
-    )
-    await centrifugo.publish(
-        campaign_channel(session_entry.campaign_id),
-        build_event("roll_resolved", payload, version=event_version(timestamp)),
-    )
-
-    record_session_activity(
-        session_entry,
-        "roll_resolved",
-        db,
-        member_id=member.id,
-        user_id=user.id,
-        actor_name=member.display_name,
-        payload=payload,
-        created_at=timestamp,
-    )
+    for payload, timestamp in rolls:
+        payload["partyId"] = session_entry.party_id
+        record_session_activity(
+            session_entry,
+            "roll_resolved",
+            db,
+            member_id=member.id,
+            user_id=user.id,
+            actor_name=member.display_name,
+            payload=payload,
+            created_at=timestamp,
+        )
     db.commit()
 
+    if len(rolls) == 1:
+        payload, timestamp = rolls[0]
+        event_type = "roll_resolved"
+    else:
+        payload = {
+            "sessionId": session_entry.id,
+            "partyId": session_entry.party_id,
+            "results": [roll_payload for roll_payload, _ in rolls],
+        }
+        timestamp = max(roll_timestamp for _, roll_timestamp in rolls)
+        event_type = "rolls_resolved"
+    event = build_event(event_type, payload, version=event_version(timestamp))
+    await centrifugo.publish(session_channel(session_entry.id), event)
+    await centrifugo.publish(campaign_channel(session_entry.campaign_id), event)
+
+
+def _concentration_roll(result: dict):
+    concentration_check = result.get("concentration_check")
+    return concentration_check.get("roll_result") if isinstance(concentration_check, dict) else None
+
+
+def _spell_roll_results(result: dict, *, include_saves: bool) -> list:
+    """Save and concentration rolls of every spell target, primary target first."""
+    targets = result.get("targets")
+    entries = targets if isinstance(targets, list) and targets else [result]
+    rolls = []
+    for entry in entries:
+        if include_saves:
+            rolls.append(entry.get("roll_result"))
+        rolls.append(_concentration_roll(entry))
+    return rolls
+
+
 @router.get("/sessions/{session_id}/combat")
 def get_combat_state(
     session_id: str,
@@ -121,6 +156,20 @@ def get_combat_state(
     return state
 
 
+@router.get("/sessions/{session_id}/combat/log")
+def get_combat_log(
+    session_id: str,
+    limit: int = Query(default=50, ge=1, le=200),
+    db: Session = Depends(get_session),
+    user: User = Depends(get_current_user),
+):
+    session_entry = load_session(db, session_id)
+    if not session_entry:
+        raise HTTPException(status_code=404, detail="Session not found")
+    require_session_view_access(session_entry, user, db)
+    return list_combat_log_entries(db, session_id, limit)
+
+
 @router.post("/sessions/{session_id}/combat/start", response_model=CombatState)
 async def start_combat(
     session_id: str,
@@ -130,7 +179,8 @@ async def start_combat(
 ):
     if not _is_session_gm(db, session_id, user):
         raise CombatServiceError("Only GM can start combat", 403)
-    return await CombatService.start_combat(db, session_id, req)
+    async with combat_command(session_id):
+        return await CombatService.start_combat(db, session_id, req)
 
 
 @router.put("/sessions/{session_id}/combat/initiative", response_model=CombatState)
@@ -142,7 +192,8 @@ async def set_initiative(
 ):
     if not _is_session_gm(db, session_id, user):
         raise CombatServiceError("Only GM can set initiative", 403)
-    return await CombatService.set_initiative(db, session_id, req)
+    async with combat_command(session_id):
+        return await CombatService.set_initiative(db, session_id, req)
 
 
 @router.post("/sessions/{session_id}/combat/turn/next", response_model=CombatState)
@@ -152,13 +203,14 @@ async def next_turn(
     db: Session = Depends(get_session),
     user: User = Depends(get_current_user),
 ):
-    return await CombatService.next_turn(
-        db,
-        session_id,
-        user.id,
-        _is_session_gm(db, session_id, user),
-        req.actor_participant_id,
-    )
+    async with combat_command(session_id):
+        return await CombatService.next_turn(
+            db,
+            session_id,
+            user.id,
+            _is_session_gm(db, session_id, user),
+            req.actor_participant_id,
+        )
 
 
 @router.post("/sessions/{session_id}/combat/end", response_model=CombatState)
@@ -167,7 +219,8 @@ async def end_combat(
     db: Session = Depends(get_session),
     user: User = Depends(get_current_user),
 ):
-    return await CombatService.end_combat(db, session_id, _is_session_gm(db, session_id, user))
+    async with combat_command(session_id):
+        return await CombatService.end_combat(db, session_id, _is_session_gm(db, session_id, user))
 
 
 @router.post("/sessions/{session_id}/combat/action/attack", response_model=CombatAttackResult)
@@ -177,9 +230,10 @@ async def action_attack(
     db: Session = Depends(get_session),
     user: User = Depends(get_current_user),
 ):
-    result = await CombatService.attack(db, session_id, req, user.id, _is_session_gm(db, session_id, user))
-    await _publish_roll_result(db, session_id, user, result.get("roll_result"))
-    return result
+    async with combat_command(session_id):
+        result = await CombatService.attack(db, session_id, req, user.id, _is_session_gm(db, session_id, user))
+        await _publish_roll_results(db, session_id, user, [result.get("roll_result")])
+        return result
 
 
 @router.post("/sessions/{session_id}/combat/action/attack/damage", response_model=CombatAttackResult)
@@ -189,14 +243,10 @@ async def action_attack_damage(
     db: Session = Depends(get_session),
     user: User = Depends(get_current_user),
 ):
-    result = await CombatService.attack_damage(db, session_id, req, user.id, _is_session_gm(db, session_id, user))
-    concentration_roll = (
-        result.get("concentration_check", {}).get("roll_result")
-        if isinstance(result.get("concentration_check"), dict)
-        else None
-    )
-    await _publish_roll_result(db, session_id, user, concentration_roll)
-    return result
+    async with combat_command(session_id):
+        result = await CombatService.attack_damage(db, session_id, req, user.id, _is_session_gm(db, session_id, user))
+        await _publish_roll_results(db, session_id, user, [_concentration_roll(result)])
+        return result
 
 
 @router.post("/sessions/{session_id}/combat/action/wild-shape-attack", response_model=CombatAttackResult)
@@ -206,9 +256,10 @@ async def action_wild_shape_attack(
     db: Session = Depends(get_session),
     user: User = Depends(get_current_user),
 ):
-    result = await CombatService.wild_shape_attack(db, session_id, req, user.id, _is_session_gm(db, session_id, user))
-    await _publish_roll_result(db, session_id, user, result.get("roll_result"))
-    return result
+    async with combat_command(session_id):
+        result = await CombatService.wild_shape_attack(db, session_id, req, user.id, _is_session_gm(db, session_id, user))
+        await _publish_roll_results(db, session_id, user, [result.get("roll_result")])
+        return result
 
 
 @router.post("/sessions/{session_id}/combat/action/cast", response_model=CombatSpellResult)
@@ -218,15 +269,10 @@ async def action_cast_spell(
     db: Session = Depends(get_session),
     user: User = Depends(get_current_user),
 ):
-    result = await CombatService.cast_spell(db, session_id, req, user.id, _is_session_gm(db, session_id, user))
-    await _publish_roll_result(db, session_id, user, result.get("roll_result"))
-    concentration_roll = (
-        result.get("concentration_check", {}).get("roll_result")
-        if isinstance(result.get("concentration_check"), dict)
-        else None
-    )
-    await _publish_roll_result(db, session_id, user, concentration_roll)
-    return result
+    async with combat_command(session_id):
+        result = await CombatService.cast_spell(db, session_id, req, user.id, _is_session_gm(db, session_id, user))
+        await _publish_roll_results(db, session_id, user, _spell_roll_results(result, include_saves=True))
+        return result
 
 
 @router.post("/sessions/{session_id}/combat/action/cast/effect", response_model=CombatSpellResult)
@@ -236,14 +282,10 @@ async def action_cast_spell_effect(
     db: Session = Depends(get_session),
     user: User = Depends(get_current_user),
 ):
-    result = await CombatService.cast_spell_effect(db, session_id, req, user.id, _is_session_gm(db, session_id, user))
-    concentration_roll = (
-        result.get("concentration_check", {}).get("roll_result")
-        if isinstance(result.get("concentration_check"), dict)
-        else None
-    )
-    await _publish_roll_result(db, session_id, user, concentration_roll)
-    return result
+    async with combat_command(session_id):
+        result = await CombatService.cast_spell_effect(db, session_id, req, user.id, _is_session_gm(db, session_id, user))
+        await _publish_roll_results(db, session_id, user, _spell_roll_results(result, include_saves=False))
+        return result
 
 
 @router.post("/sessions/{session_id}/combat/action/entity", response_model=CombatEntityActionResult)
@@ -253,15 +295,15 @@ async def action_entity(
     db: Session = Depends(get_session),
     user: User = Depends(get_current_user),
 ):
-    result = await CombatService.entity_action(db, session_id, req, user.id, _is_session_gm(db, session_id, user))
-    await _publish_roll_result(db, session_id, user, result.get("roll_result"))
-    concentration_roll = (
-        result.get("concentration_check", {}).get("roll_result")
-        if isinstance(result.get("concentration_check"), dict)
-        else None
-    )
-    await _publish_roll_result(db, session_id, user, concentration_roll)
-    return result
+    async with combat_command(session_id):
+        result = await CombatService.entity_action(db, session_id, req, user.id, _is_session_gm(db, session_id, user))
+        await _publish_roll_results(
+            db,
+            session_id,
+            user,
+            [result.get("roll_result"), _concentration_roll(result)],
+        )
+        return result
 
 
 @router.post("/sessions/{session_id}/combat/action/entity/damage", response_model=CombatEntityActionResult)
@@ -271,14 +313,10 @@ async def action_entity_damage(
     db: Session = Depends(get_session),
     user: User = Depends(get_current_user),
 ):
-    result = await CombatService.entity_action_damage(db, session_id, req, user.id, _is_session_gm(db, session_id, user))
-    concentration_roll = (
-        result.get("concentration_check", {}).get("roll_result")
-        if isinstance(result.get("concentration_check"), dict)
-        else None
-    )
-    await _publish_roll_result(db, session_id, user, concentration_roll)
-    return result
+    async with combat_command(session_id):
+        result = await CombatService.entity_action_damage(db, session_id, req, user.id, _is_session_gm(db, session_id, user))
+        await _publish_roll_results(db, session_id, user, [_concentration_roll(result)])
+        return result
 
 
 @router.post("/sessions/{session_id}/combat/action/apply-damage")
@@ -288,14 +326,10 @@ async def action_apply_damage(
     db: Session = Depends(get_session),
     user: User = Depends(get_current_user),
 ):
-    result = await CombatService.apply_damage(db, session_id, req, user.id, _is_session_gm(db, session_id, user))
-    concentration_roll = (
-        result.get("concentration_check", {}).get("roll_result")
-        if isinstance(result.get("concentration_check"), dict)
-        else None
-    )
-    await _publish_roll_result(db, session_id, user, concentration_roll)
-    return result
+    async with combat_command(session_id):
+        result = await CombatService.apply_damage(db, session_id, req, user.id, _is_session_gm(db, session_id, user))
+        await _publish_roll_results(db, session_id, user, [_concentration_roll(result)])
+        return result
 
 
 @router.post("/sessions/{session_id}/combat/action/apply-healing")
@@ -305,7 +339,8 @@ async def action_apply_healing(
     db: Session = Depends(get_session),
     user: User = Depends(get_current_user),
 ):
-    return await CombatService.apply_healing(db, session_id, req, user.id, _is_session_gm(db, session_id, user))
+    async with combat_command(session_id):
+        return await CombatService.apply_healing(db, session_id, req, user.id, _is_session_gm(db, session_id, user))
 
 
 @router.post("/sessions/{session_id}/combat/action/death-save")
@@ -315,13 +350,14 @@ async def action_death_save(
     db: Session = Depends(get_session),
     user: User = Depends(get_current_user),
 ):
-    return await CombatService.death_save(
-        db,
-        session_id,
-        user.id,
-        _is_session_gm(db, session_id, user),
-        req.actor_participant_id,
-    )
+    async with combat_command(session_id):
+        return await CombatService.death_save(
+            db,
+            session_id,
+            user.id,
+            _is_session_gm(db, session_id, user),
+            req.actor_participant_id,
+        )
 
 
 # --- Standard Actions ---
@@ -334,10 +370,10 @@ async def action_standard(
     db: Session = Depends(get_session),
     user: User = Depends(get_current_user),
 ):
-    result = await CombatService.standard_action(db, session_id, req, user.id, _is_session_gm(db, session_id, user))
-    if result.get("roll_result"):
-        await _publish_roll_result(db, session_id, user, result["roll_result"])
-    return result
+    async with combat_command(session_id):
+        result = await CombatService.standard_action(db, session_id, req, user.id, _is_session_gm(db, session_id, user))
+        await _publish_roll_results(db, session_id, user, [result.get("roll_result")])
+        return result
 
 
 # --- Action Economy ---
@@ -352,7 +388,8 @@ async def action_consume_reaction(
 ):
     if not _is_session_gm(db, session_id, user):
         raise CombatServiceError("Players can only request reactions, not consume directly.", 403)
-    return await CombatService.consume_reaction(db, session_id, req, user.id, _is_session_gm(db, session_id, user))
+    async with combat_command(session_id):
+        return await CombatService.consume_reaction(db, session_id, req, user.id, _is_session_gm(db, session_id, user))
 
 
 @router.post("/sessions/{session_id}/combat/action/reaction/request")
@@ -362,7 +399,8 @@ async def action_reaction_request(
     db: Session = Depends(get_session),
     user: User = Depends(get_current_user),
 ):
-    return await CombatService.request_reaction(db, session_id, req, user.id)
+    async with combat_command(session_id):
+        return await CombatService.request_reaction(db, session_id, req, user.id)
 
 
 @router.post("/sessions/{session_id}/combat/action/reaction/resolve")
@@ -374,7 +412,8 @@ async def action_reaction_resolve(
 ):
     if not _is_session_gm(db, session_id, user):
         raise CombatServiceError("Only GM can resolve reaction requests.", 403)
-    return await CombatService.resolve_reaction(db, session_id, req)
+    async with combat_command(session_id):
+        return await CombatService.resolve_reaction(db, session_id, req)
 
 
 # --- Active Effects ---
@@ -389,7 +428,8 @@ async def apply_effect(
 ):
     if not _is_session_gm(db, session_id, user):
         raise CombatServiceError("Only GM can apply effects", 403)
-    return await CombatService.apply_effect(db, session_id, req)
+    async with combat_command(session_id):
+        return await CombatService.apply_effect(db, session_id, req)
 
 
 @router.post("/sessions/{session_id}/combat/effects/remove")
@@ -401,7 +441,8 @@ async def remove_effect(
 ):
     if not _is_session_gm(db, session_id, user):
         raise CombatServiceError("Only GM can remove effects", 403)
-    return await CombatService.remove_effect(db, session_id, req)
+    async with combat_command(session_id):
+        return await CombatService.remove_effect(db, session_id, req)
 
 
 @router.get("/sessions/{session_id}/combat/effects")
@@ -10,12 +10,12 @@ from app.db.session import get_session
 from app.models.campaign import Campaign, RoleMode
 from app.models.campaign_member import CampaignMember
 from app.models.inventory import InventoryItem
-from app.models.item import Item
 from app.models.party import Party
 from app.models.session import Session as CampaignSession, SessionStatus
 from app.models.user import User
 from app.schemas.inventory import InventoryBuy, InventoryRead, InventoryUpdate
-from app.services.inventory_expiration import purge_expired_inventory_items
+from app.services.campaign_catalog import get_campaign_catalog_item
+from app.services.inventory_expiration import inventory_item_not_expired_clause
 from app.services.magic_item_effects import initialize_inventory_item_charges, inventory_item_supports_stacking
 
 router = APIRouter()
@@ -79,18 +79,10 @@ def list_inventory(
     target_member_id = member.id
     if member.role_mode == RoleMode.GM and memberId:
         target_member_id = memberId
-    removed_ids = purge_expired_inventory_items(
-        session,
-        campaign_id=campaign_id,
-        member_id=target_member_id,
-        party_id=partyId,
-        flush=False,
-    )
-    if removed_ids:
-        session.commit()
     filters = [
         InventoryItem.campaign_id == campaign_id,
         InventoryItem.member_id == target_member_id,
+        inventory_item_not_expired_clause(),
     ]
     if partyId:
         filters.append(InventoryItem.party_id == partyId)
@@ -148,7 +140,11 @@ def buy_item(
     ).first()
     if not member:
         raise HTTPException(status_code=403, detail="Not a campaign member")
-    item = session.exec(select(Item).where(Item.id == payload.itemId)).first()
+    item = get_campaign_catalog_item(
+        session,
+        campaign_id=campaign_id,
+        item_id=payload.itemId,
+    )
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
     if item.campaign_id != campaign_id:
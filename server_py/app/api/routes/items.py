@@ -5,18 +5,21 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session, select
 
 from app.api.deps import get_current_user, require_campaign_member, require_gm
+from app.api.fast_json import FastJSONRoute
 from app.api.serializers.item import to_item_read
 from app.db.session import get_session
 from app.models.base_item import BaseItemKind
+from app.models.campaign import Campaign
 from app.models.inventory import InventoryItem
 from app.models.item import Item
 from app.models.item import ItemType
 from app.models.user import User
 from app.schemas.item import ItemCreate, ItemRead, ItemUpdate
+from app.services.campaign_catalog import get_campaign_catalog_item, resolve_campaign_catalog
 from app.services.item_properties import normalize_item_properties
 from app.services.magic_item_effects import validate_campaign_magic_item_effect_reference
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 def _infer_item_kind(item_type: ItemType) -> BaseItemKind | None:
     if item_type == ItemType.WEAPON:
@@ -70,10 +73,14 @@ def list_items(
     session: Session = Depends(get_session),
 ):
     require_campaign_member(campaign_id, user, session)
-    statement = select(Item).where(Item.campaign_id == campaign_id).order_by(
-        Item.created_at.desc()
+    campaign = session.get(Campaign, campaign_id)
+    if not campaign:
+        raise HTTPException(status_code=404, detail="Campaign not found")
+    items = resolve_campaign_catalog(session, campaign)
+    items.sort(
+        key=lambda item: item.created_at.timestamp() if item.created_at is not None else 0.0,
+        reverse=True,
     )
-    items = session.exec(statement).all()
     return [to_item_read(item) for item in items]
 
 
@@ -120,10 +127,8 @@ def update_item(
     session: Session = Depends(get_session),
 ):
     require_gm(campaign_id, user, session)
-    item = session.exec(
-        select(Item).where(Item.id == item_id, Item.campaign_id == campaign_id)
-    ).first()
-    if not item:
+    item = get_campaign_catalog_item(session, campaign_id=campaign_id, item_id=item_id)
+    if not item or item.campaign_id != campaign_id:
         raise HTTPException(status_code=404, detail="Item not found")
     if not payload.name.strip() or not payload.description.strip():
         raise HTTPException(status_code=400, detail="Invalid payload")
@@ -154,10 +159,13 @@ def delete_item(
     session: Session = Depends(get_session),
 ):
     require_gm(campaign_id, user, session)
-    item = session.exec(
-        select(Item).where(Item.id == item_id, Item.campaign_id == campaign_id)
-    ).first()
-    if not item:
+    item = get_campaign_catalog_item(
+        session,
+        campaign_id=campaign_id,
+        item_id=item_id,
+        materialize=False,
+    )
+    if not item or item.campaign_id != campaign_id:
         raise HTTPException(status_code=404, detail="Item not found")
     if item.base_item_id:
         raise HTTPException(
@@ -5,8 +5,10 @@ from datetime import datetime, timezone
 from uuid import uuid4
 
 from fastapi import HTTPException
+from sqlalchemy import case, or_
 from sqlmodel import Session, select
 
+from app.models.campaign import Campaign, RoleMode
 from app.models.campaign_member import CampaignMember
 from app.models.party import Party
 from app.models.party_member import PartyMember, PartyMemberStatus
@@ -14,9 +16,9 @@ from app.models.session import Session as CampaignSession, SessionStatus
 from app.models.user import User
 from app.schemas.party import PartyMemberRead, PartyRead
 from app.schemas.session import ActiveSessionRead
+from app.services.campaign_deletion import is_campaign_pending_deletion
 from app.services.centrifugo import centrifugo
 from app.services.realtime import build_event, campaign_channel, event_version
-from app.models.campaign import RoleMode
 
 logger = logging.getLogger("app.parties")
 
@@ -170,7 +172,7 @@ def ensure_campaign_player_member(
 
 def get_party_or_404(party_id_value: str, session: Session) -> Party:
     party = session.get(Party, party_id_value)
-    if party is None:
+    if party is None or is_campaign_pending_deletion(session, party.campaign_id):
         raise HTTPException(status_code=404, detail="Party not found")
     return party
 
@@ -199,38 +201,44 @@ def get_party_member_or_404(
     return member
 
 
-def list_member_party_ids(member_user_id: str, session: Session) -> list[str]:
-    party_ids = session.exec(
-        select(PartyMember.party_id).where(
-            PartyMember.user_id == member_user_id,
-            PartyMember.status == PartyMemberStatus.JOINED,
-        )
-    ).all()
-    return list(party_ids)
-
-
 def list_parties_for_user(member_user_id: str, session: Session) -> list[Party]:
-    parties_as_gm = list(
-        session.exec(select(Party).where(Party.gm_user_id == member_user_id)).all()
+    joined_party_ids = select(PartyMember.party_id).where(
+        PartyMember.user_id == member_user_id,
+        PartyMember.status == PartyMemberStatus.JOINED,
+    )
+    return list(
+        session.exec(
+            select(Party)
+            .join(Campaign, Campaign.id == Party.campaign_id)
+            .where(
+                or_(Party.gm_user_id == member_user_id, Party.id.in_(joined_party_ids)),
+                Campaign.deletion_requested_at.is_(None),  # type: ignore[union-attr]
+            )
+            .order_by(case((Party.gm_user_id == member_user_id, 0), else_=1), Party.created_at)
+        ).all()
     )
-    parties_by_id: dict[str, Party] = {party_id(party): party for party in parties_as_gm}
-    for member_party_id in list_member_party_ids(member_user_id, session):
-        party = session.get(Party, member_party_id)
-        if party is not None:
-            parties_by_id[party_id(party)] = party
-    return list(parties_by_id.values())
 
 
-def find_active_party_session(
-    party_id_value: str,
+def find_active_party_sessions(
+    party_ids: list[str],
     session: Session,
-) -> CampaignSession | None:
-    return session.exec(
-        select(CampaignSession).where(
-            CampaignSession.party_id == party_id_value,
-            (
-                (CampaignSession.status == SessionStatus.ACTIVE)
-                | (CampaignSession.status == SessionStatus.LOBBY)
-            ),
+    *,
+    statuses: tuple[SessionStatus, ...] = (SessionStatus.ACTIVE, SessionStatus.LOBBY),
+) -> dict[str, CampaignSession]:
+    """Current session per party, preferring ACTIVE over LOBBY, in one query."""
+    if not party_ids:
+        return {}
+    entries = session.exec(
+        select(CampaignSession)
+        .where(CampaignSession.party_id.in_(party_ids), CampaignSession.status.in_(statuses))
+        .order_by(
+            CampaignSession.party_id,
+            case((CampaignSession.status == SessionStatus.ACTIVE, 0), else_=1),
+            CampaignSession.created_at.desc(),
         )
-    ).first()
+    ).all()
+    active_by_party: dict[str, CampaignSession] = {}
+    for entry in entries:
+        if entry.party_id is not None:
+            active_by_party.setdefault(entry.party_id, entry)
+    return active_by_party
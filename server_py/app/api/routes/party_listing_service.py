@@ -8,7 +8,7 @@ from sqlmodel import Session, select
 
 from app.api.routes.party_common import (
     ensure_campaign_player_member,
-    find_active_party_session,
+    find_active_party_sessions,
     get_party_member,
     get_party_member_or_404,
     get_party_or_404,
@@ -24,7 +24,7 @@ from app.api.routes.party_common import (
 from app.models.campaign import Campaign, RoleMode
 from app.models.party import Party
 from app.models.party_member import PartyMember, PartyMemberStatus
-from app.models.session import Session as CampaignSession, SessionStatus
+from app.models.session import SessionStatus
 from app.models.user import User
 from app.schemas.party import (
     PartyActiveSession,
@@ -120,43 +120,41 @@ def list_my_parties_active_sessions_service(
     user: User,
     session: Session,
 ) -> list[PartyActiveSession]:
-    results: list[PartyActiveSession] = []
-    for party in list_parties_for_user(user_id(user), session):
-        active = find_active_party_session(party_id(party), session)
-        results.append(
-            PartyActiveSession(
-                party=party_to_read(party),
-                activeSession=to_active_session_read(active) if active else None,
-            )
+    parties = list_parties_for_user(user_id(user), session)
+    active_by_party = find_active_party_sessions([party_id(party) for party in parties], session)
+    return [
+        PartyActiveSession(
+            party=party_to_read(party),
+            activeSession=to_active_session_read(active) if active else None,
         )
-    return results
+        for party in parties
+        for active in [active_by_party.get(party_id(party))]
+    ]
 
 
 def list_my_party_invites_service(user: User, session: Session) -> list[PartyInviteRead]:
-    invited_entries = list(
+    invites = list(
         session.exec(
-            select(PartyMember).where(
+            select(PartyMember, Party, Campaign)
+            .join(Party, Party.id == PartyMember.party_id)
+            .join(Campaign, Campaign.id == Party.campaign_id)
+            .where(
                 PartyMember.user_id == user_id(user),
                 PartyMember.role == RoleMode.PLAYER,
                 PartyMember.status == PartyMemberStatus.INVITED,
+                Campaign.deletion_requested_at.is_(None),  # type: ignore[union-attr]
             )
         ).all()
     )
+    active_by_party = find_active_party_sessions(
+        [party_id(party) for _member, party, _campaign in invites],
+        session,
+        statuses=(SessionStatus.ACTIVE,),
+    )
 
     output: list[PartyInviteRead] = []
-    for party_member in invited_entries:
-        party = session.get(Party, party_member.party_id)
-        if party is None:
-            continue
-        campaign = session.get(Campaign, party.campaign_id)
-        if campaign is None:
-            continue
-        active = session.exec(
-            select(CampaignSession).where(
-                CampaignSession.party_id == party_id(party),
-                CampaignSession.status == SessionStatus.ACTIVE,
-            )
-        ).first()
+    for party_member, party, campaign in invites:
+        active = active_by_party.get(party_id(party))
         output.append(
             PartyInviteRead(
                 party=party_to_read(party),
@@ -229,17 +227,18 @@ def get_party_details_service(
     if party.gm_user_id != current_user_id and is_member is None:
         raise HTTPException(status_code=403, detail="Not a party member")
 
-    members = list(
-        session.exec(select(PartyMember).where(PartyMember.party_id == party_id_value)).all()
-    )
+    members = session.exec(
+        select(PartyMember, User)
+        .outerjoin(User, User.id == PartyMember.user_id)
+        .where(PartyMember.party_id == party_id_value)
+    ).all()
     formatted_members = [
         party_member_to_read(
             member,
             display_name=member_user.display_name if member_user else None,
             username=member_user.username if member_user else None,
         )
-        for member in members
-        for member_user in [session.get(User, member.user_id)]
+        for member, member_user in members
     ]
 
     return PartyDetail(
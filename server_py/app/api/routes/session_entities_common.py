@@ -10,6 +10,7 @@ from app.api.routes.campaign_entities import (
     to_campaign_entity_public_read,
     to_campaign_entity_read,
 )
+from app.db.loaders import get_loader, load_campaign_entity
 from app.models.campaign_entity import CampaignEntity
 from app.models.session import Session, SessionStatus
 from app.models.session_entity import SessionEntity
@@ -18,6 +19,7 @@ from app.schemas.session_entity import (
     SessionEntityPlayerRead,
     SessionEntityRead,
 )
+from app.services.campaign_deletion import is_campaign_pending_deletion
 from app.services.centrifugo import centrifugo
 from app.services.realtime import (
     build_event,
@@ -47,7 +49,7 @@ def session_entity_id(session_entity: SessionEntity) -> str:
 
 def get_session_entry(session_id_value: str, db: DbSession) -> Session:
     entry = db.get(Session, session_id_value)
-    if entry is None:
+    if entry is None or is_campaign_pending_deletion(db, entry.campaign_id):
         raise HTTPException(status_code=404, detail="Session not found")
     return entry
 
@@ -84,7 +86,7 @@ def get_campaign_entity(
     campaign_entity_id: str,
     db: DbSession,
 ) -> CampaignEntity | None:
-    return db.get(CampaignEntity, campaign_entity_id)
+    return load_campaign_entity(db, campaign_entity_id)
 
 
 def get_campaign_entity_for_session_or_404(
@@ -190,4 +192,8 @@ def list_session_entity_pairs(
         statement = statement.where(SessionEntity.visible_to_players == True)
     entries = list(db.exec(statement).all())
     entries.sort(key=lambda entry: entry.created_at)
-    return [(entry, get_campaign_entity(entry.campaign_entity_id, db)) for entry in entries]
+    campaign_entities = get_loader(db).get_many(
+        CampaignEntity,
+        (entry.campaign_entity_id for entry in entries),
+    )
+    return [(entry, campaign_entities.get(entry.campaign_entity_id)) for entry in entries]
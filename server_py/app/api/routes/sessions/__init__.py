@@ -14,6 +14,7 @@ from .state import router as state_router
 from .rewards import router as rewards_router
 from .rest import router as rest_router
 from .rolls_resolution import router as rolls_resolution_router
+from .snapshot import router as snapshot_router
 
 router = APIRouter()
 router.include_router(campaign_sessions_router)
@@ -30,3 +31,4 @@ router.include_router(runtime_router)
 router.include_router(state_router)
 router.include_router(rewards_router)
 router.include_router(rest_router)
+router.include_router(snapshot_router)
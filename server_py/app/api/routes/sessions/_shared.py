@@ -25,6 +25,7 @@ from app.schemas.session import (
     SessionRead,
     SessionRuntimeRead,
 )
+from app.services.campaign_deletion import is_campaign_pending_deletion
 from app.services.session_rest import normalize_rest_state
 
 DEPRECATION_REMOVAL_DATE = date(2026, 6, 1)
@@ -91,7 +92,7 @@ def resolve_party_id_for_campaign(campaign_id: str, session: DbSession) -> str |
 
 def require_party_member_or_gm(party_id: str, user, session: DbSession) -> Party:
     party = session.exec(select(Party).where(Party.id == party_id)).first()
-    if not party:
+    if not party or is_campaign_pending_deletion(session, party.campaign_id):
         raise HTTPException(status_code=404, detail="Party not found")
     if party.gm_user_id == user.id:
         return party
@@ -108,7 +109,7 @@ def require_party_member_or_gm(party_id: str, user, session: DbSession) -> Party
 
 def require_party_gm(party_id: str, user, session: DbSession) -> Party:
     party = session.exec(select(Party).where(Party.id == party_id)).first()
-    if not party:
+    if not party or is_campaign_pending_deletion(session, party.campaign_id):
         raise HTTPException(status_code=404, detail="Party not found")
     if party.gm_user_id != user.id:
         raise HTTPException(status_code=403, detail="GM required")
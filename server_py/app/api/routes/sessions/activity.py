@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session as DbSession, select
 
 from app.api.deps import get_current_user
+from app.api.fast_json import FastJSONRoute
 from app.db.session import get_session
 from app.models.campaign_member import CampaignMember
 from app.models.item import Item
@@ -30,7 +31,7 @@ from app.schemas.session import (
 )
 from .shop import _format_cp_label, _price_to_cp
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 
 @router.get("/sessions/{session_id}/activity", response_model=list[ActivityEvent])
@@ -50,7 +51,11 @@ def get_session_activity(
     ).first()
     if not member:
         raise HTTPException(status_code=403, detail="Not a campaign member")
+    return build_session_activity(entry, session)
 
+
+def build_session_activity(entry: Session, session: DbSession) -> list[ActivityEvent]:
+    session_id = entry.id
     started_at = entry.started_at or entry.created_at
 
     def offset(ts: datetime) -> int:
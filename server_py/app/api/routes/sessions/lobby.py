@@ -1,10 +1,12 @@
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import update
 from sqlmodel import Session as DbSession, select
 
 from app.api.deps import get_current_user
 from app.services.centrifugo import centrifugo
+from app.services.lobby_readiness import mark_lobby_ready, schedule_lobby_update
 from app.services.realtime import build_event, campaign_channel, event_version, session_channel
 from app.db.session import get_session
 from app.models.campaign import RoleMode
@@ -17,8 +19,6 @@ from app.schemas.session import ActiveSessionRead, LobbyStatusRead
 from ._shared import (
     check_character_sheets,
     get_or_create_session_runtime,
-    lobby_expected_map,
-    lobby_ready_list,
     serialize_lobby_status,
     to_session_read,
 )
@@ -64,65 +64,46 @@ async def join_lobby(
         if not member:
             raise HTTPException(status_code=403, detail="Not a party member")
 
-    runtime = get_or_create_session_runtime(session_id, session)
-    expected = lobby_expected_map(runtime)
-    ready = set(lobby_ready_list(runtime))
-    ready.add(user.id)
-    runtime.lobby_ready = sorted(ready)
-    session.add(runtime)
+    get_or_create_session_runtime(session_id, session)
+    readiness = mark_lobby_ready(session, session_id=session_id, user_id=user.id)
+
+    started = False
+    now = datetime.now(timezone.utc)
+    if readiness.all_ready:
+        # Only the join that flips LOBBY -> ACTIVE announces the start.
+        started = session.exec(  # type: ignore[call-overload]
+            update(Session)
+            .where(Session.id == session_id, Session.status == SessionStatus.LOBBY)
+            .values(status=SessionStatus.ACTIVE, started_at=now)
+        ).rowcount == 1
+        if started:
+            session.exec(  # type: ignore[call-overload]
+                update(SessionRuntime)
+                .where(SessionRuntime.session_id == session_id)
+                .values(lobby_expected=[], lobby_ready=[], shop_open=False, combat_active=False)
+            )
+    started_payload = {
+        "sessionId": session_id,
+        "campaignId": entry.campaign_id,
+        "partyId": entry.party_id,
+        "title": entry.title,
+        "startedAt": now.isoformat(),
+    }
     session.commit()
-    session.refresh(runtime)
 
-    display_name = expected.get(user.id, user.display_name or user.username or user.id)
-    ready_count = len(runtime.lobby_ready)
-    total_count = len(expected)
-    join_version = event_version()
+    if not started:
+        schedule_lobby_update(session_id, started_payload["campaignId"], started_payload["partyId"])
+        return {"ok": True}
 
+    version = event_version(now)
     await centrifugo.publish(
-        campaign_channel(entry.campaign_id),
-        build_event(
-            "player_joined_lobby",
-            {
-                "sessionId": session_id,
-                "partyId": entry.party_id,
-                "userId": user.id,
-                "displayName": display_name,
-                "readyCount": ready_count,
-                "totalCount": total_count,
-                "readyUserIds": runtime.lobby_ready,
-            },
-            version=join_version,
-        ),
+        session_channel(session_id),
+        build_event("session_started", started_payload, version=version),
+    )
+    await centrifugo.publish(
+        campaign_channel(started_payload["campaignId"]),
+        build_event("session_started", started_payload, version=version),
     )
-
-    if expected and set(runtime.lobby_ready) >= set(expected.keys()):
-        now = datetime.now(timezone.utc)
-        entry.status = SessionStatus.ACTIVE
-        entry.started_at = now
-        runtime.lobby_expected = []
-        runtime.lobby_ready = []
-        runtime.shop_open = False
-        runtime.combat_active = False
-        session.add(entry)
-        session.add(runtime)
-        session.commit()
-        session.refresh(entry)
-        version = event_version(entry.started_at or now)
-        started_payload = {
-            "sessionId": entry.id,
-            "campaignId": entry.campaign_id,
-            "partyId": entry.party_id,
-            "title": entry.title,
-            "startedAt": now.isoformat(),
-        }
-        await centrifugo.publish(
-            session_channel(entry.id),
-            build_event("session_started", started_payload, version=version),
-        )
-        await centrifugo.publish(
-            campaign_channel(entry.campaign_id),
-            build_event("session_started", started_payload, version=version),
-        )
 
     return {"ok": True}
 
@@ -7,7 +7,6 @@ from sqlmodel import Session as DbSession, select
 
 from app.models.character_sheet import CharacterSheet
 from app.models.inventory import InventoryItem
-from app.models.item import Item
 from app.schemas.session_reward import (
     SessionGrantCurrencyRead,
     SessionGrantCurrencyRequest,
@@ -16,6 +15,7 @@ from app.schemas.session_reward import (
     SessionGrantXpRead,
     SessionGrantXpRequest,
 )
+from app.services.campaign_catalog import get_campaign_catalog_item
 from app.services.character_progression import build_progression_snapshot, grant_experience
 from app.services.magic_item_effects import inventory_item_supports_stacking
 from app.services.money import normalize_money
@@ -128,13 +128,12 @@ async def grant_session_item_service(
         player_user_id=payload.playerUserId,
         db=session,
     )
-    item = session.exec(
-        select(Item).where(
-            Item.id == payload.itemId,
-            Item.campaign_id == entry.campaign_id,
-        )
-    ).first()
-    if not item:
+    item = get_campaign_catalog_item(
+        session,
+        campaign_id=entry.campaign_id,
+        item_id=payload.itemId,
+    )
+    if not item or item.campaign_id != entry.campaign_id:
         raise HTTPException(status_code=404, detail="Item not found")
 
     state = _ensure_player_session_state(entry, payload.playerUserId, session)
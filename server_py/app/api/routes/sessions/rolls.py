@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlmodel import Session as DbSession, select
 
 from app.api.deps import get_current_user
+from app.api.fast_json import FastJSONRoute
 from app.db.session import get_session
 from app.models.campaign_member import CampaignMember
 from app.models.roll_event import RollEvent
@@ -16,7 +17,7 @@ from app.services.centrifugo import centrifugo
 from app.services.realtime import build_event, campaign_channel, event_version, session_channel
 from ._shared import parse_expression, to_roll_read_local
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 
 @router.get("/sessions/{session_id}/rolls", response_model=list[RollEventRead])
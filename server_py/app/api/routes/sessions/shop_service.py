@@ -6,6 +6,8 @@ from uuid import uuid4
 from fastapi import HTTPException
 from sqlmodel import Session as DbSession, select
 
+from app.db.persistence import commit_and_keep
+from app.models.campaign import Campaign
 from app.models.campaign_member import CampaignMember
 from app.models.item import Item
 from app.models.session import SessionStatus
@@ -33,6 +35,7 @@ from .shop_common import (
     to_item_read,
 )
 from app.models.inventory import InventoryItem
+from app.services.campaign_catalog import get_campaign_catalog_item, resolve_campaign_catalog
 from app.services.magic_item_effects import inventory_item_supports_stacking
 from app.services.money import normalize_money
 from app.services.session_state_finalize import finalize_session_state_data
@@ -86,9 +89,10 @@ def list_session_shop_items_service(
     member = require_campaign_member(entry, user, session)
     if not member:
         raise HTTPException(status_code=403, detail="Not a campaign member")
-    items = list(
-        session.exec(select(Item).where(Item.campaign_id == entry.campaign_id)).all()
-    )
+    campaign = session.get(Campaign, entry.campaign_id)
+    if not campaign:
+        raise HTTPException(status_code=404, detail="Campaign not found")
+    items = resolve_campaign_catalog(session, campaign)
     items.sort(
         key=lambda item: item.created_at.timestamp() if item.created_at is not None else 0.0,
         reverse=True,
@@ -105,7 +109,11 @@ async def buy_session_shop_item_service(
     entry, runtime = require_active_shop_session(session_id, session)
     ensure_shop_open(entry, runtime)
     member = require_campaign_member(entry, user, session)
-    item = session.exec(select(Item).where(Item.id == payload.itemId)).first()
+    item = get_campaign_catalog_item(
+        session,
+        campaign_id=entry.campaign_id,
+        item_id=payload.itemId,
+    )
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
     if item.campaign_id != entry.campaign_id:
@@ -161,10 +169,7 @@ async def buy_session_shop_item_service(
     if existing and inventory_item_supports_stacking(item):
         existing.quantity += payload.quantity
         session.add(existing)
-        session.commit()
-        session.refresh(purchase_event)
-        session.refresh(existing)
-        session.refresh(state)
+        commit_and_keep(session)
         await publish_purchase_realtime(entry, purchase_event, member.display_name)
         await _publish_session_state_realtime(
             entry,
@@ -181,10 +186,7 @@ async def buy_session_shop_item_service(
         quantity=payload.quantity,
     )
     session.add(new_entry)
-    session.commit()
-    session.refresh(purchase_event)
-    session.refresh(new_entry)
-    session.refresh(state)
+    commit_and_keep(session)
     await publish_purchase_realtime(entry, purchase_event, member.display_name)
     await _publish_session_state_realtime(
         entry,
@@ -242,10 +244,7 @@ async def sell_session_shop_item_service(
         updated_inventory_entry = None
         session.delete(inventory_entry)
 
-    session.commit()
-    session.refresh(state)
-    if updated_inventory_entry:
-        session.refresh(updated_inventory_entry)
+    commit_and_keep(session)
 
     refund_currency = {"copperValue": refund_cp}
     refund_label = _format_cp_label(refund_cp)
@@ -263,7 +262,7 @@ async def sell_session_shop_item_service(
             },
         )
     )
-    session.commit()
+    commit_and_keep(session)
     sale_timestamp = state.updated_at or state.created_at
     await publish_sale_realtime(
         entry,
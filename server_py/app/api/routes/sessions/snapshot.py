@@ -0,0 +1,165 @@
+from typing import get_args
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import Session as DbSession, select
+
+from app.api.deps import get_current_user
+from app.api.fast_json import FastJSONRoute
+from app.api.routes.session_entities_common import (
+    list_session_entity_pairs,
+    to_session_entity_player_read,
+)
+from app.db.persistence import begin_repeatable_read
+from app.db.session import get_session
+from app.models.inventory import InventoryItem
+from app.models.roll_event import RollEvent
+from app.models.session_runtime import SessionRuntime
+from app.models.session_state import SessionState
+from app.schemas.session_snapshot import SessionSnapshotRead, SnapshotField
+from app.services.combat import CombatService
+from app.services.inventory_expiration import inventory_item_not_expired_clause
+from app.services.realtime import campaign_channel, event_version, session_channel
+from app.services.realtime_replay import channel_sequences
+from ._shared import (
+    require_identifier,
+    serialize_lobby_status,
+    serialize_session_runtime,
+    to_inventory_read,
+    to_roll_read_local,
+    to_session_read,
+)
+from .activity import build_session_activity
+from .state_common import (
+    ensure_session_state,
+    get_session_entry,
+    require_campaign_member,
+    require_session_view_access,
+    to_state_read,
+)
+
+router = APIRouter(route_class=FastJSONRoute)
+
+SNAPSHOT_FIELDS: tuple[str, ...] = get_args(SnapshotField)
+SNAPSHOT_ROLLS_LIMIT = 50
+
+
+def parse_snapshot_fields(raw: str | None) -> list[str]:
+    if not raw:
+        return list(SNAPSHOT_FIELDS)
+    requested = {part.strip() for part in raw.split(",") if part.strip()}
+    unknown = requested.difference(SNAPSHOT_FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown snapshot fields: {', '.join(sorted(unknown))}",
+        )
+    return [field for field in SNAPSHOT_FIELDS if field in requested]
+
+
+@router.get("/sessions/{session_id}/snapshot", response_model=SessionSnapshotRead)
+def get_session_snapshot(
+    session_id: str,
+    fields: str | None = Query(default=None, description="Comma-separated subset of snapshot fields"),
+    user=Depends(get_current_user),
+    session: DbSession = Depends(get_session),
+):
+    """Everything the board needs on open, read from one database snapshot.
+
+    ``sequences`` holds the last realtime ``seq`` per channel as of the snapshot;
+    apply only events with a higher ``seq`` (see ``/realtime/{channel}/since``).
+    ``version`` is the older wall-clock watermark, for events without a seq.
+    """
+    selected = parse_snapshot_fields(fields)
+    user_id = user.id
+    entry = get_session_entry(session_id, session)
+    require_session_view_access(entry, user, session)
+    member = require_campaign_member(entry, user, session)
+    member_id = require_identifier(member.id, "Campaign member is missing an id")
+    party_id = entry.party_id
+
+    if "state" in selected:
+        # May seed or merge the player's state from the character sheet (and commit).
+        ensure_session_state(
+            session.exec(
+                select(SessionState).where(
+                    SessionState.session_id == session_id,
+                    SessionState.player_user_id == user_id,
+                )
+            ).first(),
+            session_id,
+            user_id,
+            party_id,
+            session,
+        )
+
+    version = event_version()
+    begin_repeatable_read(session)
+    snapshot = SessionSnapshotRead(
+        version=version,
+        sequences=channel_sequences(
+            session,
+            [session_channel(session_id), campaign_channel(entry.campaign_id)],
+        ),
+        session=to_session_read(entry),
+        fields=selected,
+    )
+
+    if "runtime" in selected or "lobby" in selected:
+        runtime = session.exec(
+            select(SessionRuntime).where(SessionRuntime.session_id == session_id)
+        ).first()
+        if "runtime" in selected:
+            snapshot.runtime = serialize_session_runtime(entry, runtime, session)
+        if "lobby" in selected:
+            snapshot.lobby = serialize_lobby_status(entry, runtime)
+
+    if "state" in selected:
+        state = session.exec(
+            select(SessionState).where(
+                SessionState.session_id == session_id,
+                SessionState.player_user_id == user_id,
+            )
+        ).first()
+        snapshot.state = to_state_read(state) if state else None
+
+    if "inventory" in selected:
+        filters = [
+            InventoryItem.campaign_id == entry.campaign_id,
+            InventoryItem.member_id == member_id,
+            inventory_item_not_expired_clause(),
+        ]
+        if party_id:
+            filters.append(InventoryItem.party_id == party_id)
+        snapshot.inventory = [
+            to_inventory_read(item) for item in session.exec(select(InventoryItem).where(*filters)).all()
+        ]
+
+    if "rolls" in selected:
+        snapshot.rolls = [
+            to_roll_read_local(roll)
+            for roll in session.exec(
+                select(RollEvent)
+                .where(RollEvent.session_id == session_id)
+                .order_by(RollEvent.created_at.desc())
+                .limit(SNAPSHOT_ROLLS_LIMIT)
+            ).all()
+        ]
+
+    if "activity" in selected:
+        snapshot.activity = build_session_activity(entry, session)
+
+    if "entities" in selected:
+        snapshot.entities = [
+            to_session_entity_player_read(session_entity, campaign_entity)
+            for session_entity, campaign_entity in list_session_entity_pairs(
+                session_id,
+                session,
+                visible_only=True,
+            )
+        ]
+
+    if "combat" in selected:
+        combat_state = CombatService.get_state(session, session_id)
+        snapshot.combat = combat_state.model_dump(mode="json") if combat_state else None
+
+    return snapshot
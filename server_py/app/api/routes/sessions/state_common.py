@@ -6,16 +6,17 @@ from uuid import uuid4
 from fastapi import HTTPException
 from sqlmodel import Session as DbSession, select
 
+from app.db.loaders import load_campaign_member, load_party, load_session
 from app.models.campaign import RoleMode
 from app.models.campaign_member import CampaignMember
 from app.models.character_sheet import CharacterSheet
 from app.models.inventory import InventoryItem
 from app.models.item import Item, ItemType
-from app.models.party import Party
 from app.models.party_member import PartyMember, PartyMemberStatus
 from app.models.session import Session, SessionStatus
 from app.models.session_state import SessionState
 from app.schemas.session_state import SessionStateRead
+from app.services.campaign_deletion import is_campaign_pending_deletion
 from app.services.centrifugo import centrifugo
 from app.services.realtime import build_event, campaign_channel, event_version
 from app.services.session_rest import ensure_rest_state
@@ -76,8 +77,8 @@ async def publish_state_update(
 
 
 def get_session_entry(session_id: str, db: DbSession) -> Session:
-    entry = db.exec(select(Session).where(Session.id == session_id)).first()
-    if not entry:
+    entry = load_session(db, session_id)
+    if not entry or is_campaign_pending_deletion(db, entry.campaign_id):
         raise HTTPException(status_code=404, detail="Session not found")
     if entry.status not in (SessionStatus.LOBBY, SessionStatus.ACTIVE):
         raise HTTPException(status_code=400, detail="Session is not active")
@@ -90,8 +91,10 @@ def require_session_view_access(
     db: DbSession,
     player_user_id: str | None = None,
 ) -> None:
+    if is_campaign_pending_deletion(db, entry.campaign_id):
+        raise HTTPException(status_code=404, detail="Session not found")
     if entry.party_id:
-        party = db.exec(select(Party).where(Party.id == entry.party_id)).first()
+        party = load_party(db, entry.party_id)
         if not party:
             raise HTTPException(status_code=404, detail="Party not found")
         if party.gm_user_id == user.id:
@@ -110,12 +113,7 @@ def require_session_view_access(
             raise HTTPException(status_code=403, detail="GM required")
         return
 
-    campaign_member = db.exec(
-        select(CampaignMember).where(
-            CampaignMember.campaign_id == entry.campaign_id,
-            CampaignMember.user_id == user.id,
-        )
-    ).first()
+    campaign_member = load_campaign_member(db, entry.campaign_id, user.id)
     if not campaign_member:
         raise HTTPException(status_code=403, detail="Not a campaign member")
     if player_user_id and player_user_id != user.id and campaign_member.role_mode != RoleMode.GM:
@@ -124,17 +122,12 @@ def require_session_view_access(
 
 def require_session_gm(entry: Session, user, db: DbSession) -> None:
     if entry.party_id:
-        party = db.exec(select(Party).where(Party.id == entry.party_id)).first()
+        party = load_party(db, entry.party_id)
         if not party or party.gm_user_id != user.id:
             raise HTTPException(status_code=403, detail="GM required")
         return
 
-    campaign_member = db.exec(
-        select(CampaignMember).where(
-            CampaignMember.campaign_id == entry.campaign_id,
-            CampaignMember.user_id == user.id,
-        )
-    ).first()
+    campaign_member = load_campaign_member(db, entry.campaign_id, user.id)
     if not campaign_member or campaign_member.role_mode != RoleMode.GM:
         raise HTTPException(status_code=403, detail="GM required")
 
@@ -211,12 +204,7 @@ def ensure_session_state(
 
 
 def require_campaign_member(session_entry: Session, user, db: DbSession) -> CampaignMember:
-    member = db.exec(
-        select(CampaignMember).where(
-            CampaignMember.campaign_id == session_entry.campaign_id,
-            CampaignMember.user_id == user.id,
-        )
-    ).first()
+    member = load_campaign_member(db, session_entry.campaign_id, user.id)
     if not member:
         raise HTTPException(status_code=403, detail="Not a campaign member")
     return member
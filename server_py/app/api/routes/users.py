@@ -1,12 +1,14 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, Query
-from sqlmodel import Session, select, or_
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import Session
 
 from app.api.deps import get_current_user
+from app.api.routes.party_common import get_party_member, get_party_or_404
 from app.db.session import get_session
 from app.models.user import User
 from app.schemas.user import UserSearchRead
+from app.services.user_search import search_users as search_user_rows
 
 router = APIRouter()
 
@@ -14,22 +16,17 @@ router = APIRouter()
 @router.get("/search", response_model=List[UserSearchRead])
 def search_users(
     q: str = Query(..., min_length=2, description="Search term"),
+    party_id: str | None = Query(default=None, description="Leave out users already in this party"),
     user: User = Depends(get_current_user),
     session: Session = Depends(get_session),
 ):
-    search_term = f"%{q}%"
-    statement = (
-        select(User)
-        .where(
-            or_(
-                User.display_name.ilike(search_term),
-                User.username.ilike(search_term),
-            )
-        )
-        .limit(20)
-    )
-    results = session.exec(statement).all()
-    
+    if party_id:
+        # Same visibility as the party details page, which already lists the members.
+        party = get_party_or_404(party_id, session)
+        if party.gm_user_id != user.id and get_party_member(party_id, user.id, session) is None:
+            raise HTTPException(status_code=403, detail="Not a party member")
+    results = search_user_rows(session, q, exclude_party_id=party_id)
+
     return [
         UserSearchRead(
             id=result.id,
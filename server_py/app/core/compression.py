@@ -0,0 +1,149 @@
+"""Pure ASGI response compression for API payloads.
+
+The middleware negotiates ``br`` or ``gzip`` from ``Accept-Encoding``. It
+compresses text and JSON bodies of at least ``minimum_size`` bytes. A body
+sent in one message is compressed in one go and gets an exact
+``Content-Length``. A streamed body goes through an incremental encoder, one
+flushed chunk at a time.
+
+It leaves these alone:
+
+- non-HTTP scopes (WebSockets)
+- HEAD requests
+- responses that already carry a ``Content-Encoding``, such as precompressed
+  static files
+- partial (206) and bodiless responses
+- event streams
+
+Ratio, byte and time totals per route and encoding go to the ``/metrics``
+registry.
+"""
+
+from __future__ import annotations
+
+import time
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.content_encoding import StreamEncoder, compress_bytes, is_compressible, negotiate_encoding
+from app.core.metrics import registry, route_template
+
+DEFAULT_MINIMUM_SIZE = 1024
+_SKIPPED_STATUSES = frozenset({204, 206, 304})
+_SKIPPED_MEDIA_TYPES = frozenset({"text/event-stream"})
+
+
+def _should_compress(message: Message) -> bool:
+    if message["status"] < 200 or message["status"] in _SKIPPED_STATUSES:
+        return False
+    headers = Headers(raw=message["headers"])
+    if "content-encoding" in headers:
+        return False
+    media_type = headers.get("content-type", "").split(";", 1)[0].strip().lower()
+    return media_type not in _SKIPPED_MEDIA_TYPES and is_compressible(media_type)
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int = DEFAULT_MINIMUM_SIZE) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await _CompressionResponder(self.app, encoding, self.minimum_size)(scope, receive, send)
+
+
+class _CompressionResponder:
+    def __init__(self, app: ASGIApp, encoding: str, minimum_size: int) -> None:
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.start_message: Message | None = None
+        self.passthrough = False
+        self.encoder: StreamEncoder | None = None
+        self.original_bytes = 0
+        self.compressed_bytes = 0
+        self.seconds = 0.0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+        if self.original_bytes:
+            registry.observe_compression(
+                scope["method"],
+                route_template(scope),
+                self.encoding,
+                self.original_bytes,
+                self.compressed_bytes,
+                self.seconds,
+            )
+
+    def _encoded_headers(self) -> MutableHeaders:
+        assert self.start_message is not None
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        headers["content-encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        return headers
+
+    def _encode(self, chunk: bytes, *, final: bool) -> bytes:
+        started = time.perf_counter()
+        assert self.encoder is not None
+        body = self.encoder.compress(chunk) if chunk else b""
+        if final:
+            body += self.encoder.finish()
+        self.seconds += time.perf_counter() - started
+        self.original_bytes += len(chunk)
+        self.compressed_bytes += len(body)
+        return body
+
+    async def send_compressed(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            self.start_message = message
+            self.passthrough = not _should_compress(message)
+            if self.passthrough:
+                await self.send(message)
+            return
+        if message_type != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.encoder is None and not more_body:
+            # Whole body in one message: the common case for JSON responses.
+            if len(body) < self.minimum_size:
+                self.passthrough = True
+                await self.send(self.start_message)
+                await self.send(message)
+                return
+            started = time.perf_counter()
+            compressed = compress_bytes(body, self.encoding)
+            self.seconds += time.perf_counter() - started
+            self.original_bytes += len(body)
+            self.compressed_bytes += len(compressed)
+            headers = self._encoded_headers()
+            headers["content-length"] = str(len(compressed))
+            await self.send(self.start_message)
+            await self.send({"type": "http.response.body", "body": compressed})
+            return
+
+        if self.encoder is None:
+            self.encoder = StreamEncoder(self.encoding)
+            headers = self._encoded_headers()
+            del headers["content-length"]
+            await self.send(self.start_message)
+        await self.send(
+            {
+                "type": "http.response.body",
+                "body": self._encode(body, final=not more_body),
+                "more_body": more_body,
+            }
+        )
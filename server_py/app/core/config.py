@@ -120,6 +120,16 @@ class Settings:
     db_startup_retry_delay_seconds: float = float(
         os.getenv("DB_STARTUP_RETRY_DELAY_SECONDS", "1.5")
     )
+    inventory_expiration_sweep_seconds: float = float(
+        os.getenv("INVENTORY_EXPIRATION_SWEEP_SECONDS", "30")
+    )
+    campaign_deletion_poll_seconds: float = float(
+        os.getenv("CAMPAIGN_DELETION_POLL_SECONDS", "5")
+    )
+    campaign_deletion_chunk_size: int = int(os.getenv("CAMPAIGN_DELETION_CHUNK_SIZE", "1000"))
+    query_budget_strict: bool = parse_bool(os.getenv("QUERY_BUDGET_STRICT"))
+    metrics_token: str = os.getenv("METRICS_TOKEN", "")
+    static_cache_dir: str = os.getenv("STATIC_CACHE_DIR", "")
     jwt_secret: str = os.getenv("JWT_SECRET", "dev-secret-change-me")
     centrifugo_api_url: str = os.getenv(
         "CENTRIFUGO_API_URL",
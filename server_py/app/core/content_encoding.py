@@ -0,0 +1,102 @@
+"""Accept-Encoding negotiation and the codecs the server can produce.
+
+gzip always works. Brotli is used only when the optional ``brotli`` package is
+installed. Without it, ``br`` is never offered.
+"""
+
+from __future__ import annotations
+
+import gzip
+import zlib
+
+try:  # Optional: smaller than gzip for JS/CSS/JSON, but a compiled extension.
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+GZIP_LEVEL = 6
+BROTLI_DYNAMIC_QUALITY = 4
+BROTLI_STATIC_QUALITY = 11
+
+COMPRESSIBLE_MEDIA_PREFIXES = ("text/",)
+COMPRESSIBLE_MEDIA_TYPES = frozenset(
+    {
+        "application/javascript",
+        "application/json",
+        "application/manifest+json",
+        "application/xml",
+        "image/svg+xml",
+        "text/javascript",
+    }
+)
+
+
+def available_encodings() -> tuple[str, ...]:
+    """Encodings in server preference order."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def is_compressible(media_type: str | None) -> bool:
+    if not media_type:
+        return False
+    base = media_type.split(";", 1)[0].strip().lower()
+    return base.startswith(COMPRESSIBLE_MEDIA_PREFIXES) or base in COMPRESSIBLE_MEDIA_TYPES
+
+
+def negotiate_encoding(accept_encoding: str | None, offered: tuple[str, ...] | None = None) -> str | None:
+    """Pick the first server-preferred encoding the client accepts with q > 0."""
+    if not accept_encoding:
+        return None
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[token] = quality
+    for encoding in offered if offered is not None else available_encodings():
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > 0:
+            return encoding
+    return None
+
+
+def compress_bytes(data: bytes, encoding: str, *, static: bool = False) -> bytes:
+    if encoding == "gzip":
+        # mtime=0 keeps output deterministic, so repeated builds produce identical files.
+        return gzip.compress(data, compresslevel=9 if static else GZIP_LEVEL, mtime=0)
+    if encoding == "br" and brotli is not None:
+        quality = BROTLI_STATIC_QUALITY if static else BROTLI_DYNAMIC_QUALITY
+        return brotli.compress(data, quality=quality)
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+class StreamEncoder:
+    """Incremental encoder; every ``compress`` call flushes so chunks reach the client."""
+
+    def __init__(self, encoding: str) -> None:
+        self.encoding = encoding
+        if encoding == "gzip":
+            self._gzip = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        elif encoding == "br" and brotli is not None:
+            self._brotli = brotli.Compressor(quality=BROTLI_DYNAMIC_QUALITY)
+        else:
+            raise ValueError(f"Unsupported content encoding: {encoding}")
+
+    def compress(self, chunk: bytes) -> bytes:
+        if self.encoding == "gzip":
+            return self._gzip.compress(chunk) + self._gzip.flush(zlib.Z_SYNC_FLUSH)
+        return self._brotli.process(chunk) + self._brotli.flush()
+
+    def finish(self) -> bytes:
+        if self.encoding == "gzip":
+            return self._gzip.flush(zlib.Z_FINISH)
+        return self._brotli.finish()
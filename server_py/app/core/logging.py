@@ -1,17 +1,53 @@
+import json
 import time
-from typing import Callable
-
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
-
-
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start = time.time()
-        response = await call_next(request)
-        duration = (time.time() - start) * 1000
-        print(
-            f"{request.method} {request.url.path} {response.status_code} {duration:.1f}ms"
-        )
-        return response
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import check_query_budget, registry, request_metrics_scope, route_template
+
+
+class RequestLoggingMiddleware:
+    """Pure ASGI request log and metrics; the body stream is passed through as-is."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        with request_metrics_scope() as metrics:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                duration = time.perf_counter() - start
+                method = scope["method"]
+                route = route_template(scope)
+                registry.observe_request(method, route, status_code, duration, metrics)
+                print(
+                    json.dumps(
+                        {
+                            "method": method,
+                            "path": scope["path"],
+                            "route": route,
+                            "status": status_code,
+                            "duration_ms": round(duration * 1000, 1),
+                            "db_queries": metrics.query_count,
+                            "db_ms": round(metrics.db_time_seconds * 1000, 1),
+                            "publishes": metrics.publish_count,
+                            "publish_ms": round(metrics.publish_time_seconds * 1000, 1),
+                        }
+                    )
+                )
+            check_query_budget(method, route, metrics, strict=settings.query_budget_strict)
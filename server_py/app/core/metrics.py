@@ -0,0 +1,317 @@
+"""In-process request metrics: query counts, DB and publish time, latency histograms.
+
+``RequestLoggingMiddleware`` opens a ``RequestMetrics`` scope for every request.
+SQLAlchemy cursor events on the app engine count queries and DB time into the
+current scope, and ``CentrifugoClient.publish`` reports its own timing. When the
+request ends, the totals go into per-route-template histograms rendered by
+``/metrics`` in the Prometheus text format. No external dependencies;
+numbers are per process.
+
+``QUERY_BUDGETS`` caps the number of queries for selected routes. Exceeding a
+budget logs a warning. With ``QUERY_BUDGET_STRICT`` enabled (``tests/conftest.py``
+turns it on for the whole suite), the request fails instead, and
+``tests/test_query_budgets.py`` drives each budgeted route so N+1 regressions
+get caught.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+import logging
+from threading import Lock
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import Scope
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS_SECONDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100)
+# Compressed size / original size.
+COMPRESSION_RATIO_BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0)
+
+# "METHOD /route/template" -> max queries per request.
+QUERY_BUDGETS: dict[str, int] = {
+    "GET /api/sessions/{session_id}/combat": 6,
+    "GET /api/sessions/{session_id}/snapshot": 25,
+    "POST /api/sessions/{session_id}/combat/turn/next": 40,
+    "POST /api/sessions/{session_id}/combat/action/attack": 30,
+    "POST /api/sessions/{session_id}/combat/action/cast": 40,
+    "GET /api/me/parties": 12,
+    "GET /api/parties/{party_id}": 12,
+}
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+@dataclass
+class RequestMetrics:
+    query_count: int = 0
+    db_time_seconds: float = 0.0
+    publish_count: int = 0
+    publish_time_seconds: float = 0.0
+
+
+_current_metrics: ContextVar[RequestMetrics | None] = ContextVar("request_metrics", default=None)
+
+
+def current_request_metrics() -> RequestMetrics | None:
+    return _current_metrics.get()
+
+
+@contextmanager
+def request_metrics_scope() -> Iterator[RequestMetrics]:
+    metrics = RequestMetrics()
+    token = _current_metrics.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _current_metrics.reset(token)
+
+
+@contextmanager
+def time_publish() -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics = _current_metrics.get()
+        if metrics is not None:
+            metrics.publish_count += 1
+            metrics.publish_time_seconds += time.perf_counter() - started
+
+
+def _before_cursor_execute(conn, _cursor, _statement, _parameters, _context, _executemany) -> None:
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, _cursor, _statement, _parameters, _context, _executemany) -> None:
+    started = conn.info.get("query_started_at")
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        metrics.query_count += 1
+        metrics.db_time_seconds += elapsed
+
+
+def _handle_error(exception_context) -> None:
+    # Failed statements never reach after_cursor_execute; drop their start time.
+    connection = exception_context.connection
+    started = connection.info.get("query_started_at") if connection is not None else None
+    if started:
+        started.pop()
+
+
+def install_query_hooks(engine: Engine) -> None:
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+@dataclass
+class _RouteSeries:
+    latency: Histogram
+    queries: Histogram
+    db_seconds: float = 0.0
+    publish_seconds: float = 0.0
+    publishes: int = 0
+
+
+@dataclass
+class _CompressionSeries:
+    ratio: Histogram
+    original_bytes: int = 0
+    compressed_bytes: int = 0
+    seconds: float = 0.0
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._series: dict[tuple[str, str], _RouteSeries] = {}
+        self._compression: dict[tuple[str, str, str], _CompressionSeries] = {}
+        self._responses: dict[tuple[str, str, int], int] = {}
+        self._budget_violations: dict[tuple[str, str], int] = {}
+
+    def observe_request(
+        self,
+        method: str,
+        route: str,
+        status_code: int,
+        duration_seconds: float,
+        metrics: RequestMetrics,
+    ) -> None:
+        key = (method, route)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _RouteSeries(
+                    latency=Histogram(LATENCY_BUCKETS_SECONDS),
+                    queries=Histogram(QUERY_COUNT_BUCKETS),
+                )
+            series.latency.observe(duration_seconds)
+            series.queries.observe(metrics.query_count)
+            series.db_seconds += metrics.db_time_seconds
+            series.publish_seconds += metrics.publish_time_seconds
+            series.publishes += metrics.publish_count
+            response_key = (method, route, status_code)
+            self._responses[response_key] = self._responses.get(response_key, 0) + 1
+
+    def observe_compression(
+        self,
+        method: str,
+        route: str,
+        encoding: str,
+        original_bytes: int,
+        compressed_bytes: int,
+        duration_seconds: float,
+    ) -> None:
+        key = (method, route, encoding)
+        with self._lock:
+            series = self._compression.get(key)
+            if series is None:
+                series = self._compression[key] = _CompressionSeries(
+                    ratio=Histogram(COMPRESSION_RATIO_BUCKETS)
+                )
+            if original_bytes:
+                series.ratio.observe(compressed_bytes / original_bytes)
+            series.original_bytes += original_bytes
+            series.compressed_bytes += compressed_bytes
+            series.seconds += duration_seconds
+
+    def record_budget_violation(self, method: str, route: str) -> None:
+        with self._lock:
+            self._budget_violations[(method, route)] = self._budget_violations.get((method, route), 0) + 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+            self._compression.clear()
+            self._responses.clear()
+            self._budget_violations.clear()
+
+    def render_prometheus(self) -> str:
+        lines: list[str] = []
+        with self._lock:
+            lines.append("# TYPE http_requests_total counter")
+            for (method, route, status), count in sorted(self._responses.items()):
+                lines.append(
+                    f"http_requests_total{{{_labels(method, route)},status=\"{status}\"}} {count}"
+                )
+            _render_histogram(
+                lines,
+                "http_request_duration_seconds",
+                {key: series.latency for key, series in self._series.items()},
+            )
+            _render_histogram(
+                lines,
+                "http_request_db_queries",
+                {key: series.queries for key, series in self._series.items()},
+            )
+            for name, attribute in (
+                ("http_request_db_seconds_total", "db_seconds"),
+                ("realtime_publish_seconds_total", "publish_seconds"),
+                ("realtime_publishes_total", "publishes"),
+            ):
+                lines.append(f"# TYPE {name} counter")
+                for (method, route), series in sorted(self._series.items()):
+                    lines.append(f"{name}{{{_labels(method, route)}}} {_number(getattr(series, attribute))}")
+            lines.append("# TYPE http_request_query_budget_exceeded_total counter")
+            for (method, route), count in sorted(self._budget_violations.items()):
+                lines.append(f"http_request_query_budget_exceeded_total{{{_labels(method, route)}}} {count}")
+            _render_compression(lines, self._compression)
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(method: str, route: str) -> str:
+    return f'method="{_escape(method)}",route="{_escape(route)}"'
+
+
+def _number(value: float) -> str:
+    return f"{value:.6f}".rstrip("0").rstrip(".") if isinstance(value, float) else str(value)
+
+
+def _render_histogram_series(lines: list[str], name: str, labels: str, histogram: Histogram) -> None:
+    cumulative = 0
+    for bound, count in zip(histogram.buckets, histogram.counts):
+        cumulative += count
+        lines.append(f'{name}_bucket{{{labels},le="{_number(float(bound))}"}} {cumulative}')
+    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+    lines.append(f"{name}_sum{{{labels}}} {_number(float(histogram.total))}")
+    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+
+def _render_histogram(lines: list[str], name: str, histograms: dict[tuple[str, str], Histogram]) -> None:
+    lines.append(f"# TYPE {name} histogram")
+    for (method, route), histogram in sorted(histograms.items()):
+        _render_histogram_series(lines, name, _labels(method, route), histogram)
+
+
+def _render_compression(
+    lines: list[str], compression: dict[tuple[str, str, str], _CompressionSeries]
+) -> None:
+    series_labels = [
+        (f'{_labels(method, route)},encoding="{_escape(encoding)}"', series)
+        for (method, route, encoding), series in sorted(compression.items())
+    ]
+    lines.append("# TYPE http_response_compression_ratio histogram")
+    for labels, series in series_labels:
+        _render_histogram_series(lines, "http_response_compression_ratio", labels, series.ratio)
+    for name, attribute in (
+        ("http_response_uncompressed_bytes_total", "original_bytes"),
+        ("http_response_compressed_bytes_total", "compressed_bytes"),
+        ("http_response_compression_seconds_total", "seconds"),
+    ):
+        lines.append(f"# TYPE {name} counter")
+        for labels, series in series_labels:
+            lines.append(f"{name}{{{labels}}} {_number(getattr(series, attribute))}")
+
+
+def route_template(scope: Scope) -> str:
+    """Route template the router matched for ``scope``, the metrics label."""
+    # The router stores the matched route in the shared scope dict.
+    path = getattr(scope.get("route"), "path", None)
+    return path if isinstance(path, str) else "unmatched"
+
+
+def check_query_budget(method: str, route: str, metrics: RequestMetrics, *, strict: bool) -> None:
+    budget = QUERY_BUDGETS.get(f"{method} {route}")
+    if budget is None or metrics.query_count <= budget:
+        return
+    registry.record_budget_violation(method, route)
+    message = f"{method} {route} ran {metrics.query_count} queries (budget {budget})"
+    if strict:
+        raise QueryBudgetExceeded(message)
+    logger.warning(message)
+
+
+registry = MetricsRegistry()
@@ -7,11 +7,10 @@ move to Redis-backed rate limiting.
 
 import time
 from collections import defaultdict
-from typing import Callable
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 # Endpoints subject to rate limiting (path prefix, max_requests, window_seconds)
 _RATE_LIMITED_PATHS: list[tuple[str, int, int]] = [
@@ -22,11 +21,12 @@ _RATE_LIMITED_PATHS: list[tuple[str, int, int]] = [
 _hits: dict[str, list[float]] = defaultdict(list)
 
 
-def _client_ip(request: Request) -> str:
-    forwarded = request.headers.get("x-forwarded-for")
+def _client_ip(scope: Scope) -> str:
+    forwarded = Headers(scope=scope).get("x-forwarded-for")
     if forwarded:
         return forwarded.split(",")[0].strip()
-    return request.client.host if request.client else "unknown"
+    client = scope.get("client")
+    return client[0] if client else "unknown"
 
 
 def _check_rate_limit(key: str, max_requests: int, window: int) -> bool:
@@ -42,17 +42,26 @@ def _check_rate_limit(key: str, max_requests: int, window: int) -> bool:
     return True
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        path = request.url.path
+class RateLimitMiddleware:
+    """Pure ASGI: every other request is handed to the app untouched."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+        path = scope["path"]
         for prefix, max_req, window in _RATE_LIMITED_PATHS:
-            if path == prefix and request.method == "POST":
-                ip = _client_ip(request)
-                key = f"{prefix}:{ip}"
+            if path == prefix:
+                key = f"{prefix}:{_client_ip(scope)}"
                 if not _check_rate_limit(key, max_req, window):
-                    return JSONResponse(
+                    response = JSONResponse(
                         status_code=429,
                         content={"detail": "Too many requests. Try again later."},
                     )
+                    await response(scope, receive, send)
+                    return
                 break
-        return await call_next(request)
+        await self.app(scope, receive, send)
@@ -0,0 +1,183 @@
+"""Serving the built frontend (Vite ``dist/``) from the API process.
+
+Vite fingerprints everything under ``assets/``, so those files are cached as
+immutable for a year. ``index.html`` is revalidated on every load. Other
+top-level files (favicon, manifest) get a short max-age.
+
+Compressible files are sent as their ``.br`` or ``.gz`` sibling when the client
+accepts it. The siblings are written at image build time by
+``precompress_tree``. Files without siblings are compressed once on first
+request, into ``cache_dir``, and served from disk afterwards. Range requests
+are always answered from the uncompressed file.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+from mimetypes import guess_type
+from pathlib import Path
+
+from fastapi import HTTPException, Request
+from starlette.responses import FileResponse, Response
+
+from app.core.content_encoding import (
+    available_encodings,
+    compress_bytes,
+    is_compressible,
+    negotiate_encoding,
+)
+
+logger = logging.getLogger(__name__)
+
+ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+INDEX_CACHE_CONTROL = "no-cache"
+DEFAULT_CACHE_CONTROL = "public, max-age=3600"
+MIN_COMPRESS_BYTES = 1024
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+_NOT_MODIFIED_HEADERS = ("cache-control", "etag", "last-modified", "vary", "content-encoding")
+
+
+def _media_type(path: Path) -> str:
+    return guess_type(path.name)[0] or "text/plain"
+
+
+def _is_fresh(variant: Path, source_mtime: float) -> bool:
+    try:
+        return variant.stat().st_mtime >= source_mtime
+    except OSError:
+        return False
+
+
+def _write_atomic(target: Path, data: bytes) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_name, target)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag.removeprefix("W/") in candidates
+
+
+def precompress_tree(dist_dir: Path | str) -> int:
+    """Write ``.br``/``.gz`` siblings for every compressible file; returns how many."""
+    written = 0
+    for path in sorted(Path(dist_dir).rglob("*")):
+        if not path.is_file() or path.suffix in (".br", ".gz"):
+            continue
+        if not is_compressible(_media_type(path)):
+            continue
+        data = path.read_bytes()
+        if len(data) < MIN_COMPRESS_BYTES:
+            continue
+        for encoding in available_encodings():
+            compressed = compress_bytes(data, encoding, static=True)
+            if len(compressed) < len(data):
+                _write_atomic(path.with_name(path.name + ENCODING_SUFFIXES[encoding]), compressed)
+                written += 1
+    return written
+
+
+class FrontendFiles:
+    def __init__(
+        self,
+        dist_dir: Path,
+        *,
+        cache_dir: Path,
+        reserved_prefixes: frozenset[str] | set[str] = frozenset(),
+    ) -> None:
+        self.dist_dir = dist_dir
+        self.index = dist_dir / "index.html"
+        self.cache_dir = cache_dir
+        self.reserved_prefixes = frozenset(reserved_prefixes)
+
+    def resolve(self, full_path: str) -> Path:
+        normalized_path = full_path.strip("/")
+        if normalized_path:
+            first_segment = normalized_path.split("/", 1)[0]
+            if first_segment in self.reserved_prefixes:
+                raise HTTPException(status_code=404, detail="Not Found")
+
+            candidate = (self.dist_dir / normalized_path).resolve()
+            if self.dist_dir not in candidate.parents and candidate != self.dist_dir:
+                raise HTTPException(status_code=404, detail="Not Found")
+            if candidate.is_file():
+                return candidate
+            # A missing hashed asset is a stale client, not a route; the SPA shell would not parse as JS.
+            if first_segment == "assets":
+                raise HTTPException(status_code=404, detail="Not Found")
+
+        if not self.index.is_file():
+            raise HTTPException(status_code=404, detail="Not Found")
+        return self.index
+
+    def cache_control(self, path: Path) -> str:
+        if path == self.index:
+            return INDEX_CACHE_CONTROL
+        if path.relative_to(self.dist_dir).parts[0] == "assets":
+            return ASSET_CACHE_CONTROL
+        return DEFAULT_CACHE_CONTROL
+
+    def encoded_variant(self, path: Path, encoding: str) -> Path | None:
+        suffix = ENCODING_SUFFIXES[encoding]
+        source_stat = path.stat()
+        sibling = path.with_name(path.name + suffix)
+        if _is_fresh(sibling, source_stat.st_mtime):
+            return sibling
+        if source_stat.st_size < MIN_COMPRESS_BYTES:
+            return None
+
+        relative = path.relative_to(self.dist_dir)
+        cached = self.cache_dir / relative.with_name(relative.name + suffix)
+        if _is_fresh(cached, source_stat.st_mtime):
+            return cached
+        data = path.read_bytes()
+        compressed = compress_bytes(data, encoding, static=True)
+        if len(compressed) >= len(data):
+            return None
+        try:
+            _write_atomic(cached, compressed)
+        except OSError:
+            logger.warning("Could not cache compressed %s in %s", relative, self.cache_dir, exc_info=True)
+            return None
+        return cached
+
+    def response(self, request: Request, full_path: str = "") -> Response:
+        path = self.resolve(full_path)
+        media_type = _media_type(path)
+        headers = {"cache-control": self.cache_control(path)}
+        served = path
+        if is_compressible(media_type):
+            headers["vary"] = "Accept-Encoding"
+            encoding = (
+                negotiate_encoding(request.headers.get("accept-encoding"))
+                if "range" not in request.headers
+                else None
+            )
+            variant = self.encoded_variant(path, encoding) if encoding else None
+            if variant is not None:
+                served = variant
+                headers["content-encoding"] = encoding
+
+        response = FileResponse(served, stat_result=served.stat(), media_type=media_type, headers=headers)
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, response.headers["etag"]):
+            return Response(
+                status_code=304,
+                headers={
+                    name: response.headers[name]
+                    for name in _NOT_MODIFIED_HEADERS
+                    if name in response.headers
+                },
+            )
+        return response
@@ -1,8 +1,10 @@
 from sqlmodel import SQLModel
 
+from app.models.admin_stat import AdminStat, AdminUserStat
 from app.models.base_item import BaseItem, BaseItemAlias
 from app.models.base_spell import BaseSpell, BaseSpellAlias
 from app.models.campaign import Campaign
+from app.models.campaign_deletion_job import CampaignDeletionJob
 from app.models.campaign_spell import CampaignSpell
 from app.models.item import Item
 from app.models.campaign_member import CampaignMember
@@ -22,14 +24,19 @@ from app.models.session_runtime import SessionRuntime
 from app.models.session_state import SessionState
 from app.models.user import User
 from app.models.combat import CombatState
+from app.models.combat_log_entry import CombatLogEntry
+from app.models.realtime_event import RealtimeChannelSequence, RealtimeEvent
 
 __all__ = [
     "SQLModel",
+    "AdminStat",
+    "AdminUserStat",
     "BaseItem",
     "BaseItemAlias",
     "BaseSpell",
     "BaseSpellAlias",
     "Campaign",
+    "CampaignDeletionJob",
     "CampaignSpell",
     "CampaignMember",
     "Item",
@@ -49,4 +56,7 @@ __all__ = [
     "SessionState",
     "User",
     "CombatState",
+    "CombatLogEntry",
+    "RealtimeChannelSequence",
+    "RealtimeEvent",
 ]
@@ -0,0 +1,138 @@
+"""Request-scoped memo for the context rows most routes look up repeatedly.
+
+Auth, access checks, combat helpers and realtime emitters each load the same
+session, campaign, party and membership rows. The loader lives in the DB
+session's ``info`` dict, and ``get_session`` opens one DB session per request,
+so a row is fetched at most once per request. Code that knows several keys up
+front (session entity listings, area spell targets) queues them with ``prime``
+or loads them with ``get_many``; they are fetched together in one ``IN`` query
+and the per-row lookups that follow are served from the memo.
+
+Cached rows are the session's own identity-mapped instances. A commit only
+expires them, and they reload on next access like any other loaded row.
+Deleted or detached rows are dropped. Misses are not cached, because a row a
+request has not found yet may be created later in the same request.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any, TypeVar
+
+from sqlalchemy import inspect
+from sqlmodel import Session, SQLModel, select
+
+from app.models.campaign import Campaign
+from app.models.campaign_entity import CampaignEntity
+from app.models.campaign_member import CampaignMember
+from app.models.party import Party
+from app.models.session import Session as CampaignSession
+from app.models.session_entity import SessionEntity
+
+ModelT = TypeVar("ModelT", bound=SQLModel)
+
+_INFO_KEY = "request_loader"
+
+
+class RequestLoader:
+    def __init__(self, db: Session) -> None:
+        self.db = db
+        self._rows: dict[tuple[Any, ...], Any] = {}
+        self._pending: dict[type[SQLModel], set[Any]] = {}
+
+    def _cached(self, key: tuple[Any, ...]) -> Any | None:
+        row = self._rows.get(key)
+        if row is None:
+            return None
+        state = inspect(row)
+        if state.deleted or state.detached:
+            del self._rows[key]
+            return None
+        return row
+
+    def prime(self, model: type[SQLModel], ids: Iterable[Any]) -> None:
+        """Queue primary keys to be fetched with the next load of ``model``."""
+        pending = self._pending.setdefault(model, set())
+        pending.update(pk for pk in ids if pk is not None and self._cached((model, pk)) is None)
+
+    def get_many(self, model: type[ModelT], ids: Iterable[Any]) -> dict[Any, ModelT]:
+        wanted = set(ids)
+        self.prime(model, wanted)
+        missing = self._pending.pop(model, set())
+        if missing:
+            pk = inspect(model).primary_key[0]
+            for row in self.db.exec(select(model).where(pk.in_(missing))).all():
+                self._rows[(model, getattr(row, pk.key))] = row
+        rows: dict[Any, ModelT] = {}
+        for pk_value in wanted:
+            row = self._cached((model, pk_value))
+            if row is not None:
+                rows[pk_value] = row
+        return rows
+
+    def get(self, model: type[ModelT], pk_value: Any) -> ModelT | None:
+        if pk_value is None:
+            return None
+        row = self._cached((model, pk_value))
+        if row is not None:
+            return row
+        if self._pending.get(model):
+            return self.get_many(model, [pk_value]).get(pk_value)
+        row = self.db.exec(
+            select(model).where(inspect(model).primary_key[0] == pk_value)
+        ).first()
+        if row is not None:
+            self._rows[(model, pk_value)] = row
+        return row
+
+    def find(self, model: type[ModelT], **natural_key: Any) -> ModelT | None:
+        """Memoized ``select(model).where(col == value, ...).first()`` lookup."""
+        key = (model, *sorted(natural_key.items()))
+        row = self._cached(key)
+        if row is not None:
+            return row
+        row = self.db.exec(
+            select(model).where(
+                *(getattr(model, column) == value for column, value in natural_key.items())
+            )
+        ).first()
+        if row is not None:
+            self._rows[key] = row
+        return row
+
+
+def get_loader(db: Session) -> RequestLoader:
+    info = getattr(db, "info", None)
+    if not isinstance(info, dict):
+        # Not a real DB session (e.g. a test double); nothing to memoize against.
+        return RequestLoader(db)
+    loader = info.get(_INFO_KEY)
+    if loader is None or loader.db is not db:
+        loader = info[_INFO_KEY] = RequestLoader(db)
+    return loader
+
+
+def load_session(db: Session, session_id: str | None) -> CampaignSession | None:
+    return get_loader(db).get(CampaignSession, session_id)
+
+
+def load_campaign(db: Session, campaign_id: str | None) -> Campaign | None:
+    return get_loader(db).get(Campaign, campaign_id)
+
+
+def load_party(db: Session, party_id: str | None) -> Party | None:
+    return get_loader(db).get(Party, party_id)
+
+
+def load_session_entity(db: Session, session_entity_id: str | None) -> SessionEntity | None:
+    return get_loader(db).get(SessionEntity, session_entity_id)
+
+
+def load_campaign_entity(db: Session, campaign_entity_id: str | None) -> CampaignEntity | None:
+    return get_loader(db).get(CampaignEntity, campaign_entity_id)
+
+
+def load_campaign_member(db: Session, campaign_id: str, user_id: str | None) -> CampaignMember | None:
+    if user_id is None:
+        return None
+    return get_loader(db).find(CampaignMember, campaign_id=campaign_id, user_id=user_id)
@@ -0,0 +1,36 @@
+"""Transaction helpers for request flows that keep using what they read or wrote."""
+
+from sqlmodel import Session
+
+
+def commit_and_keep(db: Session, *instances: object) -> None:
+    """Commit without expiring the session's loaded objects.
+
+    A plain ``commit()`` expires every instance, so reading it afterwards costs
+    a ``refresh()`` (or a lazy SELECT) per object. Models with server-generated
+    columns opt into ``eager_defaults`` so the INSERT/UPDATE already returns
+    them via RETURNING; everything else is in memory as it was flushed.
+    """
+    for instance in instances:
+        db.add(instance)
+    expire_on_commit = db.expire_on_commit
+    db.expire_on_commit = False
+    try:
+        db.commit()
+    finally:
+        db.expire_on_commit = expire_on_commit
+
+
+def begin_repeatable_read(db: Session) -> None:
+    """Restart the session's transaction so every following read sees one snapshot.
+
+    Postgres runs each statement of a READ COMMITTED transaction against a fresh
+    snapshot, so a multi-query read can mix states from concurrent commits.
+    Whatever the request already loaded (auth, access checks) is rolled back and
+    expires; it reloads lazily inside the new transaction. Other dialects keep
+    their default isolation.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return
+    db.rollback()
+    db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
@@ -1,9 +1,12 @@
+import asyncio
+import hmac
+import tempfile
 from pathlib import Path
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from sqlmodel import Session
 
 from app.core.rate_limit import RateLimitMiddleware
@@ -37,13 +40,18 @@ from app.api.routes import (
     users_router,
 )
 from app.api.ws import router as ws_router
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
 from app.core.logging import RequestLoggingMiddleware
+from app.core.metrics import install_query_hooks, registry as metrics_registry
+from app.core.static_files import FrontendFiles
 from app.db.migrations import ensure_database_schema
 from app.db.session import engine
 from app.services.base_item_seeds import bootstrap_base_items_if_empty
 from app.services.base_spell_seeds import bootstrap_base_spells_if_empty
+from app.services.campaign_deletion import run_campaign_deletion_worker
 from app.services.centrifugo import centrifugo
+from app.services.inventory_expiration import run_inventory_expiration_sweeper
 
 _is_production = settings.app_env != "development"
 
@@ -62,10 +70,18 @@ FRONTEND_DIST_DIR = next(
     (candidate for candidate in FRONTEND_DIST_CANDIDATES if candidate.is_dir()),
     FRONTEND_DIST_CANDIDATES[0],
 )
-FRONTEND_INDEX = FRONTEND_DIST_DIR / "index.html"
-FRONTEND_RESERVED_PREFIXES = {"api", "health", "ws"}
+FRONTEND_RESERVED_PREFIXES = {"api", "health", "metrics", "ws"}
+frontend_files = FrontendFiles(
+    FRONTEND_DIST_DIR,
+    cache_dir=Path(settings.static_cache_dir or Path(tempfile.gettempdir()) / "limiar-static"),
+    reserved_prefixes=FRONTEND_RESERVED_PREFIXES,
+)
+_background_tasks: set[asyncio.Task] = set()
+
+install_query_hooks(engine)
 
 app.add_middleware(RateLimitMiddleware)
+app.add_middleware(CompressionMiddleware)
 app.add_middleware(RequestLoggingMiddleware)
 app.add_middleware(
     CORSMiddleware,
@@ -125,6 +141,22 @@ def health():
     return {"ok": True}
 
 
+@app.get("/metrics", include_in_schema=False)
+def metrics(request: Request):
+    if not settings.metrics_token:
+        # Route timings and query counts are not public; outside development a token is required.
+        if _is_production:
+            raise HTTPException(status_code=404, detail="Not Found")
+    elif not hmac.compare_digest(
+        request.headers.get("authorization", ""), f"Bearer {settings.metrics_token}"
+    ):
+        raise HTTPException(status_code=401, detail="Unauthorized")
+    return PlainTextResponse(
+        metrics_registry.render_prometheus(),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
 @app.on_event("startup")
 def startup_event() -> None:
     ensure_database_schema()
@@ -133,34 +165,36 @@ def startup_event() -> None:
         bootstrap_base_items_if_empty(session)
 
 
+@app.on_event("startup")
+async def start_background_tasks() -> None:
+    if settings.inventory_expiration_sweep_seconds > 0:
+        _background_tasks.add(
+            asyncio.create_task(
+                run_inventory_expiration_sweeper(settings.inventory_expiration_sweep_seconds)
+            )
+        )
+    if settings.campaign_deletion_poll_seconds > 0:
+        _background_tasks.add(
+            asyncio.create_task(
+                run_campaign_deletion_worker(settings.campaign_deletion_poll_seconds)
+            )
+        )
+
+
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
+    for task in _background_tasks:
+        task.cancel()
+    await asyncio.gather(*_background_tasks, return_exceptions=True)
+    _background_tasks.clear()
     await centrifugo.close()
 
 
-def _get_frontend_response(full_path: str = "") -> FileResponse:
-    normalized_path = full_path.strip("/")
-    if normalized_path:
-        first_segment = normalized_path.split("/", 1)[0]
-        if first_segment in FRONTEND_RESERVED_PREFIXES:
-            raise HTTPException(status_code=404, detail="Not Found")
-
-        candidate = (FRONTEND_DIST_DIR / normalized_path).resolve()
-        if FRONTEND_DIST_DIR not in candidate.parents and candidate != FRONTEND_DIST_DIR:
-            raise HTTPException(status_code=404, detail="Not Found")
-        if candidate.is_file():
-            return FileResponse(candidate)
-
-    if not FRONTEND_INDEX.is_file():
-        raise HTTPException(status_code=404, detail="Not Found")
-    return FileResponse(FRONTEND_INDEX)
-
-
 @app.get("/", include_in_schema=False)
-def serve_frontend_root():
-    return _get_frontend_response()
+def serve_frontend_root(request: Request):
+    return frontend_files.response(request)
 
 
 @app.get("/{full_path:path}", include_in_schema=False)
-def serve_frontend(full_path: str):
-    return _get_frontend_response(full_path)
+def serve_frontend(full_path: str, request: Request):
+    return frontend_files.response(request, full_path)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, Column, ForeignKey, Integer, String
+from sqlmodel import Field, SQLModel
+
+
+class AdminStat(SQLModel, table=True):
+    """A global counter for the admin dashboard.
+
+    Rows are kept current by Postgres triggers (migration
+    ``0053_admin_stat_counters``); the application only reads them.
+    """
+
+    __tablename__ = "admin_stat"  # type: ignore[assignment]
+
+    key: str = Field(primary_key=True)
+    value: int = Field(sa_column=Column(BigInteger, nullable=False, server_default="0"))
+
+
+class AdminUserStat(SQLModel, table=True):
+    """Per-user membership counters for the admin user list, trigger-maintained."""
+
+    __tablename__ = "admin_user_stat"  # type: ignore[assignment]
+
+    user_id: str = Field(
+        sa_column=Column(
+            String,
+            ForeignKey("app_user.id", ondelete="CASCADE"),
+            primary_key=True,
+        )
+    )
+    campaigns_count: int = Field(
+        default=0, sa_column=Column(Integer, nullable=False, server_default="0")
+    )
+    gm_campaigns_count: int = Field(
+        default=0, sa_column=Column(Integer, nullable=False, server_default="0")
+    )
+    parties_count: int = Field(
+        default=0, sa_column=Column(Integer, nullable=False, server_default="0")
+    )
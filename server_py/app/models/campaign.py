@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import Column, DateTime, Enum as SAEnum, String, func
+from sqlalchemy import Column, DateTime, Enum as SAEnum, Index, String, func
 from sqlmodel import Field, SQLModel
 
 
@@ -21,6 +21,8 @@ class RoleMode(str, Enum):
 
 
 class Campaign(SQLModel, table=True):
+    __table_args__ = (Index("ix_campaign_created_at_id", "created_at", "id"),)
+
     id: str | None = Field(default=None, primary_key=True)
     name: str
 
@@ -36,6 +38,10 @@ class Campaign(SQLModel, table=True):
         default=None,
         sa_column=Column(DateTime(timezone=True), nullable=True),
     )
+    deletion_requested_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=True),
+    )
     created_at: datetime = Field(
         sa_column=Column(DateTime(timezone=True), server_default=func.now())
     )
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+
+from sqlalchemy import Column, DateTime, Enum as SAEnum, Index, func
+from sqlmodel import Field, SQLModel
+
+
+class CampaignDeletionStatus(str, Enum):
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+
+class CampaignDeletionJob(SQLModel, table=True):
+    """Progress of a background campaign deletion.
+
+    ``campaign_id`` has no foreign key: the job outlives the campaign so the
+    admin API can still report the finished deletion.
+    """
+
+    __tablename__ = "campaign_deletion_job"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_campaign_deletion_job_status_created_at", "status", "created_at"),
+    )
+
+    id: str = Field(primary_key=True)
+    campaign_id: str = Field(index=True)
+    campaign_name: str
+    requested_by_user_id: str | None = None
+    status: CampaignDeletionStatus = Field(
+        default=CampaignDeletionStatus.PENDING,
+        sa_column=Column(
+            SAEnum(CampaignDeletionStatus, native_enum=False, length=16),
+            nullable=False,
+        ),
+    )
+    steps_total: int = Field(default=0)
+    steps_done: int = Field(default=0)
+    rows_deleted: int = Field(default=0)
+    current_table: str | None = None
+    error: str | None = None
+    created_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), server_default=func.now())
+    )
+    started_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=True),
+    )
+    heartbeat_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=True),
+    )
+    finished_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=True),
+    )
@@ -2,13 +2,16 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Integer, Text, func
+from sqlalchemy import Column, DateTime, Index, Integer, Text, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, SQLModel
 
 
 class CampaignEntity(SQLModel, table=True):
     __tablename__ = "campaign_entity"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_campaign_entity_campaign_id_name_id", "campaign_id", "name", "id"),
+    )
 
     id: str | None = Field(default=None, primary_key=True)
     campaign_id: str = Field(foreign_key="campaign.id", index=True)
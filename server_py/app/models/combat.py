@@ -17,6 +17,8 @@ class CombatPhase(str, enum.Enum):
 
 class CombatState(SQLModel, table=True):
     __tablename__ = "combat_state"  # type: ignore[assignment]
+    # Server-side timestamps come back via RETURNING (see app.db.persistence).
+    __mapper_args__ = {"eager_defaults": True}
 
     id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
     session_id: str = Field(foreign_key="campaign_session.id", index=True, unique=True)
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field, SQLModel
+
+
+class CombatLogEntry(SQLModel, table=True):
+    __tablename__ = "combat_log_entry"  # type: ignore[assignment]
+    __table_args__ = (
+        Index(
+            "ix_combat_log_entry_session_id_created_at_sequence",
+            "session_id",
+            "created_at",
+            "sequence",
+        ),
+    )
+
+    id: str = Field(primary_key=True)
+    session_id: str = Field(foreign_key="campaign_session.id")
+    sequence: int = Field(default=0)
+    message: str
+    source: str | None = None
+    payload_json: dict | None = Field(default=None, sa_column=Column(JSONB, nullable=True))
+    created_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), server_default=func.now())
+    )
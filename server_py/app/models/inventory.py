@@ -2,11 +2,23 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, String, func
+from sqlalchemy import Column, DateTime, Index, String, func
 from sqlmodel import Field, SQLModel
 
 
 class InventoryItem(SQLModel, table=True):
+    # Server-side timestamps come back via RETURNING (see app.db.persistence).
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index(
+            "ix_inventoryitem_campaign_party_member_item",
+            "campaign_id",
+            "party_id",
+            "member_id",
+            "item_id",
+        ),
+    )
+
     id: str | None = Field(default=None, primary_key=True)
     campaign_id: str = Field(foreign_key="campaign.id", index=True)
     party_id: str | None = Field(default=None, foreign_key="party.id", index=True)
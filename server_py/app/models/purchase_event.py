@@ -2,12 +2,17 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, func
+from sqlalchemy import Column, DateTime, Index, func
 from sqlmodel import Field, SQLModel
 
 
 class PurchaseEvent(SQLModel, table=True):
     __tablename__ = "purchase_event"  # type: ignore[assignment]
+    # Server-side timestamps come back via RETURNING (see app.db.persistence).
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index("ix_purchase_event_session_id_created_at", "session_id", "created_at"),
+    )
 
     id: str = Field(primary_key=True)
     session_id: str = Field(foreign_key="campaign_session.id", index=True)
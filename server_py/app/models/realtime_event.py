@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Column, DateTime, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field, SQLModel
+
+
+class RealtimeChannelSequence(SQLModel, table=True):
+    __tablename__ = "realtime_channel_sequence"  # type: ignore[assignment]
+
+    channel: str = Field(primary_key=True)
+    last_seq: int = Field(sa_column=Column(BigInteger, nullable=False, server_default="0"))
+
+
+class RealtimeEvent(SQLModel, table=True):
+    __tablename__ = "realtime_event"  # type: ignore[assignment]
+
+    channel: str = Field(primary_key=True)
+    seq: int = Field(sa_column=Column(BigInteger, primary_key=True, autoincrement=False))
+    data: dict = Field(sa_column=Column(JSONB, nullable=False))
+    created_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), server_default=func.now())
+    )
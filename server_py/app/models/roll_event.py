@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Enum as SAEnum, JSON, func
+from sqlalchemy import Column, DateTime, Enum as SAEnum, Index, JSON, func
 from sqlmodel import Field, SQLModel
 
 from app.models.campaign import RoleMode
@@ -10,6 +10,9 @@ from app.models.campaign import RoleMode
 
 class RollEvent(SQLModel, table=True):
     __tablename__ = "roll_event"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_roll_event_session_id_created_at", "session_id", "created_at"),
+    )
     id: str | None = Field(default=None, primary_key=True)
     campaign_id: str | None = Field(default=None, foreign_key="campaign.id", index=True)
     session_id: str = Field(foreign_key="campaign_session.id", index=True)
@@ -2,13 +2,16 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, func
+from sqlalchemy import Column, DateTime, Index, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, SQLModel
 
 
 class SessionCommandEvent(SQLModel, table=True):
     __tablename__ = "session_command_event"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_session_command_event_session_id_created_at", "session_id", "created_at"),
+    )
 
     id: str = Field(primary_key=True)
     session_id: str = Field(foreign_key="campaign_session.id", index=True)
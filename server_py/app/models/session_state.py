@@ -2,13 +2,18 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, func
+from sqlalchemy import Column, DateTime, Index, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, SQLModel
 
 
 class SessionState(SQLModel, table=True):
     __tablename__ = "session_state"  # type: ignore[assignment]
+    # Server-side timestamps come back via RETURNING (see app.db.persistence).
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index("ix_session_state_session_id_player_user_id", "session_id", "player_user_id"),
+    )
 
     id: str | None = Field(default=None, primary_key=True)
     session_id: str = Field(foreign_key="campaign_session.id", index=True)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, String, func
+from sqlalchemy import Boolean, Column, DateTime, Index, String, func
 from sqlalchemy import Enum as SAEnum
 from sqlmodel import Field, SQLModel
 
@@ -10,6 +10,21 @@ from app.models.campaign import RoleMode
 
 class User(SQLModel, table=True):
     __tablename__ = "app_user"  # type: ignore[assignment]
+    __table_args__ = (
+        Index(
+            "ix_app_user_username_trgm",
+            "username",
+            postgresql_using="gin",
+            postgresql_ops={"username": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_app_user_display_name_trgm",
+            "display_name",
+            postgresql_using="gin",
+            postgresql_ops={"display_name": "gin_trgm_ops"},
+        ),
+        Index("ix_app_user_created_at_id", "created_at", "id"),
+    )
 
     id: str | None = Field(default=None, primary_key=True)
     username: str = Field(sa_column=Column(String, unique=True, nullable=False, index=True))
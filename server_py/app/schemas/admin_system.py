@@ -5,6 +5,7 @@ from datetime import datetime
 from pydantic import BaseModel
 
 from app.models.campaign import RoleMode, SystemType
+from app.models.campaign_deletion_job import CampaignDeletionStatus
 
 
 class AdminOverviewRead(BaseModel):
@@ -33,6 +34,11 @@ class AdminUserRead(BaseModel):
     updatedAt: datetime | None = None
 
 
+class AdminUserPage(BaseModel):
+    items: list[AdminUserRead]
+    nextCursor: str | None = None
+
+
 class AdminUserUpdate(BaseModel):
     role: RoleMode | None = None
     isSystemAdmin: bool | None = None
@@ -50,10 +56,33 @@ class AdminCampaignRead(BaseModel):
     activeSessionsCount: int
     itemCatalogSnapshotAt: datetime | None = None
     spellCatalogSnapshotAt: datetime | None = None
+    deletionRequestedAt: datetime | None = None
     createdAt: datetime
     updatedAt: datetime | None = None
 
 
+class AdminCampaignPage(BaseModel):
+    items: list[AdminCampaignRead]
+    nextCursor: str | None = None
+
+
+class AdminCampaignDeletionRead(BaseModel):
+    id: str
+    campaignId: str
+    campaignName: str
+    requestedByUserId: str | None = None
+    status: CampaignDeletionStatus
+    stepsTotal: int
+    stepsDone: int
+    rowsDeleted: int
+    currentTable: str | None = None
+    error: str | None = None
+    createdAt: datetime
+    startedAt: datetime | None = None
+    heartbeatAt: datetime | None = None
+    finishedAt: datetime | None = None
+
+
 class AdminDiagnosticsRead(BaseModel):
     appEnv: str
     autoMigrate: bool
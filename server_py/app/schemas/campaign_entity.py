@@ -4,6 +4,8 @@ from app.schemas.campaign_entity_models import (
     CampaignEntityCreate,
     CampaignEntityPublicRead,
     CampaignEntityRead,
+    CampaignEntitySummaryPage,
+    CampaignEntitySummaryRead,
     CampaignEntityUpdate,
 )
 from app.schemas.campaign_entity_shared import (
@@ -34,6 +36,8 @@ __all__ = [
     "CampaignEntityCreate",
     "CampaignEntityPublicRead",
     "CampaignEntityRead",
+    "CampaignEntitySummaryPage",
+    "CampaignEntitySummaryRead",
     "CampaignEntityUpdate",
     "ConditionType",
     "CreatureType",
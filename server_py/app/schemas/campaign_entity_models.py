@@ -98,3 +98,22 @@ class CampaignEntityPublicRead(CampaignEntityBase):
     campaignId: str
     notesPrivate: None = None
     createdAt: datetime
+
+
+class CampaignEntitySummaryRead(BaseModel):
+    id: str
+    campaignId: str
+    name: str
+    category: str
+    size: EntitySize | None = None
+    creatureType: CreatureType | None = None
+    creatureSubtype: str | None = None
+    imageUrl: str | None = None
+    armorClass: int | None = None
+    maxHp: int | None = None
+    initiativeBonus: int | None = None
+
+
+class CampaignEntitySummaryPage(BaseModel):
+    items: list[CampaignEntitySummaryRead]
+    nextCursor: str | None = None
@@ -80,6 +80,7 @@ class CombatAttackResult(BaseModel):
 class CombatCastSpellRequest(BaseModel):
     actor_participant_id: Optional[str] = None
     target_ref_id: str
+    additional_target_ref_ids: list[str] = Field(default_factory=list, max_length=50)
     inventory_item_id: str | None = None
     spell_id: str | None = None
     spell_canonical_key: str | None = None
@@ -106,6 +107,19 @@ class CombatCastSpellRequest(BaseModel):
     override_resource_limit: bool = False
 
 
+class CombatSpellTargetResult(BaseModel):
+    target_ref_id: str
+    target_kind: Literal["player", "session_entity"]
+    target_display_name: str
+    is_saved: Optional[bool] = None
+    roll: Optional[int] = None
+    roll_result: RollResult | None = None
+    damage: int = 0
+    healing: int = 0
+    new_hp: Optional[int] = None
+    concentration_check: "CombatConcentrationCheckResult | None" = None
+
+
 class CombatSpellResult(BaseModel):
     spell_name: str
     spell_canonical_key: str | None = None
@@ -140,6 +154,7 @@ class CombatSpellResult(BaseModel):
     elemental_affinity_eligible: bool = False
     elemental_affinity_damage_type: str | None = None
     elemental_affinity_bonus: int | None = None
+    targets: list[CombatSpellTargetResult] = Field(default_factory=list)
 
 
 class CombatEntityActionRequest(BaseModel):
@@ -0,0 +1,35 @@
+from typing import Any, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from app.schemas.inventory import InventoryRead
+from app.schemas.roll_event import RollEventRead
+from app.schemas.session import ActivityEvent, LobbyStatusRead, SessionRead, SessionRuntimeRead
+from app.schemas.session_entity import SessionEntityPlayerRead
+from app.schemas.session_state import SessionStateRead
+
+SnapshotField = Literal[
+    "runtime",
+    "lobby",
+    "state",
+    "inventory",
+    "rolls",
+    "activity",
+    "entities",
+    "combat",
+]
+
+
+class SessionSnapshotRead(BaseModel):
+    version: int
+    sequences: dict[str, int] = Field(default_factory=dict)
+    session: SessionRead
+    fields: list[SnapshotField]
+    runtime: Optional[SessionRuntimeRead] = None
+    lobby: Optional[LobbyStatusRead] = None
+    state: Optional[SessionStateRead] = None
+    inventory: Optional[list[InventoryRead]] = None
+    rolls: Optional[list[RollEventRead]] = None
+    activity: Optional[list[ActivityEvent]] = None
+    entities: Optional[list[SessionEntityPlayerRead]] = None
+    combat: Optional[dict[str, Any]] = None
@@ -0,0 +1,111 @@
+"""Read side of the trigger-maintained admin counters.
+
+The ``admin_stat`` and ``admin_user_stat`` rows are written only by the
+Postgres triggers from migration ``0053_admin_stat_counters``, so dashboard
+reads cost one primary-key scan no matter how large the counted tables get.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import case, delete, func
+from sqlmodel import Session, select
+
+from app.models.admin_stat import AdminStat, AdminUserStat
+from app.models.base_item import BaseItem
+from app.models.base_spell import BaseSpell
+from app.models.campaign import Campaign, RoleMode
+from app.models.campaign_member import CampaignMember
+from app.models.party import Party
+from app.models.party_member import PartyMember
+from app.models.session import Session as CampaignSession, SessionStatus
+from app.models.session_runtime import SessionRuntime
+from app.models.user import User
+
+USERS_TOTAL = "users_total"
+SYSTEM_ADMINS_TOTAL = "system_admins_total"
+CAMPAIGNS_TOTAL = "campaigns_total"
+PARTIES_TOTAL = "parties_total"
+SESSIONS_TOTAL = "sessions_total"
+ACTIVE_SESSIONS_TOTAL = "active_sessions_total"
+BASE_ITEMS_TOTAL = "base_items_total"
+BASE_ITEMS_ACTIVE = "base_items_active"
+BASE_SPELLS_TOTAL = "base_spells_total"
+BASE_SPELLS_ACTIVE = "base_spells_active"
+ACTIVE_COMBATS_TOTAL = "active_combats_total"
+
+
+class AdminStats(dict[str, int]):
+    """Counter values by key; keys with no row read as zero."""
+
+    def __missing__(self, key: str) -> int:
+        return 0
+
+
+def read_admin_stats(db: Session) -> AdminStats:
+    return AdminStats(db.exec(select(AdminStat.key, AdminStat.value)).all())
+
+
+def _count(model, *clauses):
+    statement = select(func.count()).select_from(model)
+    for clause in clauses:
+        statement = statement.where(clause)
+    return statement
+
+
+def _recount_statements():
+    return {
+        USERS_TOTAL: _count(User),
+        SYSTEM_ADMINS_TOTAL: _count(User, User.is_system_admin == True),  # noqa: E712
+        CAMPAIGNS_TOTAL: _count(Campaign),
+        PARTIES_TOTAL: _count(Party),
+        SESSIONS_TOTAL: _count(CampaignSession),
+        ACTIVE_SESSIONS_TOTAL: _count(
+            CampaignSession, CampaignSession.status == SessionStatus.ACTIVE
+        ),
+        BASE_ITEMS_TOTAL: _count(BaseItem),
+        BASE_ITEMS_ACTIVE: _count(BaseItem, BaseItem.is_active == True),  # noqa: E712
+        BASE_SPELLS_TOTAL: _count(BaseSpell),
+        BASE_SPELLS_ACTIVE: _count(BaseSpell, BaseSpell.is_active == True),  # noqa: E712
+        ACTIVE_COMBATS_TOTAL: _count(
+            SessionRuntime, SessionRuntime.combat_active == True  # noqa: E712
+        ),
+    }
+
+
+def recount_admin_stats(db: Session) -> None:
+    """Rebuild every counter from the counted tables and commit.
+
+    Only needed after writes that bypassed the triggers, such as a restore
+    with ``session_replication_role = replica``. Run it while writes are quiet.
+    """
+    db.exec(delete(AdminStat))  # type: ignore[call-overload]
+    db.exec(delete(AdminUserStat))  # type: ignore[call-overload]
+    for key, statement in _recount_statements().items():
+        db.add(AdminStat(key=key, value=db.exec(statement).one()))
+
+    campaign_counts = {
+        user_id: (total, gm_total)
+        for user_id, total, gm_total in db.exec(
+            select(
+                CampaignMember.user_id,
+                func.count(),
+                func.count(case((CampaignMember.role_mode == RoleMode.GM, 1))),
+            ).group_by(CampaignMember.user_id)
+        ).all()
+    }
+    party_counts = dict(
+        db.exec(
+            select(PartyMember.user_id, func.count()).group_by(PartyMember.user_id)
+        ).all()
+    )
+    for user_id in campaign_counts.keys() | party_counts.keys():
+        campaigns_count, gm_campaigns_count = campaign_counts.get(user_id, (0, 0))
+        db.add(
+            AdminUserStat(
+                user_id=user_id,
+                campaigns_count=campaigns_count,
+                gm_campaigns_count=gm_campaigns_count,
+                parties_count=party_counts.get(user_id, 0),
+            )
+        )
+    db.commit()
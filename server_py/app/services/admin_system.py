@@ -7,10 +7,11 @@ from fastapi import HTTPException
 from sqlalchemy import case, delete, func, or_, update
 from sqlmodel import Session, select
 
+from app.api.pagination import after_keyset, decode_cursor, encode_cursor
 from app.core.config import settings
-from app.models.base_item import BaseItem
-from app.models.base_spell import BaseSpell
+from app.models.admin_stat import AdminUserStat
 from app.models.campaign import Campaign, RoleMode, SystemType
+from app.models.campaign_deletion_job import CampaignDeletionJob, CampaignDeletionStatus
 from app.models.campaign_member import CampaignMember
 from app.models.character_sheet import CharacterSheet
 from app.models.inventory import InventoryItem
@@ -22,45 +23,51 @@ from app.models.purchase_event import PurchaseEvent
 from app.models.roll_event import RollEvent
 from app.models.session import Session as CampaignSession, SessionStatus
 from app.models.session_command_event import SessionCommandEvent
-from app.models.session_runtime import SessionRuntime
 from app.models.session_state import SessionState
 from app.models.user import User
 from app.schemas.admin_system import (
+    AdminCampaignDeletionRead,
+    AdminCampaignPage,
     AdminCampaignRead,
     AdminDiagnosticsRead,
     AdminOverviewRead,
+    AdminUserPage,
     AdminUserRead,
     AdminUserUpdate,
 )
+from app.services import admin_stats
 from app.services.campaign_cleanup import delete_campaign_tree, delete_party_tree
-
-
-def _count_rows(db: Session, model, *clauses) -> int:
-    statement = select(func.count()).select_from(model)
-    for clause in clauses:
-        statement = statement.where(clause)
-    return db.exec(statement).one()
+from app.services.campaign_deletion import request_campaign_deletion, retry_deletion_job
 
 
 def get_admin_overview(*, db: Session) -> AdminOverviewRead:
+    stats = admin_stats.read_admin_stats(db)
     return AdminOverviewRead(
-        usersTotal=_count_rows(db, User),
-        systemAdminsTotal=_count_rows(db, User, User.is_system_admin == True),  # noqa: E712
-        campaignsTotal=_count_rows(db, Campaign),
-        partiesTotal=_count_rows(db, Party),
-        sessionsTotal=_count_rows(db, CampaignSession),
-        activeSessionsTotal=_count_rows(
-            db,
-            CampaignSession,
-            CampaignSession.status == SessionStatus.ACTIVE,
+        usersTotal=stats[admin_stats.USERS_TOTAL],
+        systemAdminsTotal=stats[admin_stats.SYSTEM_ADMINS_TOTAL],
+        campaignsTotal=stats[admin_stats.CAMPAIGNS_TOTAL],
+        partiesTotal=stats[admin_stats.PARTIES_TOTAL],
+        sessionsTotal=stats[admin_stats.SESSIONS_TOTAL],
+        activeSessionsTotal=stats[admin_stats.ACTIVE_SESSIONS_TOTAL],
+        baseItemsActive=stats[admin_stats.BASE_ITEMS_ACTIVE],
+        baseItemsInactive=stats[admin_stats.BASE_ITEMS_TOTAL] - stats[admin_stats.BASE_ITEMS_ACTIVE],
+        baseSpellsActive=stats[admin_stats.BASE_SPELLS_ACTIVE],
+        baseSpellsInactive=(
+            stats[admin_stats.BASE_SPELLS_TOTAL] - stats[admin_stats.BASE_SPELLS_ACTIVE]
         ),
-        baseItemsActive=_count_rows(db, BaseItem, BaseItem.is_active == True),  # noqa: E712
-        baseItemsInactive=_count_rows(db, BaseItem, BaseItem.is_active == False),  # noqa: E712
-        baseSpellsActive=_count_rows(db, BaseSpell, BaseSpell.is_active == True),  # noqa: E712
-        baseSpellsInactive=_count_rows(db, BaseSpell, BaseSpell.is_active == False),  # noqa: E712
     )
 
 
+def _encode_cursor(created_at: datetime | None, row_id: str) -> str:
+    return encode_cursor(created_at.isoformat() if created_at else None, row_id)
+
+
+def _after_cursor(created_at_column, id_column, cursor: str):
+    """Rows after ``cursor`` in ``created_at DESC, id DESC`` order."""
+    after_created_at, after_id = decode_cursor(cursor, datetime.fromisoformat, str)
+    return after_keyset(created_at_column, id_column, after_created_at, after_id, descending=True)
+
+
 def list_admin_users(
     *,
     db: Session,
@@ -68,7 +75,9 @@ def list_admin_users(
     role: RoleMode | None = None,
     is_system_admin: bool | None = None,
     limit: int = 100,
-) -> list[AdminUserRead]:
+    cursor: str | None = None,
+) -> AdminUserPage:
+    """One page of users, newest first, keyed on ``(created_at, id)``."""
     statement = (
         select(
             User.id,
@@ -78,30 +87,14 @@ def list_admin_users(
             User.is_system_admin,
             User.created_at,
             User.updated_at,
-            func.count(func.distinct(CampaignMember.campaign_id)).label("campaigns_count"),
-            func.count(
-                func.distinct(
-                    case(
-                        (CampaignMember.role_mode == RoleMode.GM, CampaignMember.campaign_id),
-                    )
-                )
-            ).label("gm_campaigns_count"),
-            func.count(func.distinct(PartyMember.party_id)).label("parties_count"),
+            func.coalesce(AdminUserStat.campaigns_count, 0),
+            func.coalesce(AdminUserStat.gm_campaigns_count, 0),
+            func.coalesce(AdminUserStat.parties_count, 0),
         )
         .select_from(User)
-        .outerjoin(CampaignMember, CampaignMember.user_id == User.id)
-        .outerjoin(PartyMember, PartyMember.user_id == User.id)
-        .group_by(
-            User.id,
-            User.username,
-            User.display_name,
-            User.role,
-            User.is_system_admin,
-            User.created_at,
-            User.updated_at,
-        )
-        .order_by(User.created_at.desc())
-        .limit(limit)
+        .outerjoin(AdminUserStat, AdminUserStat.user_id == User.id)
+        .order_by(User.created_at.desc(), User.id.desc())
+        .limit(limit + 1)
     )
 
     if search and search.strip():
@@ -116,9 +109,11 @@ def list_admin_users(
         statement = statement.where(User.role == role)
     if is_system_admin is not None:
         statement = statement.where(User.is_system_admin == is_system_admin)  # noqa: E712
+    if cursor:
+        statement = statement.where(_after_cursor(User.created_at, User.id, cursor))
 
     rows = db.exec(statement).all()
-    return [
+    items = [
         AdminUserRead(
             id=user_id,
             username=username,
@@ -142,8 +137,10 @@ def list_admin_users(
             campaigns_count,
             gm_campaigns_count,
             parties_count,
-        ) in rows
+        ) in rows[:limit]
     ]
+    next_cursor = _encode_cursor(items[-1].createdAt, items[-1].id) if len(rows) > limit else None
+    return AdminUserPage(items=items, nextCursor=next_cursor)
 
 
 def get_admin_user_by_id(*, db: Session, user_id: str) -> User | None:
@@ -167,22 +164,7 @@ def update_admin_user(*, db: Session, user_id: str, payload: AdminUserUpdate) ->
     db.commit()
     db.refresh(user)
 
-    campaigns_count = db.exec(
-        select(func.count(func.distinct(CampaignMember.campaign_id))).where(
-            CampaignMember.user_id == user.id,
-        )
-    ).one()
-    gm_campaigns_count = db.exec(
-        select(func.count(func.distinct(CampaignMember.campaign_id))).where(
-            CampaignMember.user_id == user.id,
-            CampaignMember.role_mode == RoleMode.GM,
-        )
-    ).one()
-    parties_count = db.exec(
-        select(func.count(func.distinct(PartyMember.party_id))).where(
-            PartyMember.user_id == user.id,
-        )
-    ).one()
+    user_stat = db.get(AdminUserStat, user.id) or AdminUserStat(user_id=user.id)
 
     return AdminUserRead(
         id=user.id,
@@ -190,9 +172,9 @@ def update_admin_user(*, db: Session, user_id: str, payload: AdminUserUpdate) ->
         displayName=user.display_name or user.username,
         role=user.role,
         isSystemAdmin=user.is_system_admin,
-        campaignsCount=campaigns_count,
-        gmCampaignsCount=gm_campaigns_count,
-        partiesCount=parties_count,
+        campaignsCount=user_stat.campaigns_count,
+        gmCampaignsCount=user_stat.gm_campaigns_count,
+        partiesCount=user_stat.parties_count,
         createdAt=user.created_at,
         updatedAt=user.updated_at,
     )
@@ -279,113 +261,182 @@ def delete_admin_user(*, db: Session, user_id: str) -> None:
     db.commit()
 
 
+def _campaign_aggregates(
+    db: Session,
+    campaign_ids: list[str],
+) -> dict[str, tuple[int, int, int, int]]:
+    """Members, parties, sessions and active sessions for one page of campaigns.
+
+    Each count is grouped over the page ids only, so the cost follows the page
+    size rather than the number of campaigns in the system.
+    """
+    members = dict(
+        db.exec(
+            select(CampaignMember.campaign_id, func.count(func.distinct(CampaignMember.user_id)))
+            .where(CampaignMember.campaign_id.in_(campaign_ids))
+            .group_by(CampaignMember.campaign_id)
+        ).all()
+    )
+    parties = dict(
+        db.exec(
+            select(Party.campaign_id, func.count())
+            .where(Party.campaign_id.in_(campaign_ids))
+            .group_by(Party.campaign_id)
+        ).all()
+    )
+    sessions = {
+        campaign_id: (total, active)
+        for campaign_id, total, active in db.exec(
+            select(
+                CampaignSession.campaign_id,
+                func.count(),
+                func.count(case((CampaignSession.status == SessionStatus.ACTIVE, 1))),
+            )
+            .where(CampaignSession.campaign_id.in_(campaign_ids))
+            .group_by(CampaignSession.campaign_id)
+        ).all()
+    }
+    return {
+        campaign_id: (
+            members.get(campaign_id, 0),
+            parties.get(campaign_id, 0),
+            *sessions.get(campaign_id, (0, 0)),
+        )
+        for campaign_id in campaign_ids
+    }
+
+
 def list_admin_campaigns(
     *,
     db: Session,
     search: str | None = None,
     system: SystemType | None = None,
     limit: int = 100,
-) -> list[AdminCampaignRead]:
+    cursor: str | None = None,
+) -> AdminCampaignPage:
+    """One page of campaigns, newest first, keyed on ``(created_at, id)``."""
     statement = (
-        select(
-            Campaign.id,
-            Campaign.name,
-            Campaign.system,
-            Campaign.role_mode,
-            Campaign.item_catalog_snapshot_at,
-            Campaign.spell_catalog_snapshot_at,
-            Campaign.created_at,
-            Campaign.updated_at,
-            func.count(func.distinct(CampaignMember.user_id)).label("members_count"),
-            func.count(func.distinct(Party.id)).label("parties_count"),
-            func.count(func.distinct(CampaignSession.id)).label("sessions_count"),
-            func.count(
-                func.distinct(
-                    case(
-                        (CampaignSession.status == SessionStatus.ACTIVE, CampaignSession.id),
-                    )
-                )
-            ).label("active_sessions_count"),
-        )
-        .select_from(Campaign)
-        .outerjoin(CampaignMember, CampaignMember.campaign_id == Campaign.id)
-        .outerjoin(Party, Party.campaign_id == Campaign.id)
-        .outerjoin(CampaignSession, CampaignSession.campaign_id == Campaign.id)
-        .group_by(
-            Campaign.id,
-            Campaign.name,
-            Campaign.system,
-            Campaign.role_mode,
-            Campaign.item_catalog_snapshot_at,
-            Campaign.spell_catalog_snapshot_at,
-            Campaign.created_at,
-            Campaign.updated_at,
-        )
-        .order_by(Campaign.created_at.desc())
-        .limit(limit)
+        select(Campaign)
+        .order_by(Campaign.created_at.desc(), Campaign.id.desc())
+        .limit(limit + 1)
     )
-
     if search and search.strip():
         statement = statement.where(Campaign.name.ilike(f"%{search.strip()}%"))
     if system is not None:
         statement = statement.where(Campaign.system == system)
+    if cursor:
+        statement = statement.where(_after_cursor(Campaign.created_at, Campaign.id, cursor))
 
     rows = db.exec(statement).all()
-    campaign_ids = [campaign_id for campaign_id, *_rest in rows]
+    campaigns = rows[:limit]
+    campaign_ids = [campaign.id for campaign in campaigns if campaign.id]
+    if not campaign_ids:
+        return AdminCampaignPage(items=[], nextCursor=None)
 
+    aggregates = _campaign_aggregates(db, campaign_ids)
     gm_names_by_campaign: dict[str, list[str]] = defaultdict(list)
-    if campaign_ids:
-        gm_rows = db.exec(
-            select(CampaignMember.campaign_id, CampaignMember.display_name)
-            .where(
-                CampaignMember.campaign_id.in_(campaign_ids),
-                CampaignMember.role_mode == RoleMode.GM,
+    gm_rows = db.exec(
+        select(CampaignMember.campaign_id, CampaignMember.display_name)
+        .where(
+            CampaignMember.campaign_id.in_(campaign_ids),
+            CampaignMember.role_mode == RoleMode.GM,
+        )
+        .order_by(CampaignMember.created_at)
+    ).all()
+    for campaign_id, display_name in gm_rows:
+        if display_name not in gm_names_by_campaign[campaign_id]:
+            gm_names_by_campaign[campaign_id].append(display_name)
+
+    items = []
+    for campaign in campaigns:
+        members_count, parties_count, sessions_count, active_sessions_count = aggregates[campaign.id]
+        items.append(
+            AdminCampaignRead(
+                id=campaign.id,
+                name=campaign.name,
+                systemType=campaign.system,
+                roleMode=campaign.role_mode,
+                gmNames=gm_names_by_campaign.get(campaign.id, []),
+                membersCount=members_count,
+                partiesCount=parties_count,
+                sessionsCount=sessions_count,
+                activeSessionsCount=active_sessions_count,
+                itemCatalogSnapshotAt=campaign.item_catalog_snapshot_at,
+                spellCatalogSnapshotAt=campaign.spell_catalog_snapshot_at,
+                deletionRequestedAt=campaign.deletion_requested_at,
+                createdAt=campaign.created_at,
+                updatedAt=campaign.updated_at,
             )
-            .order_by(CampaignMember.created_at)
-        ).all()
-        for campaign_id, display_name in gm_rows:
-            if display_name not in gm_names_by_campaign[campaign_id]:
-                gm_names_by_campaign[campaign_id].append(display_name)
-
-    return [
-        AdminCampaignRead(
-            id=campaign_id,
-            name=name,
-            systemType=campaign_system,
-            roleMode=role_mode,
-            gmNames=gm_names_by_campaign.get(campaign_id, []),
-            membersCount=members_count,
-            partiesCount=parties_count,
-            sessionsCount=sessions_count,
-            activeSessionsCount=active_sessions_count,
-            itemCatalogSnapshotAt=item_catalog_snapshot_at,
-            spellCatalogSnapshotAt=spell_catalog_snapshot_at,
-            createdAt=created_at,
-            updatedAt=updated_at,
         )
-        for (
-            campaign_id,
-            name,
-            campaign_system,
-            role_mode,
-            item_catalog_snapshot_at,
-            spell_catalog_snapshot_at,
-            created_at,
-            updated_at,
-            members_count,
-            parties_count,
-            sessions_count,
-            active_sessions_count,
-        ) in rows
-    ]
+    next_cursor = (
+        _encode_cursor(campaigns[-1].created_at, campaigns[-1].id) if len(rows) > limit else None
+    )
+    return AdminCampaignPage(items=items, nextCursor=next_cursor)
+
+
+def _to_admin_campaign_deletion_read(job: CampaignDeletionJob) -> AdminCampaignDeletionRead:
+    return AdminCampaignDeletionRead(
+        id=job.id,
+        campaignId=job.campaign_id,
+        campaignName=job.campaign_name,
+        requestedByUserId=job.requested_by_user_id,
+        status=job.status,
+        stepsTotal=job.steps_total,
+        stepsDone=job.steps_done,
+        rowsDeleted=job.rows_deleted,
+        currentTable=job.current_table,
+        error=job.error,
+        createdAt=job.created_at,
+        startedAt=job.started_at,
+        heartbeatAt=job.heartbeat_at,
+        finishedAt=job.finished_at,
+    )
 
 
-def delete_admin_campaign(*, db: Session, campaign_id: str) -> None:
+def delete_admin_campaign(
+    *,
+    db: Session,
+    campaign_id: str,
+    requested_by_user_id: str | None = None,
+) -> AdminCampaignDeletionRead:
     campaign = db.exec(select(Campaign).where(Campaign.id == campaign_id)).first()
     if not campaign:
         raise HTTPException(status_code=404, detail="Campaign not found")
-    delete_campaign_tree(db, campaign)
+    job = request_campaign_deletion(db, campaign, requested_by_user_id=requested_by_user_id)
+    db.commit()
+    db.refresh(job)
+    return _to_admin_campaign_deletion_read(job)
+
+
+def list_admin_campaign_deletions(
+    *,
+    db: Session,
+    status: CampaignDeletionStatus | None = None,
+    limit: int = 50,
+) -> list[AdminCampaignDeletionRead]:
+    statement = select(CampaignDeletionJob).order_by(CampaignDeletionJob.created_at.desc()).limit(limit)
+    if status is not None:
+        statement = statement.where(CampaignDeletionJob.status == status)
+    return [_to_admin_campaign_deletion_read(job) for job in db.exec(statement).all()]
+
+
+def get_admin_campaign_deletion(*, db: Session, job_id: str) -> AdminCampaignDeletionRead:
+    job = db.get(CampaignDeletionJob, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Campaign deletion not found")
+    return _to_admin_campaign_deletion_read(job)
+
+
+def retry_admin_campaign_deletion(*, db: Session, job_id: str) -> AdminCampaignDeletionRead:
+    job = db.get(CampaignDeletionJob, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Campaign deletion not found")
+    if job.status != CampaignDeletionStatus.FAILED:
+        raise HTTPException(status_code=409, detail="Only failed campaign deletions can be retried")
+    retry_deletion_job(db, job)
     db.commit()
+    db.refresh(job)
+    return _to_admin_campaign_deletion_read(job)
 
 
 def get_admin_diagnostics(*, db: Session) -> AdminDiagnosticsRead:
@@ -398,24 +449,9 @@ def get_admin_diagnostics(*, db: Session) -> AdminDiagnosticsRead:
         database_ok = False
         database_message = str(exc)
 
-    users_total = campaigns_total = parties_total = sessions_total = 0
-    active_sessions_total = active_combats_total = 0
-
+    stats = admin_stats.AdminStats()
     try:
-        users_total = _count_rows(db, User)
-        campaigns_total = _count_rows(db, Campaign)
-        parties_total = _count_rows(db, Party)
-        sessions_total = _count_rows(db, CampaignSession)
-        active_sessions_total = _count_rows(
-            db,
-            CampaignSession,
-            CampaignSession.status == SessionStatus.ACTIVE,
-        )
-        active_combats_total = _count_rows(
-            db,
-            SessionRuntime,
-            SessionRuntime.combat_active == True,  # noqa: E712
-        )
+        stats = admin_stats.read_admin_stats(db)
     except Exception as exc:  # pragma: no cover - defensive branch
         database_ok = False
         database_message = str(exc)
@@ -426,10 +462,10 @@ def get_admin_diagnostics(*, db: Session) -> AdminDiagnosticsRead:
         utcNow=datetime.now(timezone.utc),
         databaseOk=database_ok,
         databaseMessage=database_message,
-        usersTotal=users_total,
-        campaignsTotal=campaigns_total,
-        partiesTotal=parties_total,
-        sessionsTotal=sessions_total,
-        activeSessionsTotal=active_sessions_total,
-        activeCombatsTotal=active_combats_total,
+        usersTotal=stats[admin_stats.USERS_TOTAL],
+        campaignsTotal=stats[admin_stats.CAMPAIGNS_TOTAL],
+        partiesTotal=stats[admin_stats.PARTIES_TOTAL],
+        sessionsTotal=stats[admin_stats.SESSIONS_TOTAL],
+        activeSessionsTotal=stats[admin_stats.ACTIVE_SESSIONS_TOTAL],
+        activeCombatsTotal=stats[admin_stats.ACTIVE_COMBATS_TOTAL],
     )
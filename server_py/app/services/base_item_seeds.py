@@ -2,14 +2,22 @@ from __future__ import annotations
 
 import json
 import logging
+import time
 from pathlib import Path
+from uuid import uuid4
 
 from sqlmodel import Session, select
 
 from app.api.serializers.base_item import to_base_item_seed_entry
 from app.models.base_item import BaseItem
-from app.schemas.base_item import BaseItemCreate, BaseItemSeedDocument
-from app.services.base_items import create_base_item, update_base_item
+from app.schemas.base_item import BaseItemSeedDocument
+from app.services.base_items import base_item_seed_row, mark_base_item_catalog_changed
+from app.services.magic_item_effects import validate_base_magic_item_effect_reference
+from app.services.seed_upsert import (
+    bulk_deactivate_seed_rows,
+    bulk_upsert_seed_rows,
+    seed_row_changed,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -71,12 +79,9 @@ def import_base_item_seed_document(
     document: BaseItemSeedDocument,
     *,
     replace: bool = False,
-) -> dict[str, int]:
-    inserted = 0
-    updated = 0
-    deactivated = 0
+) -> dict[str, int | float]:
+    started_at = time.perf_counter()
     items_by_key: dict[tuple[str, str], BaseItem] = {}
-    touched_keys: set[tuple[str, str]] = set()
     systems = sorted({item.system for item in document.items}, key=lambda value: value.value)
 
     if systems:
@@ -88,44 +93,61 @@ def import_base_item_seed_document(
             for item in existing_items
         }
 
+    # Later entries win when a document repeats a canonical key.
+    entries_by_key = {
+        (entry.system.value, entry.canonicalKey): entry
+        for entry in document.items
+    }
+    inserted_rows: list[dict] = []
+    updated_rows: list[dict] = []
+    unchanged = 0
     try:
-        for entry in document.items:
-            key = (entry.system.value, entry.canonicalKey)
-            touched_keys.add(key)
+        for key, entry in entries_by_key.items():
             existing = items_by_key.get(key)
-            if existing:
-                update_base_item(db=db, item=existing, payload=entry, commit=False, refresh=False)
-                updated += 1
+            row = base_item_seed_row(entry, item_id=existing.id if existing else str(uuid4()))
+            if existing and not seed_row_changed(existing, row):
+                unchanged += 1
                 continue
-
-            created = create_base_item(
-                db=db,
-                payload=BaseItemCreate.model_validate(entry.model_dump()),
-                commit=False,
-                refresh=False,
-            )
-            items_by_key[key] = created
-            inserted += 1
-
+            if row["magic_effect_json"] is not None:
+                validate_base_magic_item_effect_reference(
+                    db,
+                    system=entry.system,
+                    magic_effect=row["magic_effect_json"],
+                )
+            (updated_rows if existing else inserted_rows).append(row)
+
+        stale_ids: list[str] = []
         if replace:
-            for key, stale_item in items_by_key.items():
-                if key in touched_keys or not stale_item.is_active:
-                    continue
-                stale_item.is_active = False
-                db.add(stale_item)
-                deactivated += 1
-
+            stale_ids = [
+                stale_item.id
+                for key, stale_item in items_by_key.items()
+                if key not in entries_by_key and stale_item.is_active
+            ]
+
+        bulk_upsert_seed_rows(
+            db,
+            BaseItem.__table__,  # type: ignore[attr-defined]
+            inserted_rows + updated_rows,
+            constraint="uq_base_item_system_canonical_key",
+        )
+        bulk_deactivate_seed_rows(db, BaseItem.__table__, stale_ids)  # type: ignore[attr-defined]
         db.commit()
     except Exception:
         db.rollback()
         raise
-
-    return {
-        "inserted": inserted,
-        "updated": updated,
-        "deactivated": deactivated,
+    finally:
+        mark_base_item_catalog_changed()
+
+    result: dict[str, int | float] = {
+        "inserted": len(inserted_rows),
+        "updated": len(updated_rows),
+        "unchanged": unchanged,
+        "deactivated": len(stale_ids),
         "total": len(document.items),
+        "elapsedMs": round((time.perf_counter() - started_at) * 1000, 1),
     }
+    logger.info("Imported base item seed document: %s", result)
+    return result
 
 
 def import_base_item_seed_file(
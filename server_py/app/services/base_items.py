@@ -10,6 +10,23 @@ from app.models.base_item import BaseItem, BaseItemEquipmentCategory, BaseItemKi
 from app.models.campaign import SystemType
 from app.schemas.base_item import BaseItemCreate, BaseItemUpdate
 from app.services.magic_item_effects import validate_base_magic_item_effect_reference
+from app.services.seed_upsert import seed_row_values
+
+_catalog_revision = 0
+
+
+def base_item_catalog_revision() -> int:
+    """Process-local counter bumped on every base item write.
+
+    Readers that cache derived views of the base catalog compare against it
+    to drop stale entries without querying the database.
+    """
+    return _catalog_revision
+
+
+def mark_base_item_catalog_changed() -> None:
+    global _catalog_revision
+    _catalog_revision += 1
 
 
 def _normalize_lookup(value: str) -> str:
@@ -114,6 +131,13 @@ def _apply_payload(item: BaseItem, payload: BaseItemCreate | BaseItemUpdate) ->
     item.is_active = payload.isActive
 
 
+def base_item_seed_row(payload: BaseItemCreate | BaseItemUpdate, *, item_id: str) -> dict:
+    """Column values ``create_base_item``/``update_base_item`` would persist."""
+    item = BaseItem(id=item_id)
+    _apply_payload(item, payload)
+    return seed_row_values(item, BaseItem.__table__.columns.keys())
+
+
 def create_base_item(
     *,
     db: Session,
@@ -139,7 +163,9 @@ def create_base_item(
     db.add(item)
     if commit:
         db.commit()
+        mark_base_item_catalog_changed()
     else:
+        # The caller commits, then bumps the catalog revision.
         db.flush()
     if refresh:
         db.refresh(item)
@@ -171,7 +197,9 @@ def update_base_item(
     db.add(item)
     if commit:
         db.commit()
+        mark_base_item_catalog_changed()
     else:
+        # The caller commits, then bumps the catalog revision.
         db.flush()
     if refresh:
         db.refresh(item)
@@ -181,3 +209,4 @@ def update_base_item(
 def delete_base_item(*, db: Session, item: BaseItem) -> None:
     db.delete(item)
     db.commit()
+    mark_base_item_catalog_changed()
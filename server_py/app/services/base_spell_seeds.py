@@ -2,14 +2,20 @@ from __future__ import annotations
 
 import json
 import logging
+import time
 from pathlib import Path
 
 from sqlmodel import Session, select
 
 from app.api.serializers.base_spell import to_base_spell_seed_entry
 from app.models.base_spell import BaseSpell
-from app.schemas.base_spell import BaseSpellCreate, BaseSpellSeedDocument
-from app.services.base_spells import create_base_spell, update_base_spell
+from app.schemas.base_spell import BaseSpellSeedDocument
+from app.services.base_spells import base_spell_seed_row
+from app.services.seed_upsert import (
+    bulk_deactivate_seed_rows,
+    bulk_upsert_seed_rows,
+    seed_row_changed,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -71,12 +77,9 @@ def import_base_spell_seed_document(
     document: BaseSpellSeedDocument,
     *,
     replace: bool = False,
-) -> dict[str, int]:
-    inserted = 0
-    updated = 0
-    deactivated = 0
+) -> dict[str, int | float]:
+    started_at = time.perf_counter()
     spells_by_key: dict[tuple[str, str], BaseSpell] = {}
-    touched_keys: set[tuple[str, str]] = set()
     systems = sorted({spell.system for spell in document.spells}, key=lambda value: value.value)
 
     if systems:
@@ -88,50 +91,53 @@ def import_base_spell_seed_document(
             for spell in existing_spells
         }
 
+    # Later entries win when a document repeats a canonical key.
+    entries_by_key = {
+        (entry.system.value, entry.canonicalKey): entry
+        for entry in document.spells
+    }
+    inserted_rows: list[dict] = []
+    updated_rows: list[dict] = []
+    unchanged = 0
     try:
-        for entry in document.spells:
-            key = (entry.system.value, entry.canonicalKey)
-            touched_keys.add(key)
+        for key, entry in entries_by_key.items():
             existing = spells_by_key.get(key)
-            if existing:
-                update_base_spell(
-                    db=db,
-                    spell=existing,
-                    payload=entry,
-                    commit=False,
-                    refresh=False,
-                )
-                updated += 1
+            row = base_spell_seed_row(entry, existing=existing)
+            if existing and not seed_row_changed(existing, row):
+                unchanged += 1
                 continue
+            (updated_rows if existing else inserted_rows).append(row)
 
-            created = create_base_spell(
-                db=db,
-                payload=BaseSpellCreate.model_validate(entry.model_dump()),
-                commit=False,
-                refresh=False,
-            )
-            spells_by_key[key] = created
-            inserted += 1
-
+        stale_ids: list[str] = []
         if replace:
-            for key, stale_spell in spells_by_key.items():
-                if key in touched_keys or not stale_spell.is_active:
-                    continue
-                stale_spell.is_active = False
-                db.add(stale_spell)
-                deactivated += 1
-
+            stale_ids = [
+                stale_spell.id
+                for key, stale_spell in spells_by_key.items()
+                if key not in entries_by_key and stale_spell.is_active
+            ]
+
+        bulk_upsert_seed_rows(
+            db,
+            BaseSpell.__table__,  # type: ignore[attr-defined]
+            inserted_rows + updated_rows,
+            constraint="uq_base_spell_system_canonical_key",
+        )
+        bulk_deactivate_seed_rows(db, BaseSpell.__table__, stale_ids)  # type: ignore[attr-defined]
         db.commit()
     except Exception:
         db.rollback()
         raise
 
-    return {
-        "inserted": inserted,
-        "updated": updated,
-        "deactivated": deactivated,
+    result: dict[str, int | float] = {
+        "inserted": len(inserted_rows),
+        "updated": len(updated_rows),
+        "unchanged": unchanged,
+        "deactivated": len(stale_ids),
         "total": len(document.spells),
+        "elapsedMs": round((time.perf_counter() - started_at) * 1000, 1),
     }
+    logger.info("Imported base spell seed document: %s", result)
+    return result
 
 
 def import_base_spell_seed_file(
@@ -10,6 +10,7 @@ from app.models.base_spell import BaseSpell, BaseSpellAlias, SpellSchool
 from app.models.campaign_spell import CampaignSpell
 from app.models.campaign import SystemType
 from app.schemas.base_spell import BaseSpellCreate, BaseSpellUpdate
+from app.services.seed_upsert import seed_row_values
 
 
 def _normalize_lookup(value: str) -> str:
@@ -136,6 +137,26 @@ def _apply_payload(spell: BaseSpell, data: dict) -> None:
             setattr(spell, key, value)
 
 
+def base_spell_seed_row(
+    payload: BaseSpellCreate,
+    *,
+    existing: BaseSpell | None = None,
+) -> dict:
+    """Column values ``create_base_spell``/``update_base_spell`` would persist.
+
+    Updates only apply the fields set on the payload, like ``update_base_spell``.
+    """
+    columns = BaseSpell.__table__.columns.keys()  # type: ignore[attr-defined]
+    if existing is None:
+        spell = BaseSpell(id=str(uuid4()), system=payload.system)
+        data = payload.model_dump(exclude={"system"})
+    else:
+        spell = BaseSpell(**seed_row_values(existing, columns))
+        data = payload.model_dump(exclude_unset=True)
+    _apply_payload(spell, data)
+    return seed_row_values(spell, columns)
+
+
 def _create_base_spell(
     *,
     db: Session,
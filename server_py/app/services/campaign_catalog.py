@@ -1,21 +1,38 @@
-"""Service for materializing base_item catalog into campaign-level items."""
+"""Campaign item catalog resolved as an overlay on top of the base catalog.
+
+Campaigns do not copy every active ``BaseItem`` into ``item`` rows at
+creation time. A campaign only stores its homebrew items, its overrides of
+base entries and the base entries that were actually used (inventory, shop,
+rewards). Every other base entry is projected at read time with a
+deterministic id and materialized copy-on-write the first time a real row
+is needed.
+"""
 from __future__ import annotations
 
+import copy
+from dataclasses import dataclass
 from datetime import datetime, timezone
 import logging
-from uuid import uuid4
+import time
+from uuid import NAMESPACE_URL, uuid5
 
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
 
 from app.models.base_item import BaseItem, BaseItemCostUnit, BaseItemKind
 from app.models.campaign import Campaign, SystemType
 from app.models.item import Item, ItemType
-from app.services.base_items import get_base_item_by_canonical_key
+from app.services.base_items import base_item_catalog_revision, get_base_item_by_canonical_key
 from app.services.item_properties import normalize_item_properties
 from app.services.magic_item_effects import has_cast_spell_magic_effect
 
 logger = logging.getLogger(__name__)
 
+CAMPAIGN_CATALOG_ITEM_NAMESPACE = uuid5(NAMESPACE_URL, "limiarcontrol:campaign-catalog-item")
+# Bounds staleness across workers; writes in this process invalidate immediately.
+BASE_CATALOG_LAYER_TTL_SECONDS = 60.0
+
 ITEM_KIND_TO_ITEM_TYPE: dict[BaseItemKind, ItemType] = {
     BaseItemKind.WEAPON: ItemType.WEAPON,
     BaseItemKind.ARMOR: ItemType.ARMOR,
@@ -27,6 +44,29 @@ ITEM_KIND_TO_ITEM_TYPE: dict[BaseItemKind, ItemType] = {
     BaseItemKind.PACK: ItemType.MISC,
 }
 
+_OVERLAY_EXCLUDED_FIELDS = {"id", "campaign_id", "created_at", "updated_at"}
+
+
+@dataclass(frozen=True)
+class _BaseLayerEntry:
+    base_item_id: str
+    fields: dict
+
+
+@dataclass(frozen=True)
+class _BaseLayer:
+    revision: int
+    loaded_at: float
+    entries: tuple[_BaseLayerEntry, ...]
+
+
+_base_layers: dict[SystemType, _BaseLayer] = {}
+
+
+def campaign_catalog_item_id(campaign_id: str, base_item_id: str) -> str:
+    """Stable campaign item id for a base entry, before and after materialization."""
+    return str(uuid5(CAMPAIGN_CATALOG_ITEM_NAMESPACE, f"{campaign_id}:{base_item_id}"))
+
 
 def _base_item_price_gp(base_item: BaseItem) -> float | None:
     if base_item.cost_quantity is None:
@@ -72,7 +112,7 @@ def _base_item_to_campaign_item(
         properties = _build_armor_properties(base_item)
 
     return Item(  # type: ignore[call-arg]
-        id=str(uuid4()),
+        id=campaign_catalog_item_id(campaign_id, base_item.id),
         campaign_id=campaign_id,
         name=base_item.name_en,
         type=item_type,
@@ -109,6 +149,120 @@ def _base_item_to_campaign_item(
     )
 
 
+def invalidate_base_catalog_layer(system: SystemType | None = None) -> None:
+    if system is None:
+        _base_layers.clear()
+    else:
+        _base_layers.pop(system, None)
+
+
+def _load_base_layer(db: Session, system: SystemType) -> tuple[_BaseLayerEntry, ...]:
+    revision = base_item_catalog_revision()
+    now = time.monotonic()
+    cached = _base_layers.get(system)
+    if (
+        cached is not None
+        and cached.revision == revision
+        and now - cached.loaded_at < BASE_CATALOG_LAYER_TTL_SECONDS
+    ):
+        return cached.entries
+
+    base_items = db.exec(
+        select(BaseItem)
+        .where(BaseItem.system == system, BaseItem.is_active == True)  # noqa: E712
+        .order_by(BaseItem.item_kind, BaseItem.canonical_key)
+    ).all()
+    entries = tuple(
+        _BaseLayerEntry(
+            base_item_id=base_item.id,
+            fields=_base_item_to_campaign_item(base_item, "").model_dump(
+                exclude=_OVERLAY_EXCLUDED_FIELDS
+            ),
+        )
+        for base_item in base_items
+    )
+    _base_layers[system] = _BaseLayer(revision=revision, loaded_at=now, entries=entries)
+    return entries
+
+
+def _overlay_item(entry: _BaseLayerEntry, campaign: Campaign) -> Item:
+    campaign_id = campaign.id or ""
+    return Item(  # type: ignore[call-arg]
+        **copy.deepcopy(entry.fields),
+        id=campaign_catalog_item_id(campaign_id, entry.base_item_id),
+        campaign_id=campaign_id,
+        created_at=campaign.item_catalog_snapshot_at or campaign.created_at,
+        updated_at=None,
+    )
+
+
+def is_overlay_item(item: Item) -> bool:
+    """True for base entries projected at read time that have no row yet."""
+    return sa_inspect(item).transient
+
+
+def _insert_materialized_item(db: Session, item: Item) -> Item:
+    try:
+        with db.begin_nested():
+            db.add(item)
+    except IntegrityError:
+        existing = db.exec(
+            select(Item).where(
+                Item.campaign_id == item.campaign_id,
+                Item.base_item_id == item.base_item_id,
+            )
+        ).first()
+        if existing is None:
+            raise
+        return existing
+    return item
+
+
+def materialize_campaign_catalog_item(db: Session, item: Item) -> Item:
+    """Give an overlay item a real row (copy-on-write); persisted items pass through."""
+    if not is_overlay_item(item):
+        return item
+    return _insert_materialized_item(db, item)
+
+
+def resolve_campaign_catalog(db: Session, campaign: Campaign) -> list[Item]:
+    """Campaign rows merged with the not-yet-materialized base entries."""
+    rows = list(db.exec(select(Item).where(Item.campaign_id == campaign.id)).all())
+    materialized_base_ids = {row.base_item_id for row in rows if row.base_item_id}
+    overlay = [
+        _overlay_item(entry, campaign)
+        for entry in _load_base_layer(db, campaign.system)
+        if entry.base_item_id not in materialized_base_ids
+    ]
+    return rows + overlay
+
+
+def get_campaign_catalog_item(
+    db: Session,
+    *,
+    campaign_id: str,
+    item_id: str,
+    materialize: bool = True,
+) -> Item | None:
+    """Look up a catalog item by id, falling back to the campaign's base overlay.
+
+    Rows are matched on id alone so callers keep their own campaign checks.
+    """
+    existing = db.exec(select(Item).where(Item.id == item_id)).first()
+    if existing:
+        return existing
+
+    campaign = db.get(Campaign, campaign_id)
+    if not campaign:
+        return None
+    for entry in _load_base_layer(db, campaign.system):
+        if campaign_catalog_item_id(campaign_id, entry.base_item_id) != item_id:
+            continue
+        item = _overlay_item(entry, campaign)
+        return _insert_materialized_item(db, item) if materialize else item
+    return None
+
+
 def ensure_campaign_catalog_item_for_base_canonical_key(
     *,
     db: Session,
@@ -134,8 +288,10 @@ def ensure_campaign_catalog_item_for_base_canonical_key(
     if existing:
         return existing
 
-    campaign_item = _base_item_to_campaign_item(base_item, campaign_id)
-    db.add(campaign_item)
+    campaign_item = _insert_materialized_item(
+        db,
+        _base_item_to_campaign_item(base_item, campaign_id),
+    )
     if commit:
         db.commit()
         db.refresh(campaign_item)
@@ -144,89 +300,52 @@ def ensure_campaign_catalog_item_for_base_canonical_key(
     return campaign_item
 
 
-def seed_campaign_catalog(
-    campaign_id: str,
-    system: SystemType,
-    db: Session,
-    *,
-    commit: bool = True,
-) -> dict[str, int]:
-    """Materializes active base items into campaign-level items.
-
-    Returns {"inserted": N, "existing": M}.
-    """
-    base_items = db.exec(
-        select(BaseItem)
-        .where(BaseItem.system == system, BaseItem.is_active == True)  # noqa: E712
-        .order_by(BaseItem.item_kind, BaseItem.canonical_key)
-    ).all()
-
-    existing_base_ids: set[str] = set()
-    existing_items = db.exec(
-        select(Item.base_item_id)
-        .where(
-            Item.campaign_id == campaign_id,
-            Item.base_item_id.is_not(None),  # type: ignore[union-attr]
-        )
-    ).all()
-    for row in existing_items:
-        if row is not None:
-            existing_base_ids.add(row)
-
-    inserted = 0
-    for base_item in base_items:
-        if base_item.id in existing_base_ids:
-            continue
-        campaign_item = _base_item_to_campaign_item(base_item, campaign_id)
-        db.add(campaign_item)
-        inserted += 1
-
-    if commit and inserted > 0:
-        db.commit()
-        logger.info(
-            "Seeded %d campaign items for campaign=%s system=%s",
-            inserted,
-            campaign_id,
-            system.value,
-        )
-
-    return {"inserted": inserted, "existing": len(existing_base_ids)}
-
-
 def snapshot_campaign_catalog(
     *,
     campaign: Campaign,
     db: Session,
     commit: bool = True,
 ) -> dict[str, int]:
-    """Freeze the campaign item catalog against the current base catalog state."""
+    """Pin the campaign to the base catalog without copying any rows."""
     if not campaign.id:
         raise ValueError("Campaign must have an id before catalog snapshotting")
 
+    existing = db.exec(
+        select(Item.base_item_id).where(
+            Item.campaign_id == campaign.id,
+            Item.base_item_id.is_not(None),  # type: ignore[union-attr]
+        )
+    ).all()
+    existing_count = len([row for row in existing if row is not None])
     if campaign.item_catalog_snapshot_at is not None:
-        existing = db.exec(
-            select(Item.base_item_id).where(
-                Item.campaign_id == campaign.id,
-                Item.base_item_id.is_not(None),  # type: ignore[union-attr]
-            )
-        ).all()
-        existing_count = len([row for row in existing if row is not None])
         return {"inserted": 0, "existing": existing_count}
 
-    result = seed_campaign_catalog(
-        campaign.id,
-        campaign.system,
-        db,
-        commit=False,
-    )
     campaign.item_catalog_snapshot_at = datetime.now(timezone.utc)
     db.add(campaign)
+    logger.info(
+        "Pinned campaign=%s system=%s to the base item catalog",
+        campaign.id,
+        campaign.system.value,
+    )
 
     if commit:
         db.commit()
         db.refresh(campaign)
 
-    return result
+    return {"inserted": 0, "existing": existing_count}
+
+
+def _matches_catalog_search(item: Item, pattern: str) -> bool:
+    return any(
+        pattern in value.lower()
+        for value in (
+            item.name,
+            item.name_en_snapshot,
+            item.name_pt_snapshot,
+            item.canonical_key_snapshot,
+        )
+        if value
+    )
 
 
 def list_campaign_catalog(
@@ -238,25 +357,18 @@ def list_campaign_catalog(
     enabled_only: bool = True,
 ) -> list[Item]:
     """List campaign items (catalog) with optional filters."""
-    statement = select(Item).where(Item.campaign_id == campaign_id)
+    campaign = db.get(Campaign, campaign_id)
+    if not campaign:
+        return []
 
+    items = resolve_campaign_catalog(db, campaign)
     if enabled_only:
-        statement = statement.where(Item.is_enabled == True)  # noqa: E712
-
+        items = [item for item in items if item.is_enabled]
     if item_kind is not None:
-        statement = statement.where(Item.item_kind == item_kind)
-
+        items = [item for item in items if item.item_kind == item_kind]
     if search:
-        pattern = f"%{search.strip().lower()}%"
-        from sqlalchemy import or_, func
-        statement = statement.where(
-            or_(
-                func.lower(Item.name).like(pattern),
-                func.lower(Item.name_en_snapshot).like(pattern),
-                func.lower(Item.name_pt_snapshot).like(pattern),
-                func.lower(Item.canonical_key_snapshot).like(pattern),
-            )
-        )
+        pattern = search.strip().lower()
+        items = [item for item in items if _matches_catalog_search(item, pattern)]
 
-    statement = statement.order_by(Item.name)
-    return list(db.exec(statement).all())
+    items.sort(key=lambda item: item.name)
+    return items
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import threading
 from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+from weakref import WeakKeyDictionary
 
-from sqlalchemy import delete, inspect
+from sqlalchemy import delete, inspect, tuple_
+from sqlalchemy.engine import Engine
 from sqlmodel import Session, select
 
 from app.models.campaign import Campaign
@@ -11,18 +16,21 @@ from app.models.campaign_member import CampaignMember
 from app.models.campaign_spell import CampaignSpell
 from app.models.character_sheet import CharacterSheet
 from app.models.combat import CombatState
+from app.models.combat_log_entry import CombatLogEntry
 from app.models.inventory import InventoryItem
 from app.models.item import Item
 from app.models.party import Party
 from app.models.party_character_sheet_draft import PartyCharacterSheetDraft
 from app.models.party_member import PartyMember
 from app.models.purchase_event import PurchaseEvent
+from app.models.realtime_event import RealtimeChannelSequence, RealtimeEvent
 from app.models.roll_event import RollEvent
 from app.models.session import Session as CampaignSession
 from app.models.session_command_event import SessionCommandEvent
 from app.models.session_entity import SessionEntity
 from app.models.session_runtime import SessionRuntime
 from app.models.session_state import SessionState
+from app.services.realtime import campaign_channel, session_channel
 
 
 def _require_identifier(value: str | None, detail: str) -> str:
@@ -31,31 +39,57 @@ def _require_identifier(value: str | None, detail: str) -> str:
     return value
 
 
-def _delete_where_ids(
-    db: Session,
-    model,
-    column,
-    ids: Sequence[str],
-    existing_tables: set[str],
-) -> None:
-    if not ids or model.__table__.name not in existing_tables:
-        return
-    db.exec(delete(model).where(column.in_(ids)))
+@dataclass(frozen=True)
+class DeleteStep:
+    """One table's share of a tree delete: ``DELETE FROM model WHERE clause``."""
+
+    model: Any
+    clause: Any
+
+    @property
+    def table(self) -> str:
+        return self.model.__table__.name
+
+
+_existing_tables_cache: WeakKeyDictionary[Engine, frozenset[str]] = WeakKeyDictionary()
+_existing_tables_lock = threading.Lock()
+
+
+def _existing_tables(db: Session) -> frozenset[str]:
+    """Table names in the connected database, inspected once per engine."""
+    bind = db.get_bind()
+    engine = bind if isinstance(bind, Engine) else bind.engine
+    with _existing_tables_lock:
+        tables = _existing_tables_cache.get(engine)
+        if tables is None:
+            tables = frozenset(inspect(engine).get_table_names())
+            _existing_tables_cache[engine] = tables
+    return tables
+
+
+def reset_existing_tables_cache() -> None:
+    with _existing_tables_lock:
+        _existing_tables_cache.clear()
 
 
 def _delete_where(
     db: Session,
     model,
     clause,
-    existing_tables: set[str],
+    existing_tables: frozenset[str],
 ) -> None:
     if model.__table__.name not in existing_tables:
         return
     db.exec(delete(model).where(clause))
 
 
-def _existing_tables(db: Session) -> set[str]:
-    return set(inspect(db.get_bind()).get_table_names())
+def delete_step_chunk(db: Session, step: DeleteStep, chunk_size: int) -> int:
+    """Delete at most ``chunk_size`` rows matched by ``step``; returns the count."""
+    key_columns = list(step.model.__table__.primary_key.columns)
+    batch = select(*key_columns).where(step.clause).limit(chunk_size)
+    key = key_columns[0] if len(key_columns) == 1 else tuple_(*key_columns)
+    result = db.exec(delete(step.model).where(key.in_(batch)))
+    return result.rowcount or 0
 
 
 def _session_ids_for_party(db: Session, party_id: str) -> list[str]:
@@ -78,69 +112,98 @@ def _session_ids_for_campaign(db: Session, campaign_id: str) -> list[str]:
     ]
 
 
-def _party_ids_for_campaign(db: Session, campaign_id: str) -> list[str]:
+def _channel_steps(channels: Sequence[str]) -> list[DeleteStep]:
+    # Always two steps, even with no channels, so a resumed job's step indexes line up.
     return [
-        party_id
-        for party_id in db.exec(
-            select(Party.id).where(Party.campaign_id == campaign_id)
-        ).all()
-        if party_id
+        DeleteStep(RealtimeEvent, RealtimeEvent.channel.in_(channels)),
+        DeleteStep(RealtimeChannelSequence, RealtimeChannelSequence.channel.in_(channels)),
     ]
 
 
-def _delete_session_tree(
-    db: Session,
-    session_ids: Sequence[str],
-    existing_tables: set[str],
-) -> None:
-    _delete_where_ids(db, CombatState, CombatState.session_id, session_ids, existing_tables)
-    _delete_where_ids(db, SessionRuntime, SessionRuntime.session_id, session_ids, existing_tables)
-    _delete_where_ids(
-        db, SessionCommandEvent, SessionCommandEvent.session_id, session_ids, existing_tables
-    )
-    _delete_where_ids(db, SessionState, SessionState.session_id, session_ids, existing_tables)
-    _delete_where_ids(db, SessionEntity, SessionEntity.session_id, session_ids, existing_tables)
-    _delete_where_ids(db, PurchaseEvent, PurchaseEvent.session_id, session_ids, existing_tables)
-    _delete_where_ids(db, RollEvent, RollEvent.session_id, session_ids, existing_tables)
-    _delete_where_ids(db, CampaignSession, CampaignSession.id, session_ids, existing_tables)
+def _session_tree_steps(sessions_clause, session_ids: Sequence[str]) -> list[DeleteStep]:
+    """Rows hanging off the sessions selected by ``sessions_clause``.
+
+    Children are matched through a subquery rather than an id list, so a
+    campaign with thousands of sessions still deletes with bounded statements.
+    Session channel events go before the sessions themselves: a resumed job
+    recomputes ``session_ids`` and would lose track of them otherwise.
+    """
+    session_scope = select(CampaignSession.id).where(sessions_clause)
+    steps = [
+        DeleteStep(model, model.session_id.in_(session_scope))
+        for model in (
+            CombatState,
+            CombatLogEntry,
+            SessionRuntime,
+            SessionCommandEvent,
+            SessionState,
+            SessionEntity,
+            PurchaseEvent,
+            RollEvent,
+        )
+    ]
+    steps.extend(_channel_steps([session_channel(session_id) for session_id in session_ids]))
+    steps.append(DeleteStep(CampaignSession, sessions_clause))
+    return steps
 
 
-def delete_party_tree(db: Session, party: Party) -> None:
-    party_id = _require_identifier(party.id, "Party is missing an id")
-    session_ids = _session_ids_for_party(db, party_id)
-    existing_tables = _existing_tables(db)
+def party_delete_steps(db: Session, party_id: str) -> list[DeleteStep]:
+    return [
+        *_session_tree_steps(
+            CampaignSession.party_id == party_id, _session_ids_for_party(db, party_id)
+        ),
+        DeleteStep(CharacterSheet, CharacterSheet.party_id == party_id),
+        DeleteStep(PartyCharacterSheetDraft, PartyCharacterSheetDraft.party_id == party_id),
+        DeleteStep(InventoryItem, InventoryItem.party_id == party_id),
+        DeleteStep(PartyMember, PartyMember.party_id == party_id),
+        DeleteStep(Party, Party.id == party_id),
+    ]
 
-    _delete_session_tree(db, session_ids, existing_tables)
-    _delete_where(db, CharacterSheet, CharacterSheet.party_id == party_id, existing_tables)
-    _delete_where(db, PartyCharacterSheetDraft, PartyCharacterSheetDraft.party_id == party_id, existing_tables)
-    _delete_where(db, InventoryItem, InventoryItem.party_id == party_id, existing_tables)
-    _delete_where(db, PartyMember, PartyMember.party_id == party_id, existing_tables)
-    _delete_where(db, Party, Party.id == party_id, existing_tables)
+
+def campaign_delete_steps(db: Session, campaign_id: str) -> list[DeleteStep]:
+    party_scope = select(Party.id).where(Party.campaign_id == campaign_id)
+    return [
+        *_session_tree_steps(
+            CampaignSession.campaign_id == campaign_id,
+            _session_ids_for_campaign(db, campaign_id),
+        ),
+        *_channel_steps([campaign_channel(campaign_id)]),
+        DeleteStep(InventoryItem, InventoryItem.campaign_id == campaign_id),
+        DeleteStep(CharacterSheet, CharacterSheet.party_id.in_(party_scope)),
+        DeleteStep(PartyCharacterSheetDraft, PartyCharacterSheetDraft.party_id.in_(party_scope)),
+        DeleteStep(PartyMember, PartyMember.party_id.in_(party_scope)),
+        DeleteStep(Party, Party.campaign_id == campaign_id),
+        DeleteStep(RollEvent, RollEvent.campaign_id == campaign_id),
+        DeleteStep(CampaignSpell, CampaignSpell.campaign_id == campaign_id),
+        DeleteStep(Item, Item.campaign_id == campaign_id),
+        DeleteStep(CampaignEntity, CampaignEntity.campaign_id == campaign_id),
+        DeleteStep(CampaignMember, CampaignMember.campaign_id == campaign_id),
+        DeleteStep(Campaign, Campaign.id == campaign_id),
+    ]
 
 
-def delete_campaign_tree(db: Session, campaign: Campaign) -> None:
-    campaign_id = _require_identifier(campaign.id, "Campaign is missing an id")
-    session_ids = _session_ids_for_campaign(db, campaign_id)
-    party_ids = _party_ids_for_campaign(db, campaign_id)
+def existing_steps(db: Session, steps: Sequence[DeleteStep]) -> list[DeleteStep]:
     existing_tables = _existing_tables(db)
+    return [step for step in steps if step.table in existing_tables]
 
-    _delete_session_tree(db, session_ids, existing_tables)
-    _delete_where(db, InventoryItem, InventoryItem.campaign_id == campaign_id, existing_tables)
 
-    if party_ids:
-        _delete_where(db, CharacterSheet, CharacterSheet.party_id.in_(party_ids), existing_tables)
-        _delete_where(
-            db,
-            PartyCharacterSheetDraft,
-            PartyCharacterSheetDraft.party_id.in_(party_ids),
-            existing_tables,
-        )
-        _delete_where(db, PartyMember, PartyMember.party_id.in_(party_ids), existing_tables)
-        _delete_where(db, Party, Party.id.in_(party_ids), existing_tables)
-
-    _delete_where(db, RollEvent, RollEvent.campaign_id == campaign_id, existing_tables)
-    _delete_where(db, CampaignSpell, CampaignSpell.campaign_id == campaign_id, existing_tables)
-    _delete_where(db, Item, Item.campaign_id == campaign_id, existing_tables)
-    _delete_where(db, CampaignEntity, CampaignEntity.campaign_id == campaign_id, existing_tables)
-    _delete_where(db, CampaignMember, CampaignMember.campaign_id == campaign_id, existing_tables)
-    _delete_where(db, Campaign, Campaign.id == campaign_id, existing_tables)
+def _run_steps(db: Session, steps: Sequence[DeleteStep]) -> None:
+    existing_tables = _existing_tables(db)
+    for step in steps:
+        _delete_where(db, step.model, step.clause, existing_tables)
+
+
+def delete_party_tree(db: Session, party: Party) -> None:
+    party_id = _require_identifier(party.id, "Party is missing an id")
+    _run_steps(db, party_delete_steps(db, party_id))
+
+
+def delete_campaign_tree(db: Session, campaign: Campaign) -> None:
+    """Delete a campaign in the caller's transaction.
+
+    Meant for small trees (a user's own campaigns when the user is removed).
+    Campaign deletion from the API goes through ``campaign_deletion`` jobs,
+    which run the same steps in committed chunks.
+    """
+    campaign_id = _require_identifier(campaign.id, "Campaign is missing an id")
+    _run_steps(db, campaign_delete_steps(db, campaign_id))
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy import and_, func, or_, update
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.db.loaders import load_campaign
+from app.db.session import engine
+from app.models.campaign import Campaign
+from app.models.campaign_deletion_job import CampaignDeletionJob, CampaignDeletionStatus
+from app.models.session import Session as CampaignSession, SessionStatus
+from app.services.campaign_cleanup import campaign_delete_steps, delete_step_chunk, existing_steps
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_DELETION_STATUSES = (CampaignDeletionStatus.PENDING, CampaignDeletionStatus.RUNNING)
+# A RUNNING job whose worker has not reported for this long is taken over.
+STALE_JOB_AFTER = timedelta(minutes=5)
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def is_campaign_pending_deletion(db: Session, campaign_id: str | None) -> bool:
+    """True once deletion was requested; its sessions and parties act as gone."""
+    campaign = load_campaign(db, campaign_id)
+    return campaign is not None and campaign.deletion_requested_at is not None
+
+
+def get_active_deletion_job(db: Session, campaign_id: str) -> CampaignDeletionJob | None:
+    return db.exec(
+        select(CampaignDeletionJob)
+        .where(
+            CampaignDeletionJob.campaign_id == campaign_id,
+            CampaignDeletionJob.status.in_(ACTIVE_DELETION_STATUSES),  # type: ignore[attr-defined]
+        )
+        .order_by(CampaignDeletionJob.created_at.desc())
+    ).first()
+
+
+def request_campaign_deletion(
+    db: Session,
+    campaign: Campaign,
+    *,
+    requested_by_user_id: str | None = None,
+) -> CampaignDeletionJob:
+    """Mark ``campaign`` pending-delete and queue its job; the caller commits.
+
+    Open sessions are closed so nothing keeps writing rows into tables the
+    job has already cleared. Asking again while a job is queued or running
+    returns that job.
+    """
+    if campaign.id is None:
+        raise ValueError("Campaign is missing an id")
+    existing = get_active_deletion_job(db, campaign.id)
+    if existing is not None:
+        return existing
+
+    now = utcnow()
+    if campaign.deletion_requested_at is None:
+        campaign.deletion_requested_at = now
+        db.add(campaign)
+    db.exec(  # type: ignore[call-overload]
+        update(CampaignSession)
+        .where(
+            CampaignSession.campaign_id == campaign.id,
+            CampaignSession.status.in_((SessionStatus.LOBBY, SessionStatus.ACTIVE)),  # type: ignore[attr-defined]
+        )
+        .values(status=SessionStatus.CLOSED, ended_at=now)
+    )
+    job = CampaignDeletionJob(
+        id=str(uuid4()),
+        campaign_id=campaign.id,
+        campaign_name=campaign.name,
+        requested_by_user_id=requested_by_user_id,
+        status=CampaignDeletionStatus.PENDING,
+        created_at=now,
+    )
+    db.add(job)
+    return job
+
+
+def retry_deletion_job(db: Session, job: CampaignDeletionJob) -> CampaignDeletionJob:
+    """Requeue a FAILED job from its first step; the caller commits.
+
+    Earlier steps run again because rows written after they finished are
+    what usually makes a later step fail.
+    """
+    if job.status != CampaignDeletionStatus.FAILED:
+        raise ValueError("Only failed deletion jobs can be retried")
+    job.status = CampaignDeletionStatus.PENDING
+    job.steps_done = 0
+    job.current_table = None
+    job.error = None
+    job.finished_at = None
+    job.heartbeat_at = None
+    db.add(job)
+    return job
+
+
+def _claimable_clause(now: datetime):
+    return or_(
+        CampaignDeletionJob.status == CampaignDeletionStatus.PENDING,
+        and_(
+            CampaignDeletionJob.status == CampaignDeletionStatus.RUNNING,
+            CampaignDeletionJob.heartbeat_at < now - STALE_JOB_AFTER,  # type: ignore[operator]
+        ),
+    )
+
+
+def claim_next_deletion_job(
+    db: Session,
+    *,
+    now: datetime | None = None,
+) -> CampaignDeletionJob | None:
+    """Move the oldest claimable job to RUNNING; ``None`` if another worker won it."""
+    reference = now or utcnow()
+    job_id = db.exec(
+        select(CampaignDeletionJob.id)
+        .where(_claimable_clause(reference))
+        .order_by(CampaignDeletionJob.created_at)
+        .limit(1)
+    ).first()
+    if job_id is None:
+        return None
+    claimed = db.exec(  # type: ignore[call-overload]
+        update(CampaignDeletionJob)
+        .where(CampaignDeletionJob.id == job_id, _claimable_clause(reference))
+        .values(
+            status=CampaignDeletionStatus.RUNNING,
+            started_at=func.coalesce(CampaignDeletionJob.started_at, reference),
+            heartbeat_at=reference,
+        )
+    )
+    db.commit()
+    if claimed.rowcount != 1:
+        return None
+    return db.get(CampaignDeletionJob, job_id)
+
+
+def _report(db: Session, job: CampaignDeletionJob) -> None:
+    job.heartbeat_at = utcnow()
+    db.add(job)
+    db.commit()
+
+
+def run_deletion_job(db: Session, job: CampaignDeletionJob, *, chunk_size: int) -> None:
+    """Run a claimed job to completion, committing after every chunk.
+
+    Each commit releases the row locks taken so far, so players and the admin
+    API are never blocked for longer than one chunk. Steps already finished
+    (``steps_done``) are skipped when a stale job is resumed; a step that was
+    interrupted mid-way just finds fewer rows.
+    """
+    try:
+        steps = existing_steps(db, campaign_delete_steps(db, job.campaign_id))
+        job.steps_total = len(steps)
+        for index in range(job.steps_done, len(steps)):
+            step = steps[index]
+            job.current_table = step.table
+            while True:
+                deleted = delete_step_chunk(db, step, chunk_size)
+                job.rows_deleted += deleted
+                _report(db, job)
+                if deleted < chunk_size:
+                    break
+            job.steps_done = index + 1
+        job.status = CampaignDeletionStatus.COMPLETED
+        job.current_table = None
+        job.finished_at = utcnow()
+        _report(db, job)
+    except Exception as exc:
+        db.rollback()
+        logger.exception("Campaign deletion job %s failed", job.id)
+        job.status = CampaignDeletionStatus.FAILED
+        job.error = str(exc)[:500]
+        job.finished_at = utcnow()
+        _report(db, job)
+
+
+def _run_pending_jobs_once(chunk_size: int) -> int:
+    processed = 0
+    with Session(engine) as db:
+        while (job := claim_next_deletion_job(db)) is not None:
+            run_deletion_job(db, job, chunk_size=chunk_size)
+            processed += 1
+    return processed
+
+
+async def run_campaign_deletion_worker(interval_seconds: float) -> None:
+    """Background loop started from the app lifespan; never lets a failure kill it."""
+    while True:
+        try:
+            processed = await asyncio.to_thread(
+                _run_pending_jobs_once, settings.campaign_deletion_chunk_size
+            )
+            if processed:
+                logger.info("Processed %d campaign deletion jobs", processed)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Campaign deletion worker failed")
+        await asyncio.sleep(interval_seconds)
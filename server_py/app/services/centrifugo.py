@@ -1,6 +1,20 @@
+import asyncio
+import logging
+
 import httpx
+from sqlmodel import Session
 
 from app.core.config import settings
+from app.core.metrics import time_publish
+from app.db.session import engine
+from app.services.realtime_replay import record_realtime_event
+
+logger = logging.getLogger(__name__)
+
+
+def _record_once(channel: str, data: dict) -> dict:
+    with Session(engine) as db:
+        return record_realtime_event(db, channel, data)
 
 
 class CentrifugoClient:
@@ -18,11 +32,17 @@ class CentrifugoClient:
         return self._http
 
     async def publish(self, channel: str, data: dict) -> None:
-        resp = await self._client().post(
-            f"{self._api_url}/publish",
-            json={"channel": channel, "data": data},
-            headers=self._headers,
-        )
+        try:
+            data = await asyncio.to_thread(_record_once, channel, data)
+        except Exception:
+            # Still deliver live; clients without a seq fall back to a full refetch on reconnect.
+            logger.exception("Failed to sequence realtime event for %s", channel)
+        with time_publish():
+            resp = await self._client().post(
+                f"{self._api_url}/publish",
+                json={"channel": channel, "data": data},
+                headers=self._headers,
+            )
         resp.raise_for_status()
 
     async def presence(self, channel: str) -> dict:
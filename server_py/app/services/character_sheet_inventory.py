@@ -13,6 +13,7 @@ from app.models.campaign_member import CampaignMember
 from app.models.inventory import InventoryItem
 from app.models.item import Item, ItemType
 from app.models.party import Party
+from app.services.campaign_catalog import materialize_campaign_catalog_item, resolve_campaign_catalog
 from app.services.magic_item_effects import initialize_inventory_item_charges
 
 logger = logging.getLogger(__name__)
@@ -69,7 +70,7 @@ def sync_character_sheet_inventory(
     if only_if_inventory_empty and existing_inventory:
         return
 
-    campaign_items = db.exec(select(Item).where(Item.campaign_id == party.campaign_id)).all()
+    campaign_items = resolve_campaign_catalog(db, campaign)
     items_by_id: dict[str, Item] = {}
     items_by_base_item_id: dict[str, Item] = {}
     items_by_lookup: dict[str, Item] = {}
@@ -112,6 +113,7 @@ def sync_character_sheet_inventory(
         item_key = _campaign_item_key(catalog_item)
         if not item_key or item_key in existing_inventory_keys:
             continue
+        catalog_item = materialize_campaign_catalog_item(db, catalog_item)
 
         inventory_entry = InventoryItem(  # type: ignore[call-arg]
             id=str(uuid4()),
@@ -0,0 +1,510 @@
+from __future__ import annotations
+
+from sqlalchemy.orm.attributes import flag_modified
+from sqlmodel import Session
+
+from app.db.loaders import get_loader
+from app.db.persistence import commit_and_keep
+from app.models.campaign_entity import CampaignEntity
+from app.models.combat import CombatState
+from app.models.session_entity import SessionEntity
+from app.services.roll_resolution import resolve_saving_throw
+
+from .exceptions import CombatServiceError
+
+
+_AREA_SPELL_MODES = ("saving_throw", "direct_damage")
+
+
+class CombatAreaSpellMixin:
+    """Resolve one spell against several targets in a single command.
+
+    The caster's costs, the effect roll, the commit and the state/log emits
+    happen once; saving throws, resistances and concentration checks are
+    still resolved per target.
+    """
+
+    @classmethod
+    def _resolve_additional_spell_targets(
+        cls,
+        state: CombatState,
+        primary_target: dict,
+        target_ref_ids: list[str],
+    ) -> list[dict]:
+        targets: list[dict] = []
+        seen = {primary_target["ref_id"]}
+        for ref_id in target_ref_ids:
+            if ref_id in seen:
+                continue
+            seen.add(ref_id)
+            participant = cls._get_participant_by_ref(state, ref_id)
+            if not participant:
+                raise CombatServiceError("Target not found in combat")
+            targets.append(participant)
+        return targets
+
+    @classmethod
+    def _require_area_spell_supported(cls, spell_context: dict) -> None:
+        if spell_context["spell_mode"] not in _AREA_SPELL_MODES:
+            raise CombatServiceError(
+                "Only saving throw and direct damage spells can target several creatures at once.",
+                400,
+            )
+        if cls._get_spell_automation_spec(spell_context.get("spell_canonical_key")) is not None:
+            raise CombatServiceError("This spell can only target one creature at a time.", 400)
+
+    @classmethod
+    def _prime_area_spell_targets(cls, db: Session, outcomes: list[dict]) -> None:
+        """Load every entity target and its stat block in two ``IN`` queries.
+
+        The per-target save, damage and status helpers then read these rows
+        from the request loader instead of querying once per target.
+        """
+        loader = get_loader(db)
+        session_entities = loader.get_many(
+            SessionEntity,
+            (outcome["target_ref_id"] for outcome in outcomes if outcome["target_kind"] != "player"),
+        )
+        loader.prime(
+            CampaignEntity,
+            (session_entity.campaign_entity_id for session_entity in session_entities.values()),
+        )
+
+    @classmethod
+    def _area_target_takes_effect(cls, outcome: dict, save_success_outcome: object) -> bool:
+        return outcome.get("is_saved") is not True or (
+            cls._normalize_save_success_outcome(save_success_outcome) == "half_damage"
+        )
+
+    @classmethod
+    def _apply_area_spell_amount(
+        cls,
+        db: Session,
+        state: CombatState,
+        outcomes: list[dict],
+        *,
+        rolled_total: int,
+        action_kind: str,
+        effect_kind: str,
+        save_success_outcome: object,
+        damage_type: str | None,
+        is_critical: bool = False,
+        concentration_roll_source: str = "system",
+        concentration_manual_roll: int | None = None,
+    ) -> None:
+        for outcome in outcomes:
+            amount = (
+                cls._resolve_save_damage_amount(
+                    rolled_total,
+                    is_saved=bool(outcome.get("is_saved")),
+                    save_success_outcome=save_success_outcome,
+                )
+                if action_kind == "saving_throw" and effect_kind == "damage"
+                else max(0, rolled_total)
+            )
+            new_hp = None
+            effect_msg = ""
+            previous_hp = None
+            concentration_check = None
+            if amount > 0:
+                new_hp, effect_msg, previous_hp, concentration_check = cls._apply_spell_effect(
+                    db,
+                    state,
+                    outcome["target_ref_id"],
+                    outcome["target_kind"],
+                    effect_kind,
+                    amount,
+                    damage_type=damage_type,
+                    is_critical=is_critical,
+                    concentration_roll_source=concentration_roll_source,
+                    concentration_manual_roll=concentration_manual_roll,
+                )
+            outcome.update(
+                {
+                    "damage": amount if effect_kind != "healing" else 0,
+                    "healing": amount if effect_kind == "healing" else 0,
+                    "new_hp": new_hp,
+                    "previous_hp": previous_hp,
+                    "effect_msg": effect_msg,
+                    "concentration_check": concentration_check,
+                }
+            )
+
+    @classmethod
+    async def _emit_area_target_updates(
+        cls,
+        db: Session,
+        session_id: str,
+        outcomes: list[dict],
+        player_ref_ids: set[str],
+    ) -> None:
+        player_ref_ids = set(player_ref_ids)
+        for outcome in outcomes:
+            if not (outcome.get("damage") or outcome.get("healing")):
+                continue
+            if outcome["target_kind"] == "player":
+                player_ref_ids.add(outcome["target_ref_id"])
+            elif outcome.get("previous_hp") != outcome.get("new_hp"):
+                await cls._emit_entity_hp_update(db, session_id, outcome["target_ref_id"], outcome["previous_hp"])
+        for player_ref_id in player_ref_ids:
+            target_state, *_ = cls._get_stats(db, player_ref_id, "player", session_id)
+            await cls._emit_player_state_update(db, session_id, player_ref_id, target_state)
+
+    @classmethod
+    def _area_spell_log_message(
+        cls,
+        caster_name: str,
+        verb: str,
+        spell_name: str,
+        outcomes: list[dict],
+        *,
+        save_ability: object,
+        save_dc: object,
+        effect_kind: str,
+        damage_type: str | None,
+        pending: bool = False,
+    ) -> str:
+        header = f"{caster_name} {verb} {spell_name} em {len(outcomes)} alvos"
+        if save_ability:
+            header += f" (save de {save_ability} contra CD {save_dc})"
+        parts: list[str] = []
+        for outcome in outcomes:
+            part = outcome["target_display_name"]
+            if outcome.get("is_saved") is not None:
+                part += f" {'passou' if outcome['is_saved'] else 'falhou'}"
+                if outcome.get("roll") is not None:
+                    part += f" ({outcome['roll']})"
+            if not pending:
+                if effect_kind == "healing":
+                    part += f", {outcome.get('healing', 0)} HP restaurados"
+                else:
+                    part += f", {outcome.get('damage', 0)} de dano de {damage_type or 'energia'}"
+                if outcome.get("effect_msg"):
+                    part += outcome["effect_msg"]
+                concentration_check = outcome.get("concentration_check")
+                if isinstance(concentration_check, dict) and isinstance(concentration_check.get("summary_text"), str):
+                    part += f" {concentration_check['summary_text']}"
+            parts.append(part)
+        message = f"{header}: {'; '.join(parts)}."
+        if pending:
+            message += " Efeito pendente."
+        return message
+
+    @classmethod
+    def _area_target_results(cls, outcomes: list[dict]) -> list[dict]:
+        return [
+            {
+                "target_ref_id": outcome["target_ref_id"],
+                "target_kind": outcome["target_kind"],
+                "target_display_name": outcome["target_display_name"],
+                "is_saved": outcome.get("is_saved"),
+                "roll": outcome.get("roll"),
+                "roll_result": outcome.get("roll_result"),
+                "damage": outcome.get("damage", 0),
+                "healing": outcome.get("healing", 0),
+                "new_hp": outcome.get("new_hp"),
+                "concentration_check": outcome.get("concentration_check"),
+            }
+            for outcome in outcomes
+        ]
+
+    @classmethod
+    async def _cast_area_spell(
+        cls,
+        db: Session,
+        session_id: str,
+        req,
+        *,
+        state: CombatState,
+        attacker: dict,
+        actor_user_id: str,
+        is_gm: bool,
+        spell_context: dict,
+        targets: list[dict],
+        action_cost: str,
+        was_overridden: bool,
+        slot_spent: bool,
+    ) -> dict:
+        spell_mode = spell_context["spell_mode"]
+        effect_kind = spell_context["effect_kind"]
+        effect_bonus = cls._safe_int(spell_context.get("effect_bonus"), 0)
+        save_success_outcome = spell_context.get("save_success_outcome")
+        damage_type = spell_context.get("damage_type")
+        outcomes = [
+            {
+                "target_ref_id": target["ref_id"],
+                "target_kind": target["kind"],
+                "target_display_name": target["display_name"],
+                "is_saved": None,
+                "roll": None,
+                "roll_result": None,
+            }
+            for target in targets
+        ]
+        cls._prime_area_spell_targets(db, outcomes)
+
+        if spell_mode == "saving_throw":
+            save_dc = cls._safe_int(spell_context.get("save_dc"), 0)
+            for outcome in outcomes:
+                roll_result = resolve_saving_throw(
+                    cls._build_roll_actor_stats_for_save(
+                        db,
+                        session_id,
+                        outcome["target_ref_id"],
+                        outcome["target_kind"],
+                        outcome["target_display_name"],
+                    ),
+                    ability=spell_context["save_ability"],
+                    dc=save_dc,
+                )
+                roll_result.is_gm_roll = is_gm
+                outcome.update(
+                    {
+                        "is_saved": bool(roll_result.success),
+                        "roll": roll_result.total,
+                        "roll_result": roll_result,
+                    }
+                )
+
+        affected = [
+            outcome for outcome in outcomes
+            if cls._area_target_takes_effect(outcome, save_success_outcome)
+        ]
+        pending_spell_id = None
+        if affected and spell_context["effect_dice"] is not None:
+            primary = outcomes[0]
+            pending_spell_id = cls._create_pending_spell_effect(
+                state,
+                attacker,
+                {
+                    "spell_name": spell_context["spell_name"],
+                    "spell_canonical_key": spell_context["spell_canonical_key"],
+                    "action_kind": spell_mode,
+                    "effect_kind": effect_kind,
+                    "effect_dice": spell_context["effect_dice"],
+                    "effect_bonus": effect_bonus,
+                    "damage_type": damage_type,
+                    "elemental_affinity_eligible": spell_context.get("elemental_affinity_eligible"),
+                    "elemental_affinity_damage_type": spell_context.get("elemental_affinity_damage_type"),
+                    "elemental_affinity_bonus": spell_context.get("elemental_affinity_bonus"),
+                    "target_ref_id": primary["target_ref_id"],
+                    "target_kind": primary["target_kind"],
+                    "target_display_name": primary["target_display_name"],
+                    "save_ability": spell_context.get("save_ability"),
+                    "save_dc": spell_context.get("save_dc"),
+                    "save_success_outcome": save_success_outcome,
+                    "is_saved": primary["is_saved"],
+                    "is_critical": False,
+                    "roll": primary["roll"],
+                    "roll_result": (
+                        primary["roll_result"].model_dump(mode="json")
+                        if primary["roll_result"] is not None
+                        else None
+                    ),
+                    "targets": [
+                        {
+                            "target_ref_id": outcome["target_ref_id"],
+                            "target_kind": outcome["target_kind"],
+                            "target_display_name": outcome["target_display_name"],
+                            "is_saved": outcome["is_saved"],
+                            "roll": outcome["roll"],
+                        }
+                        for outcome in affected
+                    ],
+                },
+            )
+        elif affected:
+            cls._apply_area_spell_amount(
+                db,
+                state,
+                affected,
+                rolled_total=max(0, effect_bonus),
+                action_kind=spell_mode,
+                effect_kind=effect_kind,
+                save_success_outcome=save_success_outcome,
+                damage_type=damage_type,
+                concentration_roll_source=req.concentration_roll_source,
+                concentration_manual_roll=req.concentration_manual_roll,
+            )
+        else:
+            flag_modified(state, "participants")
+
+        db.add(state)
+        commit_and_keep(db)
+
+        await cls._emit_area_target_updates(
+            db,
+            session_id,
+            outcomes,
+            {attacker["ref_id"]} if slot_spent else set(),
+        )
+        await cls._emit_state(session_id, state)
+
+        log_message = cls._area_spell_log_message(
+            attacker["display_name"],
+            "lancou",
+            spell_context["spell_name"],
+            outcomes,
+            save_ability=spell_context.get("save_ability") if spell_mode == "saving_throw" else None,
+            save_dc=spell_context.get("save_dc"),
+            effect_kind=effect_kind,
+            damage_type=damage_type,
+            pending=pending_spell_id is not None,
+        )
+        if was_overridden:
+            log_message = f"[OVERRIDE: Limit for '{action_cost}' ignored] {log_message}"
+        await cls._emit_log(session_id, {
+            "message": log_message,
+            "actorUserId": actor_user_id,
+            "source": "gm_override" if is_gm else "player_turn",
+            "is_override": was_overridden,
+            "overridden_resource": action_cost if was_overridden else None,
+        })
+
+        primary = outcomes[0]
+        return {
+            "spell_name": spell_context["spell_name"],
+            "spell_canonical_key": spell_context["spell_canonical_key"],
+            "action_kind": spell_mode,
+            "effect_kind": effect_kind,
+            "damage": primary.get("damage", 0),
+            "healing": primary.get("healing", 0),
+            "damage_type": damage_type,
+            "is_critical": False,
+            "is_hit": None,
+            "is_saved": primary["is_saved"],
+            "new_hp": primary.get("new_hp"),
+            "roll": primary["roll"],
+            "roll_result": primary["roll_result"],
+            "target_ac": None,
+            "target_display_name": primary["target_display_name"],
+            "target_kind": primary["target_kind"],
+            "save_ability": spell_context.get("save_ability"),
+            "save_dc": spell_context.get("save_dc"),
+            "save_success_outcome": save_success_outcome,
+            "effect_dice": spell_context.get("effect_dice"),
+            "effect_bonus": effect_bonus,
+            "pending_spell_id": pending_spell_id,
+            "effect_roll_required": bool(pending_spell_id),
+            "base_effect": None if spell_context.get("effect_dice") else 0,
+            "action_cost": action_cost,
+            "summary_text": None,
+            "inventory_refresh_required": spell_context.get("source_kind") == "magic_item",
+            "concentration_check": primary.get("concentration_check"),
+            "elemental_affinity_eligible": bool(spell_context.get("elemental_affinity_eligible")),
+            "elemental_affinity_damage_type": spell_context.get("elemental_affinity_damage_type"),
+            "elemental_affinity_bonus": spell_context.get("elemental_affinity_bonus"),
+            "targets": cls._area_target_results(outcomes),
+        }
+
+    @classmethod
+    async def _resolve_area_spell_effect(
+        cls,
+        db: Session,
+        session_id: str,
+        req,
+        *,
+        state: CombatState,
+        attacker: dict,
+        actor_user_id: str,
+        is_gm: bool,
+        pending_spell: dict,
+        effect_rolls: list[int],
+        base_effect: int,
+        rolled_effect_total: int,
+    ) -> dict:
+        effect_kind = pending_spell.get("effect_kind") or "damage"
+        action_kind = pending_spell.get("action_kind") or "direct_damage"
+        save_success_outcome = cls._normalize_save_success_outcome(pending_spell.get("save_success_outcome"))
+        outcomes = [
+            {
+                "target_ref_id": target["target_ref_id"],
+                "target_kind": target["target_kind"],
+                "target_display_name": target.get("target_display_name") or "Target",
+                "is_saved": target.get("is_saved"),
+                "roll": target.get("roll"),
+                "roll_result": None,
+            }
+            for target in pending_spell["targets"]
+            if isinstance(target, dict)
+            and isinstance(target.get("target_ref_id"), str)
+            and isinstance(target.get("target_kind"), str)
+        ]
+        if not outcomes:
+            raise CombatServiceError("Pending spell effect is missing target information.", 400)
+        cls._prime_area_spell_targets(db, outcomes)
+
+        cls._apply_area_spell_amount(
+            db,
+            state,
+            outcomes,
+            rolled_total=rolled_effect_total,
+            action_kind=action_kind,
+            effect_kind=effect_kind,
+            save_success_outcome=save_success_outcome,
+            damage_type=pending_spell.get("damage_type"),
+            is_critical=bool(pending_spell.get("is_critical")),
+            concentration_roll_source=req.concentration_roll_source,
+            concentration_manual_roll=req.concentration_manual_roll,
+        )
+
+        cls._clear_participant_pending_attack(attacker)
+        flag_modified(state, "participants")
+        db.add(state)
+        commit_and_keep(db)
+
+        await cls._emit_area_target_updates(db, session_id, outcomes, set())
+        await cls._emit_state(session_id, state)
+
+        log_message = cls._area_spell_log_message(
+            attacker["display_name"],
+            "resolveu",
+            pending_spell.get("spell_name") or "magia",
+            outcomes,
+            save_ability=pending_spell.get("save_ability") if action_kind == "saving_throw" else None,
+            save_dc=pending_spell.get("save_dc"),
+            effect_kind=effect_kind,
+            damage_type=pending_spell.get("damage_type"),
+        )
+        if action_kind == "saving_throw" and effect_kind == "damage":
+            log_message += f" Dano rolado {rolled_effect_total}."
+        await cls._emit_log(session_id, {
+            "message": log_message,
+            "actorUserId": actor_user_id,
+            "source": "gm_override" if is_gm else "player_turn",
+        })
+
+        primary = outcomes[0]
+        return {
+            "spell_name": pending_spell.get("spell_name") or "Spell",
+            "spell_canonical_key": pending_spell.get("spell_canonical_key"),
+            "action_kind": action_kind,
+            "effect_kind": effect_kind,
+            "damage": primary.get("damage", 0),
+            "healing": primary.get("healing", 0),
+            "damage_type": pending_spell.get("damage_type"),
+            "is_critical": bool(pending_spell.get("is_critical")),
+            "is_hit": None,
+            "is_saved": primary["is_saved"] if action_kind == "saving_throw" else None,
+            "new_hp": primary.get("new_hp"),
+            "roll": primary["roll"],
+            "roll_result": None,
+            "target_ac": None,
+            "target_display_name": primary["target_display_name"],
+            "target_kind": primary["target_kind"],
+            "save_ability": pending_spell.get("save_ability"),
+            "save_dc": cls._safe_optional_int(pending_spell.get("save_dc")),
+            "save_success_outcome": save_success_outcome,
+            "effect_dice": pending_spell.get("effect_dice"),
+            "effect_bonus": cls._safe_int(pending_spell.get("effect_bonus"), 0),
+            "pending_spell_id": None,
+            "effect_roll_required": False,
+            "effect_rolls": effect_rolls,
+            "base_effect": base_effect,
+            "effect_roll_source": req.roll_source,
+            "concentration_check": primary.get("concentration_check"),
+            "elemental_affinity_eligible": bool(pending_spell.get("elemental_affinity_eligible")),
+            "elemental_affinity_damage_type": pending_spell.get("elemental_affinity_damage_type"),
+            "elemental_affinity_bonus": pending_spell.get("elemental_affinity_bonus"),
+            "targets": cls._area_target_results(outcomes),
+        }
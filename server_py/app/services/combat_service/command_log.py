@@ -0,0 +1,145 @@
+"""Per-command buffering of combat realtime output.
+
+A combat route runs its service call inside ``combat_command(session_id)``.
+While the scope is open, ``_emit_log`` appends to the command's log and
+``_emit_state`` keeps only the latest state payload. On exit the log is stored
+with one bulk insert, and the command publishes at most two messages: the
+final ``combat_state_updated`` and one ordered ``combat_log_batch``.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import logging
+from uuid import uuid4
+
+from sqlalchemy import insert
+from sqlmodel import Session, select
+
+from app.db.session import engine
+from app.models.combat_log_entry import CombatLogEntry
+from app.services.centrifugo import centrifugo
+from app.services.realtime import build_event, event_version, session_channel
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CombatCommandLog:
+    session_id: str
+    entries: list[dict] = field(default_factory=list)
+    state_payload: dict | None = None
+
+    def add(self, log_payload: dict) -> None:
+        self.entries.append(
+            {**log_payload, "createdAt": datetime.now(timezone.utc).isoformat()}
+        )
+
+
+_active_command: ContextVar[CombatCommandLog | None] = ContextVar(
+    "combat_command_log",
+    default=None,
+)
+
+
+def active_combat_command(session_id: str) -> CombatCommandLog | None:
+    command = _active_command.get()
+    if command is None or command.session_id != session_id:
+        return None
+    return command
+
+
+def combat_log_entry_rows(session_id: str, entries: list[dict]) -> list[dict]:
+    rows: list[dict] = []
+    for sequence, entry in enumerate(entries):
+        message = entry.get("message")
+        source = entry.get("source")
+        rows.append(
+            {
+                "id": str(uuid4()),
+                "session_id": session_id,
+                "sequence": sequence,
+                "message": message if isinstance(message, str) else "",
+                "source": source if isinstance(source, str) else None,
+                "payload_json": entry,
+                "created_at": datetime.fromisoformat(entry["createdAt"]),
+            }
+        )
+    return rows
+
+
+def persist_combat_log_entries(db: Session, session_id: str, entries: list[dict]) -> None:
+    if not entries:
+        return
+    db.exec(insert(CombatLogEntry).values(combat_log_entry_rows(session_id, entries)))  # type: ignore[call-overload]
+    db.commit()
+
+
+def list_combat_log_entries(db: Session, session_id: str, limit: int = 50) -> list[dict]:
+    """The latest ``limit`` persisted entries, oldest first."""
+    rows = db.exec(
+        select(CombatLogEntry)
+        .where(CombatLogEntry.session_id == session_id)
+        .order_by(CombatLogEntry.created_at.desc(), CombatLogEntry.sequence.desc())  # type: ignore[union-attr]
+        .limit(limit)
+    ).all()
+    return [
+        row.payload_json or {"message": row.message, "source": row.source}
+        for row in reversed(rows)
+    ]
+
+
+def _persist_once(session_id: str, entries: list[dict]) -> None:
+    with Session(engine) as db:
+        persist_combat_log_entries(db, session_id, entries)
+
+
+async def flush_combat_command(command: CombatCommandLog) -> None:
+    if command.entries:
+        try:
+            await asyncio.to_thread(_persist_once, command.session_id, command.entries)
+        except Exception:
+            logger.exception("Failed to persist combat log for session %s", command.session_id)
+
+    channel = session_channel(command.session_id)
+    if command.state_payload is not None:
+        await centrifugo.publish(channel, build_event("combat_state_updated", command.state_payload))
+    if command.entries:
+        await centrifugo.publish(
+            channel,
+            build_event(
+                "combat_log_batch",
+                {"sessionId": command.session_id, "entries": command.entries},
+                version=event_version(),
+            ),
+        )
+
+
+@asynccontextmanager
+async def combat_command(session_id: str) -> AsyncIterator[CombatCommandLog]:
+    """Buffer combat state/log output for one command; nested scopes share the outer one."""
+    current = active_combat_command(session_id)
+    if current is not None:
+        yield current
+        return
+
+    command = CombatCommandLog(session_id=session_id)
+    token = _active_command.set(command)
+    try:
+        yield command
+    except Exception:
+        _active_command.reset(token)
+        # Emits happen after the service commits, so whatever was buffered
+        # reflects persisted state even if a later step of the route failed.
+        try:
+            await flush_combat_command(command)
+        except Exception:
+            logger.exception("Failed to flush combat command for session %s", session_id)
+        raise
+    else:
+        _active_command.reset(token)
+        await flush_combat_command(command)
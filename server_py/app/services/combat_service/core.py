@@ -11,6 +11,7 @@ from sqlalchemy import func
 from sqlalchemy.orm.attributes import flag_modified
 from sqlmodel import Session, select
 
+from app.db.loaders import load_campaign_entity, load_session_entity
 from app.models.base_item import BaseItemKind, BaseItemWeaponRangeType
 from app.models.campaign import Campaign, SystemType
 from app.models.campaign_member import CampaignMember
@@ -861,9 +862,9 @@ class CombatCoreMixin:
                 spell_mod = 0
             return target, ac, str_val, dex_val, prof_bonus, spell_mod
         else:
-            target = db.exec(select(SessionEntity).where(SessionEntity.id == ref_id)).first()
+            target = load_session_entity(db, ref_id)
             if not target: raise CombatServiceError("Entity not found")
-            npc = db.exec(select(CampaignEntity).where(CampaignEntity.id == target.campaign_entity_id)).first()
+            npc = load_campaign_entity(db, target.campaign_entity_id)
             if not npc: raise CombatServiceError("Campaign entity not found")
             abilities = cls._as_dict(npc.abilities)
             overrides = cls._as_dict(target.overrides)
@@ -891,10 +892,10 @@ class CombatCoreMixin:
         db: Session,
         session_entity_id: str,
     ) -> tuple[SessionEntity, CampaignEntity]:
-        target = db.exec(select(SessionEntity).where(SessionEntity.id == session_entity_id)).first()
+        target = load_session_entity(db, session_entity_id)
         if not target:
             raise CombatServiceError("Entity not found")
-        npc = db.exec(select(CampaignEntity).where(CampaignEntity.id == target.campaign_entity_id)).first()
+        npc = load_campaign_entity(db, target.campaign_entity_id)
         if not npc:
             raise CombatServiceError("Campaign entity not found")
         return target, npc
@@ -7,13 +7,13 @@ from math import floor
 from sqlalchemy.orm.attributes import flag_modified
 from sqlmodel import Session, select
 
+from app.db.loaders import load_campaign_entity
 from app.models.base_item import BaseItemKind, BaseItemWeaponRangeType
 from app.models.campaign import Campaign, SystemType
 from app.models.combat import CombatPhase, CombatState
 from app.models.session import Session as CampaignSession
 from app.models.session_entity import SessionEntity
 from app.models.session_state import SessionState
-from app.models.campaign_entity import CampaignEntity
 from app.models.inventory import InventoryItem
 from app.models.item import Item, ItemType
 from app.schemas.combat import (
@@ -187,7 +187,7 @@ class CombatDamageMixin:
                 concentration_check,
             )
         else:
-            npc = db.exec(select(CampaignEntity).where(CampaignEntity.id == target_model.campaign_entity_id)).first()
+            npc = load_campaign_entity(db, target_model.campaign_entity_id)
             base_hp = npc.max_hp if npc else 0
             current = target_model.current_hp if target_model.current_hp is not None else base_hp or 0
             target_model.current_hp = max(0, current - amount)
@@ -281,7 +281,7 @@ class CombatDamageMixin:
                 db.add(state)
             return cls._safe_int(cls._as_dict(target_model.state_json).get("currentHP"), 0), msg, current
         else:
-            npc = db.exec(select(CampaignEntity).where(CampaignEntity.id == target_model.campaign_entity_id)).first()
+            npc = load_campaign_entity(db, target_model.campaign_entity_id)
             base_hp = npc.max_hp if npc else 999
             current = target_model.current_hp if target_model.current_hp is not None else base_hp or 0
             max_hp = base_hp or 999
@@ -6,6 +6,7 @@ from uuid import uuid4
 from sqlalchemy.orm.attributes import flag_modified
 from sqlmodel import Session
 
+from app.db.persistence import commit_and_keep
 from app.models.combat import CombatState
 from app.schemas.combat import (
     CombatApplyEffectRequest,
@@ -16,6 +17,7 @@ from app.schemas.combat import (
 )
 
 from .exceptions import CombatServiceError
+from .roster import due_effects, participant_effects_of_kind
 
 
 class CombatEffectsMixin:
@@ -34,27 +36,27 @@ class CombatEffectsMixin:
     @classmethod
     def _sum_numeric_effects(cls, participant: dict, kind: str) -> int:
         total = 0
-        for effect in cls._get_participant_effects(participant):
-            if effect.get("kind") == kind:
-                val = effect.get("numeric_value")
-                if isinstance(val, int):
-                    total += val
+        for effect in participant_effects_of_kind(participant, kind):
+            val = effect.get("numeric_value")
+            if isinstance(val, int):
+                total += val
         return total
 
     @classmethod
     def _has_effect_kind(cls, participant: dict, kind: str) -> bool:
-        return any(
-            e.get("kind") == kind
-            for e in cls._get_participant_effects(participant)
-        )
+        return bool(participant_effects_of_kind(participant, kind))
 
     @classmethod
     def _consume_first_effect(cls, participant: dict, kind: str) -> dict | None:
         """Remove and return the first effect of the given kind. Used for one-shot effects like Help."""
+        matches = participant_effects_of_kind(participant, kind)
+        if not matches:
+            return None
+        removed = matches[0]
         effects = cls._get_participant_effects(participant)
         for i, e in enumerate(effects):
-            if e.get("kind") == kind:
-                removed = effects.pop(i)
+            if e is removed:
+                effects.pop(i)
                 cls._set_participant_effects(participant, effects)
                 return removed
         return None
@@ -112,10 +114,7 @@ class CombatEffectsMixin:
         state = cls.get_state(db, session_id)
         cls._require_active(state)
 
-        target_p = next(
-            (p for p in state.participants if p["id"] == req.target_participant_id),
-            None,
-        )
+        target_p = cls._find_participant_by_id(state, req.target_participant_id)
         if not target_p:
             raise CombatServiceError("Target participant not found in combat", 404)
 
@@ -161,8 +160,7 @@ class CombatEffectsMixin:
         flag_modified(state, "participants")
 
         db.add(state)
-        db.commit()
-        db.refresh(state)
+        commit_and_keep(db)
         await cls._emit_state(session_id, state)
 
         label = cls._effect_label(effect)
@@ -182,10 +180,7 @@ class CombatEffectsMixin:
         state = cls.get_state(db, session_id)
         cls._require_active(state)
 
-        target_p = next(
-            (p for p in state.participants if p["id"] == req.target_participant_id),
-            None,
-        )
+        target_p = cls._find_participant_by_id(state, req.target_participant_id)
         if not target_p:
             raise CombatServiceError("Target participant not found in combat", 404)
 
@@ -214,8 +209,7 @@ class CombatEffectsMixin:
         flag_modified(state, "participants")
 
         db.add(state)
-        db.commit()
-        db.refresh(state)
+        commit_and_keep(db)
         await cls._emit_state(session_id, state)
 
         label = cls._effect_label(removed)
@@ -237,10 +231,7 @@ class CombatEffectsMixin:
         state = cls.get_state(db, session_id)
         cls._require_active(state)
 
-        target_p = next(
-            (p for p in state.participants if p["id"] == req.participant_id),
-            None,
-        )
+        target_p = cls._find_participant_by_id(state, req.participant_id)
         if not target_p:
             raise CombatServiceError("Participant not found in combat", 404)
 
@@ -253,8 +244,7 @@ class CombatEffectsMixin:
         flag_modified(state, "participants")
 
         db.add(state)
-        db.commit()
-        db.refresh(state)
+        commit_and_keep(db)
         await cls._emit_state(session_id, state)
         log_message = f"{target_p['display_name']} used their reaction."
         if was_overridden:
@@ -279,10 +269,7 @@ class CombatEffectsMixin:
         state = cls.get_state(db, session_id)
         cls._require_active(state)
 
-        target_p = next(
-            (p for p in state.participants if p["id"] == req.actor_participant_id),
-            None,
-        )
+        target_p = cls._find_participant_by_id(state, req.actor_participant_id)
         if not target_p:
             raise CombatServiceError("Participant not found in combat", 404)
 
@@ -296,8 +283,7 @@ class CombatEffectsMixin:
 
         flag_modified(state, "participants")
         db.add(state)
-        db.commit()
-        db.refresh(state)
+        commit_and_keep(db)
         await cls._emit_state(session_id, state)
 
         await cls._emit_log(session_id, {
@@ -316,10 +302,7 @@ class CombatEffectsMixin:
         state = cls.get_state(db, session_id)
         cls._require_active(state)
 
-        target_p = next(
-            (p for p in state.participants if p["id"] == req.actor_participant_id),
-            None,
-        )
+        target_p = cls._find_participant_by_id(state, req.actor_participant_id)
         if not target_p:
             raise CombatServiceError("Participant not found in combat", 404)
 
@@ -334,8 +317,7 @@ class CombatEffectsMixin:
             target_p["reaction_request"]["status"] = "approved"
             flag_modified(state, "participants")
             db.add(state)
-            db.commit()
-            db.refresh(state)
+            commit_and_keep(db)
             await cls._emit_state(session_id, state)
 
             log_msg = f"{target_p['display_name']}'s reaction request was approved and consumed."
@@ -354,8 +336,7 @@ class CombatEffectsMixin:
             target_p["reaction_request"]["status"] = "denied"
             flag_modified(state, "participants")
             db.add(state)
-            db.commit()
-            db.refresh(state)
+            commit_and_keep(db)
             await cls._emit_state(session_id, state)
 
             await cls._emit_log(session_id, {
@@ -382,30 +363,29 @@ class CombatEffectsMixin:
         Mutates state.participants in place — caller must flag_modified + commit.
         """
         expired: list[dict] = []
-        for p in state.participants:
-            effects = cls._get_participant_effects(p)
-            if not effects:
+        # Only the effects bucketed under this (participant, trigger) slot are touched.
+        for p, due in due_effects(state.participants, participant_id, trigger):
+            expiring: list[dict] = []
+            for e in due:
+                if e.get("duration_type") == "rounds":
+                    remaining = e.get("remaining_rounds")
+                    if isinstance(remaining, int) and remaining > 1:
+                        e["remaining_rounds"] = remaining - 1
+                        continue
+                expiring.append(e)
+            if not expiring:
                 continue
-            keep: list[dict] = []
-            for e in effects:
-                if (
-                    e.get("expires_on") == trigger
-                    and e.get("expires_at_participant_id") == participant_id
-                ):
-                    if e.get("duration_type") == "rounds":
-                        remaining = e.get("remaining_rounds")
-                        if isinstance(remaining, int) and remaining > 1:
-                            e["remaining_rounds"] = remaining - 1
-                            keep.append(e)
-                            continue
-                    expired.append({
-                        **e,
-                        "target_participant_id": p["id"],
-                        "target_display_name": p.get("display_name", ""),
-                    })
-                else:
-                    keep.append(e)
-            cls._set_participant_effects(p, keep)
+            expiring_ids = {id(e) for e in expiring}
+            cls._set_participant_effects(
+                p,
+                [e for e in cls._get_participant_effects(p) if id(e) not in expiring_ids],
+            )
+            for e in expiring:
+                expired.append({
+                    **e,
+                    "target_participant_id": p["id"],
+                    "target_display_name": p.get("display_name", ""),
+                })
         return expired
 
     # ---- query ----
@@ -7,8 +7,9 @@ from math import floor
 from sqlalchemy.orm.attributes import flag_modified
 from sqlmodel import Session, select
 
+from app.db.loaders import load_campaign, load_campaign_entity, load_session
 from app.models.base_item import BaseItemKind, BaseItemWeaponRangeType
-from app.models.campaign import Campaign, SystemType
+from app.models.campaign import SystemType
 from app.models.combat import CombatPhase, CombatState
 from app.models.session import Session as CampaignSession
 from app.models.session_entity import SessionEntity
@@ -35,10 +36,13 @@ from app.schemas.campaign_entity import (
 )
 from app.services.base_items import get_base_item_by_canonical_key
 from app.services.base_spells import get_base_spell_by_canonical_key
+from app.services.campaign_catalog import get_campaign_catalog_item
 from app.services.centrifugo import centrifugo
 from app.services.realtime import build_event, campaign_channel, event_version, session_channel
 
 from .exceptions import CombatServiceError, _roll_dice_expression
+from .command_log import active_combat_command, combat_command
+from .roster import find_participant, find_participant_by_ref
 
 
 class CombatEventsMixin:
@@ -55,7 +59,11 @@ class CombatEventsMixin:
     def _get_participant_by_ref(cls, state: CombatState | None, ref_id: str) -> dict | None:
         if not state:
             return None
-        return next((p for p in state.participants if p.get("ref_id") == ref_id), None)
+        return find_participant_by_ref(state.participants, ref_id)
+
+    @classmethod
+    def _find_participant_by_id(cls, state: CombatState, participant_id: str | None) -> dict | None:
+        return find_participant(state.participants, participant_id)
 
     @classmethod
     def _reset_death_saves(cls, data: dict):
@@ -72,25 +80,29 @@ class CombatEventsMixin:
             "current_turn_index": state.current_turn_index,
             "participants": state.participants,
         }
+        command = active_combat_command(session_id)
+        if command is not None:
+            command.state_payload = payload
+            return
         event = build_event("combat_state_updated", payload)
         await centrifugo.publish(channel, event)
 
     @classmethod
     async def _emit_log(cls, session_id: str, log_payload: dict):
-        channel = session_channel(session_id)
-        event = build_event("combat_log_added", log_payload)
-        await centrifugo.publish(channel, event)
+        # Outside a route's command scope a log line is its own one-entry batch.
+        async with combat_command(session_id) as command:
+            command.add(log_payload)
 
     @classmethod
     def _get_session_entry(cls, db: Session, session_id: str) -> CampaignSession | None:
-        return db.exec(select(CampaignSession).where(CampaignSession.id == session_id)).first()
+        return load_session(db, session_id)
 
     @classmethod
     def _get_campaign_system_for_session(cls, db: Session, session_id: str) -> SystemType:
         entry = cls._get_session_entry(db, session_id)
         if not entry:
             raise CombatServiceError("Session not found", 404)
-        campaign = db.exec(select(Campaign).where(Campaign.id == entry.campaign_id)).first()
+        campaign = load_campaign(db, entry.campaign_id)
         if not campaign:
             raise CombatServiceError("Campaign not found", 404)
         return campaign.system
@@ -100,13 +112,14 @@ class CombatEventsMixin:
         entry = cls._get_session_entry(db, session_id)
         if not entry:
             raise CombatServiceError("Session not found", 404)
-        item = db.exec(
-            select(Item).where(
-                Item.id == item_id,
-                Item.campaign_id == entry.campaign_id,
-            )
-        ).first()
-        if not item:
+        # Catalog ids may point at base items that have no campaign row yet.
+        item = get_campaign_catalog_item(
+            db,
+            campaign_id=entry.campaign_id,
+            item_id=item_id,
+            materialize=False,
+        )
+        if not item or item.campaign_id != entry.campaign_id:
             raise CombatServiceError("Referenced campaign item was not found.", 404)
         return item
 
@@ -154,9 +167,7 @@ class CombatEventsMixin:
         ).first()
         if not target:
             return
-        npc = db.exec(
-            select(CampaignEntity).where(CampaignEntity.id == target.campaign_entity_id)
-        ).first()
+        npc = load_campaign_entity(db, target.campaign_entity_id)
         payload = {
             "sessionId": entry.id,
             "campaignId": entry.campaign_id,
@@ -7,6 +7,7 @@ from math import floor
 from sqlalchemy.orm.attributes import flag_modified
 from sqlmodel import Session, select
 
+from app.db.persistence import commit_and_keep
 from app.models.base_item import BaseItemKind, BaseItemWeaponRangeType
 from app.models.campaign import Campaign, SystemType
 from app.models.combat import CombatPhase, CombatState
@@ -39,6 +40,7 @@ from app.services.centrifugo import centrifugo
 from app.services.realtime import build_event, campaign_channel, event_version, session_channel
 
 from .exceptions import CombatServiceError, _roll_dice_expression
+from .roster import CombatRoster, find_participant_by_ref
 
 
 class CombatLifecycleMixin:
@@ -71,6 +73,20 @@ class CombatLifecycleMixin:
         cls._reset_turn_resources(state.participants[0])
         return True
 
+    @classmethod
+    async def _emit_effect_expiry_log(cls, session_id: str, expired: list[dict], boundary: str) -> None:
+        """Log every effect that expired at one turn boundary as a single entry."""
+        messages = [
+            f"Effect '{exp.get('condition_type') or exp.get('kind', 'effect')}' expired on {exp['target_display_name']} ({boundary})."
+            for exp in expired
+        ]
+        if messages:
+            await cls._emit_log(session_id, {
+                "message": " ".join(messages),
+                "source": "effect_expired",
+                "entries": messages,
+            })
+
     @classmethod
     async def apply_initiative_roll(
         cls,
@@ -86,14 +102,7 @@ class CombatLifecycleMixin:
         if state.phase not in (CombatPhase.initiative, "initiative"):
             return state
 
-        participant = next(
-            (
-                candidate
-                for candidate in state.participants
-                if candidate.get("ref_id") == actor_ref_id and candidate.get("kind") == actor_kind
-            ),
-            None,
-        )
+        participant = find_participant_by_ref(state.participants, actor_ref_id, kind=actor_kind)
         if not participant or not cls._participant_requires_initiative(participant):
             return state
 
@@ -102,8 +111,7 @@ class CombatLifecycleMixin:
         flag_modified(state, "participants")
 
         db.add(state)
-        db.commit()
-        db.refresh(state)
+        commit_and_keep(db)
         await cls._emit_state(session_id, state)
 
         if transitioned_to_active and state.participants:
@@ -124,15 +132,14 @@ class CombatLifecycleMixin:
             phase=CombatPhase.initiative,
             round=1,
             current_turn_index=0,
-            participants=[
+            participants=CombatRoster(
                 {**p.model_dump(), "status": "active" if p.kind == "player" else ("active" if not getattr(p, "is_defeated", False) else "defeated")}
                 for p in req.participants
-            ],
+            ),
         )
         db.add(new_state)
         cls._sync_all_participant_statuses(db, new_state)
-        db.commit()
-        db.refresh(new_state)
+        commit_and_keep(db)
         await cls._emit_state(session_id, new_state)
         await cls._emit_log(session_id, {"message": "Combat started! Roll for initiative."})
         return new_state
@@ -154,8 +161,7 @@ class CombatLifecycleMixin:
         flag_modified(state, "participants")
         
         db.add(state)
-        db.commit()
-        db.refresh(state)
+        commit_and_keep(db)
         await cls._emit_state(session_id, state)
         
         if transitioned_to_active:
@@ -200,13 +206,11 @@ class CombatLifecycleMixin:
         expired_end = await cls._expire_effects_for_participant(
             session_id, state, outgoing_p["id"], "turn_end"
         )
-        for exp in expired_end:
-            label = exp.get("condition_type") or exp.get("kind", "effect")
-            await cls._emit_log(session_id, {
-                "message": f"Effect '{label}' expired on {exp['target_display_name']} (end of {outgoing_p['display_name']}'s turn).",
-                "source": "effect_expired",
-            })
+        await cls._emit_effect_expiry_log(
+            session_id, expired_end, f"end of {outgoing_p['display_name']}'s turn"
+        )
 
+        skipped_stable: list[str] = []
         while True:
             state.current_turn_index += 1
             if state.current_turn_index >= len(state.participants):
@@ -219,28 +223,28 @@ class CombatLifecycleMixin:
                 break # Valid turn!
             if p_status == "stable":
                 # stable ignores turn but stays in order implicitly. We just log skipping it.
-                await cls._emit_log(session_id, {"message": f"Turn skipped for stable participant {state.participants[state.current_turn_index]['display_name']}."})
+                skipped_stable.append(state.participants[state.current_turn_index]["display_name"])
                 continue
             # "dead" and "defeated" are completely skipped silently in terms of explicit turn messages, they just pass.
 
+        if skipped_stable:
+            label = "participant" if len(skipped_stable) == 1 else "participants"
+            await cls._emit_log(session_id, {"message": f"Turn skipped for stable {label} {', '.join(skipped_stable)}."})
+
         # --- Expire turn_start effects for the incoming participant ---
         incoming_p = state.participants[state.current_turn_index]
         expired_start = await cls._expire_effects_for_participant(
             session_id, state, incoming_p["id"], "turn_start"
         )
-        for exp in expired_start:
-            label = exp.get("condition_type") or exp.get("kind", "effect")
-            await cls._emit_log(session_id, {
-                "message": f"Effect '{label}' expired on {exp['target_display_name']} (start of {incoming_p['display_name']}'s turn).",
-                "source": "effect_expired",
-            })
+        await cls._emit_effect_expiry_log(
+            session_id, expired_start, f"start of {incoming_p['display_name']}'s turn"
+        )
 
         # --- Reset turn resources for the incoming participant ---
         cls._reset_turn_resources(incoming_p)
 
         db.add(state)
-        db.commit()
-        db.refresh(state)
+        commit_and_keep(db)
         await cls._emit_state(session_id, state)
 
         active_p = state.participants[state.current_turn_index]
@@ -264,8 +268,7 @@ class CombatLifecycleMixin:
         
         state.phase = CombatPhase.ended
         db.add(state)
-        db.commit()
-        db.refresh(state)
+        commit_and_keep(db)
         await cls._emit_state(session_id, state)
         await cls._emit_log(session_id, {"message": "Combat ended."})
         return state
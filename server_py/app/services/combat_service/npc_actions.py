@@ -7,6 +7,7 @@ from math import floor
 from sqlalchemy.orm.attributes import flag_modified
 from sqlmodel import Session, select
 
+from app.db.persistence import commit_and_keep
 from app.models.base_item import BaseItemKind, BaseItemWeaponRangeType
 from app.models.campaign import Campaign, SystemType
 from app.models.combat import CombatPhase, CombatState
@@ -82,7 +83,7 @@ class CombatNpcActionMixin:
 
         target_p = None
         if req.target_ref_id:
-            target_p = next((p for p in state.participants if p["ref_id"] == req.target_ref_id), None)
+            target_p = cls._get_participant_by_ref(state, req.target_ref_id)
             if not target_p:
                 raise CombatServiceError("Target not found in combat")
 
@@ -254,8 +255,7 @@ class CombatNpcActionMixin:
             raise CombatServiceError("Unsupported combat action kind.")
 
         db.add(state)
-        db.commit()
-        db.refresh(state)
+        commit_and_keep(db)
 
         if target_p and new_hp is not None and target_p["kind"] == "player":
             target_state, *_ = cls._get_stats(db, target_p["ref_id"], target_p["kind"], session_id)
@@ -418,8 +418,7 @@ class CombatNpcActionMixin:
         flag_modified(state, "participants")
 
         db.add(state)
-        db.commit()
-        db.refresh(state)
+        commit_and_keep(db)
 
         if damage > 0 and target_kind == "player":
             target_state, *_ = cls._get_stats(db, target_ref_id, target_kind, session_id)
@@ -527,8 +526,7 @@ class CombatNpcActionMixin:
         
         flag_modified(state, "participants")
         db.add(state)
-        db.commit()
-        db.refresh(state)
+        commit_and_keep(db)
         await cls._emit_player_state_update(db, session_id, attacker_p["ref_id"], target_model)
         
         await cls._emit_log(session_id, {
@@ -7,6 +7,7 @@ from math import floor
 from sqlalchemy.orm.attributes import flag_modified
 from sqlmodel import Session, select
 
+from app.db.persistence import commit_and_keep
 from app.models.base_item import BaseItemKind, BaseItemWeaponRangeType
 from app.models.campaign import Campaign, SystemType
 from app.models.campaign_member import CampaignMember
@@ -172,7 +173,7 @@ class CombatPlayerActionMixin:
         )
         damage_dice = attack_context["damage_dice"]
 
-        target_p = next((p for p in state.participants if p["ref_id"] == req.target_ref_id), None)
+        target_p = cls._get_participant_by_ref(state, req.target_ref_id)
         if not target_p:
             raise CombatServiceError("Target not found in combat")
         cls._assert_hostile_action_allowed(
@@ -242,8 +243,7 @@ class CombatPlayerActionMixin:
             flag_modified(state, "participants")
 
         db.add(state)
-        db.commit()
-        db.refresh(state)
+        commit_and_keep(db)
         await cls._emit_state(session_id, state)
         
         source = "gm_override" if is_gm else "player_turn"
@@ -403,8 +403,7 @@ class CombatPlayerActionMixin:
         flag_modified(state, "participants")
 
         db.add(state)
-        db.commit()
-        db.refresh(state)
+        commit_and_keep(db)
 
         if damage > 0 and target_kind == "player":
             target_state, *_ = cls._get_stats(db, target_ref_id, target_kind, session_id)
@@ -507,7 +506,7 @@ class CombatPlayerActionMixin:
         )
         cls._clear_participant_pending_attack(attacker)
 
-        target_p = next((p for p in state.participants if p["ref_id"] == req.target_ref_id), None)
+        target_p = cls._get_participant_by_ref(state, req.target_ref_id)
         if not target_p:
             raise CombatServiceError("Target not found in combat")
 
@@ -574,8 +573,7 @@ class CombatPlayerActionMixin:
             flag_modified(state, "participants")
 
         db.add(state)
-        db.commit()
-        db.refresh(state)
+        commit_and_keep(db)
         await cls._emit_state(session_id, state)
 
         source = "gm_override" if is_gm else "player_turn"
@@ -926,26 +924,30 @@ class CombatPlayerActionMixin:
             req,
         )
 
-        target_p = next((p for p in state.participants if p["ref_id"] == req.target_ref_id), None)
+        target_p = cls._get_participant_by_ref(state, req.target_ref_id)
         if not target_p:
             raise CombatServiceError("Target not found in combat")
+        area_targets = cls._resolve_additional_spell_targets(state, target_p, req.additional_target_ref_ids)
+        if area_targets:
+            cls._require_area_spell_supported(spell_context)
         is_hostile_spell = spell_context["spell_mode"] in (
             "spell_attack",
             "saving_throw",
             "direct_damage",
         ) or spell_context["spell_canonical_key"] == "hunters_mark"
-        if is_hostile_spell:
-            cls._assert_hostile_action_allowed(
-                attacker,
-                target_p,
-                action_label="a hostile spell",
+        for spell_target in (target_p, *area_targets):
+            if is_hostile_spell:
+                cls._assert_hostile_action_allowed(
+                    attacker,
+                    spell_target,
+                    action_label="a hostile spell",
+                )
+            cls._validate_spell_automation_target(
+                db,
+                session_id,
+                spell_canonical_key=spell_context["spell_canonical_key"],
+                target_participant=spell_target,
             )
-        cls._validate_spell_automation_target(
-            db,
-            session_id,
-            spell_canonical_key=spell_context["spell_canonical_key"],
-            target_participant=target_p,
-        )
         if spell_context.get("source_kind") == "magic_item":
             inventory_item = spell_context.get("inventory_item")
             source_item = spell_context.get("source_item")
@@ -978,6 +980,22 @@ class CombatPlayerActionMixin:
             db.add(attacker_model)
             slot_spent = True
 
+        if area_targets:
+            return await cls._cast_area_spell(
+                db,
+                session_id,
+                req,
+                state=state,
+                attacker=attacker,
+                actor_user_id=actor_user_id,
+                is_gm=is_gm,
+                spell_context=spell_context,
+                targets=[target_p, *area_targets],
+                action_cost=action_cost,
+                was_overridden=was_overridden,
+                slot_spent=slot_spent,
+            )
+
         roll_result = None
         target_ac = None
         roll_total = None
@@ -1216,8 +1234,7 @@ class CombatPlayerActionMixin:
                     damage = amount
 
         db.add(state)
-        db.commit()
-        db.refresh(state)
+        commit_and_keep(db)
 
         player_state_ids_to_emit = set(automation_player_state_ids) if automation_result is not None else set()
         if slot_spent:
@@ -1409,6 +1426,20 @@ class CombatPlayerActionMixin:
                 manual_rolls=req.manual_rolls,
             )
         rolled_effect_total = max(0, base_effect + effect_bonus)
+        if isinstance(pending_spell.get("targets"), list):
+            return await cls._resolve_area_spell_effect(
+                db,
+                session_id,
+                req,
+                state=state,
+                attacker=attacker,
+                actor_user_id=actor_user_id,
+                is_gm=is_gm,
+                pending_spell=pending_spell,
+                effect_rolls=effect_rolls,
+                base_effect=base_effect,
+                rolled_effect_total=rolled_effect_total,
+            )
         is_saved = bool(pending_spell.get("is_saved"))
         save_success_outcome = cls._normalize_save_success_outcome(
             pending_spell.get("save_success_outcome")
@@ -1443,8 +1474,7 @@ class CombatPlayerActionMixin:
         cls._clear_participant_pending_attack(attacker)
         flag_modified(state, "participants")
         db.add(state)
-        db.commit()
-        db.refresh(state)
+        commit_and_keep(db)
 
         if amount > 0 and target_kind == "player":
             target_state, *_ = cls._get_stats(db, target_ref_id, "player", session_id)
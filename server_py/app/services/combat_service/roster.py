@@ -0,0 +1,260 @@
+"""Typed, indexed view over ``CombatState.participants``.
+
+The JSONB column keeps its list-of-objects layout. Whenever the column is
+loaded or refreshed, the list is rebuilt as a ``CombatRoster`` of
+``RosterParticipant`` entries; new states are built with one directly. Both
+are ``list``/``dict`` subclasses with ``__slots__``, so existing
+``participant["hp"]`` access and the JSON encoders behave exactly as before.
+Lookups by participant id and ref id, and effect queries by kind, by
+turn-boundary expiry slot ``(expires_at participant, turn_start/turn_end)``
+and by concentration group, come from lazily built indexes instead of scans.
+
+The helpers below also accept plain lists and dicts (fixtures, states that
+never went through the ORM), falling back to a scan.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from sqlalchemy import event
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models.combat import CombatState
+
+
+class RosterParticipant(dict):
+    __slots__ = (
+        "_effects_source",
+        "_effects_size",
+        "_effects_by_kind",
+        "_effects_by_expiry",
+        "_concentration_groups",
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._invalidate_effects()
+
+    def _invalidate_effects(self) -> None:
+        self._effects_source: list | None = None
+        self._effects_size = -1
+        self._effects_by_kind: dict[object, list[dict]] = {}
+        self._effects_by_expiry: dict[tuple[object, object], list[dict]] = {}
+        self._concentration_groups: dict[str, list[dict]] = {}
+
+    def __setitem__(self, key, value):
+        if key == "active_effects":
+            self._invalidate_effects()
+        super().__setitem__(key, value)
+
+    def _ensure_effect_indexes(self) -> None:
+        # Rebuilt when the effect list is replaced or resized.
+        effects = self.get("active_effects")
+        if not isinstance(effects, list):
+            effects = []
+        if effects is self._effects_source and len(effects) == self._effects_size:
+            return
+        self._invalidate_effects()
+        for effect in effects:
+            if not isinstance(effect, dict):
+                continue
+            self._effects_by_kind.setdefault(effect.get("kind"), []).append(effect)
+            expires_on = effect.get("expires_on")
+            if expires_on is not None:
+                slot = (effect.get("expires_at_participant_id"), expires_on)
+                self._effects_by_expiry.setdefault(slot, []).append(effect)
+            metadata = effect.get("metadata")
+            group_id = metadata.get("concentration_group") if isinstance(metadata, dict) else None
+            if isinstance(group_id, str) and group_id:
+                self._concentration_groups.setdefault(group_id, []).append(effect)
+        self._effects_source = effects
+        self._effects_size = len(effects)
+
+    def effects_of_kind(self, kind: str) -> list[dict]:
+        self._ensure_effect_indexes()
+        return self._effects_by_kind.get(kind, [])
+
+    def effects_due(self, participant_id: str, trigger: str) -> list[dict]:
+        """Effects that expire on ``trigger`` (turn_start/turn_end) of ``participant_id``."""
+        self._ensure_effect_indexes()
+        return self._effects_by_expiry.get((participant_id, trigger), [])
+
+    def effects_in_concentration_group(self, group_id: str) -> list[dict]:
+        self._ensure_effect_indexes()
+        return self._concentration_groups.get(group_id, [])
+
+    def concentration_groups_from(self, source_participant_id: str) -> list[str]:
+        self._ensure_effect_indexes()
+        return [
+            group_id
+            for group_id, effects in self._concentration_groups.items()
+            if any(
+                effect.get("source_participant_id") == source_participant_id
+                and effect["metadata"].get("concentration") is True
+                for effect in effects
+            )
+        ]
+
+
+class CombatRoster(list):
+    __slots__ = ("_by_id", "_by_ref", "_indexed_size")
+
+    def __init__(self, participants: Iterable = ()):
+        super().__init__(_as_participant(entry) for entry in participants)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._by_id: dict[str, RosterParticipant] = {}
+        self._by_ref: dict[str, list[RosterParticipant]] = {}
+        self._indexed_size = -1
+
+    def _ensure_indexes(self) -> None:
+        # Participants are never re-keyed in place, so only membership changes
+        # (tracked by the overrides below, plus the size check) need a rebuild.
+        if self._indexed_size == len(self):
+            return
+        self._invalidate()
+        for participant in self:
+            if not isinstance(participant, dict):
+                continue
+            participant_id = participant.get("id")
+            if isinstance(participant_id, str):
+                self._by_id.setdefault(participant_id, participant)
+            ref_id = participant.get("ref_id")
+            if isinstance(ref_id, str):
+                self._by_ref.setdefault(ref_id, []).append(participant)
+        self._indexed_size = len(self)
+
+    def get_by_id(self, participant_id: str) -> RosterParticipant | None:
+        self._ensure_indexes()
+        return self._by_id.get(participant_id)
+
+    def get_by_ref(self, ref_id: str, *, kind: str | None = None) -> RosterParticipant | None:
+        self._ensure_indexes()
+        for participant in self._by_ref.get(ref_id, ()):
+            if kind is None or participant.get("kind") == kind:
+                return participant
+        return None
+
+    def append(self, participant):
+        super().append(_as_participant(participant))
+        self._invalidate()
+
+    def insert(self, index, participant):
+        super().insert(index, _as_participant(participant))
+        self._invalidate()
+
+    def extend(self, participants):
+        super().extend(_as_participant(entry) for entry in participants)
+        self._invalidate()
+
+    def __iadd__(self, participants):
+        self.extend(participants)
+        return self
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = [_as_participant(entry) for entry in value]
+        else:
+            value = _as_participant(value)
+        super().__setitem__(index, value)
+        self._invalidate()
+
+
+def _as_participant(entry):
+    if isinstance(entry, dict) and not isinstance(entry, RosterParticipant):
+        return RosterParticipant(entry)
+    return entry
+
+
+def as_combat_roster(value):
+    if isinstance(value, CombatRoster) or not isinstance(value, list):
+        return value
+    return CombatRoster(value)
+
+
+def find_participant(participants: list, participant_id: str | None) -> dict | None:
+    if not participant_id:
+        return None
+    if isinstance(participants, CombatRoster):
+        return participants.get_by_id(participant_id)
+    return next(
+        (participant for participant in participants if participant.get("id") == participant_id),
+        None,
+    )
+
+
+def find_participant_by_ref(
+    participants: list,
+    ref_id: str | None,
+    *,
+    kind: str | None = None,
+) -> dict | None:
+    if not ref_id:
+        return None
+    if isinstance(participants, CombatRoster):
+        return participants.get_by_ref(ref_id, kind=kind)
+    return next(
+        (
+            participant
+            for participant in participants
+            if participant.get("ref_id") == ref_id and (kind is None or participant.get("kind") == kind)
+        ),
+        None,
+    )
+
+
+def _indexed(participant: dict) -> RosterParticipant:
+    # Plain dicts get a throwaway index: same cost as the scan it replaces.
+    return participant if isinstance(participant, RosterParticipant) else RosterParticipant(participant)
+
+
+def participant_effects_of_kind(participant: dict, kind: str) -> list[dict]:
+    return _indexed(participant).effects_of_kind(kind)
+
+
+def due_effects(
+    participants: list,
+    participant_id: str,
+    trigger: str,
+) -> list[tuple[dict, list[dict]]]:
+    """``(owner, effects)`` pairs for every effect due at this turn boundary."""
+    due: list[tuple[dict, list[dict]]] = []
+    for participant in participants:
+        effects = _indexed(participant).effects_due(participant_id, trigger)
+        if effects:
+            due.append((participant, effects))
+    return due
+
+
+def concentration_groups_from(participants: list, source_participant_id: str) -> list[str]:
+    groups: list[str] = []
+    for participant in participants:
+        for group_id in _indexed(participant).concentration_groups_from(source_participant_id):
+            if group_id not in groups:
+                groups.append(group_id)
+    return groups
+
+
+def concentration_group_members(
+    participants: list,
+    group_id: str,
+) -> list[tuple[dict, list[dict]]]:
+    members: list[tuple[dict, list[dict]]] = []
+    for participant in participants:
+        effects = _indexed(participant).effects_in_concentration_group(group_id)
+        if effects:
+            members.append((participant, effects))
+    return members
+
+
+@event.listens_for(CombatState, "load")
+def _index_loaded_participants(target: CombatState, _context) -> None:
+    if "participants" in target.__dict__:
+        set_committed_value(target, "participants", as_combat_roster(target.__dict__["participants"]))
+
+
+@event.listens_for(CombatState, "refresh")
+def _index_refreshed_participants(target: CombatState, _context, attrs) -> None:
+    if (attrs is None or "participants" in attrs) and "participants" in target.__dict__:
+        set_committed_value(target, "participants", as_combat_roster(target.__dict__["participants"]))
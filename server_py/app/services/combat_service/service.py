@@ -1,3 +1,4 @@
+from .area_spells import CombatAreaSpellMixin
 from .core import CombatCoreMixin
 from .damage import CombatDamageMixin
 from .effects import CombatEffectsMixin
@@ -21,6 +22,7 @@ class CombatService(
     CombatLifecycleMixin,
     CombatDamageMixin,
     CombatSpellAutomationMixin,
+    CombatAreaSpellMixin,
     CombatPlayerActionMixin,
     CombatNpcActionMixin,
     CombatEffectsMixin,
@@ -18,6 +18,11 @@ from app.services.goodberry_inventory import (
 from app.services.roll_resolution import resolve_saving_throw
 
 from .exceptions import CombatServiceError
+from .roster import (
+    concentration_group_members,
+    concentration_groups_from,
+    participant_effects_of_kind,
+)
 
 
 @dataclass(frozen=True)
@@ -85,15 +90,6 @@ class CombatSpellAutomationMixin:
         metadata = cls._as_dict(effect).get("metadata") if isinstance(effect, dict) else None
         return metadata if isinstance(metadata, dict) else {}
 
-    @classmethod
-    def _find_participant_by_id(cls, state: CombatState, participant_id: str | None) -> dict | None:
-        if not participant_id:
-            return None
-        return next(
-            (participant for participant in state.participants if participant.get("id") == participant_id),
-            None,
-        )
-
     @classmethod
     def _build_active_effect(
         cls,
@@ -145,24 +141,20 @@ class CombatSpellAutomationMixin:
         concentration_group: str,
     ) -> list[dict]:
         removed: list[dict] = []
-        for participant in state.participants:
-            effects = cls._get_participant_effects(participant)
-            if not effects:
-                continue
-            kept: list[dict] = []
+        for participant, effects in concentration_group_members(state.participants, concentration_group):
+            removed_ids = {id(effect) for effect in effects}
             for effect in effects:
-                metadata = cls._get_effect_metadata(effect)
-                if metadata.get("concentration_group") == concentration_group:
-                    removed.append(
-                        {
-                            **effect,
-                            "target_participant_id": participant.get("id"),
-                            "target_display_name": participant.get("display_name", ""),
-                        }
-                    )
-                    continue
-                kept.append(effect)
-            cls._set_participant_effects(participant, kept)
+                removed.append(
+                    {
+                        **effect,
+                        "target_participant_id": participant.get("id"),
+                        "target_display_name": participant.get("display_name", ""),
+                    }
+                )
+            cls._set_participant_effects(
+                participant,
+                [effect for effect in cls._get_participant_effects(participant) if id(effect) not in removed_ids],
+            )
         return removed
 
     @classmethod
@@ -172,16 +164,7 @@ class CombatSpellAutomationMixin:
         *,
         source_participant_id: str,
     ) -> list[dict]:
-        groups: set[str] = set()
-        for participant in state.participants:
-            for effect in cls._get_participant_effects(participant):
-                metadata = cls._get_effect_metadata(effect)
-                if (
-                    effect.get("source_participant_id") == source_participant_id
-                    and metadata.get("concentration") is True
-                    and isinstance(metadata.get("concentration_group"), str)
-                ):
-                    groups.add(metadata["concentration_group"])
+        groups = concentration_groups_from(state.participants, source_participant_id)
 
         removed: list[dict] = []
         for group_id in groups:
@@ -212,11 +195,10 @@ class CombatSpellAutomationMixin:
         *,
         target_participant_id: str,
     ) -> dict | None:
-        for effect in cls._get_participant_effects(participant):
+        for effect in participant_effects_of_kind(participant, "spell_effect"):
             metadata = cls._get_effect_metadata(effect)
             if (
-                effect.get("kind") == "spell_effect"
-                and metadata.get("source_spell_key") == "hunters_mark"
+                metadata.get("source_spell_key") == "hunters_mark"
                 and metadata.get("marked_target_participant_id") == target_participant_id
             ):
                 return effect
@@ -229,11 +211,10 @@ class CombatSpellAutomationMixin:
         *,
         target_participant_id: str,
     ) -> dict | None:
-        for effect in cls._get_participant_effects(participant):
+        for effect in participant_effects_of_kind(participant, "condition"):
             metadata = cls._get_effect_metadata(effect)
             if (
-                effect.get("kind") == "condition"
-                and effect.get("condition_type") == "charmed"
+                effect.get("condition_type") == "charmed"
                 and metadata.get("charmer_participant_id") == target_participant_id
             ):
                 return effect
@@ -6,6 +6,7 @@ from uuid import uuid4
 from sqlalchemy.orm.attributes import flag_modified
 from sqlmodel import Session
 
+from app.db.persistence import commit_and_keep
 from app.models.combat import CombatState
 from app.schemas.combat import CombatStandardActionRequest
 from app.services.healing_consumables import (
@@ -78,12 +79,7 @@ class CombatStandardActionMixin:
 
         flag_modified(state, "participants")
         db.add(state)
-        db.commit()
-        if actor_player_state is not None:
-            db.refresh(actor_player_state)
-        if target_player_state is not None:
-            db.refresh(target_player_state)
-        db.refresh(state)
+        commit_and_keep(db)
 
         if actor_player_user_id and actor_player_state is not None:
             await cls._emit_player_state_update(
@@ -168,10 +164,7 @@ class CombatStandardActionMixin:
         if not req.target_participant_id:
             raise CombatServiceError("Help requires a target participant.", 400)
 
-        target_p = next(
-            (p for p in state.participants if p["id"] == req.target_participant_id),
-            None,
-        )
+        target_p = cls._find_participant_by_id(state, req.target_participant_id)
         if not target_p:
             raise CombatServiceError("Target participant not found in combat.", 404)
 
@@ -556,10 +549,7 @@ class CombatStandardActionMixin:
     ) -> dict:
         if not target_participant_id:
             return actor
-        target = next(
-            (participant for participant in state.participants if participant["id"] == target_participant_id),
-            None,
-        )
+        target = cls._find_participant_by_id(state, target_participant_id)
         if not target:
             raise CombatServiceError("Target participant not found in combat.", 404)
         return target
@@ -7,6 +7,7 @@ from math import floor
 from sqlalchemy.orm.attributes import flag_modified
 from sqlmodel import Session, select
 
+from app.db.loaders import load_campaign_entity
 from app.models.base_item import BaseItemKind, BaseItemWeaponRangeType
 from app.models.campaign import Campaign, SystemType
 from app.models.combat import CombatPhase, CombatState
@@ -91,9 +92,7 @@ class CombatStatusMixin:
 
         current_hp = target_model.current_hp
         if current_hp is None:
-            npc = db.exec(
-                select(CampaignEntity).where(CampaignEntity.id == target_model.campaign_entity_id)
-            ).first()
+            npc = load_campaign_entity(db, target_model.campaign_entity_id)
             current_hp = npc.max_hp if npc and npc.max_hp is not None else 0
 
         current_hp = max(0, current_hp)
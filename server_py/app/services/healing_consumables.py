@@ -7,6 +7,7 @@ import re
 from typing import Literal
 from uuid import uuid4
 
+from sqlalchemy import and_, or_
 from sqlmodel import Session, select
 
 from app.models.campaign import RoleMode
@@ -18,6 +19,7 @@ from app.models.party_member import PartyMember, PartyMemberStatus
 from app.models.session import Session as CampaignSession
 from app.models.session_command_event import SessionCommandEvent
 from app.models.session_state import SessionState
+from app.services.campaign_deletion import is_campaign_pending_deletion
 from app.services.inventory_expiration import is_inventory_item_expired
 from app.services.centrifugo import centrifugo
 from app.services.realtime import build_event, campaign_channel, event_version, session_channel
@@ -105,7 +107,7 @@ def get_session_entry(db: Session, session_id: str) -> CampaignSession:
     session_entry = db.exec(
         select(CampaignSession).where(CampaignSession.id == session_id)
     ).first()
-    if not session_entry:
+    if not session_entry or is_campaign_pending_deletion(db, session_entry.campaign_id):
         raise HealingConsumableError("Session not found", 404)
     return session_entry
 
@@ -148,8 +150,6 @@ def resolve_healing_consumable(
     if session_entry.party_id and inventory_item.party_id not in (None, session_entry.party_id):
         raise HealingConsumableError("Inventory item does not belong to this party", 404)
     if is_inventory_item_expired(inventory_item):
-        db.delete(inventory_item)
-        db.flush()
         raise HealingConsumableError("Consumable has expired", 400)
     if inventory_item.quantity < 1:
         raise HealingConsumableError("Consumable is out of stock", 400)
@@ -345,93 +345,72 @@ def list_healing_consumable_targets(
     session_entry: CampaignSession,
     actor_user_id: str,
 ) -> list[HealingConsumableTargetSummary]:
-    target_user_ids: list[str] = []
+    """Eligible players with their HP, resolved in a single round trip.
+
+    Eligible means joined party members (campaign players when the session has
+    no party) plus the actor, restricted to members of the campaign. HP comes
+    from the live session state, falling back to the party character sheet.
+    """
+    session_id = require_identifier(session_entry.id, "Session is missing an id")
+    columns = [
+        CampaignMember.user_id,
+        CampaignMember.display_name,
+        SessionState.player_user_id,
+        SessionState.state_json["currentHP"],  # type: ignore[index]
+        SessionState.state_json["maxHP"],  # type: ignore[index]
+    ]
     if session_entry.party_id:
-        party_members = db.exec(
-            select(PartyMember).where(
-                PartyMember.party_id == session_entry.party_id,
-                PartyMember.status == PartyMemberStatus.JOINED,
-            )
-        ).all()
-        target_user_ids = [
-            member.user_id
-            for member in party_members
-            if isinstance(member.user_id, str)
+        columns += [
+            CharacterSheet.data["currentHP"],  # type: ignore[index]
+            CharacterSheet.data["maxHP"],  # type: ignore[index]
         ]
-    else:
-        campaign_members = db.exec(
-            select(CampaignMember).where(
-                CampaignMember.campaign_id == session_entry.campaign_id,
-                CampaignMember.role_mode == RoleMode.PLAYER,
+    statement = select(*columns).outerjoin(
+        SessionState,
+        and_(
+            SessionState.session_id == session_id,
+            SessionState.player_user_id == CampaignMember.user_id,
+        ),
+    )
+    if session_entry.party_id:
+        statement = (
+            statement.outerjoin(
+                PartyMember,
+                and_(
+                    PartyMember.party_id == session_entry.party_id,
+                    PartyMember.user_id == CampaignMember.user_id,
+                    PartyMember.status == PartyMemberStatus.JOINED,
+                ),
             )
-        ).all()
-        target_user_ids = [
-            member.user_id
-            for member in campaign_members
-            if isinstance(member.user_id, str)
-        ]
-
-    unique_target_ids = list(dict.fromkeys(target_user_ids or [actor_user_id]))
-    if actor_user_id not in unique_target_ids:
-        unique_target_ids.insert(0, actor_user_id)
-
-    members = db.exec(
-        select(CampaignMember).where(
-            CampaignMember.campaign_id == session_entry.campaign_id,
-            CampaignMember.user_id.in_(unique_target_ids),  # type: ignore[arg-type]
-        )
-    ).all()
-    member_by_user_id = {
-        member.user_id: member
-        for member in members
-        if isinstance(member.user_id, str)
-    }
-
-    session_states = db.exec(
-        select(SessionState).where(
-            SessionState.session_id == require_identifier(session_entry.id, "Session is missing an id"),
-            SessionState.player_user_id.in_(unique_target_ids),  # type: ignore[arg-type]
+            .outerjoin(
+                CharacterSheet,
+                and_(
+                    CharacterSheet.party_id == session_entry.party_id,
+                    CharacterSheet.player_user_id == CampaignMember.user_id,
+                ),
+            )
+            .where(or_(PartyMember.user_id.is_not(None), CampaignMember.user_id == actor_user_id))  # type: ignore[union-attr]
         )
-    ).all()
-    state_by_user_id = {
-        state.player_user_id: state
-        for state in session_states
-        if isinstance(state.player_user_id, str)
-    }
-
-    character_sheets = db.exec(
-        select(CharacterSheet).where(
-            CharacterSheet.party_id == session_entry.party_id,
-            CharacterSheet.player_user_id.in_(unique_target_ids),  # type: ignore[arg-type]
+    else:
+        statement = statement.where(
+            or_(CampaignMember.role_mode == RoleMode.PLAYER, CampaignMember.user_id == actor_user_id)
         )
-    ).all() if session_entry.party_id else []
-    sheet_by_user_id = {
-        sheet.player_user_id: sheet
-        for sheet in character_sheets
-        if isinstance(sheet.player_user_id, str)
-    }
+    rows = db.exec(statement.where(CampaignMember.campaign_id == session_entry.campaign_id)).all()
 
-    targets: list[HealingConsumableTargetSummary] = []
-    for user_id in unique_target_ids:
-        member = member_by_user_id.get(user_id)
-        if not member:
+    targets_by_user_id: dict[str, HealingConsumableTargetSummary] = {}
+    for user_id, display_name, state_user_id, *hp_values in rows:
+        if not isinstance(user_id, str) or user_id in targets_by_user_id:
             continue
-        state_payload = (
-            state_by_user_id[user_id].state_json
-            if user_id in state_by_user_id and isinstance(state_by_user_id[user_id].state_json, dict)
-            else sheet_by_user_id.get(user_id).data if user_id in sheet_by_user_id and isinstance(sheet_by_user_id[user_id].data, dict) else {}
-        )
-        current_hp, max_hp = _extract_hp_snapshot(state_payload if isinstance(state_payload, dict) else {})
-        targets.append(
-            HealingConsumableTargetSummary(
-                player_user_id=user_id,
-                display_name=member.display_name,
-                current_hp=current_hp,
-                max_hp=max_hp,
-                is_self=user_id == actor_user_id,
-            )
+        state_hp, sheet_hp = hp_values[:2], hp_values[2:] or [None, None]
+        current_hp, max_hp = state_hp if state_user_id is not None else sheet_hp
+        targets_by_user_id[user_id] = HealingConsumableTargetSummary(
+            player_user_id=user_id,
+            display_name=display_name,
+            current_hp=max(0, _safe_int(current_hp, 0)),
+            max_hp=max(0, _safe_int(max_hp, 0)),
+            is_self=user_id == actor_user_id,
         )
 
+    targets = list(targets_by_user_id.values())
     targets.sort(key=lambda target: (not target.is_self, target.display_name.lower()))
     return targets
 
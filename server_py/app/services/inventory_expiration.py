@@ -1,10 +1,20 @@
 from __future__ import annotations
 
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime, timezone
+import logging
 
-from sqlmodel import Session, select
+from sqlalchemy import delete, or_
+from sqlmodel import Session
 
+from app.db.session import engine
 from app.models.inventory import InventoryItem
+from app.services.centrifugo import centrifugo
+from app.services.realtime import build_event, campaign_channel, event_version
+
+logger = logging.getLogger(__name__)
 
 
 def normalize_inventory_timestamp(value: datetime | None) -> datetime | None:
@@ -33,38 +43,102 @@ def is_inventory_item_expired(
     return expires_at <= reference
 
 
-def purge_expired_inventory_items(
+def inventory_item_not_expired_clause(now: datetime | None = None):
+    """SQL filter for inventory reads; expired rows are left for the sweeper."""
+    reference = normalize_inventory_timestamp(now) or utcnow()
+    return or_(
+        InventoryItem.expires_at.is_(None),  # type: ignore[union-attr]
+        InventoryItem.expires_at > reference,  # type: ignore[operator]
+    )
+
+
+@dataclass(frozen=True)
+class ExpiredInventoryItem:
+    id: str
+    campaign_id: str
+    party_id: str | None
+    member_id: str
+    item_id: str
+
+
+def sweep_expired_inventory_items(
     db: Session,
     *,
-    campaign_id: str | None = None,
-    member_id: str | None = None,
-    party_id: str | None = None,
-    inventory_item_id: str | None = None,
     now: datetime | None = None,
-    flush: bool = True,
-) -> list[str]:
+) -> list[ExpiredInventoryItem]:
+    """Delete every expired inventory row in one statement and commit."""
     reference = normalize_inventory_timestamp(now) or utcnow()
+    rows = db.exec(  # type: ignore[call-overload]
+        delete(InventoryItem)
+        .where(
+            InventoryItem.expires_at.is_not(None),  # type: ignore[union-attr]
+            InventoryItem.expires_at <= reference,  # type: ignore[operator]
+        )
+        .returning(
+            InventoryItem.id,
+            InventoryItem.campaign_id,
+            InventoryItem.party_id,
+            InventoryItem.member_id,
+            InventoryItem.item_id,
+        )
+    ).all()
+    db.commit()
+    return [
+        ExpiredInventoryItem(
+            id=row.id,
+            campaign_id=row.campaign_id,
+            party_id=row.party_id,
+            member_id=row.member_id,
+            item_id=row.item_id,
+        )
+        for row in rows
+    ]
+
+
+async def publish_expired_inventory_items(removed: list[ExpiredInventoryItem]) -> None:
+    """One ``inventory_items_expired`` event per affected campaign."""
+    by_campaign: dict[str, list[ExpiredInventoryItem]] = defaultdict(list)
+    for entry in removed:
+        by_campaign[entry.campaign_id].append(entry)
+
+    version = event_version()
+    for campaign_id, entries in by_campaign.items():
+        await centrifugo.publish(
+            campaign_channel(campaign_id),
+            build_event(
+                "inventory_items_expired",
+                {
+                    "campaignId": campaign_id,
+                    "items": [
+                        {
+                            "id": entry.id,
+                            "partyId": entry.party_id,
+                            "memberId": entry.member_id,
+                            "itemId": entry.item_id,
+                        }
+                        for entry in entries
+                    ],
+                },
+                version=version,
+            ),
+        )
+
+
+def _sweep_once() -> list[ExpiredInventoryItem]:
+    with Session(engine) as db:
+        return sweep_expired_inventory_items(db)
+
 
-    filters = [InventoryItem.expires_at.is_not(None)]
-    if campaign_id:
-        filters.append(InventoryItem.campaign_id == campaign_id)
-    if member_id:
-        filters.append(InventoryItem.member_id == member_id)
-    if party_id is not None:
-        filters.append(InventoryItem.party_id == party_id)
-    if inventory_item_id:
-        filters.append(InventoryItem.id == inventory_item_id)
-
-    entries = db.exec(select(InventoryItem).where(*filters)).all()
-    removed_ids: list[str] = []
-    for entry in entries:
-        expires_at = normalize_inventory_timestamp(entry.expires_at)
-        if expires_at is None or expires_at > reference:
-            continue
-        if entry.id:
-            removed_ids.append(entry.id)
-        db.delete(entry)
-
-    if removed_ids and flush:
-        db.flush()
-    return removed_ids
+async def run_inventory_expiration_sweeper(interval_seconds: float) -> None:
+    """Background loop started from the app lifespan; never lets a failure kill it."""
+    while True:
+        try:
+            removed = await asyncio.to_thread(_sweep_once)
+            if removed:
+                logger.info("Swept %d expired inventory items", len(removed))
+                await publish_expired_inventory_items(removed)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Inventory expiration sweep failed")
+        await asyncio.sleep(interval_seconds)
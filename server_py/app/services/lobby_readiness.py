@@ -0,0 +1,149 @@
+"""Lobby readiness kept consistent under concurrent joins.
+
+``SessionRuntime.lobby_ready`` is only ever changed by a single ``UPDATE`` that
+appends the user with a JSONB set operation, so simultaneous "ready" clicks
+serialise on the row lock instead of overwriting each other's lists. Counts
+come back from the same statement. Realtime fan-out is coalesced: a burst of
+joins produces one ``lobby_updated`` event per window and session.
+"""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import logging
+
+from sqlalchemy import String, case, cast, column, func, select, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Session as DbSession
+
+from app.db.session import engine
+from app.models.session import Session, SessionStatus
+from app.models.session_runtime import SessionRuntime
+from app.services.centrifugo import centrifugo
+from app.services.realtime import build_event, campaign_channel, event_version
+
+logger = logging.getLogger(__name__)
+
+LOBBY_UPDATE_WINDOW_SECONDS = 0.25
+
+_pending_lobby_updates: dict[str, asyncio.Task] = {}
+
+
+@dataclass(frozen=True)
+class LobbyReadiness:
+    ready_user_ids: list[str]
+    ready_count: int
+    total_count: int
+    ready_expected_count: int
+
+    @property
+    def all_ready(self) -> bool:
+        return self.total_count > 0 and self.ready_expected_count >= self.total_count
+
+
+def _readiness_columns():
+    expected = func.jsonb_array_elements(SessionRuntime.lobby_expected).table_valued(
+        column("value", JSONB)
+    ).render_derived()
+    ready_expected = (
+        select(func.count())
+        .select_from(expected)
+        .where(SessionRuntime.lobby_ready.has_key(expected.c.value["userId"].astext))  # type: ignore[attr-defined]
+        .correlate(SessionRuntime)
+        .scalar_subquery()
+    )
+    return (
+        SessionRuntime.lobby_ready,
+        func.jsonb_array_length(SessionRuntime.lobby_ready).label("ready_count"),
+        func.jsonb_array_length(SessionRuntime.lobby_expected).label("total_count"),
+        ready_expected.label("ready_expected_count"),
+    )
+
+
+def _to_readiness(row) -> LobbyReadiness:
+    ready = row.lobby_ready if isinstance(row.lobby_ready, list) else []
+    return LobbyReadiness(
+        ready_user_ids=[entry for entry in ready if isinstance(entry, str)],
+        ready_count=int(row.ready_count or 0),
+        total_count=int(row.total_count or 0),
+        ready_expected_count=int(row.ready_expected_count or 0),
+    )
+
+
+def mark_lobby_ready(db: DbSession, *, session_id: str, user_id: str) -> LobbyReadiness:
+    """Add ``user_id`` to the ready set in one statement; idempotent per user."""
+    marker = func.jsonb_build_array(cast(user_id, String))
+    row = db.exec(  # type: ignore[call-overload]
+        update(SessionRuntime)
+        .where(SessionRuntime.session_id == session_id)
+        .values(
+            lobby_ready=case(
+                (SessionRuntime.lobby_ready.contains(marker), SessionRuntime.lobby_ready),  # type: ignore[attr-defined]
+                else_=SessionRuntime.lobby_ready.op("||", return_type=JSONB)(marker),  # type: ignore[attr-defined]
+            )
+        )
+        .returning(*_readiness_columns())
+    ).first()
+    if row is None:
+        return LobbyReadiness(ready_user_ids=[], ready_count=0, total_count=0, ready_expected_count=0)
+    return _to_readiness(row)
+
+
+def load_lobby_readiness(db: DbSession, session_id: str) -> LobbyReadiness | None:
+    row = db.exec(  # type: ignore[call-overload]
+        select(*_readiness_columns())
+        .select_from(SessionRuntime)
+        .join(Session, Session.id == SessionRuntime.session_id)
+        .where(
+            SessionRuntime.session_id == session_id,
+            Session.status == SessionStatus.LOBBY,
+        )
+    ).first()
+    return _to_readiness(row) if row is not None else None
+
+
+def _load_lobby_readiness_once(session_id: str) -> LobbyReadiness | None:
+    with DbSession(engine) as db:
+        return load_lobby_readiness(db, session_id)
+
+
+async def _publish_lobby_update_after_window(
+    session_id: str,
+    campaign_id: str,
+    party_id: str | None,
+) -> None:
+    try:
+        await asyncio.sleep(LOBBY_UPDATE_WINDOW_SECONDS)
+    finally:
+        _pending_lobby_updates.pop(session_id, None)
+    try:
+        readiness = await asyncio.to_thread(_load_lobby_readiness_once, session_id)
+        if readiness is None:
+            # Lobby already started or closed; session_started covers it.
+            return
+        await centrifugo.publish(
+            campaign_channel(campaign_id),
+            build_event(
+                "lobby_updated",
+                {
+                    "sessionId": session_id,
+                    "campaignId": campaign_id,
+                    "partyId": party_id,
+                    "readyUserIds": readiness.ready_user_ids,
+                    "readyCount": readiness.ready_count,
+                    "totalCount": readiness.total_count,
+                },
+                version=event_version(),
+            ),
+        )
+    except Exception:
+        logger.exception("Failed to publish lobby update for session %s", session_id)
+
+
+def schedule_lobby_update(session_id: str, campaign_id: str, party_id: str | None) -> None:
+    """Publish ``lobby_updated`` once the current window closes; later calls in the window are folded in."""
+    if session_id in _pending_lobby_updates:
+        return
+    _pending_lobby_updates[session_id] = asyncio.get_running_loop().create_task(
+        _publish_lobby_update_after_window(session_id, campaign_id, party_id)
+    )
@@ -0,0 +1,99 @@
+"""Per-channel sequence numbers and a bounded replay buffer for realtime events.
+
+Every publish takes the next ``seq`` for its channel from
+``realtime_channel_sequence`` with an upsert. The upsert holds the row lock
+until commit, so a seq is only visible once every lower seq is stored. The
+publish to Centrifugo happens afterwards, outside that lock, so concurrent
+publishes can reach clients out of seq order; clients drop only duplicates
+and fetch any gap that does not close on its own.
+The published message, with ``seq`` added, is stored in ``realtime_event``.
+Only the last ``REPLAY_BUFFER_SIZE`` events per channel are kept, so a
+reconnecting client can fetch just the deltas it missed. A client that is
+further behind is told to resync.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import delete, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel import Session, select
+
+from app.models.realtime_event import RealtimeChannelSequence, RealtimeEvent
+
+REPLAY_BUFFER_SIZE = 500
+PRUNE_EVERY = 50
+
+
+@dataclass
+class RealtimeReplay:
+    channel: str
+    last_seq: int
+    events: list[dict[str, Any]]
+    truncated: bool
+    has_more: bool
+
+
+def next_channel_seq(db: Session, channel: str) -> int:
+    sequence = RealtimeChannelSequence.__table__
+    statement = (
+        pg_insert(sequence)
+        .values(channel=channel, last_seq=1)
+        .on_conflict_do_update(
+            index_elements=[sequence.c.channel],
+            set_={"last_seq": sequence.c.last_seq + 1},
+        )
+        .returning(sequence.c.last_seq)
+    )
+    return int(db.exec(statement).scalar_one())  # type: ignore[call-overload]
+
+
+def record_realtime_event(db: Session, channel: str, data: dict[str, Any]) -> dict[str, Any]:
+    seq = next_channel_seq(db, channel)
+    message = {**data, "seq": seq}
+    db.exec(insert(RealtimeEvent).values(channel=channel, seq=seq, data=message))  # type: ignore[call-overload]
+    if seq % PRUNE_EVERY == 0 and seq > REPLAY_BUFFER_SIZE:
+        db.exec(  # type: ignore[call-overload]
+            delete(RealtimeEvent).where(
+                RealtimeEvent.channel == channel,
+                RealtimeEvent.seq <= seq - REPLAY_BUFFER_SIZE,
+            )
+        )
+    db.commit()
+    return message
+
+
+def channel_sequences(db: Session, channels: list[str]) -> dict[str, int]:
+    rows = db.exec(
+        select(RealtimeChannelSequence.channel, RealtimeChannelSequence.last_seq).where(
+            RealtimeChannelSequence.channel.in_(channels)  # type: ignore[attr-defined]
+        )
+    ).all()
+    sequences = {channel: 0 for channel in channels}
+    sequences.update({channel: int(last_seq) for channel, last_seq in rows})
+    return sequences
+
+
+def list_realtime_events_since(db: Session, channel: str, since_seq: int, limit: int) -> RealtimeReplay:
+    last_seq = channel_sequences(db, [channel])[channel]
+    rows = db.exec(
+        select(RealtimeEvent.seq, RealtimeEvent.data)
+        .where(RealtimeEvent.channel == channel, RealtimeEvent.seq > since_seq)
+        .order_by(RealtimeEvent.seq)
+        .limit(limit)
+    ).all()
+    events = [data for _seq, data in rows]
+    # Missing deltas were pruned from the buffer, or the client's seq is from another timeline.
+    truncated = since_seq > last_seq or (
+        since_seq < last_seq and (not rows or rows[0][0] != since_seq + 1)
+    )
+    has_more = bool(rows) and rows[-1][0] < last_seq
+    return RealtimeReplay(
+        channel=channel,
+        last_seq=last_seq,
+        events=events,
+        truncated=truncated,
+        has_more=has_more,
+    )
@@ -0,0 +1,57 @@
+"""Batched ``INSERT ... ON CONFLICT DO UPDATE`` for base catalog seed imports.
+
+Seed documents are diffed against the rows already loaded by the importer,
+so only new or changed entries reach the database, in a handful of
+statements instead of one ORM round-trip per entry.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+
+from sqlalchemy import Table, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel import Session
+
+SEED_UPSERT_BATCH_SIZE = 500
+
+
+def seed_row_values(model: object, columns: Iterable[str]) -> dict:
+    return {column: getattr(model, column) for column in columns}
+
+
+def seed_row_changed(existing: object, row: dict) -> bool:
+    return any(
+        getattr(existing, column) != value
+        for column, value in row.items()
+        if column != "id"
+    )
+
+
+def bulk_upsert_seed_rows(
+    db: Session,
+    table: Table,
+    rows: Sequence[dict],
+    *,
+    constraint: str,
+    batch_size: int = SEED_UPSERT_BATCH_SIZE,
+) -> None:
+    """Upsert full-column rows keyed by ``constraint``; ``id`` is never overwritten."""
+    if not rows:
+        return
+    update_columns = [column for column in rows[0] if column != "id"]
+    for start in range(0, len(rows), batch_size):
+        statement = pg_insert(table).values(list(rows[start:start + batch_size]))
+        statement = statement.on_conflict_do_update(
+            constraint=constraint,
+            set_={column: statement.excluded[column] for column in update_columns},
+        )
+        db.exec(statement)  # type: ignore[call-overload]
+
+
+def bulk_deactivate_seed_rows(db: Session, table: Table, ids: Sequence[str]) -> None:
+    for start in range(0, len(ids), SEED_UPSERT_BATCH_SIZE):
+        db.exec(  # type: ignore[call-overload]
+            update(table)
+            .where(table.c.id.in_(ids[start:start + SEED_UPSERT_BATCH_SIZE]))
+            .values(is_active=False)
+        )
@@ -0,0 +1,80 @@
+"""User search for invite dialogs.
+
+On Postgres the ``ILIKE '%term%'`` filters are served by the ``pg_trgm`` GIN
+indexes on ``app_user.username`` and ``app_user.display_name``. Results rank
+exact matches first, then prefix matches, then trigram similarity. Other
+dialects (the SQLite test engine) skip the similarity step and fall back to
+username order.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import case, func, or_
+from sqlmodel import Session, select
+
+from app.models.party import Party
+from app.models.party_member import PartyMember, PartyMemberStatus
+from app.models.user import User
+
+USER_SEARCH_LIMIT = 20
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search_users(
+    db: Session,
+    query: str,
+    *,
+    limit: int = USER_SEARCH_LIMIT,
+    exclude_party_id: str | None = None,
+) -> list[User]:
+    needle = query.strip().lower()
+    if not needle:
+        return []
+    escaped = _escape_like(needle)
+    contains = f"%{escaped}%"
+    prefix = f"{escaped}%"
+    username = func.lower(User.username)
+    display_name = func.lower(func.coalesce(User.display_name, ""))
+
+    statement = select(User).where(
+        or_(
+            User.username.ilike(contains, escape="\\"),
+            User.display_name.ilike(contains, escape="\\"),
+        )
+    )
+    if exclude_party_id:
+        statement = statement.where(
+            User.id.not_in(
+                select(PartyMember.user_id).where(
+                    PartyMember.party_id == exclude_party_id,
+                    PartyMember.status.in_((PartyMemberStatus.JOINED, PartyMemberStatus.INVITED)),
+                )
+            ),
+            User.id.not_in(select(Party.gm_user_id).where(Party.id == exclude_party_id)),
+        )
+
+    ordering = [
+        case(
+            (or_(username == needle, display_name == needle), 0),
+            (
+                or_(
+                    username.like(prefix, escape="\\"),
+                    display_name.like(prefix, escape="\\"),
+                ),
+                1,
+            ),
+            else_=2,
+        )
+    ]
+    if db.get_bind().dialect.name == "postgresql":
+        ordering.append(
+            func.greatest(
+                func.similarity(User.username, needle),
+                func.similarity(func.coalesce(User.display_name, ""), needle),
+            ).desc()
+        )
+    ordering.append(User.username)
+    return list(db.exec(statement.order_by(*ordering).limit(limit)).all())
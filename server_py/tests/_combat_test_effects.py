@@ -210,6 +210,57 @@ class CombatEffectsTestsMixin:
         effects = self.state.participants[1].get("active_effects", [])
         self.assertEqual(len(effects), 0)
 
+    @patch("app.services.combat.CombatService._emit_state")
+    @patch("app.services.combat.CombatService._emit_log")
+    async def test_turn_expiries_are_grouped_per_boundary_in_log_order(self, mock_emit_log, mock_emit_state):
+        self.state.phase = CombatPhase.active
+        self.state.current_turn_index = 1
+        self.state.participants[1]["active_effects"] = [
+            {
+                "id": "eff-end",
+                "kind": "condition",
+                "condition_type": "frightened",
+                "expires_on": "turn_end",
+                "expires_at_participant_id": "e1",
+            },
+            {
+                "id": "eff-end-2",
+                "kind": "condition",
+                "condition_type": "prone",
+                "expires_on": "turn_end",
+                "expires_at_participant_id": "e1",
+            },
+        ]
+        self.state.participants[0]["active_effects"] = [
+            {
+                "id": "eff-start",
+                "kind": "temp_ac_bonus",
+                "numeric_value": 2,
+                "expires_on": "turn_start",
+                "expires_at_participant_id": "p1",
+            },
+            {
+                "id": "eff-other",
+                "kind": "dodging",
+                "expires_on": "turn_start",
+                "expires_at_participant_id": "e1",
+            },
+        ]
+
+        with patch("app.services.combat.CombatService.get_state", return_value=self.state):
+            await CombatService.next_turn(self.db, "session-123", "gm-user", True)
+
+        logs = [call.args[1] for call in mock_emit_log.await_args_list]
+        self.assertEqual(
+            [(log.get("source"), len(log.get("entries", []))) for log in logs[:3]],
+            [("effect_expired", 2), (None, 0), ("effect_expired", 1)],
+        )
+        self.assertEqual(logs[1]["message"], "Round 2 started!")
+        self.assertIn("end of Goblin's turn", logs[0]["message"])
+        self.assertIn("start of Hero's turn", logs[2]["message"])
+        self.assertEqual(self.state.participants[1]["active_effects"], [])
+        self.assertEqual([e["id"] for e in self.state.participants[0]["active_effects"]], ["eff-other"])
+
     @patch("app.services.combat.CombatService._emit_state")
     @patch("app.services.combat.CombatService._emit_log")
     async def test_manual_effect_does_not_expire(self, mock_emit_log, mock_emit_state):
@@ -1,7 +1,15 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
-from app.models.base_item import BaseItemWeaponCategory, BaseItemWeaponRangeType
+from app.models.base_item import (
+    BaseItem,
+    BaseItemCostUnit,
+    BaseItemDamageType,
+    BaseItemKind,
+    BaseItemWeaponCategory,
+    BaseItemWeaponRangeType,
+)
+from app.models.campaign import Campaign, SystemType
 from app.models.campaign_entity import CampaignEntity
 from app.models.combat import CombatPhase, CombatState
 from app.models.item import Item, ItemType
@@ -19,6 +27,7 @@ from app.schemas.combat import (
     CombatSetInitiativeRequest,
     CombatStartRequest,
 )
+from app.services.campaign_catalog import campaign_catalog_item_id, invalidate_base_catalog_layer
 from app.services.combat import (
     CombatService,
     CombatServiceError,
@@ -302,6 +311,55 @@ class CombatEntityStatsTestsMixin:
         self.assertEqual(resolved["rangeMeters"], 6)
         self.assertEqual(resolved["isMelee"], True)
 
+    def test_resolve_weapon_action_accepts_unmaterialized_catalog_item(self):
+        invalidate_base_catalog_layer()
+        self.addCleanup(invalidate_base_catalog_layer)
+        session_entry_result = MagicMock()
+        session_entry_result.first.return_value = MagicMock(id="session-123", campaign_id="camp-1")
+        missing_row_result = MagicMock()
+        missing_row_result.first.return_value = None
+        base_layer_result = MagicMock()
+        base_layer_result.all.return_value = [
+            BaseItem(
+                id="base-handaxe",
+                system=SystemType.DND5E,
+                canonical_key="handaxe",
+                name_en="Handaxe",
+                name_pt="Machadinha",
+                item_kind=BaseItemKind.WEAPON,
+                cost_quantity=5.0,
+                cost_unit=BaseItemCostUnit.GP,
+                weapon_category=BaseItemWeaponCategory.SIMPLE,
+                weapon_range_type=BaseItemWeaponRangeType.MELEE,
+                damage_dice="1d6",
+                damage_type=BaseItemDamageType.SLASHING,
+                is_shield=False,
+                is_srd=True,
+                is_active=True,
+            )
+        ]
+        self.db.exec.side_effect = [session_entry_result, missing_row_result, base_layer_result]
+        self.db.get.return_value = Campaign(id="camp-1", name="Campaign", system=SystemType.DND5E)
+        item_id = campaign_catalog_item_id("camp-1", "base-handaxe")
+
+        resolved = CombatService._resolve_weapon_combat_action(
+            self.db,
+            "session-123",
+            CombatAction(
+                id="handaxe",
+                name="Handaxe",
+                kind="weapon_attack",
+                campaignItemId=item_id,
+                toHitBonus=4,
+            ),
+        )
+
+        self.assertEqual(resolved["campaignItemId"], item_id)
+        self.assertEqual(resolved["damageDice"], "1d6")
+        self.assertEqual(resolved["damageType"], "slashing")
+        self.assertEqual(resolved["isMelee"], True)
+        self.db.add.assert_not_called()
+
     @patch("app.services.combat.CombatService._get_spell_catalog_entry_for_session")
     def test_resolve_spell_action_prefers_catalog_spell_data(self, mock_get_spell_catalog):
         mock_get_spell_catalog.return_value = MagicMock(
@@ -1,7 +1,8 @@
 import unittest
 from datetime import datetime, timedelta, timezone
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+from app.api.routes.combat import action_cast_spell, action_cast_spell_effect
 from app.models.base_item import BaseItemWeaponRangeType
 from app.models.campaign import SystemType
 from app.models.campaign_entity import CampaignEntity
@@ -809,6 +810,211 @@ class CombatFlowTestsMixin:
         self.assertIn("dano aplicado 4", final_log)
         mock_emit_state.assert_awaited()
 
+    @patch("app.services.combat.CombatService._emit_player_state_update")
+    @patch("app.services.combat.CombatService._emit_entity_hp_update")
+    @patch("app.services.combat.CombatService._emit_state")
+    @patch("app.services.combat.CombatService._emit_log")
+    async def test_player_area_spell_resolves_every_target_with_one_roll(
+        self,
+        mock_emit_log,
+        mock_emit_state,
+        mock_emit_entity_hp_update,
+        mock_emit_player_state_update,
+    ):
+        self.state.phase = CombatPhase.active
+        self.state.current_turn_index = 0
+        self.state.participants.append(
+            {
+                "id": "e2",
+                "ref_id": "enemy-456",
+                "kind": "session_entity",
+                "display_name": "Orc",
+                "initiative": None,
+                "status": "active",
+                "team": "enemies",
+                "visible": True,
+                "actor_user_id": None,
+            }
+        )
+        attacker_state = SessionState(
+            id="state-player",
+            session_id="session-123",
+            player_user_id="player-123",
+            state_json={
+                "spellcasting": {
+                    "spells": [
+                        {
+                            "name": "Raio de Gelo",
+                            "canonicalKey": "ray_of_frost_save",
+                            "level": 0,
+                            "prepared": True,
+                        }
+                    ]
+                }
+            },
+        )
+        save_stats = {
+            "enemy-123": RollActorStats(
+                display_name="Goblin",
+                abilities={"dexterity": 10},
+                actor_kind="session_entity",
+                actor_ref_id="enemy-123",
+            ),
+            "enemy-456": RollActorStats(
+                display_name="Orc",
+                abilities={"dexterity": 30},
+                actor_kind="session_entity",
+                actor_ref_id="enemy-456",
+            ),
+        }
+
+        with patch("app.services.combat.CombatService.get_state", return_value=self.state):
+            with patch(
+                "app.services.combat.CombatService._get_spell_catalog_entry_for_session",
+                return_value=MagicMock(
+                    canonical_key="ray_of_frost_save",
+                    name_en="Raio de Gelo",
+                    name_pt=None,
+                    level=0,
+                    damage_type="cold",
+                    saving_throw="dexterity",
+                    save_success_outcome="half_damage",
+                ),
+            ):
+                with patch(
+                    "app.services.combat.CombatService._get_stats",
+                    return_value=(attacker_state, 12, 10, 10, 2, 3),
+                ):
+                    with patch(
+                        "app.services.combat.CombatService._build_roll_actor_stats_for_save",
+                        side_effect=lambda db, session_id, ref_id, *args: save_stats[ref_id],
+                    ):
+                        with patch("random.randint", return_value=3):
+                            cast_result = await CombatService.cast_spell(
+                                self.db,
+                                "session-123",
+                                CombatCastSpellRequest(
+                                    actor_participant_id="p1",
+                                    target_ref_id="enemy-123",
+                                    additional_target_ref_ids=["enemy-456", "enemy-123"],
+                                    spell_canonical_key="ray_of_frost_save",
+                                    spell_mode="saving_throw",
+                                    damage_dice="1d8",
+                                    damage_type="cold",
+                                    save_ability="dexterity",
+                                ),
+                                "user-1",
+                                False,
+                            )
+
+                    self.assertEqual(
+                        [(target["target_ref_id"], target["is_saved"]) for target in cast_result["targets"]],
+                        [("enemy-123", False), ("enemy-456", True)],
+                    )
+                    self.assertTrue(cast_result["effect_roll_required"])
+
+                    with patch(
+                        "app.services.combat.CombatService._apply_damage_to_target",
+                        return_value=(5, "", 9, None),
+                    ) as mock_apply_damage:
+                        with patch("random.randint", return_value=8):
+                            effect_result = await CombatService.cast_spell_effect(
+                                self.db,
+                                "session-123",
+                                CombatResolveSpellEffectRequest(
+                                    actor_participant_id="p1",
+                                    pending_spell_id=cast_result["pending_spell_id"],
+                                ),
+                                "user-1",
+                                False,
+                            )
+
+        self.assertEqual(effect_result["effect_rolls"], [8])
+        self.assertEqual(
+            [(target["target_ref_id"], target["damage"]) for target in effect_result["targets"]],
+            [("enemy-123", 8), ("enemy-456", 4)],
+        )
+        self.assertEqual(
+            [call.args[1:4] for call in mock_apply_damage.call_args_list],
+            [("enemy-123", "session_entity", 8), ("enemy-456", "session_entity", 4)],
+        )
+        self.assertEqual(self.db.commit.call_count, 2)
+        self.assertEqual(mock_emit_state.await_count, 2)
+        self.assertEqual(mock_emit_log.await_count, 2)
+        self.assertNotIn("pending_attack", self.state.participants[0])
+
+    def test_area_spell_skips_targets_that_take_no_damage(self):
+        outcomes = [
+            {"target_ref_id": "enemy-123", "target_kind": "session_entity", "is_saved": False},
+            {"target_ref_id": "enemy-456", "target_kind": "session_entity", "is_saved": True},
+        ]
+
+        with patch(
+            "app.services.combat.CombatService._apply_spell_effect",
+            return_value=(8, "", 9, None),
+        ) as mock_apply_effect:
+            CombatService._apply_area_spell_amount(
+                self.db,
+                self.state,
+                outcomes,
+                rolled_total=1,
+                action_kind="saving_throw",
+                effect_kind="damage",
+                save_success_outcome="half_damage",
+                damage_type="cold",
+            )
+
+        self.assertEqual([call.args[2] for call in mock_apply_effect.call_args_list], ["enemy-123"])
+        self.assertEqual([(outcome["damage"], outcome["new_hp"]) for outcome in outcomes], [(1, 8), (0, None)])
+
+    async def test_area_spell_routes_record_every_target_roll_in_one_commit(self):
+        timestamp = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+        def roll(label: str) -> dict:
+            return {"event_id": label, "timestamp": timestamp}
+
+        cast_result = {
+            "roll_result": roll("save-goblin"),
+            "targets": [
+                {"target_ref_id": "enemy-123", "roll_result": roll("save-goblin")},
+                {"target_ref_id": "enemy-456", "roll_result": roll("save-orc")},
+            ],
+        }
+        effect_result = {
+            "roll_result": None,
+            "concentration_check": {"roll_result": roll("concentration-goblin")},
+            "targets": [
+                {"target_ref_id": "enemy-123", "concentration_check": {"roll_result": roll("concentration-goblin")}},
+                {"target_ref_id": "enemy-456", "concentration_check": {"roll_result": roll("concentration-orc")}},
+            ],
+        }
+        user = MagicMock(id="user-1")
+
+        with (
+            patch("app.api.routes.combat.load_session", return_value=MagicMock(id="session-123", campaign_id="campaign-1", party_id=None)),
+            patch("app.api.routes.combat.load_campaign_member", return_value=MagicMock(id="member-1", display_name="Ayla")),
+            patch("app.api.routes.combat.centrifugo.publish", new_callable=AsyncMock) as mock_publish,
+            patch("app.api.routes.combat.record_session_activity") as mock_record,
+            patch("app.services.combat.CombatService.cast_spell", new_callable=AsyncMock, return_value=cast_result),
+            patch("app.services.combat.CombatService.cast_spell_effect", new_callable=AsyncMock, return_value=effect_result),
+        ):
+            self.db.commit.reset_mock()
+            await action_cast_spell("session-123", MagicMock(), db=self.db, user=user)
+            await action_cast_spell_effect("session-123", MagicMock(), db=self.db, user=user)
+
+        self.assertEqual(
+            [call.kwargs["payload"]["event_id"] for call in mock_record.call_args_list],
+            ["save-goblin", "save-orc", "concentration-goblin", "concentration-orc"],
+        )
+        self.assertEqual(self.db.commit.call_count, 2)
+        self.assertEqual(mock_publish.await_count, 4)
+        events = [call.args[1] for call in mock_publish.await_args_list]
+        self.assertEqual({event["type"] for event in events}, {"rolls_resolved"})
+        self.assertEqual(
+            [[result["event_id"] for result in event["payload"]["results"]] for event in events[::2]],
+            [["save-goblin", "save-orc"], ["concentration-goblin", "concentration-orc"]],
+        )
+
     @patch("app.services.combat.CombatService._emit_player_state_update")
     @patch("app.services.combat.CombatService._emit_entity_hp_update")
     @patch("app.services.combat.CombatService._emit_state")
@@ -17,6 +17,7 @@ from app.schemas.combat import (
     CombatSetInitiativeRequest,
     CombatStartRequest,
 )
+from app.services.combat_service.roster import CombatRoster
 from app.services.combat import (
     CombatService,
     CombatServiceError,
@@ -78,7 +79,8 @@ class TestCombatServiceBase(unittest.IsolatedAsyncioTestCase):
             phase=CombatPhase.initiative,
             round=1,
             current_turn_index=0,
-            participants=[
+            # Loaded states carry an indexed roster (see combat_service.roster).
+            participants=CombatRoster([
                 {
                     "id": "p1",
                     "ref_id": "player-123",
@@ -101,5 +103,5 @@ class TestCombatServiceBase(unittest.IsolatedAsyncioTestCase):
                     "visible": True,
                     "actor_user_id": None
                 }
-            ]
+            ])
         )
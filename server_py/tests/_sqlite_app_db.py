@@ -0,0 +1,32 @@
+"""In-memory SQLite stand-in for the app database in route-level tests.
+
+JSONB and ARRAY columns are created as plain JSON so every table can exist;
+Postgres-only operators still need the Postgres-backed tests.
+"""
+
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb(_type, _compiler, **_kw):
+    return "JSON"
+
+
+@compiles(ARRAY, "sqlite")
+def _compile_array(_type, _compiler, **_kw):
+    return "JSON"
+
+
+def create_sqlite_app_engine(tables=None):
+    """Create ``tables`` (default: every model imported so far) on a fresh engine."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine, tables=tables)
+    return engine
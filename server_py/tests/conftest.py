@@ -0,0 +1,5 @@
+import os
+
+# Query budgets (app.core.metrics.QUERY_BUDGETS) fail the request instead of
+# logging under test, so an N+1 regression on a budgeted route fails the suite.
+os.environ.setdefault("QUERY_BUDGET_STRICT", "1")
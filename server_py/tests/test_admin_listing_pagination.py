@@ -0,0 +1,140 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel
+
+from app.models.admin_stat import AdminUserStat
+from app.models.campaign import Campaign, RoleMode, SystemType
+from app.models.campaign_member import CampaignMember
+from app.models.party import Party
+from app.models.session import Session as CampaignSession, SessionStatus
+from app.models.user import User
+from app.services.admin_system import list_admin_campaigns, list_admin_users
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class AdminListingPaginationTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        SQLModel.metadata.create_all(
+            self.engine,
+            tables=[
+                User.__table__,
+                AdminUserStat.__table__,
+                Campaign.__table__,
+                CampaignMember.__table__,
+                Party.__table__,
+                CampaignSession.__table__,
+            ],
+        )
+        self.statements: list[str] = []
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        self.db = Session(self.engine)
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def _record(self, _conn, _cursor, statement, *_args):
+        self.statements.append(statement)
+
+    def _add_users(self, count: int) -> None:
+        # Pairs share a created_at so the id tie-breaker is exercised.
+        self.db.add_all(
+            User(
+                id=f"user-{index:03d}",
+                username=f"user{index:03d}",
+                pin_hash="x",
+                created_at=START + timedelta(minutes=index // 2),
+            )
+            for index in range(count)
+        )
+        self.db.commit()
+
+    def test_user_pages_cover_every_user_once_newest_first(self):
+        self._add_users(7)
+
+        seen: list[str] = []
+        cursor = None
+        while True:
+            page = list_admin_users(db=self.db, limit=3, cursor=cursor)
+            seen.extend(user.id for user in page.items)
+            cursor = page.nextCursor
+            if cursor is None:
+                break
+
+        self.assertEqual(seen, [f"user-{index:03d}" for index in reversed(range(7))])
+
+    def test_invalid_cursor_is_rejected(self):
+        with self.assertRaises(HTTPException) as ctx:
+            list_admin_users(db=self.db, cursor="not-a-cursor")
+        self.assertEqual(ctx.exception.status_code, 400)
+
+    def test_campaign_aggregates_are_computed_for_the_page_only(self):
+        self._add_users(1)
+        for index in range(5):
+            campaign_id = f"campaign-{index}"
+            self.db.add(
+                Campaign(
+                    id=campaign_id,
+                    name=campaign_id,
+                    system=SystemType.DND5E,
+                    created_at=START + timedelta(days=index),
+                )
+            )
+            self.db.add(
+                CampaignMember(
+                    id=f"member-{index}",
+                    campaign_id=campaign_id,
+                    user_id="user-000",
+                    display_name=f"GM {index}",
+                    role_mode=RoleMode.GM,
+                )
+            )
+            self.db.add(
+                Party(id=f"party-{index}", campaign_id=campaign_id, gm_user_id="user-000", name="P")
+            )
+            self.db.add(
+                CampaignSession(
+                    id=f"session-{index}",
+                    campaign_id=campaign_id,
+                    party_id=f"party-{index}",
+                    number=1,
+                    title="S",
+                    status=SessionStatus.ACTIVE if index % 2 == 0 else SessionStatus.CLOSED,
+                )
+            )
+        self.db.commit()
+        self.statements.clear()
+
+        first = list_admin_campaigns(db=self.db, limit=2)
+        queries_for_first_page = len(self.statements)
+        second = list_admin_campaigns(db=self.db, limit=2, cursor=first.nextCursor)
+
+        self.assertEqual([item.id for item in first.items], ["campaign-4", "campaign-3"])
+        self.assertEqual([item.id for item in second.items], ["campaign-2", "campaign-1"])
+        self.assertEqual(first.items[0].gmNames, ["GM 4"])
+        self.assertEqual(
+            (
+                first.items[0].membersCount,
+                first.items[0].partiesCount,
+                first.items[0].sessionsCount,
+                first.items[0].activeSessionsCount,
+            ),
+            (1, 1, 1, 1),
+        )
+        self.assertEqual(first.items[1].activeSessionsCount, 0)
+        self.assertEqual(len(self.statements), queries_for_first_page * 2)
+        self.assertTrue(all("GROUP BY" not in statement for statement in self.statements[:1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
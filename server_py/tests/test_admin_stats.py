@@ -0,0 +1,299 @@
+import os
+import unittest
+from uuid import uuid4
+
+from sqlalchemy import create_engine, event, update
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, select
+
+from app.models.admin_stat import AdminStat, AdminUserStat
+from app.models.base_item import BaseItem, BaseItemKind
+from app.models.base_spell import BaseSpell, SpellSchool
+from app.models.campaign import Campaign, RoleMode, SystemType
+from app.models.campaign_member import CampaignMember
+from app.models.party import Party
+from app.models.party_member import PartyMember, PartyMemberStatus
+from app.models.session import Session as CampaignSession, SessionStatus
+from app.models.session_runtime import SessionRuntime
+from app.models.user import User
+from app.services import admin_stats
+from app.services.admin_stats import read_admin_stats, recount_admin_stats
+from app.services.admin_system import list_admin_users
+from app.services.seed_upsert import bulk_upsert_seed_rows, seed_row_values
+
+from tests._sqlite_app_db import create_sqlite_app_engine
+
+# The migrated Postgres the query-plan checks use; the trigger test runs in a
+# transaction that is rolled back, so the database is left as it was.
+ADMIN_STATS_DATABASE_URL = os.getenv("QUERY_PLAN_DATABASE_URL")
+
+COUNTED_TABLES = [
+    User.__table__,
+    Campaign.__table__,
+    CampaignMember.__table__,
+    Party.__table__,
+    PartyMember.__table__,
+    CampaignSession.__table__,
+    SessionRuntime.__table__,
+    BaseItem.__table__,
+    BaseSpell.__table__,
+    AdminStat.__table__,
+    AdminUserStat.__table__,
+]
+
+
+def _write_counted_rows(db: Session, suffix: str) -> dict[str, str]:
+    """Insert, update and delete rows in every counted table.
+
+    Leaves 4 users (1 system admin), 1 campaign, 1 party, 2 sessions (1 active),
+    1 active combat, 2 base items (1 active) and 1 inactive base spell.
+    """
+    ids = {name: f"{name}-{suffix}" for name in ("admin", "gm", "player", "bard", "drifter")}
+    db.add(User(id=ids["admin"], username=ids["admin"], pin_hash="x", is_system_admin=True))
+    for name in ("gm", "player", "bard", "drifter"):
+        db.add(User(id=ids[name], username=ids[name], pin_hash="x"))
+    db.add(Campaign(id=f"campaign-{suffix}", name="Kept", system=SystemType.DND5E))
+    db.add(Campaign(id=f"campaign-gone-{suffix}", name="Gone", system=SystemType.DND5E))
+    db.commit()
+
+    db.get(User, ids["admin"]).is_system_admin = False
+    db.get(User, ids["player"]).is_system_admin = True
+    db.delete(db.get(User, ids["drifter"]))
+    db.delete(db.get(Campaign, f"campaign-gone-{suffix}"))
+    for name, role in (("gm", RoleMode.GM), ("player", RoleMode.PLAYER), ("admin", RoleMode.PLAYER)):
+        db.add(
+            CampaignMember(
+                id=f"member-{name}-{suffix}",
+                campaign_id=f"campaign-{suffix}",
+                user_id=ids[name],
+                display_name=name,
+                role_mode=role,
+            )
+        )
+    db.add(Party(id=f"party-{suffix}", campaign_id=f"campaign-{suffix}", gm_user_id=ids["gm"], name="Party"))
+    db.commit()
+
+    for name, role in (("gm", RoleMode.GM), ("player", RoleMode.PLAYER), ("admin", RoleMode.PLAYER)):
+        db.add(
+            PartyMember(
+                party_id=f"party-{suffix}",
+                user_id=ids[name],
+                role=role,
+                status=PartyMemberStatus.JOINED,
+            )
+        )
+    for index, status in enumerate((SessionStatus.ACTIVE, SessionStatus.LOBBY, SessionStatus.LOBBY)):
+        db.add(
+            CampaignSession(
+                id=f"session-{index}-{suffix}",
+                campaign_id=f"campaign-{suffix}",
+                party_id=f"party-{suffix}",
+                number=index + 1,
+                title=f"Session {index + 1}",
+                status=status,
+            )
+        )
+    db.commit()
+
+    db.get(CampaignMember, f"member-player-{suffix}").role_mode = RoleMode.GM
+    db.delete(db.get(CampaignMember, f"member-admin-{suffix}"))
+    db.exec(  # type: ignore[call-overload]
+        update(PartyMember)
+        .where(PartyMember.party_id == f"party-{suffix}", PartyMember.user_id == ids["admin"])
+        .values(user_id=ids["bard"])
+    )
+    db.delete(db.get(PartyMember, (f"party-{suffix}", ids["player"])))
+    db.get(CampaignSession, f"session-0-{suffix}").status = SessionStatus.CLOSED
+    db.get(CampaignSession, f"session-1-{suffix}").status = SessionStatus.ACTIVE
+    db.delete(db.get(CampaignSession, f"session-2-{suffix}"))
+    db.add(SessionRuntime(session_id=f"session-0-{suffix}", combat_active=True))
+    db.add(SessionRuntime(session_id=f"session-1-{suffix}", combat_active=False))
+    for index in range(2):
+        db.add(
+            BaseItem(
+                id=f"base-item-{index}-{suffix}",
+                system=SystemType.DND5E,
+                canonical_key=f"item_{index}_{suffix}",
+                name_en=f"Item {index}",
+                name_pt=f"Item {index}",
+                item_kind=BaseItemKind.GEAR,
+            )
+        )
+    db.add(
+        BaseSpell(
+            id=f"base-spell-{suffix}",
+            system=SystemType.DND5E,
+            canonical_key=f"spell_{suffix}",
+            name_en="Spell",
+            description_en="Spell.",
+            level=1,
+            school=SpellSchool.EVOCATION,
+        )
+    )
+    db.commit()
+
+    db.get(SessionRuntime, f"session-1-{suffix}").combat_active = True
+    db.delete(db.get(SessionRuntime, f"session-0-{suffix}"))
+    db.get(BaseSpell, f"base-spell-{suffix}").is_active = False
+    db.commit()
+    return ids
+
+
+def _user_counters(db: Session, user_ids) -> dict[str, tuple[int, int, int]]:
+    """Non-zero membership counters; a user whose memberships all went away may keep a zero row."""
+    rows = db.exec(select(AdminUserStat).where(AdminUserStat.user_id.in_(list(user_ids)))).all()
+    return {
+        row.user_id: (row.campaigns_count, row.gm_campaigns_count, row.parties_count)
+        for row in rows
+        if (row.campaigns_count, row.gm_campaigns_count, row.parties_count) != (0, 0, 0)
+    }
+
+
+class AdminStatsTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        SQLModel.metadata.create_all(
+            self.engine,
+            tables=[User.__table__, AdminStat.__table__, AdminUserStat.__table__],
+        )
+        self.statements: list[str] = []
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        self.db = Session(self.engine)
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def _record(self, _conn, _cursor, statement, *_args):
+        self.statements.append(statement)
+
+    def test_missing_counters_read_as_zero(self):
+        self.db.add(AdminStat(key="users_total", value=7))
+        self.db.commit()
+        self.statements.clear()
+
+        stats = read_admin_stats(self.db)
+
+        self.assertEqual(stats["users_total"], 7)
+        self.assertEqual(stats["campaigns_total"], 0)
+        self.assertEqual(len(self.statements), 1)
+
+    def test_user_list_reads_membership_counters_without_grouping(self):
+        self.db.add_all(
+            [
+                User(id="gm", username="gm", pin_hash="x"),
+                User(id="new", username="new", pin_hash="x"),
+            ]
+        )
+        self.db.commit()
+        self.db.add(
+            AdminUserStat(user_id="gm", campaigns_count=3, gm_campaigns_count=2, parties_count=4)
+        )
+        self.db.commit()
+        self.statements.clear()
+
+        users = {user.id: user for user in list_admin_users(db=self.db).items}
+
+        self.assertEqual(len(self.statements), 1)
+        self.assertNotIn("GROUP BY", self.statements[0])
+        self.assertEqual(
+            (users["gm"].campaignsCount, users["gm"].gmCampaignsCount, users["gm"].partiesCount),
+            (3, 2, 4),
+        )
+        self.assertEqual(users["new"].campaignsCount, 0)
+
+
+class RecountAdminStatsTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_sqlite_app_engine(COUNTED_TABLES)
+        self.db = Session(self.engine)
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def test_recount_rebuilds_counters_from_the_counted_tables(self):
+        ids = _write_counted_rows(self.db, "t")
+        self.db.add(AdminStat(key=admin_stats.USERS_TOTAL, value=99))
+        self.db.add(AdminUserStat(user_id=ids["admin"], campaigns_count=5, gm_campaigns_count=5, parties_count=5))
+        self.db.commit()
+
+        recount_admin_stats(self.db)
+
+        self.assertEqual(
+            dict(read_admin_stats(self.db)),
+            {
+                admin_stats.USERS_TOTAL: 4,
+                admin_stats.SYSTEM_ADMINS_TOTAL: 1,
+                admin_stats.CAMPAIGNS_TOTAL: 1,
+                admin_stats.PARTIES_TOTAL: 1,
+                admin_stats.SESSIONS_TOTAL: 2,
+                admin_stats.ACTIVE_SESSIONS_TOTAL: 1,
+                admin_stats.BASE_ITEMS_TOTAL: 2,
+                admin_stats.BASE_ITEMS_ACTIVE: 2,
+                admin_stats.BASE_SPELLS_TOTAL: 1,
+                admin_stats.BASE_SPELLS_ACTIVE: 0,
+                admin_stats.ACTIVE_COMBATS_TOTAL: 1,
+            },
+        )
+        self.assertEqual(
+            _user_counters(self.db, ids.values()),
+            {ids["gm"]: (1, 1, 1), ids["player"]: (1, 1, 0), ids["bard"]: (0, 0, 1)},
+        )
+        self.assertIsNone(self.db.get(AdminUserStat, ids["admin"]))
+
+
+@unittest.skipUnless(ADMIN_STATS_DATABASE_URL, "QUERY_PLAN_DATABASE_URL is not set")
+class AdminStatTriggerTests(unittest.TestCase):
+    """The 0053 triggers keep every counter equal to a full recount."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = create_engine(ADMIN_STATS_DATABASE_URL)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.engine.dispose()
+
+    def setUp(self):
+        self.connection = self.engine.connect()
+        self.transaction = self.connection.begin()
+        self.db = Session(bind=self.connection, join_transaction_mode="create_savepoint")
+
+    def tearDown(self):
+        self.db.close()
+        self.transaction.rollback()
+        self.connection.close()
+
+    def test_trigger_counters_match_a_recount(self):
+        suffix = uuid4().hex[:8]
+        ids = _write_counted_rows(self.db, suffix)
+        # Seed imports flip is_active through INSERT ... ON CONFLICT DO UPDATE.
+        item = self.db.get(BaseItem, f"base-item-1-{suffix}")
+        row = seed_row_values(item, BaseItem.__table__.columns.keys())
+        row["is_active"] = False
+        bulk_upsert_seed_rows(
+            self.db,
+            BaseItem.__table__,
+            [row],
+            constraint="uq_base_item_system_canonical_key",
+        )
+        self.db.commit()
+
+        triggered = (dict(read_admin_stats(self.db)), _user_counters(self.db, ids.values()))
+        recount_admin_stats(self.db)
+        recounted = (dict(read_admin_stats(self.db)), _user_counters(self.db, ids.values()))
+
+        self.assertEqual(triggered, recounted)
+        self.assertEqual(
+            triggered[1],
+            {ids["gm"]: (1, 1, 1), ids["player"]: (1, 1, 0), ids["bard"]: (0, 0, 1)},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,15 +14,24 @@ from app.api.routes.admin_system import (
     admin_overview,
     admin_update_user,
 )
+from app.models.admin_stat import AdminUserStat
 from app.models.campaign import RoleMode, SystemType
+from app.models.campaign_deletion_job import CampaignDeletionJob, CampaignDeletionStatus
 from app.schemas.admin_system import (
+    AdminCampaignPage,
     AdminCampaignRead,
     AdminDiagnosticsRead,
     AdminOverviewRead,
+    AdminUserPage,
     AdminUserRead,
     AdminUserUpdate,
 )
-from app.services.admin_system import delete_admin_user, get_admin_diagnostics
+from app.services.admin_system import (
+    delete_admin_user,
+    get_admin_diagnostics,
+    get_admin_overview,
+    retry_admin_campaign_deletion,
+)
 from app.services.admin_system import update_admin_user as update_admin_user_service
 
 
@@ -70,14 +79,18 @@ class AdminSystemServiceTests(unittest.TestCase):
     def test_get_admin_diagnostics_uses_session_exec_for_health_check(self):
         health_result = MagicMock()
         health_result.one.return_value = 1
-        count_results = []
-        for value in [10, 4, 5, 8, 2, 1]:
-            result = MagicMock()
-            result.one.return_value = value
-            count_results.append(result)
+        stats_result = MagicMock()
+        stats_result.all.return_value = [
+            ("users_total", 10),
+            ("campaigns_total", 4),
+            ("parties_total", 5),
+            ("sessions_total", 8),
+            ("active_sessions_total", 2),
+            ("active_combats_total", 1),
+        ]
 
         session = MagicMock()
-        session.exec.side_effect = [health_result, *count_results]
+        session.exec.side_effect = [health_result, stats_result]
 
         diagnostics = get_admin_diagnostics(db=session)
 
@@ -85,8 +98,30 @@ class AdminSystemServiceTests(unittest.TestCase):
         self.assertEqual(diagnostics.databaseMessage, "ok")
         self.assertEqual(diagnostics.usersTotal, 10)
         self.assertEqual(diagnostics.activeCombatsTotal, 1)
+        self.assertEqual(session.exec.call_count, 2)
         session.get_bind.assert_not_called()
 
+    def test_get_admin_overview_reads_counters_in_one_query(self):
+        stats_result = MagicMock()
+        stats_result.all.return_value = [
+            ("users_total", 12),
+            ("system_admins_total", 1),
+            ("base_items_total", 40),
+            ("base_items_active", 35),
+            ("base_spells_total", 9),
+            ("base_spells_active", 9),
+        ]
+        session = MagicMock()
+        session.exec.return_value = stats_result
+
+        overview = get_admin_overview(db=session)
+
+        session.exec.assert_called_once()
+        self.assertEqual(overview.usersTotal, 12)
+        self.assertEqual(overview.baseItemsInactive, 5)
+        self.assertEqual(overview.baseSpellsInactive, 0)
+        self.assertEqual(overview.campaignsTotal, 0)
+
     def test_update_admin_user_allows_demoting_last_system_admin(self):
         user = SimpleNamespace(
             id="user-1",
@@ -100,20 +135,10 @@ class AdminSystemServiceTests(unittest.TestCase):
 
         first_result = MagicMock()
         first_result.first.return_value = user
-        campaigns_result = MagicMock()
-        campaigns_result.one.return_value = 2
-        gm_campaigns_result = MagicMock()
-        gm_campaigns_result.one.return_value = 1
-        parties_result = MagicMock()
-        parties_result.one.return_value = 0
 
         session = MagicMock()
-        session.exec.side_effect = [
-            first_result,
-            campaigns_result,
-            gm_campaigns_result,
-            parties_result,
-        ]
+        session.exec.side_effect = [first_result]
+        session.get.return_value = None
 
         result = update_admin_user_service(
             db=session,
@@ -122,6 +147,7 @@ class AdminSystemServiceTests(unittest.TestCase):
         )
 
         self.assertFalse(result.isSystemAdmin)
+        self.assertEqual(result.campaignsCount, 0)
         session.commit.assert_called_once()
 
     def test_update_admin_user_updates_role_and_admin_flag(self):
@@ -137,23 +163,15 @@ class AdminSystemServiceTests(unittest.TestCase):
 
         first_result = MagicMock()
         first_result.first.return_value = user
-        count_result = MagicMock()
-        count_result.one.return_value = 2
-        campaigns_result = MagicMock()
-        campaigns_result.one.return_value = 3
-        gm_campaigns_result = MagicMock()
-        gm_campaigns_result.one.return_value = 2
-        parties_result = MagicMock()
-        parties_result.one.return_value = 5
 
         session = MagicMock()
-        session.exec.side_effect = [
-            first_result,
-            count_result,
-            campaigns_result,
-            gm_campaigns_result,
-            parties_result,
-        ]
+        session.exec.side_effect = [first_result]
+        session.get.return_value = AdminUserStat(
+            user_id="user-1",
+            campaigns_count=3,
+            gm_campaigns_count=2,
+            parties_count=5,
+        )
 
         result = update_admin_user_service(
             db=session,
@@ -164,9 +182,26 @@ class AdminSystemServiceTests(unittest.TestCase):
         self.assertEqual(result.role, RoleMode.PLAYER)
         self.assertFalse(result.isSystemAdmin)
         self.assertEqual(result.displayName, "gm")
+        self.assertEqual(result.campaignsCount, 3)
+        self.assertEqual(result.partiesCount, 5)
         session.commit.assert_called_once()
         session.refresh.assert_called_once_with(user)
 
+    def test_retry_admin_campaign_deletion_rejects_jobs_that_did_not_fail(self):
+        session = MagicMock()
+        session.get.return_value = CampaignDeletionJob(
+            id="job-1",
+            campaign_id="camp-1",
+            campaign_name="Main Campaign",
+            status=CampaignDeletionStatus.RUNNING,
+        )
+
+        with self.assertRaises(HTTPException) as raised:
+            retry_admin_campaign_deletion(db=session, job_id="job-1")
+
+        self.assertEqual(raised.exception.status_code, 409)
+        session.commit.assert_not_called()
+
 
 class AdminSystemRouteTests(unittest.TestCase):
     def setUp(self):
@@ -194,24 +229,27 @@ class AdminSystemRouteTests(unittest.TestCase):
 
     @patch("app.api.routes.admin_system.list_admin_users")
     def test_admin_list_users_route_returns_users(self, mock_service):
-        mock_service.return_value = [
-            AdminUserRead(
-                id="user-1",
-                username="root",
-                displayName="Root",
-                role=RoleMode.GM,
-                isSystemAdmin=True,
-                campaignsCount=2,
-                gmCampaignsCount=2,
-                partiesCount=1,
-                createdAt=datetime.now(timezone.utc),
-            )
-        ]
+        mock_service.return_value = AdminUserPage(
+            items=[
+                AdminUserRead(
+                    id="user-1",
+                    username="root",
+                    displayName="Root",
+                    role=RoleMode.GM,
+                    isSystemAdmin=True,
+                    campaignsCount=2,
+                    gmCampaignsCount=2,
+                    partiesCount=1,
+                    createdAt=datetime.now(timezone.utc),
+                )
+            ]
+        )
 
         result = admin_list_users(_user=self.admin_user, session=MagicMock())
 
-        self.assertEqual(len(result), 1)
-        self.assertTrue(result[0].isSystemAdmin)
+        self.assertEqual(len(result.items), 1)
+        self.assertTrue(result.items[0].isSystemAdmin)
+        self.assertIsNone(result.nextCursor)
         mock_service.assert_called_once()
 
     @patch("app.api.routes.admin_system.update_admin_user")
@@ -247,32 +285,37 @@ class AdminSystemRouteTests(unittest.TestCase):
 
     @patch("app.api.routes.admin_system.list_admin_campaigns")
     def test_admin_list_campaigns_route_returns_campaigns(self, mock_service):
-        mock_service.return_value = [
-            AdminCampaignRead(
-                id="camp-1",
-                name="Main Campaign",
-                systemType=SystemType.DND5E,
-                roleMode=RoleMode.GM,
-                gmNames=["Root"],
-                membersCount=4,
-                partiesCount=1,
-                sessionsCount=7,
-                activeSessionsCount=1,
-                createdAt=datetime.now(timezone.utc),
-            )
-        ]
+        mock_service.return_value = AdminCampaignPage(
+            items=[
+                AdminCampaignRead(
+                    id="camp-1",
+                    name="Main Campaign",
+                    systemType=SystemType.DND5E,
+                    roleMode=RoleMode.GM,
+                    gmNames=["Root"],
+                    membersCount=4,
+                    partiesCount=1,
+                    sessionsCount=7,
+                    activeSessionsCount=1,
+                    createdAt=datetime.now(timezone.utc),
+                )
+            ],
+            nextCursor="next",
+        )
 
         result = admin_list_campaigns(_user=self.admin_user, session=MagicMock())
 
-        self.assertEqual(result[0].name, "Main Campaign")
+        self.assertEqual(result.items[0].name, "Main Campaign")
+        self.assertEqual(result.nextCursor, "next")
         mock_service.assert_called_once()
 
     @patch("app.api.routes.admin_system.delete_admin_campaign")
     def test_admin_delete_campaign_route_calls_service(self, mock_service):
-        response = admin_delete_campaign("camp-1", _user=self.admin_user, session=MagicMock())
+        response = admin_delete_campaign("camp-1", user=self.admin_user, session=MagicMock())
 
-        self.assertIsNone(response)
+        self.assertIs(response, mock_service.return_value)
         mock_service.assert_called_once()
+        self.assertEqual(mock_service.call_args.kwargs["campaign_id"], "camp-1")
 
     @patch("app.api.routes.admin_system.get_admin_diagnostics")
     def test_admin_diagnostics_route_returns_payload(self, mock_service):
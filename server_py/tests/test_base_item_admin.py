@@ -5,9 +5,10 @@ from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
 
 from app.api.deps import require_system_admin
-from app.api.serializers.base_item import to_base_item_read
+from app.api.serializers.base_item import to_base_item_read, to_base_item_seed_entry
 from app.api.routes.auth import me
 from app.api.routes.admin_base_items import (
     admin_create_base_item,
@@ -40,7 +41,7 @@ from app.services.base_item_seeds import (
     read_base_item_seed_document,
     write_base_item_seed_document,
 )
-from app.services.base_items import create_base_item
+from app.services.base_items import base_item_catalog_revision, create_base_item, update_base_item
 
 
 def make_base_item(**overrides):
@@ -346,6 +347,36 @@ class BaseItemServiceTests(unittest.TestCase):
 
         self.assertEqual(ctx.exception.status_code, 409)
 
+    @patch("app.services.base_items.get_base_item_by_canonical_key", return_value=None)
+    def test_catalog_revision_is_bumped_only_after_commit(self, _mock_existing):
+        payload = BaseItemCreate(
+            canonicalKey="club",
+            nameEn="Club",
+            itemKind=BaseItemKind.WEAPON,
+            weaponCategory=BaseItemWeaponCategory.SIMPLE,
+            weaponRangeType=BaseItemWeaponRangeType.MELEE,
+            damageDice="1d4",
+            damageType="bludgeoning",
+            rangeNormalMeters=5,
+        )
+        db = MagicMock()
+        revisions_at_commit = []
+        db.commit.side_effect = lambda: revisions_at_commit.append(base_item_catalog_revision())
+        before = base_item_catalog_revision()
+
+        create_base_item(db=db, payload=payload)
+        self.assertEqual(revisions_at_commit, [before])
+        self.assertEqual(base_item_catalog_revision(), before + 1)
+
+        item = make_base_item()
+        update_base_item(db=db, item=item, payload=BaseItemUpdate(**payload.model_dump()), commit=False)
+        db.flush.assert_called_once()
+        self.assertEqual(base_item_catalog_revision(), before + 1)
+
+        update_base_item(db=db, item=item, payload=BaseItemUpdate(**payload.model_dump()))
+        self.assertEqual(revisions_at_commit, [before, before + 1])
+        self.assertEqual(base_item_catalog_revision(), before + 2)
+
 
 class BaseItemSeedTests(unittest.TestCase):
     def test_write_and_read_seed_document_roundtrip(self):
@@ -483,13 +514,11 @@ class BaseItemSeedTests(unittest.TestCase):
 
         self.assertEqual([item.canonicalKey for item in document.items], ["club", "dagger"])
 
-    @patch("app.services.base_item_seeds.update_base_item")
-    def test_replace_deactivates_stale_items_without_deleting_them(self, mock_update):
+    def test_replace_deactivates_stale_items_without_deleting_them(self):
         existing = make_base_item(id="item-existing", canonical_key="dagger", is_active=True)
         stale = make_base_item(id="item-stale", canonical_key="club", is_active=True)
         session = MagicMock()
         session.exec.return_value.all.return_value = [existing, stale]
-        mock_update.return_value = existing
         document = BaseItemSeedDocument(
             version=1,
             items=[
@@ -511,26 +540,36 @@ class BaseItemSeedTests(unittest.TestCase):
         self.assertEqual(result["inserted"], 0)
         self.assertEqual(result["updated"], 1)
         self.assertEqual(result["deactivated"], 1)
-        self.assertFalse(stale.is_active)
+        self.assertIn("elapsedMs", result)
         session.delete.assert_not_called()
+        session.add.assert_not_called()
         session.commit.assert_called_once()
-        mock_update.assert_called_once_with(
-            db=session,
-            item=existing,
-            payload=document.items[0],
-            commit=False,
-            refresh=False,
+        upsert, deactivate = (call.args[0] for call in session.exec.call_args_list[1:])
+        upsert_sql = str(upsert.compile(dialect=postgresql.dialect()))
+        self.assertIn("ON CONFLICT ON CONSTRAINT uq_base_item_system_canonical_key", upsert_sql)
+        self.assertEqual(upsert.compile().params["id_m0"], "item-existing")
+        self.assertEqual(deactivate.compile().params["id_1"], ["item-stale"])
+
+    def test_import_skips_entries_that_match_existing_rows(self):
+        existing = make_base_item(id="item-existing")
+        session = MagicMock()
+        session.exec.return_value.all.return_value = [existing]
+        document = BaseItemSeedDocument(
+            version=1,
+            items=[to_base_item_seed_entry(existing)],
         )
 
-    @patch("app.services.base_item_seeds.create_base_item")
-    def test_import_rolls_back_all_changes_when_a_seed_entry_fails(self, mock_create):
-        created = make_base_item(id="item-created", canonical_key="dagger")
-        mock_create.side_effect = [
-            created,
-            RuntimeError("boom"),
-        ]
+        result = import_base_item_seed_document(session, document)
+
+        self.assertEqual(result["inserted"], 0)
+        self.assertEqual(result["updated"], 0)
+        self.assertEqual(result["unchanged"], 1)
+        self.assertEqual(session.exec.call_count, 1)
+        session.commit.assert_called_once()
+
+    def test_import_rolls_back_all_changes_when_the_upsert_fails(self):
         session = MagicMock()
-        session.exec.return_value.all.return_value = []
+        session.exec.side_effect = [MagicMock(all=MagicMock(return_value=[])), RuntimeError("boom")]
         document = BaseItemSeedDocument(
             version=1,
             items=[
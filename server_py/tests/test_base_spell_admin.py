@@ -491,9 +491,7 @@ class BaseSpellSeedTests(unittest.TestCase):
             ["acid_splash", "fireball"],
         )
 
-    @patch("app.services.base_spell_seeds.create_base_spell")
-    @patch("app.services.base_spell_seeds.update_base_spell")
-    def test_import_base_spell_seed_document_upserts_entries(self, mock_update, mock_create):
+    def test_import_base_spell_seed_document_upserts_entries(self):
         existing_spell = make_base_spell(id="spell-existing", canonical_key="fireball")
         session = MagicMock()
         session.exec.return_value.all.return_value = [existing_spell]
@@ -522,9 +520,29 @@ class BaseSpellSeedTests(unittest.TestCase):
         self.assertEqual(result["inserted"], 1)
         self.assertEqual(result["updated"], 1)
         self.assertEqual(result["total"], 2)
-        mock_update.assert_called_once()
-        mock_create.assert_called_once()
+        session.add.assert_not_called()
         session.commit.assert_called_once()
+        upsert_params = session.exec.call_args_list[1].args[0].compile().params
+        self.assertEqual(upsert_params["canonical_key_m0"], "magic_missile")
+        self.assertEqual(upsert_params["id_m1"], "spell-existing")
+        self.assertEqual(upsert_params["description_en_m1"], "Explosion of flame.")
+        # Fields the seed entry leaves unset keep their stored values on update.
+        self.assertEqual(upsert_params["damage_dice_m1"], "8d6")
+
+    def test_import_base_spell_seed_document_skips_unchanged_entries(self):
+        existing_spell = make_base_spell()
+        session = MagicMock()
+        session.exec.return_value.all.return_value = [existing_spell]
+        document = BaseSpellSeedDocument(
+            version=1,
+            spells=[to_base_spell_seed_entry(existing_spell)],
+        )
+
+        result = import_base_spell_seed_document(session, document)
+
+        self.assertEqual(result["unchanged"], 1)
+        self.assertEqual(result["updated"], 0)
+        self.assertEqual(session.exec.call_count, 1)
 
     @patch("app.services.base_spell_seeds.import_base_spell_seed_file")
     def test_bootstrap_base_spells_if_empty_imports_when_catalog_is_empty(self, mock_import):
@@ -1,4 +1,6 @@
 import unittest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
 
 from app.models.base_item import (
     BaseItem,
@@ -8,10 +10,17 @@ from app.models.base_item import (
     BaseItemWeaponCategory,
     BaseItemWeaponRangeType,
 )
-from app.models.campaign import SystemType
-from app.models.item import ItemType
+from app.models.campaign import Campaign, SystemType
+from app.models.item import Item, ItemType
 from app.services.combat_service.exceptions import _parse_dice
-from app.services.campaign_catalog import _base_item_to_campaign_item
+from app.services.campaign_catalog import (
+    _base_item_to_campaign_item,
+    campaign_catalog_item_id,
+    get_campaign_catalog_item,
+    invalidate_base_catalog_layer,
+    is_overlay_item,
+    resolve_campaign_catalog,
+)
 
 
 class CampaignCatalogBaseItemCompatibilityTests(unittest.TestCase):
@@ -118,6 +127,127 @@ class CampaignCatalogBaseItemCompatibilityTests(unittest.TestCase):
         self.assertEqual(item.magic_effect_json["spellCanonicalKey"], "magic_missile")
 
 
+def _exec_result(rows):
+    result = MagicMock()
+    result.all.return_value = rows
+    result.first.return_value = rows[0] if rows else None
+    return result
+
+
+def _base_item(base_id: str, canonical_key: str, name: str) -> BaseItem:
+    return BaseItem(
+        id=base_id,
+        system=SystemType.DND5E,
+        canonical_key=canonical_key,
+        name_en=name,
+        name_pt=name,
+        item_kind=BaseItemKind.GEAR,
+        cost_quantity=1.0,
+        cost_unit=BaseItemCostUnit.GP,
+        is_shield=False,
+        is_srd=False,
+        is_active=True,
+    )
+
+
+class CampaignCatalogOverlayTests(unittest.TestCase):
+    def setUp(self):
+        invalidate_base_catalog_layer()
+        self.addCleanup(invalidate_base_catalog_layer)
+        self.campaign = Campaign(
+            id="campaign-1",
+            name="Campaign",
+            system=SystemType.DND5E,
+            item_catalog_snapshot_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        )
+
+    def test_campaign_item_ids_are_stable_per_campaign_and_base_item(self):
+        self.assertEqual(
+            campaign_catalog_item_id("campaign-1", "base-rope"),
+            campaign_catalog_item_id("campaign-1", "base-rope"),
+        )
+        self.assertNotEqual(
+            campaign_catalog_item_id("campaign-1", "base-rope"),
+            campaign_catalog_item_id("campaign-2", "base-rope"),
+        )
+
+    def test_resolve_merges_campaign_rows_with_unmaterialized_base_entries(self):
+        override = Item(
+            id="row-rope",
+            campaign_id="campaign-1",
+            name="GM Rope",
+            type=ItemType.MISC,
+            description="Overridden",
+            base_item_id="base-rope",
+        )
+        db = MagicMock()
+        db.exec.side_effect = [
+            _exec_result([override]),
+            _exec_result([
+                _base_item("base-rope", "rope", "Rope"),
+                _base_item("base-torch", "torch", "Torch"),
+            ]),
+        ]
+
+        items = resolve_campaign_catalog(db, self.campaign)
+
+        self.assertEqual([item.name for item in items], ["GM Rope", "Torch"])
+        torch = items[1]
+        self.assertTrue(is_overlay_item(torch))
+        self.assertEqual(torch.id, campaign_catalog_item_id("campaign-1", "base-torch"))
+        self.assertEqual(torch.campaign_id, "campaign-1")
+        self.assertEqual(torch.created_at, self.campaign.item_catalog_snapshot_at)
+        db.add.assert_not_called()
+
+    def test_base_layer_is_cached_between_reads(self):
+        db = MagicMock()
+        db.exec.side_effect = [
+            _exec_result([]),
+            _exec_result([_base_item("base-torch", "torch", "Torch")]),
+            _exec_result([]),
+        ]
+
+        resolve_campaign_catalog(db, self.campaign)
+        items = resolve_campaign_catalog(db, self.campaign)
+
+        self.assertEqual([item.name for item in items], ["Torch"])
+        self.assertEqual(db.exec.call_count, 3)
+
+    def test_lookup_by_overlay_id_materializes_the_base_entry(self):
+        db = MagicMock()
+        db.get.return_value = self.campaign
+        db.exec.side_effect = [
+            _exec_result([]),
+            _exec_result([_base_item("base-torch", "torch", "Torch")]),
+        ]
+        item_id = campaign_catalog_item_id("campaign-1", "base-torch")
+
+        item = get_campaign_catalog_item(db, campaign_id="campaign-1", item_id=item_id)
+
+        self.assertIsNotNone(item)
+        self.assertEqual(item.id, item_id)
+        self.assertEqual(item.base_item_id, "base-torch")
+        db.add.assert_called_once_with(item)
+
+    def test_lookup_without_materialization_leaves_the_session_untouched(self):
+        db = MagicMock()
+        db.get.return_value = self.campaign
+        db.exec.side_effect = [
+            _exec_result([]),
+            _exec_result([_base_item("base-torch", "torch", "Torch")]),
+        ]
+
+        item = get_campaign_catalog_item(
+            db,
+            campaign_id="campaign-1",
+            item_id=campaign_catalog_item_id("campaign-1", "base-torch"),
+            materialize=False,
+        )
+
+        self.assertTrue(is_overlay_item(item))
+        db.add.assert_not_called()
+
+
 class CombatDamageParsingTests(unittest.TestCase):
     def test_parse_dice_supports_static_damage_values(self):
         self.assertEqual(_parse_dice("1"), (0, 0, 1))
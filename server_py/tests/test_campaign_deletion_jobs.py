@@ -0,0 +1,218 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, select
+
+from app.api.routes.party_common import list_parties_for_user
+from app.api.routes.sessions.state_common import get_session_entry
+from app.models.campaign import Campaign, RoleMode, SystemType
+from app.models.campaign_deletion_job import CampaignDeletionJob, CampaignDeletionStatus
+from app.models.campaign_member import CampaignMember
+from app.models.party import Party
+from app.models.party_member import PartyMember
+from app.models.roll_event import RollEvent
+from app.models.session import Session as CampaignSession, SessionStatus
+from app.models.user import User
+from app.services.campaign_cleanup import _existing_tables, reset_existing_tables_cache
+from app.services.campaign_deletion import (
+    claim_next_deletion_job,
+    request_campaign_deletion,
+    retry_deletion_job,
+    run_deletion_job,
+)
+
+
+class CampaignDeletionJobTests(unittest.TestCase):
+    def setUp(self):
+        reset_existing_tables_cache()
+        self.engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        SQLModel.metadata.create_all(
+            self.engine,
+            tables=[
+                User.__table__,
+                Campaign.__table__,
+                CampaignMember.__table__,
+                Party.__table__,
+                PartyMember.__table__,
+                CampaignSession.__table__,
+                RollEvent.__table__,
+                CampaignDeletionJob.__table__,
+            ],
+        )
+        self.statements: list[str] = []
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        self.db = Session(self.engine)
+        self.db.add_all(
+            [
+                User(id="gm", username="gm", pin_hash="x"),
+                Campaign(id="campaign-1", name="Long Campaign", system=SystemType.DND5E),
+                Campaign(id="campaign-2", name="Other", system=SystemType.DND5E),
+            ]
+        )
+        self.db.commit()
+        self.db.add_all(
+            [
+                CampaignMember(
+                    id=f"member-{campaign_id}",
+                    campaign_id=campaign_id,
+                    user_id="gm",
+                    display_name="GM",
+                    role_mode=RoleMode.GM,
+                )
+                for campaign_id in ("campaign-1", "campaign-2")
+            ]
+        )
+        self.db.add(Party(id="party-1", campaign_id="campaign-1", gm_user_id="gm", name="Party"))
+        self.db.commit()
+        for campaign_id in ("campaign-1", "campaign-2"):
+            self.db.add(
+                CampaignSession(
+                    id=f"session-{campaign_id}",
+                    campaign_id=campaign_id,
+                    party_id="party-1" if campaign_id == "campaign-1" else None,
+                    number=1,
+                    title="Session",
+                    status=SessionStatus.ACTIVE,
+                )
+            )
+        self.db.commit()
+        self.db.add_all(
+            [
+                RollEvent(
+                    id=f"roll-{campaign_id}-{index}",
+                    campaign_id=campaign_id,
+                    session_id=f"session-{campaign_id}",
+                    author_name="GM",
+                    role_mode=RoleMode.GM,
+                    expression="1d20",
+                    count=1,
+                    sides=20,
+                    modifier=0,
+                    results=[10],
+                    total=10,
+                )
+                for campaign_id, total in (("campaign-1", 25), ("campaign-2", 3))
+                for index in range(total)
+            ]
+        )
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+        reset_existing_tables_cache()
+
+    def _record(self, _conn, _cursor, statement, *_args):
+        self.statements.append(statement)
+
+    def _queue(self) -> str:
+        campaign = self.db.get(Campaign, "campaign-1")
+        job = request_campaign_deletion(self.db, campaign, requested_by_user_id="gm")
+        self.db.commit()
+        return job.id
+
+    def test_request_marks_campaign_pending_and_is_idempotent(self):
+        first = self._queue()
+        second = self._queue()
+
+        self.assertEqual(first, second)
+        self.assertIsNotNone(self.db.get(Campaign, "campaign-1").deletion_requested_at)
+        job = self.db.get(CampaignDeletionJob, first)
+        self.assertEqual(job.status, CampaignDeletionStatus.PENDING)
+        self.assertEqual(job.campaign_name, "Long Campaign")
+
+    def test_request_closes_open_sessions_and_hides_the_campaign(self):
+        self._queue()
+
+        self.assertEqual(self.db.get(CampaignSession, "session-campaign-1").status, SessionStatus.CLOSED)
+        self.assertEqual(self.db.get(CampaignSession, "session-campaign-2").status, SessionStatus.ACTIVE)
+        with self.assertRaises(HTTPException) as raised:
+            get_session_entry("session-campaign-1", Session(self.engine))
+        self.assertEqual(raised.exception.status_code, 404)
+        self.assertEqual(list_parties_for_user("gm", Session(self.engine)), [])
+
+    def test_job_deletes_in_chunks_and_reports_progress(self):
+        self._queue()
+        job = claim_next_deletion_job(self.db)
+        self.assertEqual(job.status, CampaignDeletionStatus.RUNNING)
+
+        run_deletion_job(self.db, job, chunk_size=10)
+
+        job = self.db.get(CampaignDeletionJob, job.id)
+        self.assertEqual(job.status, CampaignDeletionStatus.COMPLETED)
+        self.assertEqual(job.steps_done, job.steps_total)
+        self.assertIsNotNone(job.finished_at)
+        # 25 rolls + session + party + member + campaign
+        self.assertEqual(job.rows_deleted, 29)
+        roll_deletes = [
+            statement
+            for statement in self.statements
+            if statement.startswith("DELETE FROM roll_event")
+        ]
+        self.assertGreaterEqual(len(roll_deletes), 3)
+        self.assertIsNone(self.db.get(Campaign, "campaign-1"))
+        remaining = self.db.exec(select(RollEvent.campaign_id)).all()
+        self.assertEqual(set(remaining), {"campaign-2"})
+        self.assertIsNotNone(self.db.get(Campaign, "campaign-2"))
+
+    def test_running_job_is_only_reclaimed_once_stale(self):
+        self._queue()
+        now = datetime.now(timezone.utc)
+        self.assertIsNotNone(claim_next_deletion_job(self.db, now=now))
+        self.assertIsNone(claim_next_deletion_job(self.db, now=now + timedelta(minutes=1)))
+        self.assertIsNotNone(claim_next_deletion_job(self.db, now=now + timedelta(minutes=10)))
+
+    def test_failed_step_marks_job_failed(self):
+        self._queue()
+        job = claim_next_deletion_job(self.db)
+
+        with patch(
+            "app.services.campaign_deletion.delete_step_chunk",
+            side_effect=RuntimeError("lock timeout"),
+        ):
+            run_deletion_job(self.db, job, chunk_size=10)
+
+        job = self.db.get(CampaignDeletionJob, job.id)
+        self.assertEqual(job.status, CampaignDeletionStatus.FAILED)
+        self.assertEqual(job.error, "lock timeout")
+
+    def test_failed_job_can_be_retried_from_the_first_step(self):
+        self._queue()
+        job = claim_next_deletion_job(self.db)
+        with patch(
+            "app.services.campaign_deletion.delete_step_chunk",
+            side_effect=RuntimeError("lock timeout"),
+        ):
+            run_deletion_job(self.db, job, chunk_size=10)
+        self.assertIsNone(claim_next_deletion_job(self.db))
+
+        retry_deletion_job(self.db, job)
+        self.db.commit()
+        job = claim_next_deletion_job(self.db)
+        run_deletion_job(self.db, job, chunk_size=10)
+
+        job = self.db.get(CampaignDeletionJob, job.id)
+        self.assertEqual(job.status, CampaignDeletionStatus.COMPLETED)
+        self.assertIsNone(job.error)
+        self.assertIsNone(self.db.get(Campaign, "campaign-1"))
+
+    def test_schema_tables_are_inspected_once_per_engine(self):
+        first = _existing_tables(self.db)
+        inspected = len(self.statements)
+        second = _existing_tables(self.db)
+
+        self.assertIs(first, second)
+        self.assertIn("roll_event", first)
+        self.assertEqual(len(self.statements), inspected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from app.api.routes.campaign_entities import list_campaign_entity_summaries
+
+
+def _row(name: str, entity_id: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=entity_id,
+        campaign_id="campaign-1",
+        name=name,
+        category="enemy",
+        size="small",
+        creature_type="humanoid",
+        creature_subtype=None,
+        image_url=None,
+        armor_class=13,
+        max_hp=7,
+        initiative_bonus=2,
+    )
+
+
+def _compiled(db: MagicMock) -> str:
+    statement = db.exec.call_args.args[0]
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class CampaignEntitySummaryTests(unittest.TestCase):
+    def test_selects_only_summary_columns(self):
+        db = MagicMock()
+        db.exec.return_value.all.return_value = [_row("Goblin", "e1")]
+
+        page = list_campaign_entity_summaries(db, "campaign-1", limit=10)
+
+        sql = _compiled(db)
+        self.assertNotIn("abilities", sql)
+        self.assertNotIn("combat_actions", sql)
+        self.assertNotIn("notes_private", sql)
+        self.assertIn("ORDER BY campaign_entity.name, campaign_entity.id", sql)
+        self.assertEqual(page.items[0].name, "Goblin")
+        self.assertIsNone(page.nextCursor)
+
+    def test_next_cursor_resumes_after_last_item(self):
+        db = MagicMock()
+        db.exec.return_value.all.return_value = [_row("Goblin", "e1"), _row("Orc", "e2")]
+
+        page = list_campaign_entity_summaries(db, "campaign-1", limit=1)
+
+        self.assertEqual([item.id for item in page.items], ["e1"])
+        self.assertIsNotNone(page.nextCursor)
+
+        db.exec.return_value.all.return_value = [_row("Orc", "e2")]
+        list_campaign_entity_summaries(db, "campaign-1", limit=1, cursor=page.nextCursor)
+        params = db.exec.call_args.args[0].compile(dialect=postgresql.dialect()).params
+        self.assertIn("Goblin", params.values())
+        self.assertIn("e1", params.values())
+
+    def test_search_category_and_revealed_filters(self):
+        db = MagicMock()
+        db.exec.return_value.all.return_value = []
+
+        list_campaign_entity_summaries(
+            db,
+            "campaign-1",
+            limit=10,
+            search=" Gob ",
+            category="enemy",
+            revealed_only=True,
+        )
+
+        sql = _compiled(db)
+        self.assertIn("lower(campaign_entity.name) LIKE", sql)
+        self.assertIn("session_entity.visible_to_players", sql)
+        params = db.exec.call_args.args[0].compile(dialect=postgresql.dialect()).params
+        self.assertIn("%gob%", params.values())
+        self.assertIn("enemy", params.values())
+
+    def test_invalid_cursor_is_rejected(self):
+        with self.assertRaises(HTTPException) as ctx:
+            list_campaign_entity_summaries(MagicMock(), "campaign-1", limit=10, cursor="not-a-cursor")
+        self.assertEqual(ctx.exception.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,22 +6,26 @@ from fastapi import HTTPException
 
 from app.api.routes.campaigns import delete_campaign
 from app.api.routes.parties import delete_party
-from app.services.campaign_cleanup import delete_campaign_tree, delete_party_tree
+from app.services.campaign_cleanup import (
+    campaign_delete_steps,
+    delete_campaign_tree,
+    party_delete_steps,
+)
 
 
 class CampaignDeletionRouteTests(unittest.TestCase):
-    @patch("app.api.routes.campaigns.delete_campaign_tree")
+    @patch("app.api.routes.campaigns.request_campaign_deletion")
     @patch("app.api.routes.campaigns.require_gm")
-    def test_delete_campaign_uses_cleanup_service(self, mock_require_gm, mock_delete_tree):
+    def test_delete_campaign_queues_background_deletion(self, mock_require_gm, mock_request):
         campaign = SimpleNamespace(id="campaign-1")
         mock_require_gm.return_value = (campaign, SimpleNamespace())
         session = MagicMock()
 
-        result = delete_campaign("campaign-1", user=SimpleNamespace(), session=session)
+        result = delete_campaign("campaign-1", user=SimpleNamespace(id="gm-1"), session=session)
 
         self.assertIsNone(result)
         mock_require_gm.assert_called_once()
-        mock_delete_tree.assert_called_once_with(session, campaign)
+        mock_request.assert_called_once_with(session, campaign, requested_by_user_id="gm-1")
         session.commit.assert_called_once_with()
 
 
@@ -82,76 +86,47 @@ class PartyDeletionRouteTests(unittest.TestCase):
 
 
 class CampaignCleanupOrderTests(unittest.TestCase):
-    @patch("app.services.campaign_cleanup._delete_where")
-    @patch("app.services.campaign_cleanup._delete_session_tree")
-    @patch("app.services.campaign_cleanup._existing_tables")
+    def _tables(self, steps):
+        return [step.table for step in steps]
+
     @patch("app.services.campaign_cleanup._session_ids_for_party")
-    def test_delete_party_tree_removes_character_sheets_before_drafts(
-        self,
-        mock_session_ids,
-        mock_existing_tables,
-        mock_delete_session_tree,
-        mock_delete_where,
-    ):
+    def test_party_steps_remove_character_sheets_before_drafts(self, mock_session_ids):
+        mock_session_ids.return_value = ["session-1"]
+
+        tables = self._tables(party_delete_steps(MagicMock(), "party-1"))
+
+        self.assertLess(tables.index("character_sheet"), tables.index("party_character_sheet_draft"))
+        self.assertLess(tables.index("roll_event"), tables.index("campaign_session"))
+        self.assertEqual(tables[-1], "party")
+
+    @patch("app.services.campaign_cleanup._session_ids_for_campaign")
+    def test_campaign_steps_remove_children_before_their_parents(self, mock_session_ids):
         mock_session_ids.return_value = []
-        mock_existing_tables.return_value = {
-            "character_sheet",
-            "party_character_sheet_draft",
-            "inventoryitem",
-            "party_member",
-            "party",
-        }
-        session = MagicMock()
-        party = SimpleNamespace(id="party-1")
 
-        delete_party_tree(session, party)
+        tables = self._tables(campaign_delete_steps(MagicMock(), "campaign-1"))
 
-        deleted_models = [call.args[1].__name__ for call in mock_delete_where.call_args_list]
-        self.assertLess(
-            deleted_models.index("CharacterSheet"),
-            deleted_models.index("PartyCharacterSheetDraft"),
-        )
-        mock_delete_session_tree.assert_called_once()
+        self.assertLess(tables.index("character_sheet"), tables.index("party_character_sheet_draft"))
+        self.assertLess(tables.index("realtime_event"), tables.index("campaign_session"))
+        self.assertLess(tables.index("party_member"), tables.index("party"))
+        self.assertEqual(tables[-1], "campaign")
 
     @patch("app.services.campaign_cleanup._delete_where")
-    @patch("app.services.campaign_cleanup._delete_session_tree")
     @patch("app.services.campaign_cleanup._existing_tables")
-    @patch("app.services.campaign_cleanup._party_ids_for_campaign")
     @patch("app.services.campaign_cleanup._session_ids_for_campaign")
-    def test_delete_campaign_tree_removes_character_sheets_before_drafts(
+    def test_delete_campaign_tree_inspects_schema_once(
         self,
         mock_session_ids,
-        mock_party_ids,
         mock_existing_tables,
-        mock_delete_session_tree,
         mock_delete_where,
     ):
         mock_session_ids.return_value = []
-        mock_party_ids.return_value = ["party-1"]
-        mock_existing_tables.return_value = {
-            "inventoryitem",
-            "character_sheet",
-            "party_character_sheet_draft",
-            "party_member",
-            "party",
-            "roll_event",
-            "campaign_spell",
-            "item",
-            "campaign_entity",
-            "campaign_member",
-            "campaign",
-        }
-        session = MagicMock()
-        campaign = SimpleNamespace(id="campaign-1")
+        mock_existing_tables.return_value = frozenset({"campaign", "campaign_member"})
 
-        delete_campaign_tree(session, campaign)
+        delete_campaign_tree(MagicMock(), SimpleNamespace(id="campaign-1"))
 
-        deleted_models = [call.args[1].__name__ for call in mock_delete_where.call_args_list]
-        self.assertLess(
-            deleted_models.index("CharacterSheet"),
-            deleted_models.index("PartyCharacterSheetDraft"),
-        )
-        mock_delete_session_tree.assert_called_once()
+        deleted_tables = {call.args[1].__table__.name for call in mock_delete_where.call_args_list}
+        self.assertTrue({"campaign", "campaign_member"} <= deleted_tables)
+        mock_existing_tables.assert_called_once()
 
 
 if __name__ == "__main__":
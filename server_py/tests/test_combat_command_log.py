@@ -0,0 +1,114 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from app.api.routes.combat import get_combat_log
+
+from app.models.combat import CombatPhase, CombatState
+from app.services.combat import CombatService
+from app.services.combat_service.command_log import (
+    combat_command,
+    combat_log_entry_rows,
+    persist_combat_log_entries,
+)
+
+
+def _state():
+    return CombatState(
+        session_id="session-1",
+        phase=CombatPhase.active,
+        round=1,
+        current_turn_index=0,
+        participants=[],
+    )
+
+
+class CombatCommandLogTests(unittest.IsolatedAsyncioTestCase):
+    @patch("app.services.combat_service.command_log._persist_once")
+    @patch("app.services.combat_service.command_log.centrifugo.publish", new_callable=AsyncMock)
+    async def test_command_publishes_final_state_and_one_log_batch(self, mock_publish, mock_persist):
+        async with combat_command("session-1"):
+            await CombatService._emit_state("session-1", _state())
+            await CombatService._emit_log("session-1", {"message": "Hero attacks", "source": "attack"})
+            state = _state()
+            state.round = 2
+            await CombatService._emit_state("session-1", state)
+            await CombatService._emit_log("session-1", {"message": "Goblin is hit", "source": "attack"})
+
+        self.assertEqual(mock_publish.await_count, 2)
+        state_event = mock_publish.await_args_list[0].args[1]
+        batch_event = mock_publish.await_args_list[1].args[1]
+        self.assertEqual(state_event["type"], "combat_state_updated")
+        self.assertEqual(state_event["payload"]["round"], 2)
+        self.assertEqual(batch_event["type"], "combat_log_batch")
+        self.assertEqual(
+            [entry["message"] for entry in batch_event["payload"]["entries"]],
+            ["Hero attacks", "Goblin is hit"],
+        )
+        mock_persist.assert_called_once()
+        self.assertEqual(len(mock_persist.call_args.args[1]), 2)
+
+    @patch("app.services.combat_service.command_log._persist_once")
+    @patch("app.services.combat_service.command_log.centrifugo.publish", new_callable=AsyncMock)
+    async def test_buffered_output_is_flushed_when_the_command_fails(self, mock_publish, mock_persist):
+        with self.assertRaises(RuntimeError):
+            async with combat_command("session-1"):
+                await CombatService._emit_log("session-1", {"message": "Hero attacks"})
+                raise RuntimeError("publish of roll result failed")
+
+        self.assertEqual(mock_publish.await_count, 1)
+        self.assertEqual(mock_publish.await_args.args[1]["type"], "combat_log_batch")
+        mock_persist.assert_called_once()
+
+    @patch("app.services.combat_service.command_log._persist_once", side_effect=RuntimeError("db down"))
+    @patch("app.services.combat_service.command_log.centrifugo.publish", new_callable=AsyncMock)
+    async def test_log_outside_a_command_is_a_single_entry_batch(self, mock_publish, _mock_persist):
+        await CombatService._emit_log("session-1", {"message": "Round 2"})
+
+        mock_publish.assert_awaited_once()
+        self.assertEqual(
+            mock_publish.await_args.args[1]["payload"]["entries"][0]["message"],
+            "Round 2",
+        )
+
+    def test_entries_are_stored_with_one_multi_row_insert(self):
+        entries = [
+            {"message": "Hero attacks", "source": "attack", "createdAt": "2026-01-01T00:00:00+00:00"},
+            {"message": "Goblin is hit", "createdAt": "2026-01-01T00:00:00+00:00"},
+        ]
+        db = MagicMock()
+
+        persist_combat_log_entries(db, "session-1", entries)
+
+        db.exec.assert_called_once()
+        db.commit.assert_called_once()
+        sql = str(db.exec.call_args.args[0].compile(dialect=postgresql.dialect()))
+        self.assertIn("INSERT INTO combat_log_entry", sql)
+        rows = combat_log_entry_rows("session-1", entries)
+        self.assertEqual([row["sequence"] for row in rows], [0, 1])
+        self.assertIsNone(rows[1]["source"])
+
+    @patch("app.api.routes.combat.list_combat_log_entries")
+    @patch("app.api.routes.sessions.state_common.load_campaign_member", return_value=None)
+    @patch("app.api.routes.sessions.state_common.is_campaign_pending_deletion", return_value=False)
+    @patch("app.api.routes.combat.load_session")
+    def test_combat_log_requires_campaign_membership(
+        self,
+        mock_load_session,
+        _mock_pending,
+        _mock_member,
+        mock_list_entries,
+    ):
+        mock_load_session.return_value = MagicMock(id="session-1", campaign_id="campaign-1", party_id=None)
+
+        with self.assertRaises(HTTPException) as raised:
+            get_combat_log("session-1", limit=50, db=MagicMock(), user=MagicMock(id="stranger"))
+
+        self.assertEqual(raised.exception.status_code, 403)
+        mock_list_entries.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
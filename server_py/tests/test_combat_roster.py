@@ -0,0 +1,119 @@
+import json
+import unittest
+
+from app.models.combat import CombatState
+from app.services.combat import CombatService
+from app.services.combat_service.roster import (
+    CombatRoster,
+    RosterParticipant,
+    concentration_group_members,
+    concentration_groups_from,
+    due_effects,
+    find_participant,
+    find_participant_by_ref,
+    participant_effects_of_kind,
+)
+
+
+def _participants():
+    return [
+        {"id": "p1", "ref_id": "player-1", "kind": "player", "display_name": "Hero"},
+        {
+            "id": "e1",
+            "ref_id": "entity-1",
+            "kind": "session_entity",
+            "display_name": "Goblin",
+            "active_effects": [
+                {"id": "fx-1", "kind": "temp_ac_bonus", "numeric_value": 2},
+                {"id": "fx-2", "kind": "dodging"},
+                {"id": "fx-3", "kind": "temp_ac_bonus", "numeric_value": 1},
+            ],
+        },
+    ]
+
+
+class CombatRosterTests(unittest.TestCase):
+    def test_roster_serializes_to_the_existing_jsonb_layout(self):
+        roster = CombatRoster(_participants())
+
+        self.assertIsInstance(roster[0], RosterParticipant)
+        self.assertEqual(json.dumps(roster), json.dumps(_participants()))
+        self.assertEqual(roster, _participants())
+
+    def test_lookups_by_id_and_ref_return_the_stored_participant(self):
+        roster = CombatRoster(_participants())
+
+        self.assertIs(find_participant(roster, "e1"), roster[1])
+        self.assertIs(find_participant_by_ref(roster, "player-1"), roster[0])
+        self.assertIsNone(find_participant_by_ref(roster, "player-1", kind="session_entity"))
+        self.assertIsNone(find_participant(roster, "missing"))
+
+    def test_indexes_follow_membership_changes(self):
+        roster = CombatRoster(_participants())
+        self.assertIsNone(find_participant(roster, "e2"))
+
+        roster.append({"id": "e2", "ref_id": "entity-2", "kind": "session_entity"})
+        self.assertIs(find_participant(roster, "e2"), roster[2])
+        self.assertIsInstance(roster[2], RosterParticipant)
+
+        roster.pop(0)
+        self.assertIsNone(find_participant(roster, "p1"))
+
+    def test_effect_index_tracks_appends_and_replacements(self):
+        goblin = CombatRoster(_participants())[1]
+        self.assertEqual(CombatService._sum_numeric_effects(goblin, "temp_ac_bonus"), 3)
+
+        goblin["active_effects"].append({"id": "fx-4", "kind": "temp_ac_bonus", "numeric_value": 5})
+        self.assertEqual(CombatService._sum_numeric_effects(goblin, "temp_ac_bonus"), 8)
+
+        goblin["active_effects"] = [{"id": "fx-5", "kind": "advantage_on_attacks"}]
+        self.assertFalse(CombatService._has_effect_kind(goblin, "dodging"))
+        self.assertTrue(CombatService._has_effect_kind(goblin, "advantage_on_attacks"))
+
+    def test_consume_first_effect_removes_only_the_first_match(self):
+        goblin = CombatRoster(_participants())[1]
+
+        removed = CombatService._consume_first_effect(goblin, "temp_ac_bonus")
+
+        self.assertEqual(removed["id"], "fx-1")
+        self.assertEqual([effect["id"] for effect in goblin["active_effects"]], ["fx-2", "fx-3"])
+        self.assertEqual(CombatService._sum_numeric_effects(goblin, "temp_ac_bonus"), 1)
+
+    def test_due_effects_only_returns_the_matching_turn_slot(self):
+        roster = CombatRoster(_participants())
+        roster[0]["active_effects"] = [
+            {"id": "fx-a", "kind": "condition", "expires_on": "turn_start", "expires_at_participant_id": "e1"},
+            {"id": "fx-b", "kind": "condition", "expires_on": "turn_end", "expires_at_participant_id": "e1"},
+            {"id": "fx-c", "kind": "condition", "expires_on": None, "expires_at_participant_id": None},
+        ]
+
+        due = due_effects(roster, "e1", "turn_start")
+
+        self.assertEqual([(owner["id"], [e["id"] for e in effects]) for owner, effects in due], [("p1", ["fx-a"])])
+        self.assertEqual(due_effects(roster, "p1", "turn_start"), [])
+
+    def test_concentration_groups_are_indexed_by_source(self):
+        roster = CombatRoster(_participants())
+        concentration = {"concentration": True, "concentration_group": "bless-1"}
+        roster[0]["active_effects"] = [{"id": "fx-a", "kind": "spell_effect", "source_participant_id": "p1", "metadata": concentration}]
+        roster[1]["active_effects"].append(
+            {"id": "fx-b", "kind": "spell_effect", "source_participant_id": "p1", "metadata": concentration}
+        )
+
+        self.assertEqual(concentration_groups_from(roster, "p1"), ["bless-1"])
+        self.assertEqual(concentration_groups_from(roster, "e1"), [])
+        members = concentration_group_members(roster, "bless-1")
+        self.assertEqual([owner["id"] for owner, _ in members], ["p1", "e1"])
+
+    def test_plain_lists_fall_back_to_scans(self):
+        participants = _participants()
+
+        self.assertIs(find_participant(participants, "e1"), participants[1])
+        self.assertIs(find_participant_by_ref(participants, "entity-1"), participants[1])
+        self.assertEqual(len(participant_effects_of_kind(participants[1], "temp_ac_bonus")), 2)
+        state = CombatState(session_id="session-1", participants=participants)
+        self.assertIs(CombatService._get_participant_by_ref(state, "player-1"), participants[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
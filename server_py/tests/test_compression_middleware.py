@@ -0,0 +1,118 @@
+import gzip
+import unittest
+
+from fastapi import FastAPI, WebSocket
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware
+from app.core.metrics import registry
+
+PAYLOAD = {"participants": [{"id": f"p{index}", "hp": 10, "conditions": []} for index in range(200)]}
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/combat")
+    def combat():
+        return PAYLOAD
+
+    @app.get("/small")
+    def small():
+        return {"ok": True}
+
+    @app.get("/already")
+    def already():
+        return Response(
+            gzip.compress(b"x" * 2000),
+            media_type="application/json",
+            headers={"content-encoding": "gzip"},
+        )
+
+    @app.get("/binary")
+    def binary():
+        return Response(b"\x00" * 2000, media_type="image/png")
+
+    @app.get("/stream")
+    def stream():
+        def chunks():
+            for index in range(50):
+                yield f"line {index} of a repetitive activity feed\n" * 10
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    @app.get("/events")
+    def events():
+        return PlainTextResponse("data: x\n\n" * 500, media_type="text/event-stream")
+
+    @app.websocket("/ws")
+    async def ws(websocket: WebSocket):
+        await websocket.accept()
+        await websocket.send_text("hello" * 500)
+        await websocket.close()
+
+    return app
+
+
+class CompressionMiddlewareTests(unittest.TestCase):
+    def setUp(self):
+        registry.reset()
+        self.client = TestClient(_build_app())
+
+    def tearDown(self):
+        registry.reset()
+
+    def test_large_json_is_gzipped_with_exact_length(self):
+        response = self.client.get("/combat", headers={"accept-encoding": "gzip"})
+
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response.headers["vary"])
+        self.assertEqual(response.json(), PAYLOAD)
+        with self.client.stream("GET", "/combat", headers={"accept-encoding": "gzip"}) as raw:
+            self.assertEqual(int(raw.headers["content-length"]), len(b"".join(raw.iter_raw())))
+
+    def test_small_and_unaccepted_responses_pass_through(self):
+        small = self.client.get("/small", headers={"accept-encoding": "gzip"})
+        identity = self.client.get("/combat", headers={"accept-encoding": "identity"})
+
+        self.assertNotIn("content-encoding", small.headers)
+        self.assertNotIn("content-encoding", identity.headers)
+        self.assertEqual(identity.json(), PAYLOAD)
+
+    def test_already_encoded_binary_and_event_streams_are_skipped(self):
+        already = self.client.get("/already", headers={"accept-encoding": "gzip"})
+        binary = self.client.get("/binary", headers={"accept-encoding": "gzip"})
+        events = self.client.get("/events", headers={"accept-encoding": "gzip"})
+
+        self.assertEqual(already.content, b"x" * 2000)  # decoded once, so not double-encoded
+        self.assertNotIn("content-encoding", binary.headers)
+        self.assertNotIn("content-encoding", events.headers)
+
+    def test_streaming_bodies_are_encoded_incrementally(self):
+        response = self.client.get("/stream", headers={"accept-encoding": "gzip"})
+
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        self.assertNotIn("content-length", response.headers)
+        self.assertTrue(response.text.startswith("line 0 of"))
+        self.assertTrue(response.text.endswith("line 49 of a repetitive activity feed\n"))
+
+    def test_websockets_are_untouched(self):
+        with self.client.websocket_connect("/ws", headers={"accept-encoding": "gzip"}) as websocket:
+            self.assertEqual(websocket.receive_text(), "hello" * 500)
+
+    def test_ratio_and_time_metrics_are_exported(self):
+        self.client.get("/combat", headers={"accept-encoding": "gzip"})
+
+        text = registry.render_prometheus()
+        self.assertIn(
+            'http_response_compression_ratio_count{method="GET",route="/combat",encoding="gzip"} 1',
+            text,
+        )
+        self.assertIn('http_response_uncompressed_bytes_total{method="GET",route="/combat",encoding="gzip"}', text)
+        self.assertIn("http_response_compression_seconds_total", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+from unittest.mock import MagicMock
+
+from app.db.persistence import begin_repeatable_read, commit_and_keep
+from app.models.combat import CombatState
+from app.models.inventory import InventoryItem
+from app.models.purchase_event import PurchaseEvent
+from app.models.session_state import SessionState
+
+
+class CommitAndKeepTests(unittest.TestCase):
+    def test_commit_runs_without_expiring_and_restores_the_session_setting(self):
+        db = MagicMock()
+        db.expire_on_commit = True
+        seen: list[bool] = []
+        db.commit.side_effect = lambda: seen.append(db.expire_on_commit)
+        state = object()
+
+        commit_and_keep(db, state)
+
+        db.add.assert_called_once_with(state)
+        self.assertEqual(seen, [False])
+        self.assertTrue(db.expire_on_commit)
+
+    def test_setting_is_restored_when_the_commit_fails(self):
+        db = MagicMock()
+        db.expire_on_commit = True
+        db.commit.side_effect = RuntimeError("conflict")
+
+        with self.assertRaises(RuntimeError):
+            commit_and_keep(db)
+
+        self.assertTrue(db.expire_on_commit)
+
+    def test_hot_models_fetch_server_defaults_with_returning(self):
+        for model in (CombatState, InventoryItem, PurchaseEvent, SessionState):
+            self.assertTrue(model.__mapper__.eager_defaults, model.__name__)
+
+
+class BeginRepeatableReadTests(unittest.TestCase):
+    def test_postgres_transaction_restarts_as_repeatable_read(self):
+        db = MagicMock()
+        db.get_bind.return_value.dialect.name = "postgresql"
+
+        begin_repeatable_read(db)
+
+        db.rollback.assert_called_once()
+        db.connection.assert_called_once_with(execution_options={"isolation_level": "REPEATABLE READ"})
+
+    def test_other_dialects_keep_the_current_transaction(self):
+        db = MagicMock()
+        db.get_bind.return_value.dialect.name = "sqlite"
+
+        begin_repeatable_read(db)
+
+        db.rollback.assert_not_called()
+        db.connection.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
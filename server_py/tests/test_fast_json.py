@@ -0,0 +1,103 @@
+import unittest
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, FastAPI, Response
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.api.fast_json import FastJSONRoute
+from app.schemas.session import ActivityEvent, CombatActivityEvent, RollActivityEvent
+
+TIMESTAMP = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class PublicUser(BaseModel):
+    id: str
+    displayName: str
+
+
+def _activity() -> list:
+    return [
+        RollActivityEvent(
+            userId="user-1",
+            displayName="Hero",
+            expression="1d20",
+            results=[17],
+            total=17,
+            timestamp=TIMESTAMP,
+            sessionOffsetSeconds=12,
+        ),
+        CombatActivityEvent(action="started", timestamp=TIMESTAMP, sessionOffsetSeconds=0),
+    ]
+
+
+def _build_router(router: APIRouter) -> APIRouter:
+    @router.get("/activity", response_model=list[ActivityEvent])
+    def activity():
+        return _activity()
+
+    @router.get("/users", response_model=list[PublicUser])
+    def users():
+        # Raw rows with extra columns must still go through response_model filtering.
+        return [{"id": "user-1", "displayName": "Hero", "password_hash": "secret"}]
+
+    @router.get("/state")
+    def state():
+        return {"phase": "active", "participants": [{"id": "p1", "hp": 7}], "round": 2}
+
+    @router.get("/header", response_model=PublicUser)
+    def header(response: Response):
+        response.headers["X-Extra"] = "1"
+        return PublicUser(id="user-1", displayName="Hero")
+
+    @router.post("/users", response_model=PublicUser, status_code=201)
+    def create_user():
+        return PublicUser(id="user-2", displayName="Mage")
+
+    return router
+
+
+def _client(route_class=None) -> TestClient:
+    app = FastAPI()
+    router = APIRouter(route_class=route_class) if route_class else APIRouter()
+    app.include_router(_build_router(router), prefix="/api")
+    return TestClient(app)
+
+
+class FastJSONRouteTests(unittest.TestCase):
+    def setUp(self):
+        self.fast = _client(FastJSONRoute)
+        self.default = _client()
+
+    def test_responses_match_the_default_serialization(self):
+        for method, path in (
+            ("GET", "/api/activity"),
+            ("GET", "/api/users"),
+            ("GET", "/api/state"),
+            ("GET", "/api/header"),
+            ("POST", "/api/users"),
+        ):
+            fast = self.fast.request(method, path)
+            default = self.default.request(method, path)
+            self.assertEqual(fast.status_code, default.status_code, path)
+            self.assertEqual(fast.json(), default.json(), path)
+            self.assertEqual(fast.headers["content-type"], "application/json", path)
+
+    def test_untyped_rows_fall_back_to_response_model_filtering(self):
+        self.assertEqual(self.fast.get("/api/users").json(), [{"id": "user-1", "displayName": "Hero"}])
+
+    def test_only_plain_get_routes_are_wrapped(self):
+        wrapped = {
+            route.path: hasattr(route.endpoint, "__fast_json_original__")
+            for route in self.fast.app.routes
+            if isinstance(route, FastJSONRoute) and "GET" in route.methods
+        }
+        self.assertEqual(
+            wrapped,
+            {"/api/activity": True, "/api/users": True, "/api/state": True, "/api/header": False},
+        )
+        self.assertEqual(self.fast.get("/api/header").headers["x-extra"], "1")
+
+
+if __name__ == "__main__":
+    unittest.main()
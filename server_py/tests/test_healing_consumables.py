@@ -1,27 +1,42 @@
 import unittest
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Session
 
 from app.api.routes.sessions.consumables import (
     _require_active_non_combat_session,
     use_session_healing_consumable,
 )
+from app.models.campaign import Campaign, RoleMode, SystemType
+from app.models.campaign_member import CampaignMember
+from app.models.character_sheet import CharacterSheet
 from app.models.item import Item, ItemType
-from app.models.session import SessionStatus
+from app.models.party import Party
+from app.models.party_member import PartyMember, PartyMemberStatus
+from app.models.session import Session as CampaignSession, SessionStatus
 from app.models.session_state import SessionState
+from app.models.user import User
 from app.schemas.session_consumable import SessionUseConsumableRequest
 from app.services.goodberry_inventory import build_goodberry_expiration
 from app.services.healing_consumables import (
     HealingConsumableError,
     apply_healing_outside_combat,
+    list_healing_consumable_targets,
     resolve_healing_consumable,
     require_valid_healing_target,
     roll_healing_consumable,
 )
-from app.services.inventory_expiration import purge_expired_inventory_items
+from app.services.inventory_expiration import (
+    ExpiredInventoryItem,
+    publish_expired_inventory_items,
+    sweep_expired_inventory_items,
+)
+
+from tests._sqlite_app_db import create_sqlite_app_engine
 
 
 def _first_result(value):
@@ -124,8 +139,7 @@ class HealingConsumableServiceTests(unittest.TestCase):
                 inventory_item_id="inv-1",
             )
 
-        db.delete.assert_called_once_with(inventory_item)
-        db.flush.assert_called_once()
+        db.delete.assert_not_called()
 
     def test_resolve_healing_consumable_accepts_unexpired_temporary_item(self):
         db = MagicMock()
@@ -191,32 +205,170 @@ class HealingConsumableServiceTests(unittest.TestCase):
                 target_user_id="user-2",
             )
 
-
-class InventoryExpirationServiceTests(unittest.TestCase):
-    def test_purge_expired_inventory_items_removes_only_expired_entries(self):
+    def test_list_targets_resolves_members_and_hp_in_one_query(self):
         db = MagicMock()
-        expired = SimpleNamespace(
-            id="inv-expired",
-            expires_at=datetime.now(timezone.utc) - timedelta(minutes=5),
+        db.exec.return_value.all.return_value = [
+            # user_id, display_name, state user, state hp, sheet hp
+            ("user-2", "bruna", "user-2", 4, 12, 9, 12),
+            ("user-1", "Aldo", None, None, None, 7, 10),
+            ("user-1", "Aldo", None, None, None, 3, 10),
+            ("user-3", "Caio", "user-3", "5", None, 8, 8),
+        ]
+        session_entry = SimpleNamespace(id="session-1", campaign_id="campaign-1", party_id="party-1")
+
+        targets = list_healing_consumable_targets(
+            db,
+            session_entry=session_entry,
+            actor_user_id="user-1",
         )
-        fresh = SimpleNamespace(
-            id="inv-fresh",
-            expires_at=datetime.now(timezone.utc) + timedelta(minutes=5),
+
+        db.exec.assert_called_once()
+        sql = str(db.exec.call_args.args[0].compile(dialect=postgresql.dialect()))
+        for table in ("campaign_member", "party_member", "session_state", "character_sheet"):
+            self.assertIn(table, sql)
+        self.assertEqual(
+            [(t.player_user_id, t.current_hp, t.max_hp, t.is_self) for t in targets],
+            [("user-1", 7, 10, True), ("user-2", 4, 12, False), ("user-3", 0, 0, False)],
         )
-        result = MagicMock()
-        result.all.return_value = [expired, fresh]
-        db.exec.return_value = result
 
-        removed_ids = purge_expired_inventory_items(
+    def test_list_targets_without_party_skips_party_and_sheet_joins(self):
+        db = MagicMock()
+        db.exec.return_value.all.return_value = [("user-1", "Aldo", None, None, None)]
+        session_entry = SimpleNamespace(id="session-1", campaign_id="campaign-1", party_id=None)
+
+        targets = list_healing_consumable_targets(
             db,
-            campaign_id="campaign-123",
-            member_id="member-1",
-            now=datetime.now(timezone.utc),
+            session_entry=session_entry,
+            actor_user_id="user-1",
         )
 
-        self.assertEqual(removed_ids, ["inv-expired"])
-        db.delete.assert_called_once_with(expired)
-        db.flush.assert_called_once()
+        sql = str(db.exec.call_args.args[0].compile(dialect=postgresql.dialect()))
+        self.assertNotIn("party_member", sql)
+        self.assertNotIn("character_sheet", sql)
+        self.assertEqual([(t.player_user_id, t.current_hp, t.max_hp) for t in targets], [("user-1", 0, 0)])
+
+
+class HealingConsumableTargetQueryTests(unittest.TestCase):
+    """``list_healing_consumable_targets`` against real tables (SQLite)."""
+
+    def setUp(self):
+        self.engine = create_sqlite_app_engine()
+        self.db = Session(self.engine)
+        self.addCleanup(self.db.close)
+        db = self.db
+        db.add(Campaign(id="campaign-1", name="Campaign", system=SystemType.DND5E))
+        db.add(Party(id="party-1", campaign_id="campaign-1", gm_user_id="gm", name="Party"))
+        members = [
+            ("gm", "Gamemaster", RoleMode.GM, None),
+            ("user-1", "Aldo", RoleMode.PLAYER, PartyMemberStatus.JOINED),
+            ("user-2", "Bea", RoleMode.PLAYER, PartyMemberStatus.JOINED),
+            ("user-3", "Caio", RoleMode.PLAYER, PartyMemberStatus.INVITED),
+            ("user-4", "Dora", RoleMode.PLAYER, None),
+        ]
+        for user_id, display_name, role_mode, party_status in members:
+            db.add(User(id=user_id, username=user_id, pin_hash="x"))
+            db.add(
+                CampaignMember(
+                    id=f"member-{user_id}",
+                    campaign_id="campaign-1",
+                    user_id=user_id,
+                    display_name=display_name,
+                    role_mode=role_mode,
+                )
+            )
+            if party_status is not None:
+                db.add(PartyMember(party_id="party-1", user_id=user_id, role=role_mode, status=party_status))
+        db.add(
+            CampaignSession(
+                id="session-1",
+                campaign_id="campaign-1",
+                party_id="party-1",
+                number=1,
+                title="Session 1",
+                status=SessionStatus.ACTIVE,
+            )
+        )
+        db.add(
+            SessionState(
+                id="state-1",
+                session_id="session-1",
+                player_user_id="user-1",
+                state_json={"currentHP": 7, "maxHP": 10},
+            )
+        )
+        for user_id, hp in (("user-1", 1), ("user-2", 4), ("user-3", 5), ("user-4", 6)):
+            db.add(
+                CharacterSheet(
+                    id=f"sheet-{user_id}",
+                    party_id="party-1",
+                    player_user_id=user_id,
+                    data={"currentHP": hp, "maxHP": 12},
+                )
+            )
+        db.commit()
+        self.session_entry = db.get(CampaignSession, "session-1")
+
+    def _targets(self, actor_user_id: str):
+        targets = list_healing_consumable_targets(
+            self.db,
+            session_entry=self.session_entry,
+            actor_user_id=actor_user_id,
+        )
+        return [(t.player_user_id, t.current_hp, t.max_hp, t.is_self) for t in targets]
+
+    def test_joined_members_use_session_state_then_sheet_hp(self):
+        self.assertEqual(
+            self._targets("user-2"),
+            [("user-2", 4, 12, True), ("user-1", 7, 10, False)],
+        )
+
+    def test_invited_members_are_excluded(self):
+        self.assertNotIn("user-3", [target[0] for target in self._targets("user-1")])
+
+    def test_actor_outside_the_party_is_included(self):
+        self.assertEqual(
+            self._targets("user-4"),
+            [("user-4", 6, 12, True), ("user-1", 7, 10, False), ("user-2", 4, 12, False)],
+        )
+
+
+class InventoryExpirationServiceTests(unittest.IsolatedAsyncioTestCase):
+    def test_sweep_deletes_expired_rows_in_one_statement(self):
+        db = MagicMock()
+        db.exec.return_value.all.return_value = [
+            SimpleNamespace(
+                id="inv-expired",
+                campaign_id="campaign-123",
+                party_id="party-123",
+                member_id="member-1",
+                item_id="item-1",
+            ),
+        ]
+
+        removed = sweep_expired_inventory_items(db, now=datetime.now(timezone.utc))
+
+        self.assertEqual([entry.id for entry in removed], ["inv-expired"])
+        statement = db.exec.call_args.args[0]
+        self.assertTrue(statement.is_delete)
+        self.assertIn("RETURNING", str(statement))
+        db.delete.assert_not_called()
+        db.commit.assert_called_once()
+
+    @patch("app.services.inventory_expiration.centrifugo.publish", new_callable=AsyncMock)
+    async def test_publish_groups_expired_items_per_campaign(self, mock_publish):
+        removed = [
+            ExpiredInventoryItem("inv-1", "campaign-1", "party-1", "member-1", "item-1"),
+            ExpiredInventoryItem("inv-2", "campaign-1", "party-1", "member-2", "item-1"),
+            ExpiredInventoryItem("inv-3", "campaign-2", None, "member-3", "item-2"),
+        ]
+
+        await publish_expired_inventory_items(removed)
+
+        self.assertEqual(mock_publish.await_count, 2)
+        channel, event = mock_publish.await_args_list[0].args
+        self.assertEqual(channel, "campaign:campaign-1")
+        self.assertEqual(event["type"], "inventory_items_expired")
+        self.assertEqual([entry["id"] for entry in event["payload"]["items"]], ["inv-1", "inv-2"])
 
 
 class SessionHealingConsumableRouteTests(unittest.IsolatedAsyncioTestCase):
@@ -0,0 +1,135 @@
+import asyncio
+import unittest
+from asyncio import run
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from sqlalchemy.dialects import postgresql
+
+from app.api.routes.sessions.lobby import join_lobby
+from app.models.session import SessionStatus
+from app.services import lobby_readiness
+from app.services.lobby_readiness import LobbyReadiness, mark_lobby_ready, schedule_lobby_update
+
+
+def _readiness(ready, total, ready_expected=None):
+    return LobbyReadiness(
+        ready_user_ids=list(ready),
+        ready_count=len(ready),
+        total_count=total,
+        ready_expected_count=len(ready) if ready_expected is None else ready_expected,
+    )
+
+
+def _lobby_entry():
+    return SimpleNamespace(
+        id="session-1",
+        campaign_id="campaign-1",
+        party_id=None,
+        title="Session 1",
+        status=SessionStatus.LOBBY,
+    )
+
+
+class LobbyReadinessStatementTests(unittest.TestCase):
+    def test_mark_lobby_ready_appends_in_a_single_update(self):
+        db = MagicMock()
+        db.exec.return_value.first.return_value = SimpleNamespace(
+            lobby_ready=["player-1", "player-2"],
+            ready_count=2,
+            total_count=3,
+            ready_expected_count=2,
+        )
+
+        readiness = mark_lobby_ready(db, session_id="session-1", user_id="player-2")
+
+        sql = str(db.exec.call_args.args[0].compile(dialect=postgresql.dialect()))
+        self.assertTrue(sql.startswith("UPDATE session_runtime SET lobby_ready=CASE"))
+        self.assertIn("@> jsonb_build_array", sql)
+        self.assertIn("|| jsonb_build_array", sql)
+        self.assertIn("RETURNING", sql)
+        self.assertIn("jsonb_array_length(session_runtime.lobby_expected)", sql)
+        self.assertEqual(readiness.ready_user_ids, ["player-1", "player-2"])
+        self.assertEqual((readiness.ready_count, readiness.total_count), (2, 3))
+        self.assertFalse(readiness.all_ready)
+
+    def test_all_ready_requires_every_expected_player(self):
+        self.assertTrue(_readiness(["a", "b"], 2).all_ready)
+        self.assertFalse(_readiness(["a", "x"], 2, ready_expected=1).all_ready)
+        self.assertFalse(_readiness(["a"], 0).all_ready)
+
+
+class JoinLobbyTests(unittest.TestCase):
+    def _join(self, readiness, *, rowcount=1):
+        session = MagicMock()
+        session.exec.return_value.first.return_value = _lobby_entry()
+        session.exec.return_value.rowcount = rowcount
+        publish = AsyncMock()
+        with patch(
+            "app.api.routes.sessions.lobby.get_or_create_session_runtime",
+        ), patch(
+            "app.api.routes.sessions.lobby.mark_lobby_ready",
+            return_value=readiness,
+        ), patch(
+            "app.api.routes.sessions.lobby.schedule_lobby_update",
+        ) as schedule, patch(
+            "app.api.routes.sessions.lobby.centrifugo.publish",
+            new=publish,
+        ):
+            result = run(join_lobby("session-1", user=SimpleNamespace(id="player-1"), session=session))
+        return result, session, schedule, publish
+
+    def test_partial_lobby_schedules_coalesced_update(self):
+        result, session, schedule, publish = self._join(_readiness(["player-1"], 2))
+
+        self.assertEqual(result, {"ok": True})
+        session.commit.assert_called_once_with()
+        schedule.assert_called_once_with("session-1", "campaign-1", None)
+        publish.assert_not_awaited()
+
+    def test_last_player_starts_session_once(self):
+        _, _, schedule, publish = self._join(_readiness(["player-1", "player-2"], 2))
+
+        schedule.assert_not_called()
+        self.assertEqual(publish.await_count, 2)
+        self.assertEqual(publish.await_args_list[0].args[1]["type"], "session_started")
+
+    def test_concurrent_final_join_does_not_start_session_twice(self):
+        _, _, schedule, publish = self._join(_readiness(["player-1", "player-2"], 2), rowcount=0)
+
+        publish.assert_not_awaited()
+        schedule.assert_called_once()
+
+
+class LobbyUpdateCoalescingTests(unittest.IsolatedAsyncioTestCase):
+    async def test_burst_of_joins_publishes_one_lobby_updated_event(self):
+        publish = AsyncMock()
+        with patch.object(lobby_readiness, "LOBBY_UPDATE_WINDOW_SECONDS", 0), patch.object(
+            lobby_readiness,
+            "_load_lobby_readiness_once",
+            return_value=_readiness(["player-1", "player-2"], 3),
+        ), patch.object(lobby_readiness.centrifugo, "publish", new=publish):
+            for _ in range(3):
+                schedule_lobby_update("session-1", "campaign-1", "party-1")
+            await asyncio.gather(*lobby_readiness._pending_lobby_updates.values())
+
+        publish.assert_awaited_once()
+        event = publish.await_args.args[1]
+        self.assertEqual(event["type"], "lobby_updated")
+        self.assertEqual(event["payload"]["readyUserIds"], ["player-1", "player-2"])
+        self.assertEqual(event["payload"]["totalCount"], 3)
+        self.assertEqual(lobby_readiness._pending_lobby_updates, {})
+
+    async def test_closed_lobby_skips_publish(self):
+        publish = AsyncMock()
+        with patch.object(lobby_readiness, "LOBBY_UPDATE_WINDOW_SECONDS", 0), patch.object(
+            lobby_readiness, "_load_lobby_readiness_once", return_value=None
+        ), patch.object(lobby_readiness.centrifugo, "publish", new=publish):
+            schedule_lobby_update("session-1", "campaign-1", None)
+            await asyncio.gather(*lobby_readiness._pending_lobby_updates.values())
+
+        publish.assert_not_awaited()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel
+
+from app.api.routes.party_listing_service import (
+    get_party_details_service,
+    list_my_parties_active_sessions_service,
+    list_my_party_invites_service,
+)
+from app.models.campaign import Campaign, RoleMode, SystemType
+from app.models.party import Party
+from app.models.party_member import PartyMember, PartyMemberStatus
+from app.models.session import Session as CampaignSession, SessionStatus
+from app.models.user import User
+
+
+class PartyListingQueryTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        SQLModel.metadata.create_all(
+            self.engine,
+            tables=[
+                User.__table__,
+                Campaign.__table__,
+                Party.__table__,
+                PartyMember.__table__,
+                CampaignSession.__table__,
+            ],
+        )
+        self.statements: list[str] = []
+        self.party_count = 0
+        event.listen(self.engine, "before_cursor_execute", self._count)
+        self.db = Session(self.engine)
+        self.gm = User(id="gm", username="gm", pin_hash="x")
+        self.player = User(id="player", username="player", display_name="Player", pin_hash="x")
+        self.campaign = Campaign(id="campaign-1", name="Campaign", system=SystemType.DND5E)
+        self.db.add_all([self.gm, self.player, self.campaign])
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def _count(self, _conn, _cursor, statement, *_args):
+        self.statements.append(statement)
+
+    def _add_parties(self, count: int, status: PartyMemberStatus) -> list[str]:
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        ids = []
+        for _ in range(count):
+            index = self.party_count
+            self.party_count += 1
+            party_id = f"party-{status.value}-{index}"
+            ids.append(party_id)
+            self.db.add(
+                Party(
+                    id=party_id,
+                    campaign_id="campaign-1",
+                    gm_user_id="gm",
+                    name=party_id,
+                    created_at=start + timedelta(minutes=index),
+                )
+            )
+            self.db.add(
+                PartyMember(
+                    party_id=party_id,
+                    user_id="player",
+                    role=RoleMode.PLAYER,
+                    status=status,
+                )
+            )
+            self.db.add(
+                CampaignSession(
+                    id=f"{party_id}-lobby",
+                    party_id=party_id,
+                    campaign_id="campaign-1",
+                    number=1,
+                    sequence_number=1,
+                    title="Lobby",
+                    status=SessionStatus.LOBBY,
+                    created_at=start,
+                )
+            )
+            self.db.add(
+                CampaignSession(
+                    id=f"{party_id}-active",
+                    party_id=party_id,
+                    campaign_id="campaign-1",
+                    number=2,
+                    sequence_number=2,
+                    title="Active",
+                    status=SessionStatus.ACTIVE,
+                    created_at=start - timedelta(days=1),
+                )
+            )
+        self.db.commit()
+        return ids
+
+    def _query_count(self, call) -> tuple[int, object]:
+        self.db.expire_all()
+        self.statements.clear()
+        result = call()
+        return len(self.statements), result
+
+    def test_my_parties_query_count_does_not_grow_with_parties(self):
+        self._add_parties(1, PartyMemberStatus.JOINED)
+        one, _ = self._query_count(
+            lambda: list_my_parties_active_sessions_service(self.player, self.db)
+        )
+        self._add_parties(6, PartyMemberStatus.JOINED)
+        many, result = self._query_count(
+            lambda: list_my_parties_active_sessions_service(self.player, self.db)
+        )
+
+        self.assertEqual(one, many)
+        self.assertEqual(len(result), 7)
+        self.assertTrue(all(row.activeSession.id.endswith("-active") for row in result))
+
+    def test_gm_parties_are_listed_first(self):
+        self._add_parties(2, PartyMemberStatus.JOINED)
+        self.db.add(Party(id="own", campaign_id="campaign-1", gm_user_id="player", name="own"))
+        self.db.commit()
+
+        result = list_my_parties_active_sessions_service(self.player, self.db)
+
+        self.assertEqual(result[0].party.id, "own")
+        self.assertIsNone(result[0].activeSession)
+
+    def test_invites_query_count_does_not_grow_with_invites(self):
+        self._add_parties(1, PartyMemberStatus.INVITED)
+        one, _ = self._query_count(lambda: list_my_party_invites_service(self.player, self.db))
+        self._add_parties(5, PartyMemberStatus.INVITED)
+        many, result = self._query_count(lambda: list_my_party_invites_service(self.player, self.db))
+
+        self.assertEqual(one, many)
+        self.assertEqual(len(result), 6)
+        self.assertEqual({invite.campaignName for invite in result}, {"Campaign"})
+
+    def test_party_details_query_count_does_not_grow_with_members(self):
+        party_id = self._add_parties(1, PartyMemberStatus.JOINED)[0]
+        one, _ = self._query_count(lambda: get_party_details_service(party_id, self.gm, self.db))
+        for index in range(4):
+            self.db.add(
+                PartyMember(
+                    party_id=party_id,
+                    user_id=f"missing-user-{index}",
+                    role=RoleMode.PLAYER,
+                    status=PartyMemberStatus.INVITED,
+                )
+            )
+        self.db.commit()
+        many, detail = self._query_count(
+            lambda: get_party_details_service(party_id, self.gm, self.db)
+        )
+
+        self.assertEqual(one, many)
+        names = {member.userId: member.displayName for member in detail.members}
+        self.assertEqual(names["player"], "Player")
+        self.assertIsNone(names["missing-user-0"])
+
+
+if __name__ == "__main__":
+    unittest.main()
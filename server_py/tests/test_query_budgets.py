@@ -0,0 +1,236 @@
+"""Budgeted routes served by the real app through ``RequestLoggingMiddleware``.
+
+The suite runs with ``QUERY_BUDGET_STRICT`` (see ``conftest.py``), so a route
+that goes over its ``QUERY_BUDGETS`` entry raises ``QueryBudgetExceeded`` here.
+"""
+
+from datetime import datetime, timezone
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.auth import build_access_token
+from app.core.config import settings
+from app.core.metrics import QUERY_BUDGETS, install_query_hooks, registry
+from app.db.session import get_session
+from app.main import app
+from app.models.campaign import Campaign, RoleMode, SystemType
+from app.models.campaign_entity import CampaignEntity
+from app.models.base_spell import SpellSchool
+from app.models.campaign_member import CampaignMember
+from app.models.campaign_spell import CampaignSpell
+from app.models.combat import CombatPhase, CombatState
+from app.models.party import Party
+from app.models.party_member import PartyMember, PartyMemberStatus
+from app.models.session import Session as CampaignSession, SessionStatus
+from app.models.session_entity import SessionEntity
+from app.models.session_state import SessionState
+from app.models.user import User
+
+from tests._sqlite_app_db import create_sqlite_app_engine
+
+
+def _seed(db: Session) -> None:
+    now = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    db.add(User(id="gm", username="gm", pin_hash="x", role=RoleMode.GM))
+    db.add(User(id="player", username="player", pin_hash="x"))
+    db.add(Campaign(id="campaign-1", name="Campaign", system=SystemType.DND5E))
+    db.add(CampaignMember(id="member-gm", campaign_id="campaign-1", user_id="gm", display_name="GM", role_mode=RoleMode.GM))
+    db.add(
+        CampaignMember(
+            id="member-player",
+            campaign_id="campaign-1",
+            user_id="player",
+            display_name="Ayla",
+            role_mode=RoleMode.PLAYER,
+        )
+    )
+    db.add(Party(id="party-1", campaign_id="campaign-1", gm_user_id="gm", name="Party"))
+    db.add(PartyMember(party_id="party-1", user_id="gm", role=RoleMode.GM, status=PartyMemberStatus.JOINED))
+    db.add(PartyMember(party_id="party-1", user_id="player", role=RoleMode.PLAYER, status=PartyMemberStatus.JOINED))
+    db.add(
+        CampaignSession(
+            id="session-1",
+            campaign_id="campaign-1",
+            party_id="party-1",
+            number=1,
+            title="Session 1",
+            status=SessionStatus.ACTIVE,
+            started_at=now,
+        )
+    )
+    db.add(
+        SessionState(
+            id="state-1",
+            session_id="session-1",
+            player_user_id="player",
+            state_json={
+                "currentHP": 12,
+                "maxHP": 12,
+                "abilities": {"dexterity": 14, "wisdom": 16},
+                "spellcasting": {
+                    "ability": "wisdom",
+                    "spells": [{"name": "Sacred Flame", "canonicalKey": "sacred_flame", "level": 0, "prepared": True}],
+                },
+            },
+        )
+    )
+    db.add(
+        CampaignSpell(
+            id="spell-1",
+            campaign_id="campaign-1",
+            canonical_key="sacred_flame",
+            name_en="Sacred Flame",
+            description_en="Radiant flame.",
+            level=0,
+            school=SpellSchool.EVOCATION,
+            resolution_type="saving_throw",
+            saving_throw="dexterity",
+            damage_dice="1d8",
+            damage_type="radiant",
+        )
+    )
+    db.add(CampaignEntity(id="entity-1", campaign_id="campaign-1", name="Goblin", max_hp=7, armor_class=13))
+    for index in range(3):
+        db.add(
+            SessionEntity(
+                id=f"session-entity-{index}",
+                session_id="session-1",
+                campaign_entity_id="entity-1",
+                visible_to_players=True,
+                current_hp=7,
+                created_at=now,
+            )
+        )
+    db.add(
+        CombatState(
+            id="combat-1",
+            session_id="session-1",
+            phase=CombatPhase.active,
+            round=1,
+            current_turn_index=0,
+            participants=[
+                {
+                    "id": "p1",
+                    "ref_id": "player",
+                    "kind": "player",
+                    "display_name": "Ayla",
+                    "initiative": 15,
+                    "status": "active",
+                    "team": "players",
+                    "visible": True,
+                    "actor_user_id": "player",
+                },
+                *(
+                    {
+                        "id": f"e{index}",
+                        "ref_id": f"session-entity-{index}",
+                        "kind": "session_entity",
+                        "display_name": f"Goblin {index}",
+                        "initiative": 10 - index,
+                        "status": "active",
+                        "team": "enemies",
+                        "visible": True,
+                        "actor_user_id": None,
+                    }
+                    for index in range(3)
+                ),
+            ],
+        )
+    )
+    db.commit()
+
+
+class QueryBudgetRouteTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_sqlite_app_engine()
+        install_query_hooks(self.engine)
+        with Session(self.engine) as db:
+            _seed(db)
+
+        def _get_session():
+            with Session(self.engine) as session:
+                yield session
+
+        app.dependency_overrides[get_session] = _get_session
+        self.addCleanup(app.dependency_overrides.clear)
+        for target in (
+            patch("app.services.centrifugo.centrifugo.publish", new_callable=AsyncMock),
+            patch("app.services.combat_service.command_log.engine", self.engine),
+            patch("builtins.print"),
+        ):
+            target.start()
+            self.addCleanup(target.stop)
+        registry.reset()
+        self.addCleanup(registry.reset)
+        self.client = TestClient(app)
+
+    def _request(self, method: str, path: str, user_id: str, **kwargs):
+        token = build_access_token(user_id, user_id)
+        return self.client.request(method, path, headers={"Authorization": f"Bearer {token}"}, **kwargs)
+
+    def test_strict_budgets_are_enabled_for_the_suite(self):
+        self.assertTrue(settings.query_budget_strict)
+
+    def _assert_within_budget(self, method: str, path: str, route: str, user_id: str, **kwargs) -> None:
+        self.assertIn(f"{method} {route}", QUERY_BUDGETS)
+        response = self._request(method, path, user_id, **kwargs)
+        self.assertEqual(response.status_code, 200, response.text)
+
+        output = registry.render_prometheus()
+        self.assertIn(f'http_request_db_queries_count{{method="{method}",route="{route}"}} 1', output)
+        self.assertNotIn("http_request_query_budget_exceeded_total{", output)
+
+    def test_combat_state(self):
+        self._assert_within_budget(
+            "GET", "/api/sessions/session-1/combat", "/api/sessions/{session_id}/combat", "gm"
+        )
+
+    def test_session_snapshot(self):
+        self._assert_within_budget(
+            "GET", "/api/sessions/session-1/snapshot", "/api/sessions/{session_id}/snapshot", "player"
+        )
+
+    def test_combat_attack(self):
+        self._assert_within_budget(
+            "POST",
+            "/api/sessions/session-1/combat/action/attack",
+            "/api/sessions/{session_id}/combat/action/attack",
+            "player",
+            json={"target_ref_id": "session-entity-0"},
+        )
+
+    def test_combat_area_spell_cast(self):
+        self._assert_within_budget(
+            "POST",
+            "/api/sessions/session-1/combat/action/cast",
+            "/api/sessions/{session_id}/combat/action/cast",
+            "player",
+            json={
+                "target_ref_id": "session-entity-0",
+                "additional_target_ref_ids": ["session-entity-1", "session-entity-2"],
+                "spell_canonical_key": "sacred_flame",
+                "spell_mode": "saving_throw",
+            },
+        )
+
+    def test_combat_next_turn(self):
+        self._assert_within_budget(
+            "POST",
+            "/api/sessions/session-1/combat/turn/next",
+            "/api/sessions/{session_id}/combat/turn/next",
+            "gm",
+            json={},
+        )
+
+    def test_my_parties(self):
+        self._assert_within_budget("GET", "/api/me/parties", "/api/me/parties", "player")
+
+    def test_party_detail(self):
+        self._assert_within_budget("GET", "/api/parties/party-1", "/api/parties/{party_id}", "gm")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""Query-plan regression checks for hot session paths.
+
+Runs ``EXPLAIN`` against a migrated local Postgres (``alembic upgrade head``)
+with sequential scans disabled, so any hot query without a usable index shows
+up as a ``Seq Scan`` even on an empty database. Skipped unless
+``QUERY_PLAN_DATABASE_URL`` points at that database.
+"""
+
+import os
+import unittest
+
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlmodel import select
+
+from app.models.campaign_member import CampaignMember
+from app.models.inventory import InventoryItem
+from app.models.purchase_event import PurchaseEvent
+from app.models.roll_event import RollEvent
+from app.models.session_command_event import SessionCommandEvent
+from app.models.session_state import SessionState
+
+QUERY_PLAN_DATABASE_URL = os.getenv("QUERY_PLAN_DATABASE_URL")
+
+HOT_QUERIES = {
+    "list_rolls": select(RollEvent)
+    .where(RollEvent.session_id == "session-1")
+    .order_by(RollEvent.created_at.desc())
+    .limit(50),
+    "activity_commands": select(SessionCommandEvent)
+    .where(SessionCommandEvent.session_id == "session-1")
+    .order_by(SessionCommandEvent.created_at),
+    "activity_purchases": select(PurchaseEvent)
+    .where(PurchaseEvent.session_id == "session-1")
+    .order_by(PurchaseEvent.created_at),
+    "shop_inventory_stack": select(InventoryItem).where(
+        InventoryItem.campaign_id == "campaign-1",
+        InventoryItem.party_id == "party-1",
+        InventoryItem.member_id == "member-1",
+        InventoryItem.item_id == "item-1",
+    ),
+    "campaign_member_auth": select(CampaignMember).where(
+        CampaignMember.campaign_id == "campaign-1",
+        CampaignMember.user_id == "user-1",
+    ),
+    "session_state_player": select(SessionState).where(
+        SessionState.session_id == "session-1",
+        SessionState.player_user_id == "user-1",
+    ),
+}
+
+
+def _explain_sql(statement) -> str:
+    compiled = statement.compile(
+        dialect=postgresql.dialect(),
+        compile_kwargs={"literal_binds": True},
+    )
+    return f"EXPLAIN {compiled}"
+
+
+@unittest.skipUnless(QUERY_PLAN_DATABASE_URL, "QUERY_PLAN_DATABASE_URL is not set")
+class HotQueryPlanTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = create_engine(QUERY_PLAN_DATABASE_URL)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.engine.dispose()
+
+    def test_hot_queries_do_not_fall_back_to_sequential_scans(self):
+        with self.engine.connect() as connection:
+            connection.exec_driver_sql("SET enable_seqscan = off")
+            for name, statement in HOT_QUERIES.items():
+                with self.subTest(query=name):
+                    plan = "\n".join(
+                        row[0] for row in connection.exec_driver_sql(_explain_sql(statement))
+                    )
+                    self.assertNotIn("Seq Scan", plan, f"{name} plan:\n{plan}")
+                    # Ordered feeds should read the composite index in order, not sort.
+                    if name in {"list_rolls", "activity_commands", "activity_purchases"}:
+                        self.assertNotIn("Sort", plan, f"{name} plan:\n{plan}")
@@ -0,0 +1,131 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from sqlalchemy.dialects import postgresql
+
+from app.api.routes.centrifugo import replay_channel
+from app.services.centrifugo import CentrifugoClient
+from app.services.realtime_replay import (
+    REPLAY_BUFFER_SIZE,
+    list_realtime_events_since,
+    next_channel_seq,
+    record_realtime_event,
+)
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def _db_returning_seq(seq: int) -> MagicMock:
+    db = MagicMock()
+    db.exec.return_value.scalar_one.return_value = seq
+    return db
+
+
+class RealtimeSequenceTests(unittest.TestCase):
+    def test_next_seq_is_an_atomic_upsert(self):
+        db = _db_returning_seq(7)
+
+        self.assertEqual(next_channel_seq(db, "session:s1"), 7)
+
+        sql = _sql(db.exec.call_args.args[0])
+        self.assertIn("ON CONFLICT (channel) DO UPDATE", sql)
+        self.assertIn("realtime_channel_sequence.last_seq + ", sql)
+        self.assertIn("RETURNING realtime_channel_sequence.last_seq", sql)
+
+    def test_record_stores_the_message_with_its_seq(self):
+        db = _db_returning_seq(3)
+
+        message = record_realtime_event(db, "session:s1", {"type": "shop_opened", "payload": {}})
+
+        self.assertEqual(message, {"type": "shop_opened", "payload": {}, "seq": 3})
+        self.assertEqual(db.exec.call_count, 2)
+        self.assertIn("INSERT INTO realtime_event", _sql(db.exec.call_args_list[1].args[0]))
+        db.commit.assert_called_once()
+
+    def test_buffer_is_pruned_periodically(self):
+        db = _db_returning_seq(REPLAY_BUFFER_SIZE + 50)
+
+        record_realtime_event(db, "session:s1", {"type": "x"})
+
+        self.assertEqual(db.exec.call_count, 3)
+        self.assertIn("DELETE FROM realtime_event", _sql(db.exec.call_args_list[2].args[0]))
+
+
+class ReplayTests(unittest.TestCase):
+    def _db(self, last_seq: int, rows: list[tuple[int, dict]]) -> MagicMock:
+        db = MagicMock()
+        sequences = MagicMock()
+        sequences.all.return_value = [("session:s1", last_seq)] if last_seq else []
+        events = MagicMock()
+        events.all.return_value = rows
+        db.exec.side_effect = [sequences, events]
+        return db
+
+    def test_returns_missed_events_in_order(self):
+        db = self._db(5, [(4, {"seq": 4}), (5, {"seq": 5})])
+
+        replay = list_realtime_events_since(db, "session:s1", 3, 100)
+
+        self.assertEqual([event["seq"] for event in replay.events], [4, 5])
+        self.assertEqual(replay.last_seq, 5)
+        self.assertFalse(replay.truncated)
+        self.assertFalse(replay.has_more)
+
+    def test_gap_before_the_buffer_is_reported_as_truncated(self):
+        db = self._db(900, [(401, {"seq": 401})])
+
+        replay = list_realtime_events_since(db, "session:s1", 10, 1)
+
+        self.assertTrue(replay.truncated)
+        self.assertTrue(replay.has_more)
+
+    def test_seq_ahead_of_the_channel_is_truncated(self):
+        replay = list_realtime_events_since(self._db(2, []), "session:s1", 9, 100)
+
+        self.assertTrue(replay.truncated)
+
+    @patch("app.api.routes.centrifugo.list_realtime_events_since")
+    @patch("app.api.routes.centrifugo._validate_channel_access")
+    def test_route_checks_channel_access(self, mock_access, mock_list):
+        mock_list.return_value = SimpleNamespace(
+            channel="session:s1", last_seq=5, events=[{"seq": 5}], truncated=False, has_more=False
+        )
+        user = SimpleNamespace(id="user-1")
+        db = MagicMock()
+
+        response = replay_channel("session:s1", seq=4, limit=200, user=user, session=db)
+
+        mock_access.assert_called_once_with(db, "session:s1", "user-1")
+        self.assertEqual(response.lastSeq, 5)
+        self.assertEqual(response.events, [{"seq": 5}])
+
+
+class PublishSequencingTests(unittest.IsolatedAsyncioTestCase):
+    async def _publish(self, record) -> dict:
+        client = CentrifugoClient()
+        http = MagicMock()
+        http.post = AsyncMock(return_value=MagicMock())
+        with patch.object(client, "_client", return_value=http), patch(
+            "app.services.centrifugo._record_once", side_effect=record
+        ):
+            await client.publish("session:s1", {"type": "shop_opened"})
+        return http.post.await_args.kwargs["json"]["data"]
+
+    async def test_published_message_carries_the_channel_seq(self):
+        data = await self._publish(lambda channel, data: {**data, "seq": 12})
+        self.assertEqual(data, {"type": "shop_opened", "seq": 12})
+
+    async def test_publish_still_goes_out_when_sequencing_fails(self):
+        def fail(_channel, _data):
+            raise RuntimeError("db down")
+
+        with self.assertLogs("app.services.centrifugo", level="ERROR"):
+            data = await self._publish(fail)
+        self.assertEqual(data, {"type": "shop_opened"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+from datetime import datetime, timezone
+import unittest
+from unittest.mock import MagicMock
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel
+
+from app.api.routes.combat import _is_session_gm
+from app.api.routes.session_entities_common import get_campaign_entity, list_session_entity_pairs
+from app.db.loaders import (
+    get_loader,
+    load_campaign,
+    load_campaign_entity,
+    load_campaign_member,
+    load_session,
+    load_session_entity,
+)
+from app.models.campaign import Campaign, RoleMode, SystemType
+from app.models.campaign_entity import CampaignEntity
+from app.models.campaign_member import CampaignMember
+from app.models.session import Session as CampaignSession
+from app.models.session_entity import SessionEntity
+from app.models.user import User
+from app.services.combat_service import CombatService
+
+
+class RequestLoaderTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        SQLModel.metadata.create_all(
+            self.engine,
+            tables=[
+                User.__table__,
+                Campaign.__table__,
+                CampaignMember.__table__,
+                CampaignSession.__table__,
+            ],
+        )
+        with Session(self.engine) as seed:
+            seed.add(User(id="gm", username="gm", pin_hash="x"))
+            seed.add_all(
+                Campaign(id=f"campaign-{index}", name=f"Campaign {index}", system=SystemType.DND5E)
+                for index in range(3)
+            )
+            seed.add(
+                CampaignMember(
+                    id="member-1",
+                    campaign_id="campaign-0",
+                    user_id="gm",
+                    display_name="GM",
+                    role_mode=RoleMode.GM,
+                )
+            )
+            seed.add(
+                CampaignSession(
+                    id="session-1",
+                    campaign_id="campaign-0",
+                    number=1,
+                    title="Session",
+                )
+            )
+            seed.commit()
+        self.statements: list[str] = []
+        event.listen(self.engine, "before_cursor_execute", self._count)
+        self.db = Session(self.engine)
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def _count(self, _conn, _cursor, statement, *_args):
+        self.statements.append(statement)
+
+    def test_repeated_context_lookups_cost_one_query_each(self):
+        user = MagicMock(id="gm")
+        for _ in range(5):
+            self.assertTrue(_is_session_gm(self.db, "session-1", user))
+            load_campaign(self.db, "campaign-0")
+
+        self.assertEqual(len(self.statements), 3)
+
+    def test_primed_keys_load_in_one_in_query(self):
+        loader = get_loader(self.db)
+        loader.prime(Campaign, ["campaign-0", "campaign-1", "campaign-2"])
+
+        campaign = load_campaign(self.db, "campaign-1")
+        self.assertEqual(campaign.name, "Campaign 1")
+        for campaign_id in ("campaign-0", "campaign-2"):
+            load_campaign(self.db, campaign_id)
+
+        self.assertEqual(len(self.statements), 1)
+        self.assertIn(" IN ", self.statements[0])
+
+    def test_misses_are_not_cached(self):
+        self.assertIsNone(load_campaign_member(self.db, "campaign-1", "gm"))
+        self.db.add(
+            CampaignMember(
+                id="member-2",
+                campaign_id="campaign-1",
+                user_id="gm",
+                display_name="GM",
+                role_mode=RoleMode.PLAYER,
+            )
+        )
+        self.db.commit()
+
+        self.assertEqual(load_campaign_member(self.db, "campaign-1", "gm").id, "member-2")
+
+    def test_deleted_rows_are_dropped(self):
+        entry = load_session(self.db, "session-1")
+        self.db.delete(entry)
+        self.db.commit()
+
+        self.assertIsNone(load_session(self.db, "session-1"))
+
+    def test_each_db_session_gets_its_own_loader(self):
+        load_campaign(self.db, "campaign-0")
+        with Session(self.engine) as other:
+            load_campaign(other, "campaign-0")
+
+        self.assertEqual(len(self.statements), 2)
+        self.assertIsNot(get_loader(self.db), get_loader(Session(self.engine)))
+
+
+class BatchedEntityLoadTests(unittest.TestCase):
+    def setUp(self):
+        self.db = MagicMock()
+        self.db.info = {}
+        self.session_entities = [
+            SessionEntity(
+                id=f"session-entity-{index}",
+                session_id="session-1",
+                campaign_entity_id=f"entity-{index}",
+                created_at=datetime(2026, 1, 1, index, tzinfo=timezone.utc),
+            )
+            for index in range(3)
+        ]
+        self.campaign_entities = [
+            CampaignEntity(id=f"entity-{index}", campaign_id="campaign-1", name=f"Goblin {index}")
+            for index in range(3)
+        ]
+
+    def test_listed_campaign_entities_serve_later_lookups(self):
+        self.db.exec.return_value.all.side_effect = [self.session_entities, self.campaign_entities]
+
+        pairs = list_session_entity_pairs("session-1", self.db)
+        for index in range(3):
+            self.assertEqual(get_campaign_entity(f"entity-{index}", self.db).name, f"Goblin {index}")
+
+        self.assertEqual([campaign_entity.name for _, campaign_entity in pairs], ["Goblin 0", "Goblin 1", "Goblin 2"])
+        self.assertEqual(self.db.exec.call_count, 2)
+
+    def test_area_spell_targets_load_in_two_queries(self):
+        self.db.exec.return_value.all.side_effect = [self.session_entities, self.campaign_entities]
+        outcomes = [
+            {"target_ref_id": f"session-entity-{index}", "target_kind": "entity"}
+            for index in range(3)
+        ] + [{"target_ref_id": "player-1", "target_kind": "player"}]
+
+        CombatService._prime_area_spell_targets(self.db, outcomes)
+        for index in range(3):
+            session_entity = load_session_entity(self.db, f"session-entity-{index}")
+            self.assertEqual(load_campaign_entity(self.db, session_entity.campaign_entity_id).name, f"Goblin {index}")
+
+        self.assertEqual(self.db.exec.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from app.core import metrics as metrics_module
+from app.core.logging import RequestLoggingMiddleware
+from app.core.metrics import (
+    MetricsRegistry,
+    QueryBudgetExceeded,
+    RequestMetrics,
+    install_query_hooks,
+    registry,
+    time_publish,
+)
+
+
+def _build_app(engine):
+    app = FastAPI()
+    app.add_middleware(RequestLoggingMiddleware)
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int):
+        with engine.connect() as connection:
+            for _ in range(3):
+                connection.execute(text("SELECT 1"))
+        return {"id": item_id}
+
+    @app.get("/publish")
+    async def publish():
+        with time_publish():
+            pass
+        return {}
+
+    return app
+
+
+class RequestMetricsMiddlewareTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        install_query_hooks(self.engine)
+        registry.reset()
+        self.client = TestClient(_build_app(self.engine))
+
+    def tearDown(self):
+        registry.reset()
+
+    @patch("builtins.print")
+    def test_queries_are_counted_per_route_template(self, mock_print):
+        self.client.get("/items/1")
+        self.client.get("/items/2")
+        self.client.get("/publish")
+
+        output = registry.render_prometheus()
+        self.assertIn('http_requests_total{method="GET",route="/items/{item_id}",status="200"} 2', output)
+        self.assertIn('http_request_db_queries_sum{method="GET",route="/items/{item_id}"} 6', output)
+        self.assertIn('http_request_duration_seconds_count{method="GET",route="/items/{item_id}"} 2', output)
+        self.assertIn('realtime_publishes_total{method="GET",route="/publish"} 1', output)
+        log_line = mock_print.call_args_list[0].args[0]
+        self.assertIn('"route": "/items/{item_id}"', log_line)
+        self.assertIn('"db_queries": 3', log_line)
+
+    @patch("builtins.print")
+    def test_strict_query_budget_fails_the_request(self, _mock_print):
+        with patch.dict(metrics_module.QUERY_BUDGETS, {"GET /items/{item_id}": 2}):
+            with patch("app.core.logging.settings.query_budget_strict", True):
+                with self.assertRaises(QueryBudgetExceeded):
+                    self.client.get("/items/1")
+            with patch("app.core.logging.settings.query_budget_strict", False):
+                self.assertEqual(self.client.get("/items/1").status_code, 200)
+
+        self.assertIn(
+            'http_request_query_budget_exceeded_total{method="GET",route="/items/{item_id}"} 2',
+            registry.render_prometheus(),
+        )
+
+
+class MetricsRegistryTests(unittest.TestCase):
+    def test_histogram_buckets_are_cumulative(self):
+        local_registry = MetricsRegistry()
+        for duration in (0.004, 0.02, 3.0):
+            local_registry.observe_request("GET", "/x", 200, duration, RequestMetrics())
+
+        output = local_registry.render_prometheus()
+
+        self.assertIn('http_request_duration_seconds_bucket{method="GET",route="/x",le="0.005"} 1', output)
+        self.assertIn('http_request_duration_seconds_bucket{method="GET",route="/x",le="0.025"} 2', output)
+        self.assertIn('http_request_duration_seconds_bucket{method="GET",route="/x",le="+Inf"} 3', output)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import unittest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from fastapi import HTTPException
+
+from app.api.routes.sessions.snapshot import (
+    SNAPSHOT_FIELDS,
+    get_session_snapshot,
+    parse_snapshot_fields,
+)
+from app.models.combat import CombatPhase, CombatState
+from app.models.session import Session, SessionStatus
+from app.schemas.session import SessionRuntimeRead
+
+MODULE = "app.api.routes.sessions.snapshot"
+
+
+def _entry() -> Session:
+    return Session(
+        id="session-1",
+        campaign_id="campaign-1",
+        party_id="party-1",
+        number=3,
+        title="Into the Mines",
+        status=SessionStatus.ACTIVE,
+        duration_seconds=0,
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+class ParseSnapshotFieldsTests(unittest.TestCase):
+    def test_defaults_to_every_field(self):
+        self.assertEqual(parse_snapshot_fields(None), list(SNAPSHOT_FIELDS))
+
+    def test_keeps_canonical_order_and_ignores_blanks(self):
+        self.assertEqual(parse_snapshot_fields("combat, runtime,,"), ["runtime", "combat"])
+
+    def test_rejects_unknown_fields(self):
+        with self.assertRaises(HTTPException) as ctx:
+            parse_snapshot_fields("runtime,secrets")
+        self.assertEqual(ctx.exception.status_code, 400)
+        self.assertIn("secrets", ctx.exception.detail)
+
+
+class SessionSnapshotRouteTests(unittest.TestCase):
+    @patch(f"{MODULE}.build_session_activity")
+    @patch(f"{MODULE}.ensure_session_state")
+    @patch(f"{MODULE}.CombatService.get_state")
+    @patch(f"{MODULE}.serialize_session_runtime")
+    @patch(f"{MODULE}.require_campaign_member", return_value=SimpleNamespace(id="member-1"))
+    @patch(f"{MODULE}.require_session_view_access")
+    @patch(f"{MODULE}.get_session_entry")
+    def test_only_selected_fields_are_loaded(
+        self,
+        mock_entry,
+        mock_access,
+        _mock_member,
+        mock_runtime,
+        mock_combat,
+        mock_ensure_state,
+        mock_activity,
+    ):
+        entry = _entry()
+        mock_entry.return_value = entry
+        mock_runtime.return_value = SessionRuntimeRead(
+            sessionId="session-1",
+            campaignId="campaign-1",
+            partyId="party-1",
+            status=SessionStatus.ACTIVE,
+            shopOpen=True,
+            combatActive=True,
+        )
+        mock_combat.return_value = CombatState(
+            session_id="session-1",
+            phase=CombatPhase.active,
+            round=2,
+            current_turn_index=0,
+            participants=[],
+        )
+        db = MagicMock()
+        user = SimpleNamespace(id="user-1")
+
+        snapshot = get_session_snapshot("session-1", fields="combat,runtime", user=user, session=db)
+
+        mock_access.assert_called_once_with(entry, user, db)
+        self.assertEqual(snapshot.fields, ["runtime", "combat"])
+        self.assertEqual(snapshot.session.id, "session-1")
+        self.assertTrue(snapshot.runtime.shopOpen)
+        self.assertEqual(snapshot.combat["round"], 2)
+        self.assertGreater(snapshot.version, 0)
+        self.assertIsNone(snapshot.state)
+        self.assertIsNone(snapshot.activity)
+        mock_ensure_state.assert_not_called()
+        mock_activity.assert_not_called()
+
+    @patch(f"{MODULE}.get_session_entry")
+    def test_missing_session_is_not_found(self, mock_entry):
+        mock_entry.side_effect = HTTPException(status_code=404, detail="Session not found")
+
+        with self.assertRaises(HTTPException) as ctx:
+            get_session_snapshot("missing", fields=None, user=SimpleNamespace(id="user-1"), session=MagicMock())
+
+        self.assertEqual(ctx.exception.status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import gzip
+import tempfile
+import unittest
+from pathlib import Path
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.core.content_encoding import negotiate_encoding
+from app.core.static_files import (
+    ASSET_CACHE_CONTROL,
+    INDEX_CACHE_CONTROL,
+    FrontendFiles,
+    precompress_tree,
+)
+
+BUNDLE = ("console.log('limiar');\n" * 200).encode()
+
+
+def _build_app(frontend: FrontendFiles) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/{full_path:path}")
+    def serve(full_path: str, request: Request):
+        return frontend.response(request, full_path)
+
+    return app
+
+
+class FrontendFilesTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        self.dist = root / "dist"
+        (self.dist / "assets").mkdir(parents=True)
+        (self.dist / "index.html").write_text("<!doctype html><div id=root></div>")
+        (self.dist / "assets" / "index-abc123.js").write_bytes(BUNDLE)
+        (self.dist / "favicon.ico").write_bytes(b"\x00" * 64)
+        self.cache_dir = root / "cache"
+        self.frontend = FrontendFiles(
+            self.dist.resolve(),
+            cache_dir=self.cache_dir,
+            reserved_prefixes={"api"},
+        )
+        self.client = TestClient(_build_app(self.frontend))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_hashed_assets_are_immutable_and_index_revalidates(self):
+        asset = self.client.get("/assets/index-abc123.js", headers={"accept-encoding": "identity"})
+        index = self.client.get("/campaigns/123")
+
+        self.assertEqual(asset.headers["cache-control"], ASSET_CACHE_CONTROL)
+        self.assertEqual(asset.content, BUNDLE)
+        self.assertEqual(index.headers["cache-control"], INDEX_CACHE_CONTROL)
+        self.assertIn("root", index.text)
+
+    def test_missing_asset_is_404_not_the_spa_shell(self):
+        self.assertEqual(self.client.get("/assets/index-old.js").status_code, 404)
+        self.assertEqual(self.client.get("/api/unknown").status_code, 404)
+
+    def test_gzip_variant_is_compressed_once_and_cached_on_disk(self):
+        first = self.client.get(
+            "/assets/index-abc123.js",
+            headers={"accept-encoding": "gzip"},
+        )
+        cached = self.cache_dir / "assets" / "index-abc123.js.gz"
+
+        self.assertEqual(first.headers["content-encoding"], "gzip")
+        self.assertEqual(first.headers["vary"], "Accept-Encoding")
+        self.assertEqual(first.content, BUNDLE)  # the test client decodes gzip
+        self.assertTrue(cached.is_file())
+        self.assertLess(int(first.headers["content-length"]), len(BUNDLE))
+
+        mtime = cached.stat().st_mtime_ns
+        self.client.get("/assets/index-abc123.js", headers={"accept-encoding": "gzip"})
+        self.assertEqual(cached.stat().st_mtime_ns, mtime)
+
+    def test_build_time_siblings_are_preferred(self):
+        self.assertGreater(precompress_tree(self.dist), 0)
+        sibling = self.dist / "assets" / "index-abc123.js.gz"
+        self.assertEqual(gzip.decompress(sibling.read_bytes()), BUNDLE)
+
+        self.client.get("/assets/index-abc123.js", headers={"accept-encoding": "gzip"})
+        self.assertFalse((self.cache_dir / "assets" / "index-abc123.js.gz").exists())
+
+    def test_range_requests_use_the_identity_file(self):
+        response = self.client.get(
+            "/assets/index-abc123.js",
+            headers={"accept-encoding": "gzip", "range": "bytes=0-9"},
+        )
+
+        self.assertEqual(response.status_code, 206)
+        self.assertNotIn("content-encoding", response.headers)
+        self.assertEqual(response.content, BUNDLE[:10])
+
+    def test_matching_etag_returns_304(self):
+        first = self.client.get("/assets/index-abc123.js", headers={"accept-encoding": "gzip"})
+        second = self.client.get(
+            "/assets/index-abc123.js",
+            headers={"accept-encoding": "gzip", "if-none-match": first.headers["etag"]},
+        )
+
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.headers["cache-control"], ASSET_CACHE_CONTROL)
+        self.assertEqual(second.content, b"")
+
+    def test_binary_files_are_not_compressed(self):
+        response = self.client.get("/favicon.ico", headers={"accept-encoding": "gzip"})
+
+        self.assertNotIn("content-encoding", response.headers)
+
+
+class NegotiateEncodingTests(unittest.TestCase):
+    def test_respects_quality_values_and_server_preference(self):
+        self.assertEqual(negotiate_encoding("gzip, br", ("br", "gzip")), "br")
+        self.assertEqual(negotiate_encoding("br;q=0, gzip", ("br", "gzip")), "gzip")
+        self.assertEqual(negotiate_encoding("*", ("gzip",)), "gzip")
+        self.assertIsNone(negotiate_encoding("identity", ("br", "gzip")))
+        self.assertIsNone(negotiate_encoding(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel
+
+from app.models.campaign import RoleMode
+from app.models.party import Party
+from app.models.party_member import PartyMember, PartyMemberStatus
+from app.models.user import User
+from app.services.user_search import search_users
+
+
+class UserSearchTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        SQLModel.metadata.create_all(
+            self.engine,
+            tables=[User.__table__, Party.__table__, PartyMember.__table__],
+        )
+        self.db = Session(self.engine)
+        self.db.add_all(
+            [
+                User(id="u1", username="bruna", display_name="Ana Bruna", pin_hash="x"),
+                User(id="u2", username="anakin", display_name=None, pin_hash="x"),
+                User(id="u3", username="ana", display_name="Ana", pin_hash="x"),
+                User(id="u4", username="mariana", display_name="Mariana", pin_hash="x"),
+                User(id="u5", username="gm", display_name="Game Master", pin_hash="x"),
+                User(id="u6", username="an_a", display_name=None, pin_hash="x"),
+            ]
+        )
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def _usernames(self, query: str, **kwargs) -> list[str]:
+        return [user.username for user in search_users(self.db, query, **kwargs)]
+
+    def test_exact_then_prefix_then_substring(self):
+        self.assertEqual(self._usernames("Ana"), ["ana", "anakin", "bruna", "mariana"])
+
+    def test_like_wildcards_are_literal(self):
+        self.assertEqual(self._usernames("n_a"), ["an_a"])
+
+    def test_excludes_party_gm_and_current_members(self):
+        self.db.add(Party(id="p1", campaign_id="c1", gm_user_id="u3", name="Party"))
+        self.db.add_all(
+            [
+                PartyMember(party_id="p1", user_id="u2", role=RoleMode.PLAYER, status=PartyMemberStatus.INVITED),
+                PartyMember(party_id="p1", user_id="u4", role=RoleMode.PLAYER, status=PartyMemberStatus.DECLINED),
+            ]
+        )
+        self.db.commit()
+
+        self.assertEqual(self._usernames("ana", exclude_party_id="p1"), ["bruna", "mariana"])
+
+    def test_blank_query_returns_nothing(self):
+        self.assertEqual(self._usernames("   "), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -27,11 +27,17 @@ export type AdminUser = {
   updatedAt?: string | null;
 };
 
+export type AdminUserPage = {
+  items: AdminUser[];
+  nextCursor?: string | null;
+};
+
 export type AdminUserFilters = {
   search?: string;
   role?: RoleMode;
   isSystemAdmin?: boolean;
   limit?: number;
+  cursor?: string;
 };
 
 export type AdminUserUpdatePayload = {
@@ -51,14 +57,40 @@ export type AdminCampaign = {
   activeSessionsCount: number;
   itemCatalogSnapshotAt?: string | null;
   spellCatalogSnapshotAt?: string | null;
+  deletionRequestedAt?: string | null;
   createdAt: string;
   updatedAt?: string | null;
 };
 
+export type AdminCampaignDeletionStatus = "PENDING" | "RUNNING" | "COMPLETED" | "FAILED";
+
+export type AdminCampaignDeletion = {
+  id: string;
+  campaignId: string;
+  campaignName: string;
+  requestedByUserId?: string | null;
+  status: AdminCampaignDeletionStatus;
+  stepsTotal: number;
+  stepsDone: number;
+  rowsDeleted: number;
+  currentTable?: string | null;
+  error?: string | null;
+  createdAt: string;
+  startedAt?: string | null;
+  heartbeatAt?: string | null;
+  finishedAt?: string | null;
+};
+
+export type AdminCampaignPage = {
+  items: AdminCampaign[];
+  nextCursor?: string | null;
+};
+
 export type AdminCampaignFilters = {
   search?: string;
   system?: CampaignSystemType;
   limit?: number;
+  cursor?: string;
 };
 
 export type AdminDiagnostics = {
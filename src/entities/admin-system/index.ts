@@ -1,9 +1,13 @@
 export type {
   AdminCampaign,
+  AdminCampaignDeletion,
+  AdminCampaignDeletionStatus,
   AdminCampaignFilters,
+  AdminCampaignPage,
   AdminDiagnostics,
   AdminOverview,
   AdminUser,
   AdminUserFilters,
+  AdminUserPage,
   AdminUserUpdatePayload,
 } from "./adminSystem.types";
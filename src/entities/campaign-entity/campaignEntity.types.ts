@@ -146,4 +146,31 @@ export type CampaignEntity = {
 
 export type CampaignEntityPublic = Omit<CampaignEntity, "notesPrivate">;
 
+export type CampaignEntitySummary = Pick<
+  CampaignEntity,
+  | "id"
+  | "campaignId"
+  | "name"
+  | "category"
+  | "size"
+  | "creatureType"
+  | "creatureSubtype"
+  | "imageUrl"
+  | "armorClass"
+  | "maxHp"
+  | "initiativeBonus"
+>;
+
+export type CampaignEntitySummaryPage = {
+  items: CampaignEntitySummary[];
+  nextCursor: string | null;
+};
+
+export type CampaignEntitySummaryFilters = {
+  search?: string;
+  category?: EntityCategory;
+  cursor?: string | null;
+  limit?: number;
+};
+
 export type CampaignEntityPayload = Omit<CampaignEntity, "id" | "campaignId" | "createdAt" | "updatedAt">;
@@ -2,6 +2,9 @@ export type {
   CampaignEntity,
   CampaignEntityPublic,
   CampaignEntityPayload,
+  CampaignEntitySummary,
+  CampaignEntitySummaryFilters,
+  CampaignEntitySummaryPage,
   EntityCategory,
   AbilityName,
   AbilityScores,
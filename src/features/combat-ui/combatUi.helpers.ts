@@ -79,6 +79,14 @@ export const toCombatLogEntry = (
   source: typeof payload.source === "string" ? payload.source : null,
 });
 
+export const toCombatLogBatchEntries = (
+  payload: Record<string, unknown>,
+  batchId: string,
+): CombatLogEntry[] =>
+  (Array.isArray(payload.entries) ? payload.entries : [])
+    .filter((entry): entry is Record<string, unknown> => Boolean(entry) && typeof entry === "object")
+    .map((entry, index) => toCombatLogEntry(entry, `${batchId}:${index}`));
+
 export const appendCombatLogEntries = (
   current: CombatLogEntry[],
   nextEntries: CombatLogEntry[],
@@ -7,6 +7,7 @@ import {
 import { combatRepo, type CombatState } from "../../shared/api/combatRepo";
 import {
   appendCombatLogEntries,
+  toCombatLogBatchEntries,
   toCombatLogEntry,
 } from "./combatUi.helpers";
 import type { CombatLogEntry } from "./types";
@@ -67,6 +68,11 @@ export const useCombatUiState = ({
     if (data.type === "combat_log_added" && data.payload) {
       const logId = offset ?? `live:${++logSequenceRef.current}`;
       appendLogs([toCombatLogEntry(data.payload, logId)]);
+      return;
+    }
+    if (data.type === "combat_log_batch" && data.payload) {
+      const batchId = offset ?? `live:${++logSequenceRef.current}`;
+      appendLogs(toCombatLogBatchEntries(data.payload, batchId));
     }
   }, [appendLogs]);
 
@@ -102,6 +108,15 @@ export const useCombatUiState = ({
             combatLogEntries.push(
               toCombatLogEntry(data.payload, publication.offset ?? `history:${++logSequenceRef.current}`),
             );
+            return;
+          }
+          if (data.type === "combat_log_batch" && data.payload) {
+            combatLogEntries.push(
+              ...toCombatLogBatchEntries(
+                data.payload,
+                publication.offset ?? `history:${++logSequenceRef.current}`,
+              ),
+            );
           }
         });
       appendLogs(combatLogEntries);
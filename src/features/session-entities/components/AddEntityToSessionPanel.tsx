@@ -1,5 +1,5 @@
-import { useEffect, useMemo, useState } from "react";
-import type { CampaignEntity } from "../../../entities/campaign-entity";
+import { useEffect, useState } from "react";
+import type { CampaignEntitySummary } from "../../../entities/campaign-entity";
 import { campaignEntitiesRepo } from "../../../shared/api/campaignEntitiesRepo";
 import { CategoryBadge } from "../../campaign-entities";
 import { useLocale } from "../../../shared/hooks/useLocale";
@@ -10,28 +10,57 @@ type Props = {
   onClose: () => void;
 };
 
+const SEARCH_DEBOUNCE_MS = 250;
+
 export const AddEntityToSessionPanel = ({ campaignId, onAdd, onClose }: Props) => {
   const { t } = useLocale();
-  const [entities, setEntities] = useState<CampaignEntity[]>([]);
+  const [entities, setEntities] = useState<CampaignEntitySummary[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [search, setSearch] = useState("");
   const [adding, setAdding] = useState<string | null>(null);
 
   useEffect(() => {
-    campaignEntitiesRepo
-      .list(campaignId)
-      .then((data) => setEntities(Array.isArray(data) ? data : []))
-      .catch(() => setEntities([]))
-      .finally(() => setLoading(false));
-  }, [campaignId]);
+    let cancelled = false;
+    setLoading(true);
+    const timer = setTimeout(() => {
+      campaignEntitiesRepo
+        .listSummary(campaignId, { search: search.trim() || undefined })
+        .then((page) => {
+          if (cancelled) return;
+          setEntities(page.items);
+          setNextCursor(page.nextCursor);
+        })
+        .catch(() => {
+          if (cancelled) return;
+          setEntities([]);
+          setNextCursor(null);
+        })
+        .finally(() => {
+          if (!cancelled) setLoading(false);
+        });
+    }, search ? SEARCH_DEBOUNCE_MS : 0);
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [campaignId, search]);
 
-  const filtered = useMemo(() => {
-    if (!search.trim()) return entities;
-    const lower = search.trim().toLowerCase();
-    return entities.filter((e) => e.name.toLowerCase().includes(lower));
-  }, [entities, search]);
+  const handleLoadMore = () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    campaignEntitiesRepo
+      .listSummary(campaignId, { search: search.trim() || undefined, cursor: nextCursor })
+      .then((page) => {
+        setEntities((current) => [...current, ...page.items]);
+        setNextCursor(page.nextCursor);
+      })
+      .catch(() => setNextCursor(null))
+      .finally(() => setLoadingMore(false));
+  };
 
-  const handleAdd = async (entity: CampaignEntity) => {
+  const handleAdd = async (entity: CampaignEntitySummary) => {
     setAdding(entity.id);
     try {
       await onAdd(entity.id, null, entity.maxHp);
@@ -61,11 +90,11 @@ export const AddEntityToSessionPanel = ({ campaignId, onAdd, onClose }: Props) =
       />
       {loading ? (
         <p className="text-xs text-slate-500">{t("entity.loading")}</p>
-      ) : filtered.length === 0 ? (
+      ) : entities.length === 0 ? (
         <p className="text-xs text-slate-500">{t("entity.empty")}</p>
       ) : (
         <div className="max-h-60 space-y-1 overflow-y-auto">
-          {filtered.map((entity) => (
+          {entities.map((entity) => (
             <button
               key={entity.id}
               type="button"
@@ -80,6 +109,16 @@ export const AddEntityToSessionPanel = ({ campaignId, onAdd, onClose }: Props) =
               )}
             </button>
           ))}
+          {nextCursor && (
+            <button
+              type="button"
+              disabled={loadingMore}
+              onClick={handleLoadMore}
+              className="w-full rounded-xl px-3 py-2 text-xs text-slate-400 hover:bg-slate-800 hover:text-slate-200 disabled:opacity-50"
+            >
+              {t("entity.loadMore")}
+            </button>
+          )}
         </div>
       )}
     </div>
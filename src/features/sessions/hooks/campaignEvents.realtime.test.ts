@@ -2,6 +2,7 @@ import { describe, expect, it } from "vitest";
 
 import {
   getCampaignEventVersionKey,
+  getExpiredInventoryItemIds,
   isSupportedCampaignEventType,
 } from "./campaignEvents.realtime";
 
@@ -45,4 +46,29 @@ describe("campaignEvents.realtime", () => {
       }),
     ).toBe("hit_dice_used:sess-1:player-1");
   });
+
+  it("keys grouped roll results by their first roll", () => {
+    expect(isSupportedCampaignEventType("rolls_resolved")).toBe(true);
+    expect(
+      getCampaignEventVersionKey("camp-1", {
+        type: "rolls_resolved",
+        payload: { sessionId: "sess-1", results: [{ event_id: "roll-1" }, { event_id: "roll-2" }] },
+      }),
+    ).toBe("rolls_resolved:sess-1:roll-1");
+  });
+
+  it("reads expired inventory ids from the sweeper event", () => {
+    expect(isSupportedCampaignEventType("inventory_items_expired")).toBe(true);
+    expect(
+      getExpiredInventoryItemIds({
+        campaignId: "camp-1",
+        items: [
+          { id: "inv-1", memberId: "member-1", itemId: "item-1" },
+          { memberId: "member-2" },
+          { id: "inv-2", memberId: "member-2", itemId: "item-1" },
+        ],
+      }),
+    ).toEqual(new Set(["inv-1", "inv-2"]));
+    expect(getExpiredInventoryItemIds({})).toEqual(new Set());
+  });
 });
@@ -5,7 +5,7 @@ const CAMPAIGN_EVENT_TYPES = new Set([
   "session_closed",
   "session_resumed",
   "session_lobby",
-  "player_joined_lobby",
+  "lobby_updated",
   "shop_opened",
   "shop_closed",
   "combat_started",
@@ -23,6 +23,7 @@ const CAMPAIGN_EVENT_TYPES = new Set([
   "rest_started",
   "rest_ended",
   "hit_dice_used",
+  "inventory_items_expired",
   "level_up_requested",
   "level_up_approved",
   "level_up_denied",
@@ -32,6 +33,7 @@ const CAMPAIGN_EVENT_TYPES = new Set([
   "session_entity_added",
   "session_entity_removed",
   "roll_resolved",
+  "rolls_resolved",
 ]);
 
 export const isSupportedCampaignEventType = (type?: string): boolean =>
@@ -57,12 +59,11 @@ export const getCampaignEventVersionKey = (
     case "level_up_approved":
     case "level_up_denied":
       return `${event.type}:${event.payload?.partyId ?? ""}:${event.payload?.playerUserId ?? ""}`;
-    case "player_joined_lobby":
-      return `${event.type}:${event.payload?.sessionId ?? ""}:${event.payload?.userId ?? ""}`;
     case "session_started":
     case "session_closed":
     case "session_resumed":
     case "session_lobby":
+    case "lobby_updated":
     case "shop_opened":
     case "shop_closed":
     case "combat_started":
@@ -82,11 +83,26 @@ export const getCampaignEventVersionKey = (
       return `${event.type}:${event.payload?.sessionId ?? ""}:${event.payload?.sessionEntityId ?? ""}`;
     case "roll_resolved":
       return `roll_resolved:${event.payload?.sessionId ?? ""}:${event.payload?.event_id ?? ""}`;
+    case "rolls_resolved": {
+      const results = Array.isArray(event.payload?.results) ? event.payload.results : [];
+      const first = results[0] as { event_id?: unknown } | undefined;
+      return `rolls_resolved:${event.payload?.sessionId ?? ""}:${String(first?.event_id ?? "")}`;
+    }
     default:
       return event.type ?? "unknown";
   }
 };
 
+/** Inventory row ids listed in an ``inventory_items_expired`` payload. */
+export const getExpiredInventoryItemIds = (payload: Record<string, unknown> | undefined): Set<string> => {
+  const items = Array.isArray(payload?.items) ? payload.items : [];
+  return new Set(
+    items
+      .map((item) => (item as { id?: unknown } | null | undefined)?.id)
+      .filter((id): id is string => typeof id === "string"),
+  );
+};
+
 export const sortRealtimeHistoryByVersion = (
   publications: RealtimeHistoryPublication[],
 ): RealtimeHistoryPublication[] =>
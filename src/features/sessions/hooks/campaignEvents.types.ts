@@ -1,3 +1,28 @@
+export type RollResolvedPayload = {
+  event_id: string;
+  roll_type: string;
+  actor_kind: string;
+  actor_ref_id: string;
+  actor_display_name: string;
+  rolls: number[];
+  selected_roll: number;
+  advantage_mode: string;
+  modifier_used: number;
+  override_used: boolean;
+  formula: string;
+  total: number;
+  ability?: string | null;
+  skill?: string | null;
+  dc?: number | null;
+  target_ac?: number | null;
+  success?: boolean | null;
+  is_gm_roll: boolean;
+  roll_source: string;
+  sessionId: string;
+  campaignId: string;
+  partyId?: string | null;
+};
+
 export type CampaignEvent =
   | {
       type: "session_started";
@@ -27,15 +52,14 @@ export type CampaignEvent =
       version?: number;
     }
   | {
-      type: "player_joined_lobby";
+      type: "lobby_updated";
       payload: {
-        displayName: string;
+        campaignId: string;
         partyId?: string | null;
         readyCount: number;
-        readyUserIds?: string[];
+        readyUserIds: string[];
         sessionId: string;
         totalCount: number;
-        userId: string;
       };
       version?: number;
     }
@@ -243,6 +267,19 @@ export type CampaignEvent =
       };
       version?: number;
     }
+  | {
+      type: "inventory_items_expired";
+      payload: {
+        campaignId: string;
+        items: {
+          id: string;
+          partyId?: string | null;
+          memberId: string;
+          itemId: string;
+        }[];
+      };
+      version?: number;
+    }
   | {
       type: "consumable_used";
       payload: {
@@ -339,29 +376,15 @@ export type CampaignEvent =
     }
   | {
       type: "roll_resolved";
+      payload: RollResolvedPayload;
+      version?: number;
+    }
+  | {
+      type: "rolls_resolved";
       payload: {
-        event_id: string;
-        roll_type: string;
-        actor_kind: string;
-        actor_ref_id: string;
-        actor_display_name: string;
-        rolls: number[];
-        selected_roll: number;
-        advantage_mode: string;
-        modifier_used: number;
-        override_used: boolean;
-        formula: string;
-        total: number;
-        ability?: string | null;
-        skill?: string | null;
-        dc?: number | null;
-        target_ac?: number | null;
-        success?: boolean | null;
-        is_gm_roll: boolean;
-        roll_source: string;
         sessionId: string;
-        campaignId: string;
         partyId?: string | null;
+        results: RollResolvedPayload[];
       };
       version?: number;
     };
@@ -2,6 +2,7 @@ export { SessionProvider, useSession } from "./hooks/useSession";
 export { useActiveSession } from "./hooks/useActiveSession";
 export { usePartyActiveSession } from "./hooks/usePartyActiveSession";
 export { useCampaignEvents } from "./hooks/useCampaignEvents";
+export { getExpiredInventoryItemIds } from "./hooks/campaignEvents.realtime";
 export { useSessionCommands } from "./hooks/useSessionCommands";
 export { SessionActivityToggle } from "./components/SessionActivityToggle";
 export { SessionActivityRow } from "./components/SessionActivityRow";
@@ -8,6 +8,8 @@ import { Toast } from "../../shared/ui";
 
 type SystemFilter = "ALL" | CampaignSystemType;
 
+const PAGE_SIZE = 50;
+
 const formatDateTime = (value: string | null | undefined, locale: "pt" | "en") => {
   if (!value) {
     return "—";
@@ -27,17 +29,25 @@ export const AdminCampaignsPage = () => {
   const [search, setSearch] = useState("");
   const [systemFilter, setSystemFilter] = useState<SystemFilter>("ALL");
   const [deletingCampaignId, setDeletingCampaignId] = useState<string | null>(null);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const deferredSearch = useDeferredValue(search);
 
-  const loadCampaigns = async () => {
-    setLoading(true);
+  const loadCampaigns = async (cursor?: string) => {
+    if (cursor) {
+      setLoadingMore(true);
+    } else {
+      setLoading(true);
+    }
     try {
-      const result = await adminSystemRepo.listCampaigns({
+      const page = await adminSystemRepo.listCampaigns({
         search: deferredSearch.trim() || undefined,
         system: systemFilter === "ALL" ? undefined : systemFilter,
-        limit: 200,
+        limit: PAGE_SIZE,
+        cursor,
       });
-      setCampaigns(result);
+      setCampaigns((current) => (cursor ? [...current, ...page.items] : page.items));
+      setNextCursor(page.nextCursor ?? null);
     } catch (error) {
       showToast({
         variant: "error",
@@ -47,6 +57,7 @@ export const AdminCampaignsPage = () => {
       });
     } finally {
       setLoading(false);
+      setLoadingMore(false);
     }
   };
 
@@ -64,8 +75,14 @@ export const AdminCampaignsPage = () => {
 
     setDeletingCampaignId(campaign.id);
     try {
-      await adminSystemRepo.deleteCampaign(campaign.id);
-      setCampaigns((current) => current.filter((entry) => entry.id !== campaign.id));
+      const deletion = await adminSystemRepo.deleteCampaign(campaign.id);
+      setCampaigns((current) =>
+        current.map((entry) =>
+          entry.id === campaign.id
+            ? { ...entry, deletionRequestedAt: deletion.createdAt }
+            : entry,
+        ),
+      );
       showToast({
         variant: "success",
         title: t("admin.campaigns.deleteSuccessTitle"),
@@ -146,6 +163,11 @@ export const AdminCampaignsPage = () => {
                       <span className="rounded-full border border-sky-400/20 bg-sky-400/10 px-3 py-1 text-[11px] uppercase tracking-[0.22em] text-sky-100">
                         {campaign.roleMode}
                       </span>
+                      {campaign.deletionRequestedAt ? (
+                        <span className="rounded-full border border-rose-500/30 bg-rose-500/10 px-3 py-1 text-[11px] uppercase tracking-[0.22em] text-rose-200">
+                          {t("admin.campaigns.pendingDeletion")}
+                        </span>
+                      ) : null}
                     </div>
                     <p className="text-sm text-slate-300">
                       {t("admin.campaigns.gmLabel")}: {campaign.gmNames.join(", ") || "—"}
@@ -203,13 +225,15 @@ export const AdminCampaignsPage = () => {
                     </p>
                     <button
                       type="button"
-                      disabled={deletingCampaignId === campaign.id}
+                      disabled={
+                        deletingCampaignId === campaign.id || Boolean(campaign.deletionRequestedAt)
+                      }
                       onClick={() => {
                         void handleDelete(campaign);
                       }}
                       className="mt-4 w-full rounded-full border border-rose-500/30 bg-rose-500/10 px-4 py-3 text-xs font-semibold uppercase tracking-[0.22em] text-rose-200 transition hover:bg-rose-500/18 disabled:cursor-not-allowed disabled:opacity-50"
                     >
-                      {deletingCampaignId === campaign.id
+                      {deletingCampaignId === campaign.id || campaign.deletionRequestedAt
                         ? t("admin.campaigns.deleting")
                         : t("admin.campaigns.deleteAction")}
                     </button>
@@ -217,6 +241,18 @@ export const AdminCampaignsPage = () => {
                 </div>
               </section>
             ))}
+            {nextCursor ? (
+              <button
+                type="button"
+                disabled={loadingMore}
+                onClick={() => {
+                  void loadCampaigns(nextCursor);
+                }}
+                className="w-full rounded-full border border-white/10 bg-white/4 px-4 py-3 text-xs font-semibold uppercase tracking-[0.22em] text-slate-300 transition hover:bg-white/8 disabled:cursor-not-allowed disabled:opacity-50"
+              >
+                {loadingMore ? t("admin.loadingMore") : t("admin.loadMore")}
+              </button>
+            ) : null}
           </div>
         )}
       </section>
@@ -9,6 +9,8 @@ type RoleFilter = "ALL" | RoleMode;
 type AdminFilter = "all" | "admins" | "non_admins";
 type UserDraftMap = Record<string, { role: RoleMode; isSystemAdmin: boolean }>;
 
+const PAGE_SIZE = 50;
+
 const formatDateTime = (value: string | null | undefined, locale: "pt" | "en") => {
   if (!value) {
     return "—";
@@ -31,27 +33,34 @@ export const AdminUsersPage = () => {
   const [adminFilter, setAdminFilter] = useState<AdminFilter>("all");
   const [savingUserId, setSavingUserId] = useState<string | null>(null);
   const [deletingUserId, setDeletingUserId] = useState<string | null>(null);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const deferredSearch = useDeferredValue(search);
 
-  const loadUsers = async () => {
-    setLoading(true);
+  const loadUsers = async (cursor?: string) => {
+    if (cursor) {
+      setLoadingMore(true);
+    } else {
+      setLoading(true);
+    }
     try {
-      const result = await adminSystemRepo.listUsers({
+      const page = await adminSystemRepo.listUsers({
         search: deferredSearch.trim() || undefined,
         role: roleFilter === "ALL" ? undefined : roleFilter,
         isSystemAdmin:
           adminFilter === "all" ? undefined : adminFilter === "admins",
-        limit: 200,
+        limit: PAGE_SIZE,
+        cursor,
       });
-      setUsers(result);
-      setDrafts(
-        Object.fromEntries(
-          result.map((user) => [
-            user.id,
-            { role: user.role, isSystemAdmin: user.isSystemAdmin },
-          ]),
-        ),
+      const pageDrafts = Object.fromEntries(
+        page.items.map((user) => [
+          user.id,
+          { role: user.role, isSystemAdmin: user.isSystemAdmin },
+        ]),
       );
+      setUsers((current) => (cursor ? [...current, ...page.items] : page.items));
+      setDrafts((current) => (cursor ? { ...current, ...pageDrafts } : pageDrafts));
+      setNextCursor(page.nextCursor ?? null);
     } catch (error) {
       showToast({
         variant: "error",
@@ -61,6 +70,7 @@ export const AdminUsersPage = () => {
       });
     } finally {
       setLoading(false);
+      setLoadingMore(false);
     }
   };
 
@@ -345,6 +355,18 @@ export const AdminUsersPage = () => {
                 </div>
               </section>
             ))}
+            {nextCursor ? (
+              <button
+                type="button"
+                disabled={loadingMore}
+                onClick={() => {
+                  void loadUsers(nextCursor);
+                }}
+                className="w-full rounded-full border border-white/10 bg-white/4 px-4 py-3 text-xs font-semibold uppercase tracking-[0.22em] text-slate-300 transition hover:bg-white/8 disabled:cursor-not-allowed disabled:opacity-50"
+              >
+                {loadingMore ? t("admin.loadingMore") : t("admin.loadMore")}
+              </button>
+            ) : null}
           </div>
         )}
       </section>
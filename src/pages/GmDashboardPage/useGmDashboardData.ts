@@ -1,5 +1,6 @@
 import { useCallback, useEffect, useMemo, useRef, useState } from "react";
 import {
+  getExpiredInventoryItemIds,
   useActiveSession,
   useCampaignEvents,
   useSession,
@@ -163,14 +164,14 @@ export const useGmDashboardData = ({
       });
     }
 
-    if (lastEvent.type === "player_joined_lobby") {
+    if (lastEvent.type === "lobby_updated") {
       setLobbyStatus((current) => {
         if (!current || current.sessionId !== lastEvent.payload.sessionId) return current;
-        if (current.ready.includes(String(lastEvent.payload.userId))) return current;
         return {
           ...current,
-          ready: [...current.ready, String(lastEvent.payload.userId)],
-          readyCount: Number(lastEvent.payload.readyCount ?? current.readyCount + 1),
+          ready: (lastEvent.payload.readyUserIds as string[]) ?? [],
+          readyCount: Number(lastEvent.payload.readyCount ?? 0),
+          totalCount: Number(lastEvent.payload.totalCount ?? current.totalCount),
         };
       });
     }
@@ -201,6 +202,18 @@ export const useGmDashboardData = ({
       }
     }
 
+    if (lastEvent.type === "inventory_items_expired") {
+      const expiredIds = getExpiredInventoryItemIds(lastEvent.payload);
+      setInventoryByMemberId((current) =>
+        Object.fromEntries(
+          Object.entries(current).map(([memberId, items]) => [
+            memberId,
+            items.filter((item) => !expiredIds.has(item.id)),
+          ]),
+        ),
+      );
+    }
+
     if (lastEvent.type === "gm_granted_currency") {
       const eventUserId =
         typeof lastEvent.payload.playerUserId === "string" ? lastEvent.payload.playerUserId : null;
@@ -30,6 +30,7 @@ const RESOURCE_REFRESH_EVENT_TYPES = new Set([
     "gm_granted_item",
     "gm_granted_xp",
     "hit_dice_used",
+    "inventory_items_expired",
     "level_up_approved",
     "level_up_denied",
     "level_up_requested",
@@ -157,7 +158,7 @@ export const PartyDetailsPage = () => {
             void loadData();
             return;
         }
-        if (lastEvent.type === "player_joined_lobby") {
+        if (lastEvent.type === "lobby_updated") {
             if (!isCurrentPartyEvent(lastEvent.payload.partyId)) {
                 return;
             }
@@ -165,13 +166,11 @@ export const PartyDetailsPage = () => {
                 if (!current || current.sessionId !== lastEvent.payload.sessionId) {
                     return current;
                 }
-                if (current.ready.includes(lastEvent.payload.userId)) {
-                    return current;
-                }
                 return {
                     ...current,
-                    ready: [...current.ready, lastEvent.payload.userId],
-                    readyCount: lastEvent.payload.readyCount ?? current.readyCount + 1,
+                    ready: lastEvent.payload.readyUserIds,
+                    readyCount: lastEvent.payload.readyCount,
+                    totalCount: lastEvent.payload.totalCount,
                 };
             });
             return;
@@ -226,7 +225,9 @@ export const PartyDetailsPage = () => {
         const delay = setTimeout(async () => {
             setSearching(true);
             try {
-                const results = await usersRepo.search(searchQuery);
+                const results = await usersRepo.search(searchQuery, {
+                    excludePartyId: partyId,
+                });
                 setSearchResults(results);
             } catch {
                 // ignore
@@ -235,7 +236,7 @@ export const PartyDetailsPage = () => {
             }
         }, 400);
         return () => clearTimeout(delay);
-    }, [searchQuery]);
+    }, [partyId, searchQuery]);
 
     const handleInvite = async (userId: string) => {
         if (!partyId) return;
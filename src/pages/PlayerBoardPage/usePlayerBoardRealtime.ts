@@ -250,13 +250,22 @@ export const usePlayerBoardRealtime = ({
       }
       return;
     }
-    if (lastEvent.type === "roll_resolved") {
-      const p = lastEvent.payload;
-      if (!isRollEventKnown(String(p.event_id ?? ""))) {
+    if (lastEvent.type === "roll_resolved" || lastEvent.type === "rolls_resolved") {
+      const results = (
+        lastEvent.type === "roll_resolved"
+          ? [lastEvent.payload]
+          : Array.isArray(lastEvent.payload.results)
+            ? lastEvent.payload.results
+            : []
+      ) as Record<string, unknown>[];
+      const unknown = results.filter((p) => !isRollEventKnown(String(p?.event_id ?? "")));
+      const p = unknown[0];
+      if (p) {
+        const summary = `${String(p.formula ?? "")} = ${String(p.total ?? 0)}${p.success === true ? " ✓" : p.success === false ? " ✗" : ""}`;
         showToast({
           variant: "info",
           title: `${String(p.actor_display_name ?? "")}: ${String(p.roll_type ?? "")}`,
-          description: `${String(p.formula ?? "")} = ${String(p.total ?? 0)}${p.success === true ? " ✓" : p.success === false ? " ✗" : ""}`,
+          description: unknown.length > 1 ? `${summary} (+${unknown.length - 1})` : summary,
           duration: 4000,
         });
       }
@@ -10,6 +10,7 @@ import { EMPTY_WALLET, normalizeWallet } from "../../features/shop/utils/shopCur
 import { parseCharacterSheet } from "../../features/character-sheet/model/characterSheet.schema";
 import type { CharacterSheet } from "../../features/character-sheet/model/characterSheet.types";
 import {
+  getExpiredInventoryItemIds,
   useCampaignEvents,
   usePartyActiveSession,
   useSession,
@@ -159,6 +160,14 @@ export const usePlayerBoardResources = ({
     void refreshPlayerState();
   }, [refreshPlayerState]);
 
+  useEffect(() => {
+    if (lastEvent?.type !== "inventory_items_expired") {
+      return;
+    }
+    const expiredIds = getExpiredInventoryItemIds(lastEvent.payload);
+    setMyInventory((current) => current && current.filter((item) => !expiredIds.has(item.id)));
+  }, [lastEvent]);
+
   useEffect(() => {
     if (!activeSession?.id || !userId || !lastEvent) {
       return;
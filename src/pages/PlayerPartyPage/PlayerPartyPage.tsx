@@ -157,7 +157,7 @@ export const PlayerPartyPage = () => {
       return;
     }
 
-    if (lastEvent.type === "player_joined_lobby") {
+    if (lastEvent.type === "lobby_updated") {
       if (lastEvent.payload.partyId && partyId && lastEvent.payload.partyId !== partyId) {
         return;
       }
@@ -165,13 +165,11 @@ export const PlayerPartyPage = () => {
         if (!current || current.sessionId !== lastEvent.payload.sessionId) {
           return current;
         }
-        if (current.ready.includes(lastEvent.payload.userId)) {
-          return current;
-        }
         return {
           ...current,
-          ready: [...current.ready, lastEvent.payload.userId],
-          readyCount: lastEvent.payload.readyCount ?? current.readyCount + 1,
+          ready: lastEvent.payload.readyUserIds,
+          readyCount: lastEvent.payload.readyCount,
+          totalCount: lastEvent.payload.totalCount,
         };
       });
     }
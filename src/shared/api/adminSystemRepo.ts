@@ -1,10 +1,13 @@
 import type {
-  AdminCampaign,
+  AdminCampaignDeletion,
+  AdminCampaignDeletionStatus,
   AdminCampaignFilters,
+  AdminCampaignPage,
   AdminDiagnostics,
   AdminOverview,
   AdminUser,
   AdminUserFilters,
+  AdminUserPage,
   AdminUserUpdatePayload,
 } from "../../entities/admin-system";
 import { http } from "./http";
@@ -27,6 +30,9 @@ const toUserQueryString = (filters?: AdminUserFilters) => {
   if (filters.limit) {
     params.set("limit", String(filters.limit));
   }
+  if (filters.cursor) {
+    params.set("cursor", filters.cursor);
+  }
 
   const queryString = params.toString();
   return queryString ? `?${queryString}` : "";
@@ -47,6 +53,9 @@ const toCampaignQueryString = (filters?: AdminCampaignFilters) => {
   if (filters.limit) {
     params.set("limit", String(filters.limit));
   }
+  if (filters.cursor) {
+    params.set("cursor", filters.cursor);
+  }
 
   const queryString = params.toString();
   return queryString ? `?${queryString}` : "";
@@ -55,12 +64,21 @@ const toCampaignQueryString = (filters?: AdminCampaignFilters) => {
 export const adminSystemRepo = {
   overview: () => http.get<AdminOverview>("/admin/overview"),
   listUsers: (filters?: AdminUserFilters) =>
-    http.get<AdminUser[]>(`/admin/users${toUserQueryString(filters)}`),
+    http.get<AdminUserPage>(`/admin/users${toUserQueryString(filters)}`),
   updateUser: (userId: string, payload: AdminUserUpdatePayload) =>
     http.patch<AdminUser>(`/admin/users/${userId}`, payload),
   deleteUser: (userId: string) => http.del(`/admin/users/${userId}`),
   listCampaigns: (filters?: AdminCampaignFilters) =>
-    http.get<AdminCampaign[]>(`/admin/campaigns${toCampaignQueryString(filters)}`),
-  deleteCampaign: (campaignId: string) => http.del(`/admin/campaigns/${campaignId}`),
+    http.get<AdminCampaignPage>(`/admin/campaigns${toCampaignQueryString(filters)}`),
+  deleteCampaign: (campaignId: string) =>
+    http.del<AdminCampaignDeletion>(`/admin/campaigns/${campaignId}`),
+  listCampaignDeletions: (status?: AdminCampaignDeletionStatus) =>
+    http.get<AdminCampaignDeletion[]>(
+      `/admin/campaign-deletions${status ? `?status=${status}` : ""}`,
+    ),
+  getCampaignDeletion: (jobId: string) =>
+    http.get<AdminCampaignDeletion>(`/admin/campaign-deletions/${jobId}`),
+  retryCampaignDeletion: (jobId: string) =>
+    http.post<AdminCampaignDeletion>(`/admin/campaign-deletions/${jobId}/retry`, {}),
   diagnostics: () => http.get<AdminDiagnostics>("/admin/diagnostics"),
 };
@@ -1,13 +1,58 @@
-import type { CampaignEntity, CampaignEntityPayload, CampaignEntityPublic } from "../../entities/campaign-entity";
+import type {
+  CampaignEntity,
+  CampaignEntityPayload,
+  CampaignEntityPublic,
+  CampaignEntitySummaryFilters,
+  CampaignEntitySummaryPage,
+} from "../../entities/campaign-entity";
 import { http } from "./http";
 
+const toSummaryQueryString = (filters?: CampaignEntitySummaryFilters) => {
+  if (!filters) {
+    return "";
+  }
+
+  const params = new URLSearchParams();
+  if (filters.search) {
+    params.set("search", filters.search);
+  }
+  if (filters.category) {
+    params.set("category", filters.category);
+  }
+  if (filters.cursor) {
+    params.set("cursor", filters.cursor);
+  }
+  if (filters.limit) {
+    params.set("limit", String(filters.limit));
+  }
+
+  const queryString = params.toString();
+  return queryString ? `?${queryString}` : "";
+};
+
 export const campaignEntitiesRepo = {
   list: (campaignId: string) =>
     http.get<CampaignEntity[]>(`/campaigns/${campaignId}/entities`),
 
+  listSummary: (campaignId: string, filters?: CampaignEntitySummaryFilters) =>
+    http.get<CampaignEntitySummaryPage>(
+      `/campaigns/${campaignId}/entities/summary${toSummaryQueryString(filters)}`,
+    ),
+
+  get: (campaignId: string, entityId: string) =>
+    http.get<CampaignEntity>(`/campaigns/${campaignId}/entities/${entityId}`),
+
   listPublic: (campaignId: string) =>
     http.get<CampaignEntityPublic[]>(`/campaigns/${campaignId}/entities/public`),
 
+  listPublicSummary: (campaignId: string, filters?: CampaignEntitySummaryFilters) =>
+    http.get<CampaignEntitySummaryPage>(
+      `/campaigns/${campaignId}/entities/public/summary${toSummaryQueryString(filters)}`,
+    ),
+
+  getPublic: (campaignId: string, entityId: string) =>
+    http.get<CampaignEntityPublic>(`/campaigns/${campaignId}/entities/public/${entityId}`),
+
   create: (campaignId: string, payload: CampaignEntityPayload) =>
     http.post<CampaignEntity>(`/campaigns/${campaignId}/entities`, payload),
 
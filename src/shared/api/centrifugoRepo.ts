@@ -8,9 +8,21 @@ type SubscribeTokenResponse = {
   token: string;
 };
 
+export type RealtimeReplayResponse = {
+  channel: string;
+  lastSeq: number;
+  events: unknown[];
+  truncated: boolean;
+  hasMore: boolean;
+};
+
 export const centrifugoRepo = {
   connectionToken: () =>
     http.post<ConnectionTokenResponse>("/centrifugo/connection-token", {}),
   subscribeToken: (payload: { channel: string }) =>
     http.post<SubscribeTokenResponse>("/centrifugo/subscribe", payload),
+  replay: (channel: string, sinceSeq: number) =>
+    http.get<RealtimeReplayResponse>(
+      `/realtime/${encodeURIComponent(channel)}/since/${sinceSeq}`,
+    ),
 };
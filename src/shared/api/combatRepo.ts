@@ -140,6 +140,7 @@ export type CombatAttackResult = {
 export type CombatCastSpellRequest = {
   actor_participant_id?: string | null;
   target_ref_id: string;
+  additional_target_ref_ids?: string[];
   inventory_item_id?: string | null;
   spell_id?: string | null;
   spell_canonical_key?: string | null;
@@ -166,6 +167,19 @@ export type CombatCastSpellRequest = {
   override_resource_limit?: boolean;
 };
 
+export type CombatSpellTargetResult = {
+  target_ref_id: string;
+  target_kind: CombatParticipantKind;
+  target_display_name: string;
+  is_saved?: boolean | null;
+  roll?: number | null;
+  roll_result?: RollResult | null;
+  damage: number;
+  healing: number;
+  new_hp?: number | null;
+  concentration_check?: CombatConcentrationCheckResult | null;
+};
+
 export type CombatSpellResult = {
   spell_name: string;
   spell_canonical_key?: string | null;
@@ -200,6 +214,7 @@ export type CombatSpellResult = {
   elemental_affinity_eligible?: boolean;
   elemental_affinity_damage_type?: string | null;
   elemental_affinity_bonus?: number | null;
+  targets?: CombatSpellTargetResult[];
 };
 
 export type CombatEntityActionRequest = {
@@ -1,5 +1,8 @@
 import type { RollEvent } from "../../entities/roll";
 import type { InventoryItem } from "../../entities/inventory";
+import type { SessionStateRecord } from "../../entities/character";
+import type { SessionEntityPlayer } from "../../entities/session-entity";
+import type { CombatState } from "./combatRepo";
 import { http } from "./http";
 
 export type RollActivityEvent = {
@@ -337,6 +340,30 @@ export type SessionSummary = {
 
 export type ActiveSession = SessionSummary;
 
+export type SessionSnapshotField =
+  | "runtime"
+  | "lobby"
+  | "state"
+  | "inventory"
+  | "rolls"
+  | "activity"
+  | "entities"
+  | "combat";
+
+export type SessionSnapshot = {
+  version: number;
+  session: SessionSummary;
+  fields: SessionSnapshotField[];
+  runtime?: SessionRuntime | null;
+  lobby?: LobbyStatus | null;
+  state?: SessionStateRecord | null;
+  inventory?: InventoryItem[] | null;
+  rolls?: RollEvent[] | null;
+  activity?: ActivityEvent[] | null;
+  entities?: SessionEntityPlayer[] | null;
+  combat?: CombatState | null;
+};
+
 export const sessionsRepo = {
   getActive: (campaignId: string) =>
     http.get<ActiveSession>(`/campaigns/${campaignId}/sessions/active`),
@@ -364,6 +391,10 @@ export const sessionsRepo = {
     http.get<LobbyStatus>(`/sessions/${sessionId}/lobby`),
   getRuntime: (sessionId: string) =>
     http.get<SessionRuntime>(`/sessions/${sessionId}/runtime`),
+  getSnapshot: (sessionId: string, fields?: SessionSnapshotField[]) =>
+    http.get<SessionSnapshot>(
+      `/sessions/${sessionId}/snapshot${fields?.length ? `?fields=${fields.join(",")}` : ""}`,
+    ),
   listHealingConsumableTargets: (sessionId: string) =>
     http.get<SessionHealingConsumableTarget[]>(
       `/sessions/${sessionId}/consumables/healing-targets`,
@@ -7,6 +7,11 @@ export type UserSearchResult = {
 };
 
 export const usersRepo = {
-  search: (query: string) =>
-    http.get<UserSearchResult[]>(`/users/search?q=${encodeURIComponent(query)}`),
+  search: (query: string, options?: { excludePartyId?: string }) => {
+    const params = new URLSearchParams({ q: query });
+    if (options?.excludePartyId) {
+      params.set("party_id", options.excludePartyId);
+    }
+    return http.get<UserSearchResult[]>(`/users/search?${params.toString()}`);
+  },
 };
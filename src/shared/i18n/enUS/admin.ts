@@ -5,6 +5,8 @@ export const adminEnUSDictionary = {
   "admin.userFallback": "Administrator",
   "admin.menuLabel": "Admin Panel",
   "admin.openWorkspace": "Open game workspace",
+  "admin.loadMore": "Load more",
+  "admin.loadingMore": "Loading...",
   "admin.nav.overview": "Overview",
   "admin.nav.catalog": "Global Catalog",
   "admin.nav.governance": "Governance",
@@ -129,9 +131,10 @@ export const adminEnUSDictionary = {
   "admin.campaigns.deleteHint": "Use administrative deletion only when you need to remove an entire campaign from the system.",
   "admin.campaigns.deleteAction": "Delete campaign",
   "admin.campaigns.deleting": "Deleting...",
+  "admin.campaigns.pendingDeletion": "Pending deletion",
   "admin.campaigns.deleteConfirm": "Delete the campaign \"{name}\" permanently?",
-  "admin.campaigns.deleteSuccessTitle": "Campaign removed",
-  "admin.campaigns.deleteSuccessDescription": "The campaign and its operational tree were removed.",
+  "admin.campaigns.deleteSuccessTitle": "Campaign deletion queued",
+  "admin.campaigns.deleteSuccessDescription": "The campaign is hidden now; its data is being removed in the background.",
   "admin.campaigns.deleteErrorTitle": "Campaign deletion failed",
   "admin.campaigns.deleteErrorDescription": "Could not delete the campaign.",
   "admin.diagnostics.loading": "Loading administrative diagnostics...",
@@ -8,6 +8,7 @@ export const entityEnUSDictionary = {
   "entity.search": "Search entities...",
   "entity.empty": "No entities yet. Create the first one.",
   "entity.loading": "Loading entities...",
+  "entity.loadMore": "Load more",
   "entity.loadErrorTitle": "Entities unavailable",
   "entity.loadErrorDescription": "Could not load entities.",
   "entity.pageFeatureOne": "Build a structured statblock with AC, HP, speed, abilities, saves, and senses without relying on loose text.",
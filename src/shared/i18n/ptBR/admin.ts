@@ -5,6 +5,8 @@ export const adminPtBRDictionary = {
   "admin.userFallback": "Administrador",
   "admin.menuLabel": "Painel ADM",
   "admin.openWorkspace": "Abrir workspace do jogo",
+  "admin.loadMore": "Carregar mais",
+  "admin.loadingMore": "Carregando...",
   "admin.nav.overview": "Visão Geral",
   "admin.nav.catalog": "Catálogo Global",
   "admin.nav.governance": "Governança",
@@ -129,9 +131,10 @@ export const adminPtBRDictionary = {
   "admin.campaigns.deleteHint": "Use a exclusão administrativa só quando precisar remover uma campanha inteira do sistema.",
   "admin.campaigns.deleteAction": "Excluir campanha",
   "admin.campaigns.deleting": "Excluindo...",
+  "admin.campaigns.pendingDeletion": "Exclusão pendente",
   "admin.campaigns.deleteConfirm": "Excluir a campanha \"{name}\" permanentemente?",
-  "admin.campaigns.deleteSuccessTitle": "Campanha removida",
-  "admin.campaigns.deleteSuccessDescription": "A campanha e sua árvore operacional foram removidas.",
+  "admin.campaigns.deleteSuccessTitle": "Exclusão da campanha agendada",
+  "admin.campaigns.deleteSuccessDescription": "A campanha já está oculta; seus dados estão sendo removidos em segundo plano.",
   "admin.campaigns.deleteErrorTitle": "Falha ao excluir campanha",
   "admin.campaigns.deleteErrorDescription": "Não foi possível excluir a campanha.",
   "admin.diagnostics.loading": "Carregando diagnóstico administrativo...",
@@ -8,6 +8,7 @@ export const entityPtBRDictionary = {
   "entity.search": "Buscar entidades...",
   "entity.empty": "Nenhuma entidade ainda. Crie a primeira.",
   "entity.loading": "Carregando entidades...",
+  "entity.loadMore": "Carregar mais",
   "entity.loadErrorTitle": "Entidades indisponiveis",
   "entity.loadErrorDescription": "Nao foi possivel carregar entidades.",
   "entity.pageFeatureOne": "Monte um statblock estruturado com AC, HP, deslocamento, atributos, saves e sentidos sem depender de texto solto.",
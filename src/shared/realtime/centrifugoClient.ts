@@ -15,8 +15,9 @@ import {
   type UnsubscribedContext,
 } from "centrifuge";
 import { env } from "../../app/config";
-import { centrifugoRepo } from "../api/centrifugoRepo";
+import { centrifugoRepo, type RealtimeReplayResponse } from "../api/centrifugoRepo";
 import { getToken } from "../auth/tokenStore";
+import { createChannelSequence, type ChannelSequence } from "./channelSequence";
 
 export type ConnectionState = "connected" | "reconnecting" | "offline";
 
@@ -37,6 +38,8 @@ type SubscriptionHandlers = {
   onJoin?: (member: RealtimePresenceMember, ctx: JoinContext) => void;
   onLeave?: (member: RealtimePresenceMember, ctx: LeaveContext) => void;
   onPublication?: (data: unknown, ctx: PublicationContext) => void;
+  /** Missed events could not be replayed; refetch state (e.g. the session snapshot). */
+  onResync?: () => void;
   onSubscribed?: (ctx: SubscribedContext) => void;
   onSubscribing?: (ctx: SubscribingContext) => void;
   onUnsubscribed?: (ctx: UnsubscribedContext) => void;
@@ -50,6 +53,12 @@ type ChannelEntry = {
 type ConnectionStateListener = (state: ConnectionState) => void;
 
 const channelEntries = new Map<string, ChannelEntry>();
+// Delivered seqs per channel; survives resubscribes so gaps can be replayed.
+const sequenceByChannel = new Map<string, ChannelSequence>();
+const gapReplayTimers = new Map<string, ReturnType<typeof setTimeout>>();
+const replayingChannels = new Set<string>();
+// How long an out-of-order event may wait for the seqs below it before they are fetched.
+const GAP_REPLAY_DELAY_MS = 1000;
 const connectionStateListeners = new Set<ConnectionStateListener>();
 
 let client: Centrifuge | null = null;
@@ -96,6 +105,94 @@ const dispatchToChannel = <TContext>(
   entry.listeners.forEach((handlers) => callback(handlers, ctx));
 };
 
+const readSeq = (data: unknown) => {
+  const seq = (data as { seq?: unknown } | null | undefined)?.seq;
+  return typeof seq === "number" ? seq : null;
+};
+
+const getSequence = (channel: string) => {
+  let sequence = sequenceByChannel.get(channel);
+  if (!sequence) {
+    sequence = createChannelSequence();
+    sequenceByChannel.set(channel, sequence);
+  }
+  return sequence;
+};
+
+const clearChannelSequence = (channel: string) => {
+  clearTimeout(gapReplayTimers.get(channel));
+  gapReplayTimers.delete(channel);
+  sequenceByChannel.delete(channel);
+};
+
+const deliverPublication = (channel: string, data: unknown, ctx: PublicationContext) => {
+  const seq = readSeq(data);
+  if (seq !== null) {
+    const sequence = getSequence(channel);
+    if (!sequence.accept(seq)) {
+      return;
+    }
+    if (sequence.hasGap()) {
+      scheduleGapReplay(channel);
+    }
+  }
+  dispatchToChannel(channel, (handlers, publication) => {
+    handlers.onPublication?.(publication.data, publication);
+  }, { ...ctx, data });
+};
+
+const scheduleGapReplay = (channel: string) => {
+  if (gapReplayTimers.has(channel) || replayingChannels.has(channel)) {
+    return;
+  }
+  gapReplayTimers.set(channel, setTimeout(() => {
+    gapReplayTimers.delete(channel);
+    if (channelEntries.has(channel) && sequenceByChannel.get(channel)?.hasGap()) {
+      void replayMissedPublications(channel);
+    }
+  }, GAP_REPLAY_DELAY_MS));
+};
+
+const replayMissedPublications = async (channel: string) => {
+  if (replayingChannels.has(channel)) {
+    return;
+  }
+  replayingChannels.add(channel);
+  try {
+    while (channelEntries.has(channel)) {
+      const sequence = sequenceByChannel.get(channel);
+      const sinceSeq = sequence?.contiguousSeq() ?? null;
+      if (!sequence || sinceSeq === null) {
+        return;
+      }
+      let replay: RealtimeReplayResponse;
+      try {
+        replay = await centrifugoRepo.replay(channel, sinceSeq);
+      } catch {
+        return;
+      }
+      if (replay.truncated) {
+        sequence.advanceTo(replay.lastSeq);
+        dispatchToChannel(channel, (handlers) => handlers.onResync?.(), null);
+        return;
+      }
+      replay.events.forEach((data) => {
+        deliverPublication(channel, data, { channel, data } as PublicationContext);
+      });
+      if (!replay.hasMore) {
+        // Every seq up to lastSeq was committed before lastSeq was read.
+        sequence.advanceTo(replay.lastSeq);
+        return;
+      }
+    }
+  } finally {
+    replayingChannels.delete(channel);
+    if (sequenceByChannel.get(channel)?.hasGap()) {
+      scheduleGapReplay(channel);
+    }
+  }
+};
+
 export const fetchConnectionToken = async (
   _ctx?: ConnectionTokenContext,
 ): Promise<string> => {
@@ -166,9 +263,7 @@ const createSubscription = (channel: string) => {
   });
 
   subscription.on("publication", (ctx) => {
-    dispatchToChannel(channel, (handlers, publication) => {
-      handlers.onPublication?.(publication.data, publication);
-    }, ctx);
+    deliverPublication(channel, ctx.data, ctx);
   });
 
   subscription.on("join", (ctx) => {
@@ -187,6 +282,9 @@ const createSubscription = (channel: string) => {
     dispatchToChannel(channel, (handlers, subscribed) => {
       handlers.onSubscribed?.(subscribed);
     }, ctx);
+    if (ctx.wasRecovering && !ctx.recovered) {
+      void replayMissedPublications(channel);
+    }
   });
 
   subscription.on("subscribing", (ctx) => {
@@ -225,6 +323,7 @@ const releaseChannelListener = (channel: string, listenerId: number) => {
   entry.subscription.removeAllListeners();
   getClient().removeSubscription(entry.subscription);
   channelEntries.delete(channel);
+  clearChannelSequence(channel);
 
   if (channelEntries.size === 0) {
     connectionRequested = false;
@@ -317,6 +416,7 @@ export const disconnectRealtime = () => {
     client?.removeSubscription(entry.subscription);
   });
   channelEntries.clear();
+  [...sequenceByChannel.keys()].forEach(clearChannelSequence);
   connectionRequested = false;
   client.disconnect();
   notifyConnectionState("offline");
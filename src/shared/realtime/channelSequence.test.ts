@@ -0,0 +1,32 @@
+import { describe, expect, it } from "vitest";
+
+import { createChannelSequence } from "./channelSequence";
+
+describe("channelSequence", () => {
+  it("delivers out-of-order seqs and drops only exact duplicates", () => {
+    const sequence = createChannelSequence();
+
+    expect(sequence.accept(4)).toBe(true);
+    expect(sequence.accept(6)).toBe(true);
+    expect(sequence.hasGap()).toBe(true);
+    expect(sequence.accept(5)).toBe(true);
+    expect(sequence.hasGap()).toBe(false);
+    expect(sequence.contiguousSeq()).toBe(6);
+    expect(sequence.accept(5)).toBe(false);
+    expect(sequence.accept(6)).toBe(false);
+  });
+
+  it("keeps seqs beyond a replayed range pending", () => {
+    const sequence = createChannelSequence(10);
+
+    sequence.accept(12);
+    sequence.accept(15);
+    sequence.advanceTo(13);
+
+    expect(sequence.contiguousSeq()).toBe(13);
+    expect(sequence.hasGap()).toBe(true);
+    expect(sequence.accept(14)).toBe(true);
+    expect(sequence.contiguousSeq()).toBe(15);
+    expect(sequence.hasGap()).toBe(false);
+  });
+});
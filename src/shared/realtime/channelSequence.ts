@@ -0,0 +1,61 @@
+/**
+ * Tracks which server-assigned seqs a channel has delivered.
+ *
+ * Seqs are assigned before the publish reaches Centrifugo, so concurrent
+ * publishes can arrive out of order. Only exact duplicates are dropped; a seq
+ * above the contiguous prefix is delivered and remembered until the gap below
+ * it closes.
+ */
+export type ChannelSequence = {
+  /** Returns false when ``seq`` was already delivered. */
+  accept: (seq: number) => boolean;
+  /** Every seq up to this one has been delivered; null until the first event. */
+  contiguousSeq: () => number | null;
+  hasGap: () => boolean;
+  /** Treat everything up to ``seq`` as delivered (after a replay or a resync). */
+  advanceTo: (seq: number) => void;
+};
+
+export const createChannelSequence = (initialSeq: number | null = null): ChannelSequence => {
+  let contiguous = initialSeq;
+  const ahead = new Set<number>();
+
+  const closeGaps = () => {
+    if (contiguous === null) {
+      return;
+    }
+    while (ahead.has(contiguous + 1)) {
+      contiguous += 1;
+      ahead.delete(contiguous);
+    }
+  };
+
+  return {
+    accept: (seq) => {
+      if (contiguous === null) {
+        contiguous = seq;
+        return true;
+      }
+      if (seq <= contiguous || ahead.has(seq)) {
+        return false;
+      }
+      ahead.add(seq);
+      closeGaps();
+      return true;
+    },
+    contiguousSeq: () => contiguous,
+    hasGap: () => ahead.size > 0,
+    advanceTo: (seq) => {
+      if (contiguous !== null && seq <= contiguous) {
+        return;
+      }
+      contiguous = seq;
+      ahead.forEach((pending) => {
+        if (pending <= seq) {
+          ahead.delete(pending);
+        }
+      });
+      closeGaps();
+    },
+  };
+};